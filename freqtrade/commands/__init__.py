@@ -3,46 +3,106 @@
 Commands module.
 Contains all start-commands, subcommands and CLI Interface creation.
 
+Start-commands are imported on first access - so starting one command doesn't import the modules
+of all other commands.
+
 Note: Be careful with file-scoped imports in these subfiles.
-    as they are parsed on startup, nothing containing optional modules should be loaded.
+    as they are parsed when their command starts, nothing containing optional modules
+    should be loaded.
 """
 
-from freqtrade.commands.analyze_commands import start_analysis_entries_exits
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from freqtrade.commands.arguments import Arguments
-from freqtrade.commands.build_config_commands import start_new_config, start_show_config
-from freqtrade.commands.data_commands import (
-    start_convert_data,
-    start_convert_trades,
-    start_download_data,
-    start_list_data,
-    start_list_trades_data,
-)
-from freqtrade.commands.db_commands import start_convert_db
-from freqtrade.commands.deploy_commands import (
-    start_create_userdir,
-    start_install_ui,
-    start_new_strategy,
-)
-from freqtrade.commands.hyperopt_commands import start_hyperopt_list, start_hyperopt_show
-from freqtrade.commands.list_commands import (
-    start_list_exchanges,
-    start_list_freqAI_models,
-    start_list_hyperopt_loss_functions,
-    start_list_markets,
-    start_list_strategies,
-    start_list_timeframes,
-    start_show_trades,
-)
-from freqtrade.commands.optimize_commands import (
-    start_backtesting,
-    start_backtesting_show,
-    start_edge,
-    start_hyperopt,
-    start_lookahead_analysis,
-    start_recursive_analysis,
-)
-from freqtrade.commands.pairlist_commands import start_test_pairlist
-from freqtrade.commands.plot_commands import start_plot_dataframe, start_plot_profit
-from freqtrade.commands.strategy_utils_commands import start_strategy_update
-from freqtrade.commands.trade_commands import start_trading
-from freqtrade.commands.webserver_commands import start_webserver
+
+
+if TYPE_CHECKING:
+    from freqtrade.commands.analyze_commands import start_analysis_entries_exits
+    from freqtrade.commands.build_config_commands import start_new_config, start_show_config
+    from freqtrade.commands.data_commands import (
+        start_convert_data,
+        start_convert_trades,
+        start_download_data,
+        start_list_data,
+        start_list_trades_data,
+        start_record_data,
+    )
+    from freqtrade.commands.db_commands import start_convert_db
+    from freqtrade.commands.deploy_commands import (
+        start_create_userdir,
+        start_install_ui,
+        start_new_strategy,
+    )
+    from freqtrade.commands.hyperopt_commands import start_hyperopt_list, start_hyperopt_show
+    from freqtrade.commands.list_commands import (
+        start_list_exchanges,
+        start_list_freqAI_models,
+        start_list_hyperopt_loss_functions,
+        start_list_markets,
+        start_list_strategies,
+        start_list_timeframes,
+        start_show_trades,
+    )
+    from freqtrade.commands.optimize_commands import (
+        start_backtesting,
+        start_backtesting_show,
+        start_edge,
+        start_hyperopt,
+        start_lookahead_analysis,
+        start_recursive_analysis,
+    )
+    from freqtrade.commands.pairlist_commands import start_test_pairlist
+    from freqtrade.commands.plot_commands import start_plot_dataframe, start_plot_profit
+    from freqtrade.commands.strategy_utils_commands import start_strategy_update
+    from freqtrade.commands.trade_commands import start_trading
+    from freqtrade.commands.webserver_commands import start_webserver
+
+
+# Start-command -> module defining it
+_COMMAND_MODULES = {
+    "start_analysis_entries_exits": "analyze_commands",
+    "start_new_config": "build_config_commands",
+    "start_show_config": "build_config_commands",
+    "start_convert_data": "data_commands",
+    "start_convert_trades": "data_commands",
+    "start_download_data": "data_commands",
+    "start_list_data": "data_commands",
+    "start_list_trades_data": "data_commands",
+    "start_record_data": "data_commands",
+    "start_convert_db": "db_commands",
+    "start_create_userdir": "deploy_commands",
+    "start_install_ui": "deploy_commands",
+    "start_new_strategy": "deploy_commands",
+    "start_hyperopt_list": "hyperopt_commands",
+    "start_hyperopt_show": "hyperopt_commands",
+    "start_list_exchanges": "list_commands",
+    "start_list_freqAI_models": "list_commands",
+    "start_list_hyperopt_loss_functions": "list_commands",
+    "start_list_markets": "list_commands",
+    "start_list_strategies": "list_commands",
+    "start_list_timeframes": "list_commands",
+    "start_show_trades": "list_commands",
+    "start_backtesting": "optimize_commands",
+    "start_backtesting_show": "optimize_commands",
+    "start_edge": "optimize_commands",
+    "start_hyperopt": "optimize_commands",
+    "start_lookahead_analysis": "optimize_commands",
+    "start_recursive_analysis": "optimize_commands",
+    "start_test_pairlist": "pairlist_commands",
+    "start_plot_dataframe": "plot_commands",
+    "start_plot_profit": "plot_commands",
+    "start_strategy_update": "strategy_utils_commands",
+    "start_trading": "trade_commands",
+    "start_webserver": "webserver_commands",
+}
+
+__all__ = ["Arguments", *_COMMAND_MODULES]
+
+
+def __getattr__(name: str) -> Any:
+    if module := _COMMAND_MODULES.get(name):
+        command = getattr(import_module(f"{__name__}.{module}"), name)
+        globals()[name] = command
+        return command
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,7 +3,7 @@ This module contains the argument manager class
 """
 
 from argparse import ArgumentParser, Namespace, _ArgumentGroup
-from functools import partial
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -134,6 +134,7 @@ ARGS_CONVERT_TRADES = [
     "dataformat_ohlcv",
     "dataformat_trades",
     "trading_mode",
+    "convert_workers",
 ]
 
 ARGS_LIST_DATA = [
@@ -162,6 +163,20 @@ ARGS_DOWNLOAD_DATA = [
     "dataformat_trades",
     "trading_mode",
     "prepend_data",
+    "download_concurrency",
+    "convert_workers",
+]
+
+ARGS_RECORD_DATA = [
+    "pairs",
+    "pairs_file",
+    "exchange",
+    "timeframes",
+    "record_trades",
+    "record_flush_interval",
+    "dataformat_ohlcv",
+    "dataformat_trades",
+    "trading_mode",
 ]
 
 ARGS_PLOT_DATAFRAME = [
@@ -255,6 +270,7 @@ NO_CONF_REQURIED = [
     "convert-data",
     "convert-trade-data",
     "download-data",
+    "record-data",
     "list-timeframes",
     "list-markets",
     "list-pairs",
@@ -275,6 +291,23 @@ NO_CONF_REQURIED = [
 NO_CONF_ALLOWED = ["create-userdir", "list-exchanges", "new-strategy"]
 
 
+def _lazy_command(name: str, **kwargs: Any) -> Callable[[dict[str, Any]], Any]:
+    """
+    Wraps a start-function of `freqtrade.commands` - which is only imported once the command runs,
+    so parsing arguments doesn't import the modules (and dependencies) of all commands.
+    :param name: Name of the start-function
+    :param kwargs: Additional keyword arguments passed to the start-function
+    """
+
+    def run_command(args: dict[str, Any]) -> Any:
+        from freqtrade import commands
+
+        return getattr(commands, name)(args, **kwargs)
+
+    run_command.__name__ = name
+    return run_command
+
+
 class Arguments:
     """
     Arguments Class. Manage the arguments received by the cli
@@ -349,41 +382,6 @@ class Arguments:
         )
         self._build_args(optionlist=["version_main"], parser=self.parser)
 
-        from freqtrade.commands import (
-            start_analysis_entries_exits,
-            start_backtesting,
-            start_backtesting_show,
-            start_convert_data,
-            start_convert_db,
-            start_convert_trades,
-            start_create_userdir,
-            start_download_data,
-            start_edge,
-            start_hyperopt,
-            start_hyperopt_list,
-            start_hyperopt_show,
-            start_install_ui,
-            start_list_data,
-            start_list_exchanges,
-            start_list_freqAI_models,
-            start_list_hyperopt_loss_functions,
-            start_list_markets,
-            start_list_strategies,
-            start_list_timeframes,
-            start_lookahead_analysis,
-            start_new_config,
-            start_new_strategy,
-            start_plot_dataframe,
-            start_plot_profit,
-            start_recursive_analysis,
-            start_show_config,
-            start_show_trades,
-            start_strategy_update,
-            start_test_pairlist,
-            start_trading,
-            start_webserver,
-        )
-
         subparsers = self.parser.add_subparsers(
             dest="command",
             # Use custom message when no subhandler is added
@@ -395,7 +393,7 @@ class Arguments:
         trade_cmd = subparsers.add_parser(
             "trade", help="Trade module.", parents=[_common_parser, _strategy_parser]
         )
-        trade_cmd.set_defaults(func=start_trading)
+        trade_cmd.set_defaults(func=_lazy_command("start_trading"))
         self._build_args(optionlist=ARGS_TRADE, parser=trade_cmd)
 
         # add create-userdir subcommand
@@ -403,7 +401,7 @@ class Arguments:
             "create-userdir",
             help="Create user-data directory.",
         )
-        create_userdir_cmd.set_defaults(func=start_create_userdir)
+        create_userdir_cmd.set_defaults(func=_lazy_command("start_create_userdir"))
         self._build_args(optionlist=ARGS_CREATE_USERDIR, parser=create_userdir_cmd)
 
         # add new-config subcommand
@@ -411,7 +409,7 @@ class Arguments:
             "new-config",
             help="Create new config",
         )
-        build_config_cmd.set_defaults(func=start_new_config)
+        build_config_cmd.set_defaults(func=_lazy_command("start_new_config"))
         self._build_args(optionlist=ARGS_BUILD_CONFIG, parser=build_config_cmd)
 
         # add show-config subcommand
@@ -419,7 +417,7 @@ class Arguments:
             "show-config",
             help="Show resolved config",
         )
-        show_config_cmd.set_defaults(func=start_show_config)
+        show_config_cmd.set_defaults(func=_lazy_command("start_show_config"))
         self._build_args(optionlist=ARGS_SHOW_CONFIG, parser=show_config_cmd)
 
         # add new-strategy subcommand
@@ -427,7 +425,7 @@ class Arguments:
             "new-strategy",
             help="Create new strategy",
         )
-        build_strategy_cmd.set_defaults(func=start_new_strategy)
+        build_strategy_cmd.set_defaults(func=_lazy_command("start_new_strategy"))
         self._build_args(optionlist=ARGS_BUILD_STRATEGY, parser=build_strategy_cmd)
 
         # Add download-data subcommand
@@ -436,16 +434,25 @@ class Arguments:
             help="Download backtesting data.",
             parents=[_common_parser],
         )
-        download_data_cmd.set_defaults(func=start_download_data)
+        download_data_cmd.set_defaults(func=_lazy_command("start_download_data"))
         self._build_args(optionlist=ARGS_DOWNLOAD_DATA, parser=download_data_cmd)
 
+        # Add record-data subcommand
+        record_data_cmd = subparsers.add_parser(
+            "record-data",
+            help="Continuously record candle (and trades) data.",
+            parents=[_common_parser],
+        )
+        record_data_cmd.set_defaults(func=_lazy_command("start_record_data"))
+        self._build_args(optionlist=ARGS_RECORD_DATA, parser=record_data_cmd)
+
         # Add convert-data subcommand
         convert_data_cmd = subparsers.add_parser(
             "convert-data",
             help="Convert candle (OHLCV) data from one format to another.",
             parents=[_common_parser],
         )
-        convert_data_cmd.set_defaults(func=partial(start_convert_data, ohlcv=True))
+        convert_data_cmd.set_defaults(func=_lazy_command("start_convert_data", ohlcv=True))
         self._build_args(optionlist=ARGS_CONVERT_DATA_OHLCV, parser=convert_data_cmd)
 
         # Add convert-trade-data subcommand
@@ -454,7 +461,7 @@ class Arguments:
             help="Convert trade data from one format to another.",
             parents=[_common_parser],
         )
-        convert_trade_data_cmd.set_defaults(func=partial(start_convert_data, ohlcv=False))
+        convert_trade_data_cmd.set_defaults(func=_lazy_command("start_convert_data", ohlcv=False))
         self._build_args(optionlist=ARGS_CONVERT_DATA_TRADES, parser=convert_trade_data_cmd)
 
         # Add trades-to-ohlcv subcommand
@@ -463,7 +470,7 @@ class Arguments:
             help="Convert trade data to OHLCV data.",
             parents=[_common_parser],
         )
-        convert_trade_data_cmd.set_defaults(func=start_convert_trades)
+        convert_trade_data_cmd.set_defaults(func=_lazy_command("start_convert_trades"))
         self._build_args(optionlist=ARGS_CONVERT_TRADES, parser=convert_trade_data_cmd)
 
         # Add list-data subcommand
@@ -472,14 +479,14 @@ class Arguments:
             help="List downloaded data.",
             parents=[_common_parser],
         )
-        list_data_cmd.set_defaults(func=start_list_data)
+        list_data_cmd.set_defaults(func=_lazy_command("start_list_data"))
         self._build_args(optionlist=ARGS_LIST_DATA, parser=list_data_cmd)
 
         # Add backtesting subcommand
         backtesting_cmd = subparsers.add_parser(
             "backtesting", help="Backtesting module.", parents=[_common_parser, _strategy_parser]
         )
-        backtesting_cmd.set_defaults(func=start_backtesting)
+        backtesting_cmd.set_defaults(func=_lazy_command("start_backtesting"))
         self._build_args(optionlist=ARGS_BACKTEST, parser=backtesting_cmd)
 
         # Add backtesting-show subcommand
@@ -488,21 +495,21 @@ class Arguments:
             help="Show past Backtest results",
             parents=[_common_parser],
         )
-        backtesting_show_cmd.set_defaults(func=start_backtesting_show)
+        backtesting_show_cmd.set_defaults(func=_lazy_command("start_backtesting_show"))
         self._build_args(optionlist=ARGS_BACKTEST_SHOW, parser=backtesting_show_cmd)
 
         # Add backtesting analysis subcommand
         analysis_cmd = subparsers.add_parser(
             "backtesting-analysis", help="Backtest Analysis module.", parents=[_common_parser]
         )
-        analysis_cmd.set_defaults(func=start_analysis_entries_exits)
+        analysis_cmd.set_defaults(func=_lazy_command("start_analysis_entries_exits"))
         self._build_args(optionlist=ARGS_ANALYZE_ENTRIES_EXITS, parser=analysis_cmd)
 
         # Add edge subcommand
         edge_cmd = subparsers.add_parser(
             "edge", help="Edge module.", parents=[_common_parser, _strategy_parser]
         )
-        edge_cmd.set_defaults(func=start_edge)
+        edge_cmd.set_defaults(func=_lazy_command("start_edge"))
         self._build_args(optionlist=ARGS_EDGE, parser=edge_cmd)
 
         # Add hyperopt subcommand
@@ -511,7 +518,7 @@ class Arguments:
             help="Hyperopt module.",
             parents=[_common_parser, _strategy_parser],
         )
-        hyperopt_cmd.set_defaults(func=start_hyperopt)
+        hyperopt_cmd.set_defaults(func=_lazy_command("start_hyperopt"))
         self._build_args(optionlist=ARGS_HYPEROPT, parser=hyperopt_cmd)
 
         # Add hyperopt-list subcommand
@@ -520,7 +527,7 @@ class Arguments:
             help="List Hyperopt results",
             parents=[_common_parser],
         )
-        hyperopt_list_cmd.set_defaults(func=start_hyperopt_list)
+        hyperopt_list_cmd.set_defaults(func=_lazy_command("start_hyperopt_list"))
         self._build_args(optionlist=ARGS_HYPEROPT_LIST, parser=hyperopt_list_cmd)
 
         # Add hyperopt-show subcommand
@@ -529,7 +536,7 @@ class Arguments:
             help="Show details of Hyperopt results",
             parents=[_common_parser],
         )
-        hyperopt_show_cmd.set_defaults(func=start_hyperopt_show)
+        hyperopt_show_cmd.set_defaults(func=_lazy_command("start_hyperopt_show"))
         self._build_args(optionlist=ARGS_HYPEROPT_SHOW, parser=hyperopt_show_cmd)
 
         # Add list-exchanges subcommand
@@ -538,7 +545,7 @@ class Arguments:
             help="Print available exchanges.",
             parents=[_common_parser],
         )
-        list_exchanges_cmd.set_defaults(func=start_list_exchanges)
+        list_exchanges_cmd.set_defaults(func=_lazy_command("start_list_exchanges"))
         self._build_args(optionlist=ARGS_LIST_EXCHANGES, parser=list_exchanges_cmd)
 
         # Add list-markets subcommand
@@ -547,7 +554,7 @@ class Arguments:
             help="Print markets on exchange.",
             parents=[_common_parser],
         )
-        list_markets_cmd.set_defaults(func=partial(start_list_markets, pairs_only=False))
+        list_markets_cmd.set_defaults(func=_lazy_command("start_list_markets", pairs_only=False))
         self._build_args(optionlist=ARGS_LIST_PAIRS, parser=list_markets_cmd)
 
         # Add list-pairs subcommand
@@ -556,7 +563,7 @@ class Arguments:
             help="Print pairs on exchange.",
             parents=[_common_parser],
         )
-        list_pairs_cmd.set_defaults(func=partial(start_list_markets, pairs_only=True))
+        list_pairs_cmd.set_defaults(func=_lazy_command("start_list_markets", pairs_only=True))
         self._build_args(optionlist=ARGS_LIST_PAIRS, parser=list_pairs_cmd)
 
         # Add list-strategies subcommand
@@ -565,7 +572,7 @@ class Arguments:
             help="Print available strategies.",
             parents=[_common_parser],
         )
-        list_strategies_cmd.set_defaults(func=start_list_strategies)
+        list_strategies_cmd.set_defaults(func=_lazy_command("start_list_strategies"))
         self._build_args(optionlist=ARGS_LIST_STRATEGIES, parser=list_strategies_cmd)
 
         # Add list-Hyperopt loss subcommand
@@ -574,7 +581,9 @@ class Arguments:
             help="Print available hyperopt loss functions.",
             parents=[_common_parser],
         )
-        list_hyperopt_loss_cmd.set_defaults(func=start_list_hyperopt_loss_functions)
+        list_hyperopt_loss_cmd.set_defaults(
+            func=_lazy_command("start_list_hyperopt_loss_functions")
+        )
         self._build_args(optionlist=ARGS_LIST_HYPEROPTS, parser=list_hyperopt_loss_cmd)
 
         # Add list-freqAI Models subcommand
@@ -583,7 +592,7 @@ class Arguments:
             help="Print available freqAI models.",
             parents=[_common_parser],
         )
-        list_freqaimodels_cmd.set_defaults(func=start_list_freqAI_models)
+        list_freqaimodels_cmd.set_defaults(func=_lazy_command("start_list_freqAI_models"))
         self._build_args(optionlist=ARGS_LIST_FREQAIMODELS, parser=list_freqaimodels_cmd)
 
         # Add list-timeframes subcommand
@@ -592,7 +601,7 @@ class Arguments:
             help="Print available timeframes for the exchange.",
             parents=[_common_parser],
         )
-        list_timeframes_cmd.set_defaults(func=start_list_timeframes)
+        list_timeframes_cmd.set_defaults(func=_lazy_command("start_list_timeframes"))
         self._build_args(optionlist=ARGS_LIST_TIMEFRAMES, parser=list_timeframes_cmd)
 
         # Add show-trades subcommand
@@ -601,7 +610,7 @@ class Arguments:
             help="Show trades.",
             parents=[_common_parser],
         )
-        show_trades.set_defaults(func=start_show_trades)
+        show_trades.set_defaults(func=_lazy_command("start_show_trades"))
         self._build_args(optionlist=ARGS_SHOW_TRADES, parser=show_trades)
 
         # Add test-pairlist subcommand
@@ -609,7 +618,7 @@ class Arguments:
             "test-pairlist",
             help="Test your pairlist configuration.",
         )
-        test_pairlist_cmd.set_defaults(func=start_test_pairlist)
+        test_pairlist_cmd.set_defaults(func=_lazy_command("start_test_pairlist"))
         self._build_args(optionlist=ARGS_TEST_PAIRLIST, parser=test_pairlist_cmd)
 
         # Add db-convert subcommand
@@ -617,7 +626,7 @@ class Arguments:
             "convert-db",
             help="Migrate database to different system",
         )
-        convert_db.set_defaults(func=start_convert_db)
+        convert_db.set_defaults(func=_lazy_command("start_convert_db"))
         self._build_args(optionlist=ARGS_CONVERT_DB, parser=convert_db)
 
         # Add install-ui subcommand
@@ -625,7 +634,7 @@ class Arguments:
             "install-ui",
             help="Install FreqUI",
         )
-        install_ui_cmd.set_defaults(func=start_install_ui)
+        install_ui_cmd.set_defaults(func=_lazy_command("start_install_ui"))
         self._build_args(optionlist=ARGS_INSTALL_UI, parser=install_ui_cmd)
 
         # Add Plotting subcommand
@@ -634,7 +643,7 @@ class Arguments:
             help="Plot candles with indicators.",
             parents=[_common_parser, _strategy_parser],
         )
-        plot_dataframe_cmd.set_defaults(func=start_plot_dataframe)
+        plot_dataframe_cmd.set_defaults(func=_lazy_command("start_plot_dataframe"))
         self._build_args(optionlist=ARGS_PLOT_DATAFRAME, parser=plot_dataframe_cmd)
 
         # Plot profit
@@ -643,14 +652,14 @@ class Arguments:
             help="Generate plot showing profits.",
             parents=[_common_parser, _strategy_parser],
         )
-        plot_profit_cmd.set_defaults(func=start_plot_profit)
+        plot_profit_cmd.set_defaults(func=_lazy_command("start_plot_profit"))
         self._build_args(optionlist=ARGS_PLOT_PROFIT, parser=plot_profit_cmd)
 
         # Add webserver subcommand
         webserver_cmd = subparsers.add_parser(
             "webserver", help="Webserver module.", parents=[_common_parser]
         )
-        webserver_cmd.set_defaults(func=start_webserver)
+        webserver_cmd.set_defaults(func=_lazy_command("start_webserver"))
         self._build_args(optionlist=ARGS_WEBSERVER, parser=webserver_cmd)
 
         # Add strategy_updater subcommand
@@ -659,7 +668,7 @@ class Arguments:
             help="updates outdated strategy files to the current version",
             parents=[_common_parser],
         )
-        strategy_updater_cmd.set_defaults(func=start_strategy_update)
+        strategy_updater_cmd.set_defaults(func=_lazy_command("start_strategy_update"))
         self._build_args(optionlist=ARGS_STRATEGY_UPDATER, parser=strategy_updater_cmd)
 
         # Add lookahead_analysis subcommand
@@ -668,7 +677,7 @@ class Arguments:
             help="Check for potential look ahead bias.",
             parents=[_common_parser, _strategy_parser],
         )
-        lookahead_analayis_cmd.set_defaults(func=start_lookahead_analysis)
+        lookahead_analayis_cmd.set_defaults(func=_lazy_command("start_lookahead_analysis"))
 
         self._build_args(optionlist=ARGS_LOOKAHEAD_ANALYSIS, parser=lookahead_analayis_cmd)
 
@@ -678,6 +687,6 @@ class Arguments:
             help="Check for potential recursive formula issue.",
             parents=[_common_parser, _strategy_parser],
         )
-        recursive_analayis_cmd.set_defaults(func=start_recursive_analysis)
+        recursive_analayis_cmd.set_defaults(func=_lazy_command("start_recursive_analysis"))
 
         self._build_args(optionlist=ARGS_RECURSIVE_ANALYSIS, parser=recursive_analayis_cmd)
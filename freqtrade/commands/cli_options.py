@@ -442,6 +442,31 @@ AVAILABLE_CLI_OPTIONS = {
         type=check_int_positive,
         metavar="INT",
     ),
+    "download_concurrency": Arg(
+        "--dl-concurrency",
+        help="Number of concurrent OHLCV downloads. "
+        "Values above 1 enable concurrent, resumable downloads. Default: `%(default)s`.",
+        type=check_int_positive,
+        metavar="INT",
+    ),
+    "record_trades": Arg(
+        "--record-trades",
+        help="Also record public trades (in addition to candles).",
+        action="store_true",
+    ),
+    "record_flush_interval": Arg(
+        "--flush-interval",
+        help="Write recorded data to disk every INT seconds. Default: `60`.",
+        type=check_int_positive,
+        metavar="INT",
+    ),
+    "convert_workers": Arg(
+        "--convert-workers",
+        help="Number of pairs to convert from trades to OHLCV in parallel (in separate processes). "
+        "Default: `%(default)s`.",
+        type=check_int_positive,
+        metavar="INT",
+    ),
     "download_trades": Arg(
         "--dl-trades",
         help="Download trades instead of OHLCV data.",
@@ -43,6 +43,24 @@ def start_download_data(args: dict[str, Any]) -> None:
         sys.exit("SIGINT received, aborting ...")
 
 
+def start_record_data(args: dict[str, Any]) -> None:
+    """
+    Continuously record candles (and trades) for the configured pairs
+    """
+    from freqtrade.configuration import setup_utils_configuration
+    from freqtrade.data.history.data_recorder import record_data_main
+
+    config = setup_utils_configuration(args, RunMode.UTIL_EXCHANGE)
+
+    if "pairs" not in config:
+        raise ConfigurationError(
+            "Recording data requires a list of pairs. "
+            "Please check the documentation on how to configure this."
+        )
+
+    record_data_main(config)
+
+
 def start_convert_trades(args: dict[str, Any]) -> None:
     from freqtrade.configuration import TimeRange, setup_utils_configuration
     from freqtrade.data.converter import convert_trades_to_ohlcv
@@ -83,6 +101,7 @@ def start_convert_trades(args: dict[str, Any]) -> None:
         data_format_ohlcv=config["dataformat_ohlcv"],
         data_format_trades=config["dataformat_trades"],
         candle_type=config.get("candle_type_def", CandleType.SPOT),
+        workers=config.get("convert_workers", 1),
     )
 
 
@@ -4,6 +4,8 @@ from freqtrade.constants import (
     AVAILABLE_DATAHANDLERS,
     AVAILABLE_PAIRLISTS,
     BACKTEST_BREAKDOWNS,
+    DB_DURABILITY_OPTIONS,
+    DRY_RUN_MATCHING_MODES,
     DRY_RUN_WALLET,
     EXPORT_OPTIONS,
     MARGIN_MODES,
@@ -216,6 +218,30 @@ CONF_SCHEMA = {
             "type": "array",
             "items": {"type": "string", "enum": BACKTEST_BREAKDOWNS},
         },
+        "backtest_float_math": {
+            "description": (
+                "Calculate profits in backtesting and hyperopt with float instead of "
+                "decimal math. Faster, but subject to float rounding."
+            ),
+            "type": "boolean",
+            "default": False,
+        },
+        "backtest_keep_closed_trades": {
+            "description": (
+                "Keep all closed trade objects during backtesting and hyperopt. If false, only "
+                "trades within the lookback period of the protections are kept."
+            ),
+            "type": "boolean",
+            "default": True,
+        },
+        "backtest_indicator_cache": {
+            "description": (
+                "Cache populated indicators of backtesting and hyperopt on disk, "
+                "and reuse them while strategy indicator code, parameters and data are unchanged."
+            ),
+            "type": "boolean",
+            "default": False,
+        },
         "bot_name": {
             "description": "Name of the trading bot. Passed via API to a client.",
             "type": "string",
@@ -481,6 +507,30 @@ CONF_SCHEMA = {
                     "type": "number",
                     "minimum": 0.0,
                 },
+                "global_rate_limit": {
+                    "description": "Maximum messages per second sent by this bot token.",
+                    "type": "number",
+                    "exclusiveMinimum": 0,
+                    "default": 30,
+                },
+                "chat_rate_limit": {
+                    "description": "Maximum messages per second sent to one chat.",
+                    "type": "number",
+                    "exclusiveMinimum": 0,
+                    "default": 1,
+                },
+                "coalesce_messages": {
+                    "description": "Combine notifications pending for the same chat.",
+                    "type": "boolean",
+                    "default": True,
+                },
+                "rate_limit_dir": {
+                    "description": (
+                        "Directory to share the global rate limit with other processes in. "
+                        "Defaults to the system's temporary directory, null disables sharing."
+                    ),
+                    "type": ["string", "null"],
+                },
                 "notification_settings": {
                     "description": "Settings for different types of notifications.",
                     "type": "object",
@@ -569,6 +619,17 @@ CONF_SCHEMA = {
                 "format": {"type": "string", "enum": WEBHOOK_FORMAT_OPTIONS, "default": "form"},
                 "retries": {"type": "integer", "minimum": 0},
                 "retry_delay": {"type": "number", "minimum": 0},
+                "async_delivery": {
+                    "description": "Send notifications from a background thread.",
+                    "type": "boolean",
+                    "default": True,
+                },
+                "queue_size": {
+                    "description": "Maximum number of pending notifications.",
+                    "type": "integer",
+                    "minimum": 1,
+                    "default": 1000,
+                },
                 **__MESSAGE_TYPE_DICT,
             },
         },
@@ -578,6 +639,17 @@ CONF_SCHEMA = {
             "properties": {
                 "enabled": {"type": "boolean"},
                 "webhook_url": {"type": "string"},
+                "async_delivery": {
+                    "description": "Send notifications from a background thread.",
+                    "type": "boolean",
+                    "default": True,
+                },
+                "queue_size": {
+                    "description": "Maximum number of pending notifications.",
+                    "type": "integer",
+                    "minimum": 1,
+                    "default": 1000,
+                },
                 "exit_fill": {
                     "type": "array",
                     "items": {"type": "object"},
@@ -658,6 +730,12 @@ CONF_SCHEMA = {
                     "type": "string",
                     "enum": ["error", "info"],
                 },
+                "backtest_workers": {
+                    "description": "Number of worker processes running queued backtest jobs.",
+                    "type": "integer",
+                    "minimum": 1,
+                    "default": 1,
+                },
             },
             "required": ["enabled", "listen_ip_address", "listen_port", "username", "password"],
         },
@@ -666,6 +744,24 @@ CONF_SCHEMA = {
             "description": "Database connection URL.",
             "type": "string",
         },
+        "db_durability": {
+            "description": (
+                "Which database changes of the trading loop are committed immediately. "
+                "`fills` commits new orders, fills and exits immediately, and all other "
+                "changes in batches."
+            ),
+            "type": "string",
+            "enum": DB_DURABILITY_OPTIONS,
+            "default": "full",
+        },
+        "db_flush_interval": {
+            "description": (
+                "Seconds to batch database changes for, with `db_durability` set to `fills`."
+            ),
+            "type": "number",
+            "minimum": 0,
+            "default": 2,
+        },
         "export": {
             "description": "Type of data to export.",
             "type": "string",
@@ -734,6 +830,40 @@ CONF_SCHEMA = {
             "description": "Download trades data by default (instead of ohlcv data).",
             "type": "boolean",
         },
+        "download_concurrency": {
+            "description": (
+                "Number of concurrent OHLCV downloads. "
+                "Values above 1 enable concurrent, resumable downloads."
+            ),
+            "type": "integer",
+            "minimum": 1,
+            "default": 1,
+        },
+        "convert_workers": {
+            "description": "Number of pairs to convert from trades to OHLCV in parallel.",
+            "type": "integer",
+            "minimum": 1,
+            "default": 1,
+        },
+        # Record data section
+        "record_trades": {
+            "description": "Record public trades in addition to candles (record-data).",
+            "type": "boolean",
+        },
+        "record_flush_interval": {
+            "description": "Interval (in seconds) to write recorded data to disk.",
+            "type": "integer",
+            "minimum": 1,
+            "default": 60,
+        },
+        "record_max_buffer_rows": {
+            "description": (
+                "Maximum rows buffered per pair (and timeframe) before recorded data is written."
+            ),
+            "type": "integer",
+            "minimum": 1,
+            "default": 10000,
+        },
         "max_entry_position_adjustment": {
             "description": f"Maximum entry position adjustment allowed. {__IN_STRATEGY}",
             "type": ["integer", "number"],
@@ -801,6 +931,16 @@ CONF_SCHEMA = {
                     "type": "boolean",
                     "default": True,
                 },
+                "dry_run_matching": {
+                    "description": (
+                        "How dry-run limit orders are filled. `price_cross` fills orders "
+                        "completely once the price crosses them, `l2_queue` simulates queue "
+                        "position and partial fills based on order book snapshots."
+                    ),
+                    "type": "string",
+                    "enum": DRY_RUN_MATCHING_MODES,
+                    "default": "price_cross",
+                },
                 "key": {
                     "description": "API key for the exchange.",
                     "type": "string",
@@ -1047,6 +1187,31 @@ CONF_SCHEMA = {
                     "type": "boolean",
                     "default": True,
                 },
+                "training_workers": {
+                    "description": (
+                        "Number of pairs trained at the same time during dry/live runs. "
+                        "Limited by the number of CPUs and the threads used per model."
+                    ),
+                    "type": "integer",
+                    "minimum": 1,
+                    "default": 1,
+                },
+                "persist_interval": {
+                    "description": (
+                        "Minimum interval (in seconds) between saving historic predictions "
+                        "and metrics after models were trained."
+                    ),
+                    "type": "number",
+                    "minimum": 0,
+                    "default": 60,
+                },
+                "model_registry_path": {
+                    "description": (
+                        "Directory shared by bots running the same identifier. One bot trains "
+                        "and publishes its models, all other bots use them."
+                    ),
+                    "type": "string",
+                },
                 "continual_learning": {
                     "description": (
                         "Use the final state of the most recently trained model "
@@ -378,6 +378,10 @@ class Configuration:
             ("days", "Detected --days: {}"),
             ("include_inactive", "Detected --include-inactive-pairs: {}"),
             ("download_trades", "Detected --dl-trades: {}"),
+            ("download_concurrency", "Detected --dl-concurrency: {}"),
+            ("convert_workers", "Detected --convert-workers: {}"),
+            ("record_trades", "Detected --record-trades: {}"),
+            ("record_flush_interval", "Detected --flush-interval: {}"),
             ("convert_trades", "Detected --convert: {} - Converting Trade data to OHCV {}"),
             ("dataformat_ohlcv", 'Using "{}" to store OHLCV data.'),
             ("dataformat_trades", 'Using "{}" to store trades data.'),
@@ -18,6 +18,7 @@ TIMEOUT_UNITS = ["minutes", "seconds"]
 EXPORT_OPTIONS = ["none", "trades", "signals"]
 DEFAULT_DB_PROD_URL = "sqlite:///tradesv3.sqlite"
 DEFAULT_DB_DRYRUN_URL = "sqlite:///tradesv3.dryrun.sqlite"
+DB_DURABILITY_OPTIONS = ["full", "fills"]
 UNLIMITED_STAKE_AMOUNT = "unlimited"
 DEFAULT_AMOUNT_RESERVE_PERCENT = 0.05
 REQUIRED_ORDERTIF = ["entry", "exit"]
@@ -58,7 +59,7 @@ AVAILABLE_PAIRLISTS = [
     "SpreadFilter",
     "VolatilityFilter",
 ]
-AVAILABLE_DATAHANDLERS = ["json", "jsongz", "feather", "parquet"]
+AVAILABLE_DATAHANDLERS = ["json", "jsongz", "feather", "parquet", "partitioned"]
 BACKTEST_BREAKDOWNS = ["day", "week", "month", "year"]
 BACKTEST_CACHE_AGE = ["none", "day", "week", "month"]
 BACKTEST_CACHE_DEFAULT = "day"
@@ -81,6 +82,7 @@ TRADES_DTYPES = {
 }
 TRADING_MODES = ["spot", "margin", "futures"]
 MARGIN_MODES = ["cross", "isolated", ""]
+DRY_RUN_MATCHING_MODES = ["price_cross", "l2_queue"]
 
 LAST_BT_RESULT_FN = ".last_result.json"
 FTHYPT_FILEVERSION = "fthypt_fileversion"
@@ -95,6 +97,8 @@ WEBHOOK_FORMAT_OPTIONS = ["form", "json", "raw"]
 FULL_DATAFRAME_THRESHOLD = 100
 CUSTOM_TAG_MAX_LENGTH = 255
 DL_DATA_TIMEFRAMES = ["1m", "5m"]
+# Number of trades held in memory at once when converting trades to OHLCV
+TRADES_CONVERT_CHUNK_SIZE = 1_000_000
 
 ENV_VAR_PREFIX = "FREQTRADE__"
 
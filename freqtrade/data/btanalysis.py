@@ -547,6 +547,21 @@ def trade_list_to_dataframe(trades: list[Trade] | list[LocalTrade]) -> pd.DataFr
     :return: Dataframe with BT_DATA_COLUMNS
     """
     df = pd.DataFrame.from_records([t.to_json(True) for t in trades], columns=BT_DATA_COLUMNS)
+    return _format_trades_dataframe(df)
+
+
+def trade_columns_to_dataframe(columns: dict[str, list]) -> pd.DataFrame:
+    """
+    Convert trade results stored column-wise (see `LocalTrade.bt_trades_results`)
+    to pandas Dataframe
+    :param columns: Dictionary of column name to values
+    :return: Dataframe with BT_DATA_COLUMNS
+    """
+    df = pd.DataFrame(columns, columns=BT_DATA_COLUMNS)
+    return _format_trades_dataframe(df)
+
+
+def _format_trades_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     if len(df) > 0:
         df["close_date"] = pd.to_datetime(df["close_date"], utc=True)
         df["open_date"] = pd.to_datetime(df["open_date"], utc=True)
@@ -3,15 +3,19 @@ Functions to convert data from one format to another
 """
 
 import logging
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import pandas as pd
-from pandas import DataFrame, to_datetime
+from pandas import DataFrame, Timestamp, concat, to_datetime
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import (
     DEFAULT_DATAFRAME_COLUMNS,
     DEFAULT_TRADES_COLUMNS,
+    TRADES_CONVERT_CHUNK_SIZE,
     TRADES_DTYPES,
     Config,
     TradeList,
@@ -67,11 +71,15 @@ def trades_list_to_df(trades: TradeList, convert: bool = True):
     return df
 
 
-def trades_to_ohlcv(trades: DataFrame, timeframe: str) -> DataFrame:
+def trades_to_ohlcv(
+    trades: DataFrame, timeframe: str, origin: Timestamp | None = None
+) -> DataFrame:
     """
     Converts trades list to OHLCV list
     :param trades: List of trades, as returned by ccxt.fetch_trades.
     :param timeframe: Timeframe to resample data to
+    :param origin: Timestamp to align candles to - defaults to midnight of the first trade's day.
+        Only used by timeframes shorter than a week.
     :return: OHLCV Dataframe.
     :raises: ValueError if no trades are provided
     """
@@ -81,49 +89,138 @@ def trades_to_ohlcv(trades: DataFrame, timeframe: str) -> DataFrame:
         raise ValueError("Trade-list empty.")
     df = trades.set_index("date", drop=True)
     resample_interval = timeframe_to_resample_freq(timeframe)
-    df_new = df["price"].resample(resample_interval).ohlc()
-    df_new["volume"] = df["amount"].resample(resample_interval).sum()
+    resampler = df.resample(resample_interval, origin="start_day" if origin is None else origin)
+    df_new = resampler["price"].ohlc()
+    df_new["volume"] = resampler["amount"].sum()
     df_new["date"] = df_new.index
     # Drop 0 volume rows
     df_new = df_new.dropna()
     return df_new.loc[:, DEFAULT_DATAFRAME_COLUMNS]
 
 
-def convert_trades_to_ohlcv(
-    pairs: list[str],
+def trades_chunks_to_ohlcv(
+    chunks: Iterable[DataFrame], timeframes: list[str]
+) -> dict[str, DataFrame]:
+    """
+    Converts time-ordered chunks of trades to OHLCV data of all timeframes in one pass.
+    Candles spanning two chunks are combined, so the result matches
+    trades_to_ohlcv() of all trades - while only one chunk of trades is held in memory.
+    :param chunks: Iterable of trades dataframes, ordered by time
+    :param timeframes: Timeframes to resample data to
+    :return: Dictionary of timeframe to OHLCV Dataframe. Timeframes without trades are missing.
+    """
+    candles: dict[str, list[DataFrame]] = {timeframe: [] for timeframe in timeframes}
+    origin = None
+    for trades in chunks:
+        if trades.empty:
+            continue
+        if origin is None:
+            # Align candles of all chunks like resampling all trades at once would
+            origin = trades["date"].min().floor("D")
+        for timeframe in timeframes:
+            candles[timeframe].append(trades_to_ohlcv(trades, timeframe, origin=origin))
+
+    result = {}
+    for timeframe, frames in candles.items():
+        if not frames:
+            continue
+        if len(frames) == 1:
+            result[timeframe] = frames[0]
+            continue
+        ohlcv = concat(frames, ignore_index=True)
+        if ohlcv["date"].duplicated().any():
+            ohlcv = ohlcv.groupby("date", sort=True, as_index=False).agg(
+                open=("open", "first"),
+                high=("high", "max"),
+                low=("low", "min"),
+                close=("close", "last"),
+                volume=("volume", "sum"),
+            )
+        result[timeframe] = ohlcv.loc[:, DEFAULT_DATAFRAME_COLUMNS]
+    return result
+
+
+def _convert_pair_trades_to_ohlcv(
+    pair: str,
     timeframes: list[str],
     datadir: Path,
-    timerange: TimeRange,
     erase: bool,
     data_format_ohlcv: str,
     data_format_trades: str,
     candle_type: CandleType,
-) -> None:
+    chunk_size: int,
+) -> bool:
     """
-    Convert stored trades data to ohlcv data
+    Convert stored trades data of one pair to ohlcv data of all timeframes.
+    Runs in a worker process if multiple pairs are converted in parallel.
+    :return: True if the pair was converted, False if there was no trades data.
     """
     from freqtrade.data.history import get_datahandler
 
     data_handler_trades = get_datahandler(datadir, data_format=data_format_trades)
     data_handler_ohlcv = get_datahandler(datadir, data_format=data_format_ohlcv)
+    trading_mode = TradingMode.FUTURES if candle_type != CandleType.SPOT else TradingMode.SPOT
 
+    if erase:
+        for timeframe in timeframes:
+            if data_handler_ohlcv.ohlcv_purge(pair, timeframe, candle_type=candle_type):
+                logger.info(f"Deleting existing data for pair {pair}, interval {timeframe}.")
+    try:
+        ohlcv = trades_chunks_to_ohlcv(
+            data_handler_trades.trades_load_chunks(pair, trading_mode, chunk_size), timeframes
+        )
+    except Exception:
+        logger.exception(f"Error loading trades for {pair}")
+        return False
+    for timeframe, data in ohlcv.items():
+        # Store ohlcv
+        data_handler_ohlcv.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
+    return bool(ohlcv)
+
+
+def convert_trades_to_ohlcv(
+    pairs: list[str],
+    timeframes: list[str],
+    datadir: Path,
+    timerange: TimeRange,
+    erase: bool,
+    data_format_ohlcv: str,
+    data_format_trades: str,
+    candle_type: CandleType,
+    workers: int = 1,
+    chunk_size: int = TRADES_CONVERT_CHUNK_SIZE,
+) -> None:
+    """
+    Convert stored trades data to ohlcv data.
+    Trades are read in chunks of chunk_size trades, building all timeframes in one pass.
+    :param workers: Number of pairs to convert in parallel (in separate processes)
+    :param chunk_size: Number of trades to hold in memory at once (per worker)
+    """
     logger.info(
         f"About to convert pairs: '{', '.join(pairs)}', "
         f"intervals: '{', '.join(timeframes)}' to {datadir}"
     )
-    trading_mode = TradingMode.FUTURES if candle_type != CandleType.SPOT else TradingMode.SPOT
-    for pair in pairs:
-        trades = data_handler_trades.trades_load(pair, trading_mode)
-        for timeframe in timeframes:
-            if erase:
-                if data_handler_ohlcv.ohlcv_purge(pair, timeframe, candle_type=candle_type):
-                    logger.info(f"Deleting existing data for pair {pair}, interval {timeframe}.")
-            try:
-                ohlcv = trades_to_ohlcv(trades, timeframe)
-                # Store ohlcv
-                data_handler_ohlcv.ohlcv_store(pair, timeframe, data=ohlcv, candle_type=candle_type)
-            except ValueError:
-                logger.warning(f"Could not convert {pair} to OHLCV.")
+    convert_pair = partial(
+        _convert_pair_trades_to_ohlcv,
+        timeframes=timeframes,
+        datadir=datadir,
+        erase=erase,
+        data_format_ohlcv=data_format_ohlcv,
+        data_format_trades=data_format_trades,
+        candle_type=candle_type,
+        chunk_size=chunk_size,
+    )
+    workers = min(workers, len(pairs))
+    if workers > 1:
+        logger.info(f"Converting {len(pairs)} pairs using {workers} worker processes.")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(convert_pair, pairs))
+    else:
+        results = [convert_pair(pair) for pair in pairs]
+
+    for pair, converted in zip(pairs, results, strict=True):
+        if not converted:
+            logger.warning(f"Could not convert {pair} to OHLCV.")
 
 
 def convert_trades_format(config: Config, convert_from: str, convert_to: str, erase: bool):
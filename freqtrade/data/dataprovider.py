@@ -557,13 +557,14 @@ class DataProvider:
         """
         Fetch latest l2 orderbook data
         Warning: Does a network request - so use with common sense.
+        Within a bot iteration, order books are shared with pricing and dry-run order fills.
         :param pair: pair to get the data for
         :param maximum: Maximum number of orderbook entries to query
         :return: dict including bids/asks with a total of `maximum` entries.
         """
         if self._exchange is None:
             raise OperationalException(NO_EXCHANGE_EXCEPTION)
-        return self._exchange.fetch_l2_order_book(pair, maximum)
+        return self._exchange.get_order_book(pair, maximum)
 
     def send_msg(self, message: str, *, always_send: bool = False) -> None:
         """
@@ -0,0 +1,401 @@
+"""
+Continuous candle and trades recorder for the record-data subcommand.
+
+Builds a local archive for exchanges which only provide a limited window of history
+(e.g. Hyperliquid): closed candles are polled after every candle close,
+public trades are streamed through the websocket connection.
+Data is buffered in memory and flushed in batches through the datahandlers.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from pandas import concat
+
+from freqtrade.constants import DL_DATA_TIMEFRAMES, Config
+from freqtrade.data.converter import (
+    ohlcv_to_dataframe,
+    trades_df_remove_duplicates,
+    trades_list_to_df,
+)
+from freqtrade.data.history.datahandlers import IDataHandler, get_datahandler
+from freqtrade.data.history.history_utils import _store_ohlcv_update
+from freqtrade.enums import CandleType, TradingMode
+from freqtrade.exceptions import OperationalException
+from freqtrade.exchange import (
+    Exchange,
+    timeframe_to_msecs,
+    timeframe_to_next_date,
+    timeframe_to_prev_date,
+)
+from freqtrade.plugins.pairlist.pairlist_helpers import dynamic_expand_pairlist
+from freqtrade.util import dt_now, dt_ts, format_ms_time
+
+
+logger = logging.getLogger(__name__)
+
+# Delay polling after the candle close, giving the exchange time to finalize the candle.
+CANDLE_CLOSE_DELAY = 2
+# Polling interval for exchanges without websocket trades support.
+TRADES_POLL_INTERVAL = 10
+RECONNECT_BACKOFF_MAX = 60
+
+
+class DataRecorder:
+    """
+    Record closed candles (and optionally public trades) for a list of pairs.
+    Memory is bounded by max_buffer_rows per (pair, timeframe) and per pair for trades,
+    reaching this limit flushes immediately and pauses recording until data is written.
+    If data can't be written, the oldest rows above this limit are dropped.
+    """
+
+    def __init__(
+        self,
+        exchange: Exchange,
+        ohlcv_handler: IDataHandler,
+        trades_handler: IDataHandler,
+        *,
+        pairs: list[str],
+        timeframes: list[str],
+        candle_type: CandleType = CandleType.SPOT,
+        trading_mode: TradingMode = TradingMode.SPOT,
+        record_trades: bool = False,
+        flush_interval: int = 60,
+        max_buffer_rows: int = 10000,
+    ) -> None:
+        self._exchange = exchange
+        self._ohlcv_handler = ohlcv_handler
+        self._trades_handler = trades_handler
+        self._pairs = pairs
+        self._timeframes = timeframes
+        self._candle_type = candle_type
+        self._trading_mode = trading_mode
+        self._record_trades = record_trades
+        self._flush_interval = flush_interval
+        self._max_buffer_rows = max_buffer_rows
+        self._watch_trades = exchange.exchange_has("watchTrades")
+        if record_trades and not self._watch_trades and not exchange.exchange_has("fetchTrades"):
+            raise OperationalException(
+                f"Exchange {exchange.name} does not provide public trades. "
+                "Trades can't be recorded for this exchange."
+            )
+
+        self._ohlcv_buffer: dict[tuple[str, str], list[list]] = {}
+        # Open time (ms) of the next candle expected for each (pair, timeframe)
+        self._next_candle: dict[tuple[str, str], int | None] = {}
+        self._trades_buffer: dict[str, list[list]] = {}
+        # Timestamp (ms) of the last recorded trade, and the trade ids seen at this timestamp
+        self._last_trade: dict[str, tuple[int, set[str]]] = {}
+        self._stop_event: asyncio.Event | None = None
+        self._flush_lock: asyncio.Lock | None = None
+        self._writer: ThreadPoolExecutor | None = None
+
+    def _init_state(self) -> None:
+        """
+        Determine where each recording continues, based on the stored data.
+        """
+        for pair in self._pairs:
+            for timeframe in self._timeframes:
+                _, end, length = self._ohlcv_handler.ohlcv_data_min_max(
+                    pair, timeframe, self._candle_type
+                )
+                self._next_candle[(pair, timeframe)] = (
+                    dt_ts(end) + timeframe_to_msecs(timeframe) if length else None
+                )
+                self._ohlcv_buffer[(pair, timeframe)] = []
+            if self._record_trades:
+                _, end, length = self._trades_handler.trades_data_min_max(pair, self._trading_mode)
+                if length:
+                    self._last_trade[pair] = (dt_ts(end), set())
+                self._trades_buffer[pair] = []
+
+    async def _wait(self, seconds: float) -> bool:
+        """
+        Sleep for the given amount of seconds, or until the recorder is stopped.
+        :return: True if the recorder was stopped
+        """
+        if self._stop_event is None:
+            raise OperationalException("Data recorder is not running.")
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=max(seconds, 0))
+        except asyncio.TimeoutError:
+            pass
+        return self._stop_event.is_set()
+
+    def _history_window_start(self, timeframe: str) -> int:
+        """
+        Oldest candle open time (ms) which can be requested from the exchange.
+        """
+        tf_ms = timeframe_to_msecs(timeframe)
+        candle_limit = self._exchange.ohlcv_candle_limit(timeframe, self._candle_type)
+        return dt_ts(timeframe_to_prev_date(timeframe)) - candle_limit * tf_ms
+
+    async def _poll_ohlcv(self, pair: str, timeframe: str) -> None:
+        """
+        Fetch all closed candles since the last recorded candle.
+        On the first call, this backfills from the available history.
+        """
+        key = (pair, timeframe)
+        expected = self._next_candle[key]
+        window_start = self._history_window_start(timeframe)
+        since = expected
+        if since is None or (
+            since < window_start and not self._exchange.get_option("ohlcv_has_history", True)
+        ):
+            since = window_start
+
+        _, _, _, data, _ = await self._exchange._async_get_historic_ohlcv(
+            pair, timeframe, since, self._candle_type, raise_=True
+        )
+        current_open = dt_ts(timeframe_to_prev_date(timeframe))
+        data = [c for c in data if since <= c[0] < current_open]
+        if not data:
+            return
+        if expected is not None and data[0][0] > expected:
+            logger.warning(
+                f"Gap in recorded candles for {pair}, {timeframe}: "
+                f"missing {format_ms_time(expected)} to {format_ms_time(data[0][0])}, "
+                "as the exchange does not provide this history anymore."
+            )
+        self._next_candle[key] = data[-1][0] + timeframe_to_msecs(timeframe)
+        self._ohlcv_buffer[key].extend(data)
+        if len(self._ohlcv_buffer[key]) >= self._max_buffer_rows:
+            await self.flush()
+
+    async def _record_ohlcv(self, pair: str, timeframe: str) -> None:
+        backoff = 1
+        while True:
+            try:
+                await self._poll_ohlcv(pair, timeframe)
+                backoff = 1
+            except Exception as e:
+                logger.warning(f"Could not fetch candles for {pair}, {timeframe}: {e}")
+                if await self._wait(backoff):
+                    return
+                backoff = min(backoff * 2, RECONNECT_BACKOFF_MAX)
+                continue
+            next_close = timeframe_to_next_date(timeframe).timestamp()
+            if await self._wait(next_close - dt_now().timestamp() + CANDLE_CLOSE_DELAY):
+                return
+
+    def _new_trades(self, pair: str, trades: list[list]) -> list[list]:
+        """
+        Filter out trades which were already recorded, updating the last trade.
+        """
+        last_ts, last_ids = self._last_trade.get(pair, (0, set()))
+        new = [
+            t
+            for t in sorted(trades, key=lambda t: t[0])
+            if t[0] > last_ts or (t[0] == last_ts and t[1] not in last_ids)
+        ]
+        if new:
+            new_ts = new[-1][0]
+            ids = {t[1] for t in new if t[0] == new_ts}
+            if new_ts == last_ts:
+                ids |= last_ids
+            self._last_trade[pair] = (new_ts, ids)
+        return new
+
+    async def _add_trades(self, pair: str, trades: list[list]) -> None:
+        had_trades = pair in self._last_trade
+        last_ts = self._last_trade.get(pair, (0, set()))[0]
+        new = self._new_trades(pair, trades)
+        if not new:
+            return
+        if had_trades and len(new) == len(trades):
+            # None of the received trades was known - trades may have been missed.
+            logger.warning(
+                f"Possible gap in recorded trades for {pair}: "
+                f"{format_ms_time(last_ts)} to {format_ms_time(new[0][0])}."
+            )
+        self._trades_buffer[pair].extend(new)
+        if len(self._trades_buffer[pair]) >= self._max_buffer_rows:
+            await self.flush()
+
+    async def _record_trades_pair(self, pair: str) -> None:
+        backoff = 1
+        while True:
+            try:
+                if self._watch_trades:
+                    trades = await self._exchange._async_watch_trades(pair)
+                else:
+                    since = self._last_trade.get(pair, (None, None))[0]
+                    trades, _ = await self._exchange._async_fetch_trades(pair, since=since)
+                backoff = 1
+            except Exception as e:
+                logger.warning(f"Trades stream for {pair} interrupted: {e}. Reconnecting.")
+                if await self._wait(backoff):
+                    return
+                backoff = min(backoff * 2, RECONNECT_BACKOFF_MAX)
+                continue
+            await self._add_trades(pair, trades)
+            if not self._watch_trades and await self._wait(TRADES_POLL_INTERVAL):
+                return
+
+    def _take_buffers(self) -> tuple[dict[tuple[str, str], list[list]], dict[str, list[list]]]:
+        ohlcv = {k: v for k, v in self._ohlcv_buffer.items() if v}
+        trades = {k: v for k, v in self._trades_buffer.items() if v}
+        for key in ohlcv:
+            self._ohlcv_buffer[key] = []
+        for pair in trades:
+            self._trades_buffer[pair] = []
+        return ohlcv, trades
+
+    def _write(
+        self, ohlcv: dict[tuple[str, str], list[list]], trades: dict[str, list[list]]
+    ) -> None:
+        """
+        Store buffered data. Runs in the writer thread.
+        Datahandlers supporting incremental appends only write the new data,
+        all others merge it with the stored data.
+        """
+        for (pair, timeframe), candles in ohlcv.items():
+            new_data = ohlcv_to_dataframe(
+                candles, timeframe, pair, fill_missing=False, drop_incomplete=False
+            )
+            if self._ohlcv_handler._incremental_append:
+                self._ohlcv_handler.ohlcv_append(pair, timeframe, new_data, self._candle_type)
+            else:
+                data = self._ohlcv_handler.ohlcv_load(
+                    pair,
+                    timeframe,
+                    candle_type=self._candle_type,
+                    fill_missing=False,
+                    drop_incomplete=False,
+                    warn_no_data=False,
+                )
+                _store_ohlcv_update(
+                    self._ohlcv_handler, pair, timeframe, self._candle_type, data, new_data
+                )
+        for pair, pair_trades in trades.items():
+            new_trades = trades_list_to_df(pair_trades)
+            if self._trades_handler._incremental_append:
+                self._trades_handler.trades_append(pair, new_trades, self._trading_mode)
+            else:
+                stored = self._trades_handler.trades_load(pair, self._trading_mode)
+                self._trades_handler.trades_store(
+                    pair,
+                    trades_df_remove_duplicates(concat([stored, new_trades], ignore_index=True)),
+                    self._trading_mode,
+                )
+        logger.info(
+            f"Stored {sum(len(c) for c in ohlcv.values())} candles "
+            f"and {sum(len(t) for t in trades.values())} trades."
+        )
+
+    async def flush(self) -> None:
+        """
+        Write all buffered data using the writer thread.
+        Failed writes are kept in the buffer and retried on the next flush.
+        """
+        if self._flush_lock is None or self._writer is None:
+            raise OperationalException("Data recorder is not running.")
+        async with self._flush_lock:
+            ohlcv, trades = self._take_buffers()
+            if not ohlcv and not trades:
+                return
+            try:
+                await asyncio.get_running_loop().run_in_executor(
+                    self._writer, self._write, ohlcv, trades
+                )
+            except Exception:
+                logger.exception("Could not store recorded data, retrying on next flush.")
+                for key, candles in ohlcv.items():
+                    self._ohlcv_buffer[key] = self._cap_buffer(
+                        candles + self._ohlcv_buffer[key], f"candles of {key[0]}, {key[1]}"
+                    )
+                for pair, pair_trades in trades.items():
+                    self._trades_buffer[pair] = self._cap_buffer(
+                        pair_trades + self._trades_buffer[pair], f"trades of {pair}"
+                    )
+
+    def _cap_buffer(self, buffer: list[list], name: str) -> list[list]:
+        """
+        Keep at most max_buffer_rows of a buffer which couldn't be written, dropping the oldest.
+        """
+        dropped = len(buffer) - self._max_buffer_rows
+        if dropped <= 0:
+            return buffer
+        logger.warning(
+            f"Dropping the oldest {dropped} unwritten {name}, "
+            f"as the buffer exceeds {self._max_buffer_rows} rows."
+        )
+        return buffer[dropped:]
+
+    async def _flush_loop(self) -> None:
+        while not await self._wait(self._flush_interval):
+            await self.flush()
+
+    async def _run(self) -> None:
+        self._stop_event = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        tasks = [
+            asyncio.create_task(self._record_ohlcv(pair, timeframe))
+            for pair in self._pairs
+            for timeframe in self._timeframes
+        ]
+        if self._record_trades:
+            tasks += [asyncio.create_task(self._record_trades_pair(pair)) for pair in self._pairs]
+        tasks.append(asyncio.create_task(self._flush_loop()))
+        try:
+            await self._stop_event.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.flush()
+
+    def stop(self) -> None:
+        """
+        Stop recording. Buffered data is flushed before run() returns.
+        """
+        if self._stop_event:
+            self._stop_event.set()
+
+    def run(self) -> None:
+        """
+        Record until stopped (or interrupted), flushing remaining data on exit.
+        """
+        self._init_state()
+        logger.info(
+            f"Recording {len(self._pairs)} pairs, timeframes {self._timeframes}"
+            f"{' and trades' if self._record_trades else ''}. Press Ctrl+C to stop."
+        )
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="recorder_writer") as writer:
+            self._writer = writer
+            try:
+                self._exchange.run_coroutine(self._run())
+            except KeyboardInterrupt:
+                logger.info("Recorder interrupted, storing buffered data.")
+                writer.submit(self._write, *self._take_buffers()).result()
+
+
+def record_data_main(config: Config) -> None:
+    from freqtrade.resolvers.exchange_resolver import ExchangeResolver
+
+    # Remove stake-currency to skip checks which are not relevant for data recording
+    config["stake_currency"] = ""
+    exchange = ExchangeResolver.load_exchange(config, validate=False)
+
+    available_pairs = list(exchange.get_markets(tradable_only=True, active_only=True).keys())
+    pairs = dynamic_expand_pairlist(config, available_pairs)
+    if not pairs:
+        raise OperationalException("No pairs available for recording.")
+    timeframes = config.get("timeframes", DL_DATA_TIMEFRAMES)
+    for timeframe in timeframes:
+        exchange.validate_timeframes(timeframe)
+
+    recorder = DataRecorder(
+        exchange,
+        get_datahandler(config["datadir"], config["dataformat_ohlcv"]),
+        get_datahandler(config["datadir"], config["dataformat_trades"]),
+        pairs=pairs,
+        timeframes=timeframes,
+        candle_type=config.get("candle_type_def", CandleType.SPOT),
+        trading_mode=config.get("trading_mode", TradingMode.SPOT),
+        record_trades=bool(config.get("record_trades")),
+        flush_interval=config.get("record_flush_interval", 60),
+        max_buffer_rows=config.get("record_max_buffer_rows", 10000),
+    )
+    recorder.run()
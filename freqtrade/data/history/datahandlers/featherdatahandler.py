@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Iterator
 
 from pandas import DataFrame, read_feather, to_datetime
 
@@ -102,12 +103,15 @@ class FeatherDataHandler(IDataHandler):
         self.create_dir_if_needed(filename)
         data.reset_index(drop=True).to_feather(filename, compression_level=9, compression="lz4")
 
-    def trades_append(self, pair: str, data: DataFrame):
+    def trades_append(
+        self, pair: str, data: DataFrame, trading_mode: TradingMode = TradingMode.SPOT
+    ):
         """
         Append data to existing files
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
         """
         raise NotImplementedError()
 
@@ -130,6 +134,36 @@ class FeatherDataHandler(IDataHandler):
 
         return tradesdata
 
+    def _trades_load_chunks(
+        self, pair: str, trading_mode: TradingMode, chunk_size: int
+    ) -> Iterator[DataFrame]:
+        """
+        Load trades for a pair in chunks, reading the record batches of the file one by one.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param chunk_size: Number of trades per chunk (at least one record batch)
+        :return: Iterator of Dataframes containing trades
+        """
+        from pyarrow import Table, ipc, memory_map
+
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if not filename.exists():
+            return
+        with memory_map(str(filename)) as source:
+            reader = ipc.open_file(source)
+            batches = []
+            rows = 0
+            for idx in range(reader.num_record_batches):
+                batch = reader.get_batch(idx)
+                batches.append(batch)
+                rows += batch.num_rows
+                if rows >= chunk_size:
+                    yield Table.from_batches(batches).to_pandas()
+                    batches = []
+                    rows = 0
+            if batches:
+                yield Table.from_batches(batches).to_pandas()
+
     @classmethod
     def _get_file_extension(cls):
         return "feather"
@@ -7,15 +7,20 @@ It's subclasses handle and storing data from disk.
 import logging
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
 
-from pandas import DataFrame, to_datetime
+from pandas import DataFrame, concat, to_datetime
 
 from freqtrade import misc
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DEFAULT_TRADES_COLUMNS, ListPairsWithTimeframes
+from freqtrade.constants import (
+    DEFAULT_TRADES_COLUMNS,
+    TRADES_CONVERT_CHUNK_SIZE,
+    ListPairsWithTimeframes,
+)
 from freqtrade.data.converter import (
     clean_ohlcv_dataframe,
     trades_convert_types,
@@ -33,6 +38,8 @@ logger = logging.getLogger(__name__)
 class IDataHandler(ABC):
     _OHLCV_REGEX = r"^([a-zA-Z_\d-]+)\-(\d+[a-zA-Z]{1,2})\-?([a-zA-Z_]*)?(?=\.)"
     _TRADES_REGEX = r"^([a-zA-Z_\d-]+)\-(trades)?(?=\.)"
+    # Handlers supporting ohlcv_append without rewriting all stored data
+    _incremental_append = False
 
     def __init__(self, datadir: Path) -> None:
         self._datadir = datadir
@@ -237,12 +244,15 @@ class IDataHandler(ABC):
         """
 
     @abstractmethod
-    def trades_append(self, pair: str, data: DataFrame):
+    def trades_append(
+        self, pair: str, data: DataFrame, trading_mode: TradingMode = TradingMode.SPOT
+    ):
         """
         Append data to existing files
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
         """
 
     @abstractmethod
@@ -303,6 +313,52 @@ class IDataHandler(ABC):
         trades = trades_convert_types(trades)
         return trades
 
+    def _trades_load_chunks(
+        self, pair: str, trading_mode: TradingMode, chunk_size: int
+    ) -> Iterator[DataFrame]:
+        """
+        Load trades for a pair in chunks, in the order they are stored.
+        Formats which can't be read partially load all trades and split them afterwards.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param chunk_size: Number of trades per chunk
+        :return: Iterator of Dataframes containing trades
+        """
+        trades = self._trades_load(pair, trading_mode)
+        for start in range(0, len(trades), chunk_size):
+            yield trades.iloc[start : start + chunk_size]
+
+    def trades_load_chunks(
+        self,
+        pair: str,
+        trading_mode: TradingMode,
+        chunk_size: int = TRADES_CONVERT_CHUNK_SIZE,
+    ) -> Iterator[DataFrame]:
+        """
+        Load trades for a pair in chunks of about chunk_size trades, without loading
+        the whole trades history at once (for formats supporting partial reads).
+        Removes duplicates in the process - trades of the last timestamp of a chunk are
+        held back until the next chunk, so duplicates spanning two chunks are removed as well.
+        Expects trades to be stored in time order.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param chunk_size: Number of trades per chunk
+        :return: Iterator of Dataframes containing trades
+        """
+        pending: DataFrame | None = None
+        for chunk in self._trades_load_chunks(pair, trading_mode, chunk_size):
+            if chunk.empty:
+                continue
+            if pending is None:
+                pending = chunk
+                continue
+            is_last = pending["timestamp"] == pending["timestamp"].iloc[-1]
+            if not is_last.all():
+                yield trades_convert_types(trades_df_remove_duplicates(pending.loc[~is_last]))
+            pending = concat([pending.loc[is_last], chunk], ignore_index=True)
+        if pending is not None:
+            yield trades_convert_types(trades_df_remove_duplicates(pending))
+
     @classmethod
     def create_dir_if_needed(cls, datadir: Path):
         """
@@ -565,6 +621,10 @@ def get_datahandlerclass(datatype: str) -> type[IDataHandler]:
         from .parquetdatahandler import ParquetDataHandler
 
         return ParquetDataHandler
+    elif datatype == "partitioned":
+        from .partitioneddatahandler import PartitionedDataHandler
+
+        return PartitionedDataHandler
     else:
         raise ValueError(f"No datahandler for datatype {datatype} available.")
 
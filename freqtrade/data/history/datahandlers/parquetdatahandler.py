@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Iterator
 
 from pandas import DataFrame, read_parquet, to_datetime
 
@@ -100,12 +101,15 @@ class ParquetDataHandler(IDataHandler):
         self.create_dir_if_needed(filename)
         data.reset_index(drop=True).to_parquet(filename)
 
-    def trades_append(self, pair: str, data: DataFrame):
+    def trades_append(
+        self, pair: str, data: DataFrame, trading_mode: TradingMode = TradingMode.SPOT
+    ):
         """
         Append data to existing files
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
         """
         raise NotImplementedError()
 
@@ -128,6 +132,25 @@ class ParquetDataHandler(IDataHandler):
 
         return tradesdata
 
+    def _trades_load_chunks(
+        self, pair: str, trading_mode: TradingMode, chunk_size: int
+    ) -> Iterator[DataFrame]:
+        """
+        Load trades for a pair in chunks, reading the file batch by batch.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param chunk_size: Number of trades per chunk
+        :return: Iterator of Dataframes containing trades
+        """
+        from pyarrow.parquet import ParquetFile
+
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if not filename.exists():
+            return
+        with ParquetFile(filename) as parquet_file:
+            for batch in parquet_file.iter_batches(batch_size=chunk_size):
+                yield batch.to_pandas()
+
     @classmethod
     def _get_file_extension(cls):
         return "parquet"
@@ -0,0 +1,375 @@
+import logging
+import shutil
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pandas import DataFrame, Series, concat, read_feather, to_datetime
+
+from freqtrade.configuration import TimeRange
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
+from freqtrade.enums import CandleType, TradingMode
+from freqtrade.misc import file_dump_json, file_load_json
+from freqtrade.util import dt_from_ts
+
+from .featherdatahandler import FeatherDataHandler
+
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "manifest.json"
+
+
+class PartitionedDataHandler(FeatherDataHandler):
+    """
+    Stores data as feather partitions within one directory per pair (and timeframe),
+    alongside a manifest describing each partition.
+    OHLCV data is partitioned by month, trades data by day.
+    Appending data only rewrites the partitions touched by the new data,
+    and loading a timerange only reads the overlapping partitions.
+    """
+
+    _columns = DEFAULT_DATAFRAME_COLUMNS
+    _incremental_append = True
+
+    @staticmethod
+    def _ohlcv_partition_names(data: DataFrame) -> Series:
+        return data["date"].dt.strftime("%Y-%m")
+
+    @staticmethod
+    def _trades_partition_names(data: DataFrame) -> Series:
+        return to_datetime(data["timestamp"], unit="ms", utc=True).dt.strftime("%Y-%m-%d")
+
+    @staticmethod
+    def _load_manifest(pair_dir: Path) -> dict[str, dict]:
+        manifest = pair_dir / MANIFEST_FILENAME
+        if not manifest.is_file():
+            return {}
+        return file_load_json(manifest).get("partitions", {})
+
+    @staticmethod
+    def _store_manifest(pair_dir: Path, partitions: dict[str, dict]) -> None:
+        tmp_file = pair_dir / f"{MANIFEST_FILENAME}.tmp"
+        file_dump_json(
+            tmp_file, {"version": 1, "partitions": dict(sorted(partitions.items()))}, log=False
+        )
+        tmp_file.replace(pair_dir / MANIFEST_FILENAME)
+
+    @staticmethod
+    def _selected_partitions(partitions: dict[str, dict], timerange: TimeRange | None) -> list:
+        """
+        Names of all partitions overlapping the timerange
+        """
+        return [
+            name
+            for name, part in sorted(partitions.items())
+            if not timerange
+            or (
+                (timerange.starttype != "date" or part["end"] >= timerange.startts * 1000)
+                and (timerange.stoptype != "date" or part["start"] <= timerange.stopts * 1000)
+            )
+        ]
+
+    @staticmethod
+    def _write_partitions(
+        pair_dir: Path,
+        data: DataFrame,
+        partitions: dict[str, dict],
+        names: Series,
+        ts_column: Series,
+    ) -> None:
+        """
+        Write all partitions contained in data, updating partitions in place.
+        Partitions are written to a temporary file first, so a crash can't corrupt existing data.
+        :param names: Partition name for each row of data
+        :param ts_column: Timestamp (in ms) for each row of data
+        """
+        for name, part in data.groupby(names, sort=True):
+            part_ts = ts_column.loc[part.index]
+            part = part.reset_index(drop=True)
+            tmp_file = pair_dir / f"{name}.feather.tmp"
+            part.to_feather(tmp_file, compression_level=9, compression="lz4")
+            tmp_file.replace(pair_dir / f"{name}.feather")
+            partitions[str(name)] = {
+                "start": int(part_ts.iloc[0]),
+                "end": int(part_ts.iloc[-1]),
+                "rows": len(part),
+            }
+
+    @staticmethod
+    def _read_partitions(pair_dir: Path, names: list[str]) -> DataFrame:
+        return concat(
+            [read_feather(pair_dir / f"{name}.feather") for name in names], ignore_index=True
+        )
+
+    @staticmethod
+    def _manifest_min_max(partitions: dict[str, dict]) -> tuple[datetime, datetime, int]:
+        if not partitions:
+            return (
+                datetime.fromtimestamp(0, tz=timezone.utc),
+                datetime.fromtimestamp(0, tz=timezone.utc),
+                0,
+            )
+        return (
+            dt_from_ts(min(p["start"] for p in partitions.values())),
+            dt_from_ts(max(p["end"] for p in partitions.values())),
+            sum(p["rows"] for p in partitions.values()),
+        )
+
+    @staticmethod
+    def _reset_dir(pair_dir: Path) -> None:
+        if pair_dir.exists():
+            shutil.rmtree(pair_dir)
+        pair_dir.mkdir(parents=True)
+
+    def _ohlcv_write(self, pair_dir: Path, data: DataFrame, partitions: dict[str, dict]) -> None:
+        data = data.loc[:, self._columns]
+        self._write_partitions(
+            pair_dir,
+            data,
+            partitions,
+            self._ohlcv_partition_names(data),
+            data["date"].dt.as_unit("ms").astype("int64"),
+        )
+        self._store_manifest(pair_dir, partitions)
+
+    def ohlcv_store(
+        self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
+    ) -> None:
+        """
+        Store data, replacing all existing partitions.
+        Empty data keeps the stored partitions.
+        :param pair: Pair - used to generate filename
+        :param timeframe: Timeframe - used to generate filename
+        :param data: Dataframe containing OHLCV data
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: None
+        """
+        if data.empty:
+            return
+        pair_dir = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        self._reset_dir(pair_dir)
+        self._ohlcv_write(pair_dir, data, {})
+
+    def _ohlcv_load(
+        self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
+    ) -> DataFrame:
+        """
+        Internal method used to load data for one pair from disk.
+        Only partitions overlapping the timerange are read.
+        Timerange trimming and dataframe validation happens outside of this method.
+        :param pair: Pair to load data
+        :param timeframe: Timeframe (e.g. "5m")
+        :param timerange: Limit data to be loaded to this timerange.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: DataFrame with ohlcv data, or empty DataFrame
+        """
+        pair_dir = self._pair_data_filename(self._datadir, pair, timeframe, candle_type=candle_type)
+        if not pair_dir.exists():
+            # Fallback mode for 1M files
+            pair_dir = self._pair_data_filename(
+                self._datadir, pair, timeframe, candle_type=candle_type, no_timeframe_modify=True
+            )
+            if not pair_dir.exists():
+                return DataFrame(columns=self._columns)
+        try:
+            names = self._selected_partitions(self._load_manifest(pair_dir), timerange)
+            if not names:
+                return DataFrame(columns=self._columns)
+            pairdata = self._read_partitions(pair_dir, names)
+            pairdata.columns = self._columns
+            pairdata = pairdata.astype(
+                dtype={
+                    "open": "float",
+                    "high": "float",
+                    "low": "float",
+                    "close": "float",
+                    "volume": "float",
+                }
+            )
+            pairdata["date"] = to_datetime(pairdata["date"], unit="ms", utc=True)
+            return pairdata
+        except Exception as e:
+            logger.exception(
+                f"Error loading data from {pair_dir}. Exception: {e}. Returning empty dataframe."
+            )
+            return DataFrame(columns=self._columns)
+
+    def ohlcv_append(
+        self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
+    ) -> None:
+        """
+        Append data to existing data structures.
+        Only partitions overlapping the new data are rewritten.
+        Candles in data replace stored candles with the same date.
+        :param pair: Pair
+        :param timeframe: Timeframe this ohlcv data is for
+        :param data: Data to append.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        """
+        if data.empty:
+            return
+        pair_dir = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not pair_dir.exists():
+            self.ohlcv_store(pair, timeframe, data, candle_type)
+            return
+        partitions = self._load_manifest(pair_dir)
+        data = data.loc[:, self._columns]
+        touched = [n for n in self._ohlcv_partition_names(data).unique() if n in partitions]
+        if touched:
+            existing = self._read_partitions(pair_dir, touched)
+            existing.columns = self._columns
+            data = concat([existing, data], ignore_index=True)
+            data["date"] = to_datetime(data["date"], unit="ms", utc=True)
+        data = data.drop_duplicates(subset="date", keep="last").sort_values("date")
+        self._ohlcv_write(pair_dir, data.reset_index(drop=True), partitions)
+
+    def ohlcv_data_min_max(
+        self, pair: str, timeframe: str, candle_type: CandleType
+    ) -> tuple[datetime, datetime, int]:
+        """
+        Returns the min and max timestamp for the given pair and timeframe.
+        Uses the manifest, so no partition needs to be loaded.
+        :param pair: Pair to get min/max for
+        :param timeframe: Timeframe to get min/max for
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: (min, max, len)
+        """
+        pair_dir = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        return self._manifest_min_max(self._load_manifest(pair_dir))
+
+    def ohlcv_purge(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
+        """
+        Remove data for this pair
+        :param pair: Delete data for this pair.
+        :param timeframe: Timeframe (e.g. "5m")
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: True when deleted, false if the directory did not exist.
+        """
+        pair_dir = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if pair_dir.is_dir():
+            shutil.rmtree(pair_dir)
+            return True
+        return False
+
+    def _trades_write(self, pair_dir: Path, data: DataFrame, partitions: dict[str, dict]) -> None:
+        data = data.loc[:, DEFAULT_TRADES_COLUMNS]
+        self._write_partitions(
+            pair_dir, data, partitions, self._trades_partition_names(data), data["timestamp"]
+        )
+        self._store_manifest(pair_dir, partitions)
+
+    def _trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
+        """
+        Store trades data, replacing all existing partitions.
+        Empty data keeps the stored partitions.
+        :param pair: Pair - used for filename
+        :param data: Dataframe containing trades
+                     column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        """
+        if data.empty:
+            return
+        pair_dir = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        self._reset_dir(pair_dir)
+        self._trades_write(pair_dir, data, {})
+
+    def trades_append(
+        self, pair: str, data: DataFrame, trading_mode: TradingMode = TradingMode.SPOT
+    ):
+        """
+        Append data to existing files.
+        Only the partitions (days) touched by the new trades are rewritten.
+        :param pair: Pair - used for filename
+        :param data: Dataframe containing trades
+                     column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        """
+        if data.empty:
+            return
+        pair_dir = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if not pair_dir.exists():
+            self.trades_store(pair, data, trading_mode)
+            return
+        partitions = self._load_manifest(pair_dir)
+        data = data.loc[:, DEFAULT_TRADES_COLUMNS]
+        touched = [n for n in self._trades_partition_names(data).unique() if n in partitions]
+        if touched:
+            data = concat([self._read_partitions(pair_dir, touched), data], ignore_index=True)
+        data = data.drop_duplicates(subset=["timestamp", "id"], keep="last").sort_values(
+            "timestamp", kind="stable"
+        )
+        self._trades_write(pair_dir, data.reset_index(drop=True), partitions)
+
+    def _trades_load(
+        self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
+    ) -> DataFrame:
+        """
+        Load trades for a pair, reading only partitions overlapping the timerange.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param timerange: Timerange to load trades for - used to select partitions
+        :return: Dataframe containing trades
+        """
+        pair_dir = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if not pair_dir.exists():
+            return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
+        names = self._selected_partitions(self._load_manifest(pair_dir), timerange)
+        if not names:
+            return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
+        return self._read_partitions(pair_dir, names)
+
+    def _trades_load_chunks(
+        self, pair: str, trading_mode: TradingMode, chunk_size: int
+    ) -> Iterator[DataFrame]:
+        """
+        Load trades for a pair in chunks, combining partitions up to chunk_size trades.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param chunk_size: Number of trades per chunk (at least one partition)
+        :return: Iterator of Dataframes containing trades
+        """
+        pair_dir = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if not pair_dir.exists():
+            return
+        names: list[str] = []
+        rows = 0
+        for name, part in sorted(self._load_manifest(pair_dir).items()):
+            names.append(name)
+            rows += part["rows"]
+            if rows >= chunk_size:
+                yield self._read_partitions(pair_dir, names)
+                names = []
+                rows = 0
+        if names:
+            yield self._read_partitions(pair_dir, names)
+
+    def trades_data_min_max(
+        self, pair: str, trading_mode: TradingMode
+    ) -> tuple[datetime, datetime, int]:
+        """
+        Returns the min and max timestamp for the given pair's trades data.
+        Uses the manifest, so no partition needs to be loaded.
+        :param pair: Pair to get min/max for
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :return: (min, max, len)
+        """
+        pair_dir = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        return self._manifest_min_max(self._load_manifest(pair_dir))
+
+    def trades_purge(self, pair: str, trading_mode: TradingMode) -> bool:
+        """
+        Remove data for this pair
+        :param pair: Delete data for this pair.
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :return: True when deleted, false if the directory did not exist.
+        """
+        pair_dir = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if pair_dir.is_dir():
+            shutil.rmtree(pair_dir)
+            return True
+        return False
+
+    @classmethod
+    def _get_file_extension(cls):
+        return "partitioned"
@@ -0,0 +1,236 @@
+"""
+Concurrent, resumable OHLCV download for the download-data subcommand.
+
+Downloads run concurrently on the exchange's async loop (throttled by ccxt's rate limiter),
+while a single writer thread loads and stores data through the datahandler,
+so network and disk work overlap.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from pandas import DataFrame
+
+from freqtrade.configuration import TimeRange
+from freqtrade.data.history.datahandlers import IDataHandler
+from freqtrade.data.history.history_utils import (
+    _load_cached_data_for_updating,
+    _store_ohlcv_update,
+)
+from freqtrade.enums import CandleType
+from freqtrade.exchange import Exchange
+from freqtrade.misc import file_dump_json, file_load_json
+from freqtrade.util import format_ms_time
+
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILENAME = ".download-data-checkpoint.json"
+
+
+@dataclass(frozen=True)
+class OhlcvDownloadJob:
+    pair: str
+    timeframe: str
+    candle_type: CandleType
+
+    @property
+    def key(self) -> str:
+        return f"{self.pair}|{self.timeframe}|{self.candle_type.value}"
+
+
+class DownloadCheckpoint:
+    """
+    Tracks completed download jobs in a small json file within the data directory.
+    An interrupted run with identical settings skips jobs which already completed.
+    The checkpoint is removed once a run completes without failures.
+    """
+
+    def __init__(self, datadir: Path, signature: str) -> None:
+        self._file = datadir / CHECKPOINT_FILENAME
+        self._signature = signature
+        self._completed: set[str] = set()
+        if self._file.is_file():
+            try:
+                data = file_load_json(self._file)
+            except Exception:
+                logger.warning(f"Could not read download checkpoint {self._file}, ignoring.")
+                data = None
+            if data and data.get("signature") == signature:
+                self._completed = set(data.get("completed", []))
+                logger.info(
+                    f"Resuming interrupted download, {len(self._completed)} jobs already done."
+                )
+
+    def is_completed(self, job: OhlcvDownloadJob) -> bool:
+        return job.key in self._completed
+
+    def mark_completed(self, job: OhlcvDownloadJob) -> None:
+        self._completed.add(job.key)
+        tmp_file = self._file.with_suffix(".tmp")
+        file_dump_json(
+            tmp_file,
+            {"signature": self._signature, "completed": sorted(self._completed)},
+            log=False,
+        )
+        tmp_file.replace(self._file)
+
+    def clear(self) -> None:
+        self._completed = set()
+        self._file.unlink(missing_ok=True)
+
+
+class OhlcvDownloadScheduler:
+    """
+    Run many (pair, timeframe, candle_type) downloads concurrently.
+    """
+
+    def __init__(
+        self,
+        exchange: Exchange,
+        datadir: Path,
+        data_handler: IDataHandler,
+        *,
+        pairs: list[str],
+        concurrency: int,
+        timerange: TimeRange | None = None,
+        new_pairs_days: int = 30,
+        erase: bool = False,
+        prepend: bool = False,
+    ) -> None:
+        self._exchange = exchange
+        self._datadir = datadir
+        self._data_handler = data_handler
+        self._concurrency = max(concurrency, 1)
+        self._timerange = timerange
+        self._new_pairs_days = new_pairs_days
+        self._erase = erase
+        self._prepend = prepend
+        signature = "|".join(
+            [
+                exchange.id,
+                str(exchange.trading_mode),
+                ",".join(sorted(pairs)),
+                data_handler._get_file_extension(),
+                str(timerange.timerange_str) if timerange else "",
+                str(new_pairs_days),
+                str(erase),
+                str(prepend),
+            ]
+        )
+        self.checkpoint = DownloadCheckpoint(datadir, signature)
+
+    def _prepare(self, job: OhlcvDownloadJob) -> tuple[DataFrame, int | None, int | None]:
+        """Runs in the writer thread"""
+        if self._erase:
+            if self._data_handler.ohlcv_purge(job.pair, job.timeframe, job.candle_type):
+                logger.info(
+                    f"Deleting existing data for pair {job.pair}, {job.timeframe}, "
+                    f"{job.candle_type}."
+                )
+        return _load_cached_data_for_updating(
+            job.pair,
+            job.timeframe,
+            self._timerange,
+            data_handler=self._data_handler,
+            candle_type=job.candle_type,
+            prepend=self._prepend,
+        )
+
+    def _store(self, job: OhlcvDownloadJob, data: DataFrame, new_data: DataFrame) -> None:
+        """Runs in the writer thread"""
+        _store_ohlcv_update(
+            self._data_handler, job.pair, job.timeframe, job.candle_type, data, new_data
+        )
+        self.checkpoint.mark_completed(job)
+
+    async def _download_job(
+        self,
+        job: OhlcvDownloadJob,
+        writer: ThreadPoolExecutor,
+        dl_semaphore: asyncio.Semaphore,
+        write_semaphore: asyncio.Semaphore,
+    ) -> bool:
+        loop = asyncio.get_running_loop()
+        try:
+            # Limit downloaded, but not yet stored results to keep memory bounded.
+            async with write_semaphore:
+                async with dl_semaphore:
+                    data, since_ms, until_ms = await loop.run_in_executor(
+                        writer, self._prepare, job
+                    )
+                    logger.info(
+                        f'Download history data for "{job.pair}", {job.timeframe}, '
+                        f"{job.candle_type} and store in {self._datadir}. "
+                        f"From {format_ms_time(since_ms) if since_ms else 'start'} to "
+                        f"{format_ms_time(until_ms) if until_ms else 'now'}"
+                    )
+                    new_data = await self._exchange._async_get_historic_ohlcv_df(
+                        pair=job.pair,
+                        timeframe=job.timeframe,
+                        since_ms=(
+                            since_ms
+                            if since_ms
+                            else int(
+                                (datetime.now() - timedelta(days=self._new_pairs_days)).timestamp()
+                            )
+                            * 1000
+                        ),
+                        is_new_pair=data.empty,
+                        candle_type=job.candle_type,
+                        until_ms=until_ms if until_ms else None,
+                    )
+                logger.info(f"Downloaded data for {job.pair} with length {len(new_data)}.")
+                await loop.run_in_executor(writer, self._store, job, data, new_data)
+            return True
+        except Exception:
+            logger.exception(
+                f'Failed to download history data for pair: "{job.pair}", '
+                f"timeframe: {job.timeframe}, candle type: {job.candle_type}."
+            )
+            return False
+
+    async def _run(
+        self, jobs: list[OhlcvDownloadJob], job_done: Callable[[OhlcvDownloadJob], None] | None
+    ) -> list[OhlcvDownloadJob]:
+        dl_semaphore = asyncio.Semaphore(self._concurrency)
+        write_semaphore = asyncio.Semaphore(self._concurrency * 2)
+        failed: list[OhlcvDownloadJob] = []
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="ohlcv_writer") as writer:
+
+            async def run_job(job: OhlcvDownloadJob) -> None:
+                if not await self._download_job(job, writer, dl_semaphore, write_semaphore):
+                    failed.append(job)
+                if job_done:
+                    job_done(job)
+
+            await asyncio.gather(*(run_job(job) for job in jobs))
+        return failed
+
+    def run(
+        self,
+        jobs: list[OhlcvDownloadJob],
+        job_done: Callable[[OhlcvDownloadJob], None] | None = None,
+    ) -> list[OhlcvDownloadJob]:
+        """
+        Download all jobs not yet completed according to the checkpoint.
+        :param jobs: Jobs to download
+        :param job_done: Callback, called after each job (successful or not)
+        :return: List of failed jobs
+        """
+        pending = [job for job in jobs if not self.checkpoint.is_completed(job)]
+        for job in jobs:
+            if job not in pending and job_done:
+                job_done(job)
+        logger.info(
+            f"Downloading {len(pending)} jobs using up to {self._concurrency} concurrent downloads."
+        )
+        failed = self._exchange.run_coroutine(self._run(pending, job_done))
+        if not failed:
+            self.checkpoint.clear()
+        return failed
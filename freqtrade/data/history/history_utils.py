@@ -6,7 +6,13 @@ from pathlib import Path
 from pandas import DataFrame, concat
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DATETIME_PRINT_FORMAT, DL_DATA_TIMEFRAMES, DOCS_LINK, Config
+from freqtrade.constants import (
+    DATETIME_PRINT_FORMAT,
+    DEFAULT_DATAFRAME_COLUMNS,
+    DL_DATA_TIMEFRAMES,
+    DOCS_LINK,
+    Config,
+)
 from freqtrade.data.converter import (
     clean_ohlcv_dataframe,
     convert_trades_to_ohlcv,
@@ -16,7 +22,7 @@ from freqtrade.data.converter import (
 from freqtrade.data.history.datahandlers import IDataHandler, get_datahandler
 from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exceptions import OperationalException
-from freqtrade.exchange import Exchange
+from freqtrade.exchange import Exchange, timeframe_to_seconds
 from freqtrade.plugins.pairlist.pairlist_helpers import dynamic_expand_pairlist
 from freqtrade.util import dt_now, dt_ts, format_ms_time, format_ms_time_det
 from freqtrade.util.migrations import migrate_data
@@ -183,37 +189,120 @@ def _load_cached_data_for_updating(
         if timerange.stoptype == "date":
             end = timerange.stopdt
 
-    # Intentionally don't pass timerange in - since we need to load the full dataset.
-    data = data_handler.ohlcv_load(
-        pair,
-        timeframe=timeframe,
-        timerange=None,
-        fill_missing=False,
-        drop_incomplete=True,
-        warn_no_data=False,
-        candle_type=candle_type,
-    )
-    if not data.empty:
+    if data_handler._incremental_append:
+        # Only load the boundary of the stored data - new data is appended without
+        # rewriting the full history.
+        data, data_start, data_end = _load_boundary_data_for_updating(
+            pair, timeframe, data_handler, candle_type, prepend
+        )
+    else:
+        # Intentionally don't pass timerange in - since we need to load the full dataset.
+        data = data_handler.ohlcv_load(
+            pair,
+            timeframe=timeframe,
+            timerange=None,
+            fill_missing=False,
+            drop_incomplete=True,
+            warn_no_data=False,
+            candle_type=candle_type,
+        )
+        data_start = data.iloc[0]["date"] if not data.empty else None
+        data_end = data.iloc[-1]["date"] if not data.empty else None
+    if data_start is not None and data_end is not None:
         if prepend:
-            end = data.iloc[0]["date"]
+            end = data_start
         else:
-            if start and start < data.iloc[0]["date"]:
+            if start and start < data_start:
                 # Earlier data than existing data requested, Update start date
                 logger.info(
                     f"{pair}, {timeframe}, {candle_type}: "
                     f"Requested start date {start:{DATETIME_PRINT_FORMAT}} earlier than local "
-                    f"data start date {data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}. "
+                    f"data start date {data_start:{DATETIME_PRINT_FORMAT}}. "
                     f"Use `--prepend` to download data prior "
-                    f"to {data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}, or "
+                    f"to {data_start:{DATETIME_PRINT_FORMAT}}, or "
                     "`--erase` to redownload all data."
                 )
-            start = data.iloc[-1]["date"]
+            start = data_end
 
     start_ms = int(start.timestamp() * 1000) if start else None
     end_ms = int(end.timestamp() * 1000) if end else None
     return data, start_ms, end_ms
 
 
+def _load_boundary_data_for_updating(
+    pair: str,
+    timeframe: str,
+    data_handler: IDataHandler,
+    candle_type: CandleType,
+    prepend: bool,
+) -> tuple[DataFrame, datetime | None, datetime | None]:
+    """
+    Load only the first (prepend) or last candles of the stored data.
+    Used for datahandlers supporting incremental appends.
+    Whether data is stored is decided from the datahandler's metadata, not from the
+    boundary data - which can be empty (e.g. a gap in the stored data) while history exists.
+    :return: Tuple of (boundary data, start date of the stored data,
+        date to resume downloading from). Dates are None if no data is stored.
+    """
+    data_start, data_end, length = data_handler.ohlcv_data_min_max(pair, timeframe, candle_type)
+    if not length:
+        return DataFrame(columns=DEFAULT_DATAFRAME_COLUMNS), None, None
+    tf_seconds = timeframe_to_seconds(timeframe)
+    if prepend:
+        timerange = TimeRange(None, "date", 0, int(data_start.timestamp()) + tf_seconds * 2)
+    else:
+        timerange = TimeRange("date", None, int(data_end.timestamp()) - tf_seconds * 2, 0)
+    data = data_handler.ohlcv_load(
+        pair,
+        timeframe=timeframe,
+        timerange=timerange,
+        fill_missing=False,
+        drop_incomplete=False,
+        warn_no_data=False,
+        candle_type=candle_type,
+    )
+    if not prepend and len(data) > 1:
+        # The last stored candle may be incomplete - download it again.
+        data = data.iloc[:-1]
+    resume_date = data.iloc[-1]["date"] if not data.empty else data_end
+    return data, data_start, resume_date
+
+
+def _store_ohlcv_update(
+    data_handler: IDataHandler,
+    pair: str,
+    timeframe: str,
+    candle_type: CandleType,
+    data: DataFrame,
+    new_data: DataFrame,
+) -> DataFrame:
+    """
+    Store newly downloaded data alongside the existing data.
+    Datahandlers supporting incremental appends only write the new data.
+    :param data: Existing data as returned by _load_cached_data_for_updating
+    :param new_data: Newly downloaded data
+    :return: Dataframe which was written
+    """
+    if data_handler._incremental_append:
+        # Never replace the stored history - appending to a pair without data stores it.
+        data_handler.ohlcv_append(pair, timeframe, data=new_data, candle_type=candle_type)
+        return new_data
+    if data.empty:
+        data_handler.ohlcv_store(pair, timeframe, data=new_data, candle_type=candle_type)
+        return new_data
+    # Run cleaning again to ensure there were no duplicate candles
+    # Especially between existing and new data.
+    data = clean_ohlcv_dataframe(
+        concat([data, new_data], axis=0),
+        timeframe,
+        pair,
+        fill_missing=False,
+        drop_incomplete=False,
+    )
+    data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
+    return data
+
+
 def _download_pair_history(
     pair: str,
     *,
@@ -286,18 +375,7 @@ def _download_pair_history(
             until_ms=until_ms if until_ms else None,
         )
         logger.info(f"Downloaded data for {pair} with length {len(new_dataframe)}.")
-        if data.empty:
-            data = new_dataframe
-        else:
-            # Run cleaning again to ensure there were no duplicate candles
-            # Especially between existing and new data.
-            data = clean_ohlcv_dataframe(
-                concat([data, new_dataframe], axis=0),
-                timeframe,
-                pair,
-                fill_missing=False,
-                drop_incomplete=False,
-            )
+        data = _store_ohlcv_update(data_handler, pair, timeframe, candle_type, data, new_dataframe)
 
         logger.debug(
             "New Start: %s",
@@ -307,8 +385,6 @@ def _download_pair_history(
             "New End: %s",
             f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
         )
-
-        data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
         return True
 
     except Exception:
@@ -330,10 +406,13 @@ def refresh_backtest_ohlcv_data(
     data_format: str | None = None,
     prepend: bool = False,
     progress_tracker: CustomProgress | None = None,
+    concurrency: int = 1,
 ) -> list[str]:
     """
     Refresh stored ohlcv data for backtesting and hyperopt operations.
     Used by freqtrade download-data subcommand.
+    :param concurrency: Number of concurrent downloads. Values > 1 use the
+        resumable concurrent download scheduler.
     :return: List of pairs that are not available.
     """
     progress_tracker = retrieve_progress_tracker(progress_tracker)
@@ -341,6 +420,21 @@ def refresh_backtest_ohlcv_data(
     pairs_not_available = []
     data_handler = get_datahandler(datadir, data_format)
     candle_type = CandleType.get_default(trading_mode)
+    if concurrency > 1:
+        return _refresh_backtest_ohlcv_data_concurrent(
+            exchange,
+            pairs=pairs,
+            timeframes=timeframes,
+            datadir=datadir,
+            data_handler=data_handler,
+            trading_mode=trading_mode,
+            timerange=timerange,
+            new_pairs_days=new_pairs_days,
+            erase=erase,
+            prepend=prepend,
+            progress_tracker=progress_tracker,
+            concurrency=concurrency,
+        )
     with progress_tracker as progress:
         tf_length = len(timeframes) if trading_mode != "futures" else len(timeframes) + 2
         timeframe_task = progress.add_task("Timeframe", total=tf_length)
@@ -404,6 +498,76 @@ def refresh_backtest_ohlcv_data(
     return pairs_not_available
 
 
+def _refresh_backtest_ohlcv_data_concurrent(
+    exchange: Exchange,
+    *,
+    pairs: list[str],
+    timeframes: list[str],
+    datadir: Path,
+    data_handler: IDataHandler,
+    trading_mode: str,
+    timerange: TimeRange | None,
+    new_pairs_days: int,
+    erase: bool,
+    prepend: bool,
+    progress_tracker: CustomProgress,
+    concurrency: int,
+) -> list[str]:
+    """
+    Concurrent variant of refresh_backtest_ohlcv_data.
+    Downloads all (pair, timeframe, candle_type) combinations through the download scheduler.
+    :return: List of pairs that are not available.
+    """
+    from freqtrade.data.history.download_scheduler import (
+        OhlcvDownloadJob,
+        OhlcvDownloadScheduler,
+    )
+
+    pairs_not_available = []
+    candle_type = CandleType.get_default(trading_mode)
+    jobs: list[OhlcvDownloadJob] = []
+    for pair in pairs:
+        if pair not in exchange.markets:
+            pairs_not_available.append(f"{pair}: Pair not available on exchange.")
+            logger.info(f"Skipping pair {pair}...")
+            continue
+        for timeframe in timeframes:
+            jobs.append(OhlcvDownloadJob(pair, str(timeframe), candle_type))
+        if trading_mode == "futures":
+            tf_mark = exchange.get_option("mark_ohlcv_timeframe")
+            tf_funding_rate = exchange.get_option("funding_fee_timeframe")
+            fr_candle_type = CandleType.from_string(exchange.get_option("mark_ohlcv_price"))
+            jobs.append(OhlcvDownloadJob(pair, str(tf_funding_rate), CandleType.FUNDING_RATE))
+            jobs.append(OhlcvDownloadJob(pair, str(tf_mark), fr_candle_type))
+
+    scheduler = OhlcvDownloadScheduler(
+        exchange,
+        datadir,
+        data_handler,
+        pairs=pairs,
+        concurrency=concurrency,
+        timerange=timerange,
+        new_pairs_days=new_pairs_days,
+        erase=erase,
+        prepend=prepend,
+    )
+    with progress_tracker as progress:
+        job_task = progress.add_task("Downloading data...", total=len(jobs))
+
+        def job_done(job: OhlcvDownloadJob) -> None:
+            progress.update(
+                job_task, advance=1, description=f"Downloaded {job.pair}, {job.timeframe}"
+            )
+
+        failed = scheduler.run(jobs, job_done=job_done)
+
+    if failed:
+        logger.warning(
+            f"{len(failed)} downloads failed. Rerun the same command to resume the download."
+        )
+    return pairs_not_available
+
+
 def _download_trades_history(
     exchange: Exchange,
     pair: str,
@@ -675,6 +839,7 @@ def download_data(
                     data_format_ohlcv=config["dataformat_ohlcv"],
                     data_format_trades=config["dataformat_trades"],
                     candle_type=config.get("candle_type_def", CandleType.SPOT),
+                    workers=config.get("convert_workers", 1),
                 )
         else:
             if not exchange.get_option("ohlcv_has_history", True):
@@ -702,6 +867,7 @@ def download_data(
                 trading_mode=config.get("trading_mode", "spot"),
                 prepend=config.get("prepend_data", False),
                 progress_tracker=progress_tracker,
+                concurrency=config.get("download_concurrency", 1),
             )
     finally:
         if pairs_not_available:
@@ -1,6 +1,6 @@
 import logging
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
 import numpy as np
@@ -113,25 +113,185 @@ def create_cum_profit(
     return df
 
 
-def _calc_drawdown_series(
-    profit_results: pd.DataFrame, *, date_col: str, value_col: str, starting_balance: float
-) -> pd.DataFrame:
-    max_drawdown_df = pd.DataFrame()
-    max_drawdown_df["cumulative"] = profit_results[value_col].cumsum()
-    max_drawdown_df["high_value"] = max_drawdown_df["cumulative"].cummax()
-    max_drawdown_df["drawdown"] = max_drawdown_df["cumulative"] - max_drawdown_df["high_value"]
-    max_drawdown_df["date"] = profit_results.loc[:, date_col]
+@dataclass()
+class DrawDownResult:
+    drawdown_abs: float = 0.0
+    high_date: pd.Timestamp = None
+    low_date: pd.Timestamp = None
+    high_value: float = 0.0
+    low_value: float = 0.0
+    relative_account_drawdown: float = 0.0
+
+
+@dataclass()
+class TradeMetrics:
+    """
+    Metrics of a set of trades - calculated by `calculate_trade_metrics()`.
+    Ratios (sharpe, sortino, calmar) are 0 without a valid date range.
+    """
+
+    trade_count: int = 0
+    profit_total: float = 0.0
+    winning_trades: int = 0
+    losing_trades: int = 0
+    winning_profit: float = 0.0
+    losing_profit: float = 0.0
+    profit_factor: float = 0.0
+    expectancy: float = 0.0
+    expectancy_ratio: float = 100.0
+    sharpe: float = 0.0
+    sortino: float = 0.0
+    calmar: float = 0.0
+    sqn: float = 0.0
+    csum_min: float = 0.0
+    csum_max: float = 0.0
+    # None if there is no drawdown (no losing trade)
+    drawdown: DrawDownResult | None = None
+    relative_drawdown: DrawDownResult | None = None
+    # Drawdown series, sorted by date_col - dates.iloc[order] are their dates
+    dates: pd.Series | None = field(default=None, repr=False)
+    order: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64), repr=False)
+    cumulative: np.ndarray = field(default_factory=lambda: np.empty(0), repr=False)
+    high_value: np.ndarray = field(default_factory=lambda: np.empty(0), repr=False)
+    drawdown_series: np.ndarray = field(default_factory=lambda: np.empty(0), repr=False)
+    drawdown_relative: np.ndarray = field(default_factory=lambda: np.empty(0), repr=False)
+
+
+def _drawdown_result(metrics: TradeMetrics, idx: int) -> DrawDownResult | None:
+    if idx == 0 or metrics.dates is None:
+        return None
+    high_idx = int(np.argmax(metrics.high_value[:idx]))
+    return DrawDownResult(
+        drawdown_abs=abs(metrics.drawdown_series[idx]),
+        high_date=metrics.dates.iloc[metrics.order[high_idx]],
+        low_date=metrics.dates.iloc[metrics.order[idx]],
+        high_value=metrics.cumulative[high_idx],
+        low_value=metrics.cumulative[idx],
+        relative_account_drawdown=metrics.drawdown_relative[idx],
+    )
+
+
+def _calculate_drawdown(
+    metrics: TradeMetrics, profits: np.ndarray, dates: pd.Series, starting_balance: float
+) -> None:
+    metrics.dates = dates
+    # Same (unstable) sort as DataFrame.sort_values()
+    metrics.order = np.argsort(dates.values, kind="quicksort")
+    metrics.cumulative = np.cumsum(profits[metrics.order])
+    metrics.high_value = np.maximum.accumulate(metrics.cumulative)
+    metrics.drawdown_series = metrics.cumulative - metrics.high_value
     if starting_balance:
-        cumulative_balance = starting_balance + max_drawdown_df["cumulative"]
-        max_balance = starting_balance + max_drawdown_df["high_value"]
-        max_drawdown_df["drawdown_relative"] = (max_balance - cumulative_balance) / max_balance
+        cumulative_balance = starting_balance + metrics.cumulative
+        max_balance = starting_balance + metrics.high_value
+        metrics.drawdown_relative = (max_balance - cumulative_balance) / max_balance
     else:
         # NOTE: This is not completely accurate,
         # but might good enough if starting_balance is not available
-        max_drawdown_df["drawdown_relative"] = (
-            max_drawdown_df["high_value"] - max_drawdown_df["cumulative"]
-        ) / max_drawdown_df["high_value"]
-    return max_drawdown_df
+        metrics.drawdown_relative = (metrics.high_value - metrics.cumulative) / metrics.high_value
+    metrics.drawdown = _drawdown_result(metrics, int(np.argmin(metrics.drawdown_series)))
+    if not np.isnan(metrics.drawdown_relative).all():
+        metrics.relative_drawdown = _drawdown_result(
+            metrics, int(np.nanargmax(metrics.drawdown_relative))
+        )
+
+
+def calculate_trade_metrics(
+    trades: pd.DataFrame,
+    min_date: datetime | None = None,
+    max_date: datetime | None = None,
+    starting_balance: float = 0.0,
+    *,
+    date_col: str = "close_date",
+    value_col: str = "profit_abs",
+) -> TradeMetrics:
+    """
+    Calculate all trade metrics in one pass over the trade columns.
+    The calculate_* functions below return parts of this result.
+    :param trades: DataFrame containing trades (requires column value_col,
+        drawdowns also date_col)
+    :param min_date: Start of the backtest period
+    :param max_date: End of the backtest period
+    :param starting_balance: Portfolio starting balance
+    :param date_col: Column in DataFrame to order the trades by (defaults to 'close_date')
+    :param value_col: Column in DataFrame to use for values (defaults to 'profit_abs')
+    :return: TradeMetrics object
+    """
+    metrics = TradeMetrics()
+    trade_count = len(trades)
+    if trade_count == 0:
+        return metrics
+
+    profits = trades[value_col].to_numpy(dtype=np.float64)
+    with np.errstate(all="ignore"):
+        wins = profits[profits > 0]
+        losses = profits[profits < 0]
+        metrics.trade_count = trade_count
+        metrics.profit_total = profits.sum()
+        metrics.winning_trades = len(wins)
+        metrics.losing_trades = len(losses)
+        metrics.winning_profit = wins.sum()
+        metrics.losing_profit = losses.sum()
+        if metrics.losing_profit:
+            metrics.profit_factor = metrics.winning_profit / abs(metrics.losing_profit)
+
+        # Expectancy
+        average_win = (metrics.winning_profit / len(wins)) if len(wins) > 0 else 0
+        average_loss = (abs(metrics.losing_profit) / len(losses)) if len(losses) > 0 else 0
+        winrate = len(wins) / trade_count
+        loserate = len(losses) / trade_count
+        metrics.expectancy = (winrate * average_win) - (loserate * average_loss)
+        if average_loss > 0:
+            risk_reward_ratio = average_win / average_loss
+            metrics.expectancy_ratio = ((1 + risk_reward_ratio) * winrate) - 1
+
+        # Wallet high / low points, in order of the trades
+        csum = np.cumsum(profits)
+        metrics.csum_min = csum.min() + starting_balance
+        metrics.csum_max = csum.max() + starting_balance
+
+        if date_col in trades.columns:
+            _calculate_drawdown(metrics, profits, trades[date_col], starting_balance)
+
+        # SQN
+        total_profit = profits / starting_balance
+        profits_std = total_profit.std(ddof=1) if trade_count > 1 else np.nan
+        if profits_std != 0 and not np.isnan(profits_std):
+            sqn = math.sqrt(trade_count) * (total_profit.mean() / profits_std)
+        else:
+            # Define negative SQN to indicate this is NOT optimal
+            sqn = -100.0
+        metrics.sqn = round(sqn, 4)
+
+        if min_date is None or max_date is None or min_date == max_date:
+            return metrics
+        days_period = max(1, (max_date - min_date).days)
+        expected_returns_mean = total_profit.sum() / days_period
+
+        # Sharpe
+        up_stdev = total_profit.std()
+        if up_stdev != 0:
+            metrics.sharpe = expected_returns_mean / up_stdev * np.sqrt(365)
+        else:
+            # Define high (negative) sharpe ratio to be clear that this is NOT optimal.
+            metrics.sharpe = -100
+
+        # Sortino
+        down_stdev = (losses / starting_balance).std() if len(losses) > 0 else np.nan
+        if down_stdev != 0 and not np.isnan(down_stdev):
+            metrics.sortino = expected_returns_mean / down_stdev * np.sqrt(365)
+        else:
+            # Define high (negative) sortino ratio to be clear that this is NOT optimal.
+            metrics.sortino = -100
+
+        # Calmar
+        max_drawdown = metrics.drawdown.relative_account_drawdown if metrics.drawdown else 0
+        if max_drawdown != 0:
+            calmar_returns_mean = metrics.profit_total / starting_balance / days_period * 100
+            metrics.calmar = calmar_returns_mean / max_drawdown * math.sqrt(365)
+        else:
+            # Define high (negative) calmar ratio to be clear that this is NOT optimal.
+            metrics.calmar = -100
+    return metrics
 
 
 def calculate_underwater(
@@ -152,22 +312,20 @@ def calculate_underwater(
     """
     if len(trades) == 0:
         raise ValueError("Trade dataframe empty.")
-    profit_results = trades.sort_values(date_col).reset_index(drop=True)
-    max_drawdown_df = _calc_drawdown_series(
-        profit_results, date_col=date_col, value_col=value_col, starting_balance=starting_balance
+    metrics = calculate_trade_metrics(
+        trades, starting_balance=starting_balance, date_col=date_col, value_col=value_col
+    )
+    if metrics.dates is None:
+        raise ValueError(f"Trade dataframe has no column {date_col}.")
+    return pd.DataFrame(
+        {
+            "cumulative": metrics.cumulative,
+            "high_value": metrics.high_value,
+            "drawdown": metrics.drawdown_series,
+            "date": metrics.dates.iloc[metrics.order].reset_index(drop=True),
+            "drawdown_relative": metrics.drawdown_relative,
+        }
     )
-
-    return max_drawdown_df
-
-
-@dataclass()
-class DrawDownResult:
-    drawdown_abs: float = 0.0
-    high_date: pd.Timestamp = None
-    low_date: pd.Timestamp = None
-    high_value: float = 0.0
-    low_value: float = 0.0
-    relative_account_drawdown: float = 0.0
 
 
 def calculate_max_drawdown(
@@ -191,34 +349,13 @@ def calculate_max_drawdown(
     """
     if len(trades) == 0:
         raise ValueError("Trade dataframe empty.")
-    profit_results = trades.sort_values(date_col).reset_index(drop=True)
-    max_drawdown_df = _calc_drawdown_series(
-        profit_results, date_col=date_col, value_col=value_col, starting_balance=starting_balance
-    )
-
-    idxmin = (
-        max_drawdown_df["drawdown_relative"].idxmax()
-        if relative
-        else max_drawdown_df["drawdown"].idxmin()
+    metrics = calculate_trade_metrics(
+        trades, starting_balance=starting_balance, date_col=date_col, value_col=value_col
     )
-    if idxmin == 0:
+    drawdown = metrics.relative_drawdown if relative else metrics.drawdown
+    if drawdown is None:
         raise ValueError("No losing trade, therefore no drawdown.")
-    high_date = profit_results.loc[max_drawdown_df.iloc[:idxmin]["high_value"].idxmax(), date_col]
-    low_date = profit_results.loc[idxmin, date_col]
-    high_val = max_drawdown_df.loc[
-        max_drawdown_df.iloc[:idxmin]["high_value"].idxmax(), "cumulative"
-    ]
-    low_val = max_drawdown_df.loc[idxmin, "cumulative"]
-    max_drawdown_rel = max_drawdown_df.loc[idxmin, "drawdown_relative"]
-
-    return DrawDownResult(
-        drawdown_abs=abs(max_drawdown_df.loc[idxmin, "drawdown"]),
-        high_date=high_date,
-        low_date=low_date,
-        high_value=high_val,
-        low_value=low_val,
-        relative_account_drawdown=max_drawdown_rel,
-    )
+    return drawdown
 
 
 def calculate_csum(trades: pd.DataFrame, starting_balance: float = 0) -> tuple[float, float]:
@@ -293,24 +430,7 @@ def calculate_sortino(
     :param trades: DataFrame containing trades (requires columns profit_abs)
     :return: sortino
     """
-    if (len(trades) == 0) or (min_date is None) or (max_date is None) or (min_date == max_date):
-        return 0
-
-    total_profit = trades["profit_abs"] / starting_balance
-    days_period = max(1, (max_date - min_date).days)
-
-    expected_returns_mean = total_profit.sum() / days_period
-
-    down_stdev = np.std(trades.loc[trades["profit_abs"] < 0, "profit_abs"] / starting_balance)
-
-    if down_stdev != 0 and not np.isnan(down_stdev):
-        sortino_ratio = expected_returns_mean / down_stdev * np.sqrt(365)
-    else:
-        # Define high (negative) sortino ratio to be clear that this is NOT optimal.
-        sortino_ratio = -100
-
-    # print(expected_returns_mean, down_stdev, sortino_ratio)
-    return sortino_ratio
+    return calculate_trade_metrics(trades, min_date, max_date, starting_balance).sortino
 
 
 def calculate_sharpe(
@@ -321,23 +441,7 @@ def calculate_sharpe(
     :param trades: DataFrame containing trades (requires column profit_abs)
     :return: sharpe
     """
-    if (len(trades) == 0) or (min_date is None) or (max_date is None) or (min_date == max_date):
-        return 0
-
-    total_profit = trades["profit_abs"] / starting_balance
-    days_period = max(1, (max_date - min_date).days)
-
-    expected_returns_mean = total_profit.sum() / days_period
-    up_stdev = np.std(total_profit)
-
-    if up_stdev != 0:
-        sharp_ratio = expected_returns_mean / up_stdev * np.sqrt(365)
-    else:
-        # Define high (negative) sharpe ratio to be clear that this is NOT optimal.
-        sharp_ratio = -100
-
-    # print(expected_returns_mean, up_stdev, sharp_ratio)
-    return sharp_ratio
+    return calculate_trade_metrics(trades, min_date, max_date, starting_balance).sharpe
 
 
 def calculate_calmar(
@@ -348,33 +452,7 @@ def calculate_calmar(
     :param trades: DataFrame containing trades (requires columns close_date and profit_abs)
     :return: calmar
     """
-    if (len(trades) == 0) or (min_date is None) or (max_date is None) or (min_date == max_date):
-        return 0
-
-    total_profit = trades["profit_abs"].sum() / starting_balance
-    days_period = max(1, (max_date - min_date).days)
-
-    # adding slippage of 0.1% per trade
-    # total_profit = total_profit - 0.0005
-    expected_returns_mean = total_profit / days_period * 100
-
-    # calculate max drawdown
-    try:
-        drawdown = calculate_max_drawdown(
-            trades, value_col="profit_abs", starting_balance=starting_balance
-        )
-        max_drawdown = drawdown.relative_account_drawdown
-    except ValueError:
-        max_drawdown = 0
-
-    if max_drawdown != 0:
-        calmar_ratio = expected_returns_mean / max_drawdown * math.sqrt(365)
-    else:
-        # Define high (negative) calmar ratio to be clear that this is NOT optimal.
-        calmar_ratio = -100
-
-    # print(expected_returns_mean, max_drawdown, calmar_ratio)
-    return calmar_ratio
+    return calculate_trade_metrics(trades, min_date, max_date, starting_balance).calmar
 
 
 def calculate_sqn(trades: pd.DataFrame, starting_balance: float) -> float:
@@ -387,20 +465,4 @@ def calculate_sqn(trades: pd.DataFrame, starting_balance: float) -> float:
     :param starting_balance: Starting balance of the trading system
     :return: SQN value
     """
-    if len(trades) == 0:
-        return 0.0
-
-    total_profit = trades["profit_abs"] / starting_balance
-    number_of_trades = len(trades)
-
-    # Calculate average trade and standard deviation
-    average_profits = total_profit.mean()
-    profits_std = total_profit.std()
-
-    if profits_std != 0 and not np.isnan(profits_std):
-        sqn = math.sqrt(number_of_trades) * (average_profits / profits_std)
-    else:
-        # Define negative SQN to indicate this is NOT optimal
-        sqn = -100.0
-
-    return round(sqn, 4)
+    return calculate_trade_metrics(trades, starting_balance=starting_balance).sqn
@@ -143,11 +143,33 @@ class Binance(Exchange):
         Does not work for other exchanges, which don't return the earliest data when called with "0"
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
+        return self.run_coroutine(
+            self._async_get_historic_ohlcv_df(
+                pair=pair,
+                timeframe=timeframe,
+                since_ms=since_ms,
+                candle_type=candle_type,
+                is_new_pair=is_new_pair,
+                until_ms=until_ms,
+            )
+        )
+
+    async def _async_get_historic_ohlcv_df(
+        self,
+        pair: str,
+        timeframe: str,
+        since_ms: int,
+        candle_type: CandleType,
+        is_new_pair: bool = False,
+        until_ms: int | None = None,
+    ) -> DataFrame:
+        """
+        Async implementation of get_historic_ohlcv, including "fast new pair" detection
+        and downloads from data.binance.vision.
+        Shared by the sync path and the concurrent download scheduler.
+        """
         if is_new_pair:
-            with self._loop_lock:
-                x = self.loop.run_until_complete(
-                    self._async_get_candle_history(pair, timeframe, candle_type, 0)
-                )
+            x = await self._async_get_candle_history(pair, timeframe, candle_type, 0)
             if x and x[3] and x[3][0] and x[3][0][0] > since_ms:
                 # Set starting date to first available candle.
                 since_ms = x[3][0][0]
@@ -175,7 +197,7 @@ class Binance(Exchange):
                 )
             )
         ):
-            return super().get_historic_ohlcv(
+            return await super()._async_get_historic_ohlcv_df(
                 pair=pair,
                 timeframe=timeframe,
                 since_ms=since_ms,
@@ -185,7 +207,7 @@ class Binance(Exchange):
             )
         else:
             # Download from data.binance.vision
-            return self.get_historic_ohlcv_fast(
+            return await self._async_get_historic_ohlcv_fast(
                 pair=pair,
                 timeframe=timeframe,
                 since_ms=since_ms,
@@ -206,17 +228,34 @@ class Binance(Exchange):
         """
         Fastly fetch OHLCV data by leveraging https://data.binance.vision.
         """
-        with self._loop_lock:
-            df = self.loop.run_until_complete(
-                download_archive_ohlcv(
-                    candle_type=candle_type,
-                    pair=pair,
-                    timeframe=timeframe,
-                    since_ms=since_ms,
-                    until_ms=until_ms,
-                    markets=self.markets,
-                )
+        return self.run_coroutine(
+            self._async_get_historic_ohlcv_fast(
+                pair=pair,
+                timeframe=timeframe,
+                since_ms=since_ms,
+                candle_type=candle_type,
+                is_new_pair=is_new_pair,
+                until_ms=until_ms,
             )
+        )
+
+    async def _async_get_historic_ohlcv_fast(
+        self,
+        pair: str,
+        timeframe: str,
+        since_ms: int,
+        candle_type: CandleType,
+        is_new_pair: bool = False,
+        until_ms: int | None = None,
+    ) -> DataFrame:
+        df = await download_archive_ohlcv(
+            candle_type=candle_type,
+            pair=pair,
+            timeframe=timeframe,
+            since_ms=since_ms,
+            until_ms=until_ms,
+            markets=self.markets,
+        )
 
         # download the remaining data from rest API
         if df.empty:
@@ -224,11 +263,11 @@ class Binance(Exchange):
         else:
             rest_since_ms = dt_ts(df.iloc[-1].date) + timeframe_to_msecs(timeframe)
 
-        # make sure since <= until
-        if until_ms and rest_since_ms > until_ms:
+        # make sure since < until
+        if until_ms and rest_since_ms >= until_ms:
             rest_df = DataFrame()
         else:
-            rest_df = super().get_historic_ohlcv(
+            rest_df = await super()._async_get_historic_ohlcv_df(
                 pair=pair,
                 timeframe=timeframe,
                 since_ms=rest_since_ms,
@@ -0,0 +1,223 @@
+"""
+Dry-run matching of limit orders against L2 order book snapshots.
+"""
+
+from abc import ABC, abstractmethod
+
+from freqtrade.constants import OBLiteral
+from freqtrade.exchange.exchange_types import CcxtOrder, OrderBook
+
+
+def _same_book(a: OrderBook, b: OrderBook) -> bool:
+    """
+    Snapshots may be copies (e.g. truncated to a smaller depth) - so compare the levels.
+    """
+    return a is b or (a["bids"] == b["bids"] and a["asks"] == b["asks"])
+
+
+class DryRunMatchingEngine(ABC):
+    """
+    Decides how much of a dry-run limit order fills, based on order book snapshots.
+    The exchange class applies the returned fill amounts (and fees) to the order.
+    """
+
+    @abstractmethod
+    def add_order(self, order: CcxtOrder, orderbook: OrderBook) -> float:
+        """
+        Register a newly placed limit order.
+        :param order: Dry-run order
+        :param orderbook: Order book snapshot at the time the order was placed
+        :return: Amount filled immediately (as taker)
+        """
+
+    @abstractmethod
+    def match(self, order: CcxtOrder, orderbook: OrderBook) -> float:
+        """
+        Match an open order against an order book snapshot.
+        Matching the same snapshot again does not fill anything.
+        :param order: Dry-run order
+        :param orderbook: Current order book snapshot
+        :return: Amount filled (as maker) since the previous snapshot
+        """
+
+    @abstractmethod
+    def remove_order(self, order_id: str) -> None:
+        """
+        Forget a closed or canceled order.
+        """
+
+
+class _BookView:
+    """
+    Volume per price level of one snapshot,
+    and the volume dry-run orders have already taken from it.
+    """
+
+    __slots__ = ("orderbook", "levels", "taken", "traded")
+
+    def __init__(self, orderbook: OrderBook) -> None:
+        self.orderbook = orderbook
+        self.levels: dict[str, dict[float, float]] = {
+            "bids": {entry[0]: entry[1] for entry in orderbook["bids"]},
+            "asks": {entry[0]: entry[1] for entry in orderbook["asks"]},
+        }
+        # Opposite volume consumed by crossing orders
+        self.taken: dict[tuple[str, float], float] = {}
+        # Traded volume at own price levels handed out to resting orders
+        self.traded: dict[tuple[str, float], float] = {}
+
+
+class _OrderState:
+    __slots__ = ("side", "price", "queue_ahead", "level_volume", "at_touch", "orderbook")
+
+    def __init__(
+        self,
+        side: str,
+        price: float,
+        queue_ahead: float,
+        level_volume: float,
+        at_touch: bool,
+        orderbook: OrderBook,
+    ) -> None:
+        self.side = side
+        self.price = price
+        # Volume resting at the order's price level which fills before the order
+        self.queue_ahead = queue_ahead
+        self.level_volume = level_volume
+        self.at_touch = at_touch
+        self.orderbook = orderbook
+
+
+class L2QueueMatchingEngine(DryRunMatchingEngine):
+    """
+    Simulates the queue position of dry-run orders within their price level.
+    * A new order joins the back of its price level.
+    * Volume leaving the best price level is assumed to be traded - filling the volume
+      ahead of the order first, then the order itself.
+    * Volume leaving deeper levels is assumed to be canceled - evenly ahead of and behind
+      the order.
+    * Once the price trades through the order's level, the order fills completely.
+    * Opposite orders at or better than the order's price fill it, up to their volume.
+    The volume of a snapshot is only handed out once - across all dry-run orders of a pair.
+    Cost per snapshot is linear in the visible depth, so hundreds of orders remain cheap.
+    """
+
+    def __init__(self) -> None:
+        self._orders: dict[str, _OrderState] = {}
+        self._books: dict[str, _BookView] = {}
+
+    def _view(self, pair: str, orderbook: OrderBook) -> _BookView:
+        view = self._books.get(pair)
+        if view is None or not _same_book(view.orderbook, orderbook):
+            view = _BookView(orderbook)
+            self._books[pair] = view
+        return view
+
+    @staticmethod
+    def _cross(view: _BookView, side: str, price: float, amount: float) -> float:
+        """
+        Fill against opposite orders at or better than price.
+        """
+        book_side: OBLiteral = "asks" if side == "buy" else "bids"
+        sign = 1.0 if side == "buy" else -1.0
+        filled = 0.0
+        for entry in view.orderbook[book_side]:
+            level_price = entry[0]
+            if (level_price - price) * sign > 0 or filled >= amount:
+                break
+            key = (book_side, level_price)
+            available = entry[1] - view.taken.get(key, 0.0)
+            if available > 0:
+                take = min(amount - filled, available)
+                view.taken[key] = view.taken.get(key, 0.0) + take
+                filled += take
+        return filled
+
+    def _join(self, order: CcxtOrder, view: _BookView) -> None:
+        side = order["side"]
+        price = order["price"]
+        book_side: OBLiteral = "bids" if side == "buy" else "asks"
+        sign = 1.0 if side == "buy" else -1.0
+        levels = view.orderbook[book_side]
+        volume = view.levels[book_side].get(price, 0.0)
+        self._orders[order["id"]] = _OrderState(
+            side,
+            price,
+            queue_ahead=volume,
+            level_volume=volume,
+            at_touch=not levels or (price - levels[0][0]) * sign >= 0,
+            orderbook=view.orderbook,
+        )
+
+    def _queue(self, view: _BookView, state: _OrderState, remaining: float) -> float:
+        """
+        Update the queue position from changes at the order's price level.
+        :return: Amount filled
+        """
+        book_side: OBLiteral = "bids" if state.side == "buy" else "asks"
+        sign = 1.0 if state.side == "buy" else -1.0
+        levels = view.orderbook[book_side]
+        if not levels or (state.price - levels[-1][0]) * sign < 0:
+            # Order is beyond the visible depth - nothing can be observed.
+            return 0.0
+
+        volume = view.levels[book_side].get(state.price, 0.0)
+        decrease = state.level_volume - volume
+        at_touch = (state.price - levels[0][0]) * sign >= 0
+        filled = 0.0
+        if state.level_volume > 0 and volume == 0 and (state.price - levels[0][0]) * sign > 0:
+            # Level was consumed and the price moved through it.
+            filled = remaining
+        elif decrease > 0 and state.at_touch:
+            ahead = min(decrease, state.queue_ahead)
+            state.queue_ahead -= ahead
+            key = (book_side, state.price)
+            available = decrease - ahead - view.traded.get(key, 0.0)
+            if available > 0:
+                filled = min(remaining, available)
+                view.traded[key] = view.traded.get(key, 0.0) + filled
+        elif decrease > 0:
+            state.queue_ahead -= decrease * state.queue_ahead / state.level_volume
+
+        state.queue_ahead = max(min(state.queue_ahead, volume), 0.0)
+        state.level_volume = volume
+        state.at_touch = at_touch
+        return filled
+
+    def add_order(self, order: CcxtOrder, orderbook: OrderBook) -> float:
+        view = self._view(order["symbol"], orderbook)
+        filled = self._cross(
+            view, order["side"], order["price"], order["amount"] - (order.get("filled") or 0.0)
+        )
+        self._join(order, view)
+        return filled
+
+    def match(self, order: CcxtOrder, orderbook: OrderBook) -> float:
+        view = self._view(order["symbol"], orderbook)
+        state = self._orders.get(order["id"])
+        if state is None:
+            # Order restored after a restart - joins the queue at the current snapshot.
+            self._join(order, view)
+            return 0.0
+        if _same_book(state.orderbook, orderbook):
+            return 0.0
+        state.orderbook = orderbook
+
+        remaining = order["amount"] - (order.get("filled") or 0.0)
+        filled = self._cross(view, state.side, state.price, remaining)
+        if filled < remaining:
+            filled += self._queue(view, state, remaining - filled)
+        return filled
+
+    def remove_order(self, order_id: str) -> None:
+        self._orders.pop(order_id, None)
+
+
+def create_matching_engine(mode: str) -> DryRunMatchingEngine | None:
+    """
+    Matching engine for the configured `exchange.dry_run_matching` mode.
+    :return: None for the default mode, which fills orders once the price crosses them.
+    """
+    if mode == "l2_queue":
+        return L2QueueMatchingEngine()
+    return None
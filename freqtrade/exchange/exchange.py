@@ -68,6 +68,7 @@ from freqtrade.exchange.common import (
     retrier,
     retrier_async,
 )
+from freqtrade.exchange.dry_run_matching import DryRunMatchingEngine, create_matching_engine
 from freqtrade.exchange.exchange_types import (
     CcxtBalances,
     CcxtOrder,
@@ -210,6 +211,11 @@ class Exchange:
         # Shouldn't be too high either, as it'll freeze UI updates in case of open orders.
         self._exit_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=300)
         self._entry_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=300)
+        # Order book snapshot for the current bot iteration - pair -> (depth, order book).
+        # Only used while a snapshot is active (see refresh_order_books()).
+        # The TTL limits staleness should an iteration take unusually long.
+        self._order_book_cache: TTLCache = TTLCache(maxsize=1000, ttl=10)
+        self._order_book_snapshot = False
 
         # Holds candles
         self._klines: dict[PairWithTimeframe, DataFrame] = {}
@@ -234,6 +240,11 @@ class Exchange:
             MarginMode(config.get("margin_mode")) if config.get("margin_mode") else MarginMode.NONE
         )
         self.liquidation_buffer = config.get("liquidation_buffer", 0.05)
+        self._dry_matching: DryRunMatchingEngine | None = None
+        if config["dry_run"]:
+            self._dry_matching = create_matching_engine(
+                exchange_conf.get("dry_run_matching", "price_cross")
+            )
 
         # Deep merge ft_has with default ft_has options
         self._ft_has = deep_merge_dicts(self._ft_has, deepcopy(self._ft_has_default))
@@ -1074,7 +1085,7 @@ class Exchange:
             dry_order["ft_order_type"] = "stoploss"
         orderbook: OrderBook | None = None
         if self.exchange_has("fetchL2OrderBook"):
-            orderbook = self.fetch_l2_order_book(pair, 20)
+            orderbook = self.get_order_book(pair, 20)
         if ordertype == "limit" and orderbook:
             # Allow a 1% price difference
             allowed_diff = 0.01
@@ -1134,7 +1145,7 @@ class Exchange:
         """
         if self.exchange_has("fetchL2OrderBook"):
             if not orderbook:
-                orderbook = self.fetch_l2_order_book(pair, 20)
+                orderbook = self.get_order_book(pair, 20)
             ob_type: OBLiteral = "asks" if side == "buy" else "bids"
             slippage = 0.05
             max_slippage_val = rate * ((1 + slippage) if side == "buy" else (1 - slippage))
@@ -1181,7 +1192,7 @@ class Exchange:
         if not self.exchange_has("fetchL2OrderBook"):
             return True
         if not orderbook:
-            orderbook = self.fetch_l2_order_book(pair, 1)
+            orderbook = self.get_order_book(pair, 1)
         try:
             if side == "buy":
                 price = orderbook["asks"][0][0]
@@ -1208,6 +1219,8 @@ class Exchange:
             and not order.get("ft_order_type")
         ):
             pair = order["symbol"]
+            if self._dry_matching and self.exchange_has("fetchL2OrderBook"):
+                return self._dry_match_order(order, immediate, orderbook)
             if self._dry_is_price_crossed(pair, order["side"], order["price"], orderbook):
                 order.update(
                     {
@@ -1225,6 +1238,68 @@ class Exchange:
 
         return order
 
+    def _dry_match_order(
+        self, order: CcxtOrder, immediate: bool, orderbook: OrderBook | None
+    ) -> CcxtOrder:
+        """
+        Fill a dry-run limit order (partially) using the configured matching engine.
+        """
+        if order["status"] != "open" or not self._dry_matching:
+            return order
+        pair = order["symbol"]
+        if not orderbook:
+            orderbook = self.get_order_book(pair, 20)
+        if immediate:
+            amount = self._dry_matching.add_order(order, orderbook)
+        else:
+            amount = self._dry_matching.match(order, orderbook)
+        if amount > 0:
+            self.add_dry_order_fill(pair, order, amount, "taker" if immediate else "maker")
+        if order["status"] != "open":
+            self._dry_matching.remove_order(order["id"])
+        return order
+
+    def add_dry_order_fill(
+        self, pair: str, dry_order: CcxtOrder, amount: float, taker_or_maker: MakerTaker
+    ) -> CcxtOrder:
+        """
+        Add a (partial) fill at the order's price to a dry-run limit order.
+        Fees accumulate over all fills of the order.
+        """
+        filled = dry_order.get("filled") or 0.0
+        remaining = dry_order["amount"] - filled
+        if amount < remaining:
+            amount = self._contracts_to_amount(
+                pair, self.amount_to_precision(pair, self._amount_to_contracts(pair, amount))
+            )
+            if not amount:
+                return dry_order
+        if amount >= remaining:
+            amount = remaining
+            filled = dry_order["amount"]
+        else:
+            filled += amount
+        fee_rate = self.get_fee(pair, taker_or_maker=taker_or_maker)
+        fee_cost = (dry_order.get("fee") or {}).get("cost", 0.0) + (
+            amount * dry_order["price"] * fee_rate
+        )
+        cost = filled * dry_order["price"]
+        dry_order.update(
+            {
+                "status": "closed" if filled >= dry_order["amount"] else "open",
+                "filled": filled,
+                "remaining": dry_order["amount"] - filled,
+                "average": dry_order["price"],
+                "cost": cost,
+                "fee": {
+                    "currency": self.get_pair_quote_currency(pair),
+                    "cost": fee_cost,
+                    "rate": fee_cost / cost if cost else fee_rate,
+                },
+            }
+        )
+        return dry_order
+
     def fetch_dry_run_order(self, order_id) -> CcxtOrder:
         """
         Return dry-run order
@@ -1595,7 +1670,16 @@ class Exchange:
             try:
                 order = self.fetch_dry_run_order(order_id)
 
-                order.update({"status": "canceled", "filled": 0.0, "remaining": order["amount"]})
+                # Partial fills of open orders remain filled
+                filled = (order.get("filled") or 0.0) if order["status"] == "open" else 0.0
+                remaining = (
+                    order["amount"] - filled
+                    if order.get("amount") is not None
+                    else order.get("amount")
+                )
+                order.update({"status": "canceled", "filled": filled, "remaining": remaining})
+                if self._dry_matching:
+                    self._dry_matching.remove_order(order_id)
                 return order
             except InvalidOrderException:
                 return {}
@@ -1996,6 +2080,113 @@ class Exchange:
         except ccxt.BaseError as e:
             raise OperationalException(e) from e
 
+    @retrier_async
+    async def _async_fetch_l2_order_book(self, pair: str, limit: int = 100) -> OrderBook:
+        """
+        Asynchronously get L2 order book from exchange - see fetch_l2_order_book().
+        """
+        limit1 = self._order_book_depth(limit)
+        try:
+            return await self._api_async.fetch_l2_order_book(pair, limit1)
+        except ccxt.NotSupported as e:
+            raise OperationalException(
+                f"Exchange {self._api.name} does not support fetching order book. Message: {e}"
+            ) from e
+        except ccxt.DDoSProtection as e:
+            raise DDosProtection(e) from e
+        except (ccxt.OperationFailed, ccxt.ExchangeError) as e:
+            raise TemporaryError(
+                f"Could not get order book due to {e.__class__.__name__}. Message: {e}"
+            ) from e
+        except ccxt.BaseError as e:
+            raise OperationalException(e) from e
+
+    def _order_book_depth(self, limit: int) -> int | None:
+        """Depth actually requested from the exchange for limit. None is the full book."""
+        return self.get_next_limit_in_list(
+            limit, self._ft_has["l2_limit_range"], self._ft_has["l2_limit_range_required"]
+        )
+
+    def _get_cached_order_book(self, pair: str, limit: int) -> OrderBook | None:
+        """
+        Order book from the current snapshot - if it's at least as deep as requested.
+        Deeper books are truncated to the requested depth.
+        """
+        with self._cache_lock:
+            cached = self._order_book_cache.get(pair)
+        if cached is None:
+            return None
+        cached_depth, order_book = cached
+        depth = self._order_book_depth(limit)
+        if cached_depth == depth:
+            return order_book
+        if depth is None or (cached_depth is not None and cached_depth < depth):
+            return None
+        truncated = order_book.copy()
+        truncated["bids"] = order_book["bids"][:depth]
+        truncated["asks"] = order_book["asks"][:depth]
+        return truncated
+
+    def _cache_order_book(self, pair: str, limit: int, order_book: OrderBook) -> None:
+        depth = self._order_book_depth(limit)
+        with self._cache_lock:
+            cached = self._order_book_cache.get(pair)
+            if cached is None or depth is None or (cached[0] is not None and cached[0] < depth):
+                self._order_book_cache[pair] = (depth, order_book)
+
+    def get_order_book(self, pair: str, limit: int = 100) -> OrderBook:
+        """
+        Get L2 order book for pair.
+        While an order book snapshot is active (see refresh_order_books()), books are
+        served from the snapshot if they're deep enough - otherwise they're fetched
+        and added to the snapshot.
+        :param pair: Pair to get the order book for
+        :param limit: Depth of the order book
+        """
+        if not self._order_book_snapshot:
+            return self.fetch_l2_order_book(pair, limit)
+        if (order_book := self._get_cached_order_book(pair, limit)) is None:
+            order_book = self.fetch_l2_order_book(pair, limit)
+            self._cache_order_book(pair, limit, order_book)
+        return order_book
+
+    async def _async_fetch_order_books(
+        self, pairs: list[str], limit: int
+    ) -> list[OrderBook | BaseException]:
+        return await asyncio.gather(
+            *(self._async_fetch_l2_order_book(pair, limit) for pair in pairs),
+            return_exceptions=True,
+        )
+
+    def refresh_order_books(self, pairs: list[str], limit: int) -> None:
+        """
+        Start a new order book snapshot, fetching the order books for pairs concurrently.
+        Until close_order_book_snapshot() is called, get_order_book() serves all requests
+        for the same pair (with a depth up to limit) from this snapshot.
+        :param pairs: Pairs to fetch order books for
+        :param limit: Depth of the order books
+        """
+        with self._cache_lock:
+            self._order_book_cache.clear()
+        self._order_book_snapshot = True
+        if not pairs or not self.exchange_has("fetchL2OrderBook"):
+            return
+        results = self.run_coroutine(self._async_fetch_order_books(pairs, limit))
+        for pair, result in zip(pairs, results, strict=True):
+            if isinstance(result, BaseException):
+                # Will be fetched again once it's needed
+                logger.warning(f"Could not fetch order book for {pair}: {result}")
+                continue
+            self._cache_order_book(pair, limit, result)
+
+    def close_order_book_snapshot(self) -> None:
+        """
+        Drop the current order book snapshot - order books will be fetched on every request.
+        """
+        self._order_book_snapshot = False
+        with self._cache_lock:
+            self._order_book_cache.clear()
+
     def _get_price_side(self, side: str, is_short: bool, conf_strategy: dict) -> BidAsk:
         price_side = conf_strategy["price_side"]
 
@@ -2052,7 +2243,7 @@ class Exchange:
         if conf_strategy.get("use_order_book", False):
             order_book_top = conf_strategy.get("order_book_top", 1)
             if order_book is None:
-                order_book = self.fetch_l2_order_book(pair, order_book_top)
+                order_book = self.get_order_book(pair, order_book_top)
             rate = self._get_rate_from_ob(pair, side, order_book, name, price_side, order_book_top)
         else:
             logger.debug(f"Using Last {price_side.capitalize()} / Last Price")
@@ -2133,7 +2324,7 @@ class Exchange:
             order_book_top = max(
                 entry_pricing.get("order_book_top", 1), exit_pricing.get("order_book_top", 1)
             )
-            order_book = self.fetch_l2_order_book(pair, order_book_top)
+            order_book = self.get_order_book(pair, order_book_top)
             entry_rate = self.get_rate(pair, refresh, "entry", is_short, order_book=order_book)
         elif not entry_rate:
             ticker = self.fetch_ticker(pair)
@@ -2357,6 +2548,41 @@ class Exchange:
         logger.debug(f"Downloaded data for {pair} from ccxt with length {len(data)}.")
         return ohlcv_to_dataframe(data, timeframe, pair, fill_missing=False, drop_incomplete=True)
 
+    async def _async_get_historic_ohlcv_df(
+        self,
+        pair: str,
+        timeframe: str,
+        since_ms: int,
+        candle_type: CandleType,
+        is_new_pair: bool = False,
+        until_ms: int | None = None,
+    ) -> DataFrame:
+        """
+        Async variant of get_historic_ohlcv.
+        Allows downloading multiple pairs concurrently on the exchange loop.
+        Must be awaited from within the exchange loop (see `run_coroutine()`).
+        :param is_new_pair: used by binance subclass to allow "fast" new pair downloading
+        :return: Dataframe with candle (OHLCV) data
+        """
+        pair, _, _, data, _ = await self._async_get_historic_ohlcv(
+            pair=pair,
+            timeframe=timeframe,
+            since_ms=since_ms,
+            until_ms=until_ms,
+            candle_type=candle_type,
+            raise_=True,
+        )
+        logger.debug(f"Downloaded data for {pair} from ccxt with length {len(data)}.")
+        return ohlcv_to_dataframe(data, timeframe, pair, fill_missing=False, drop_incomplete=True)
+
+    def run_coroutine(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine to completion on the exchange loop.
+        Holds the loop lock for the duration of the call.
+        """
+        with self._loop_lock:
+            return self.loop.run_until_complete(coro)
+
     async def _async_get_historic_ohlcv(
         self,
         pair: str,
@@ -2967,6 +3193,31 @@ class Exchange:
         except ccxt.BaseError as e:
             raise OperationalException(f"Could not fetch trade data. Msg: {e}") from e
 
+    async def _async_watch_trades(self, pair: str) -> list[list]:
+        """
+        Wait for new public trades using the websocket connection.
+        The result contains the most recent trades cached by ccxt,
+        so it can contain trades which were returned by a previous call.
+        :param pair: Pair to watch trades for
+        :return: List of Lists, with constants.DEFAULT_TRADES_COLUMNS as columns
+        """
+        try:
+            trades = await self._api_async.watch_trades(pair)
+            trades = self._trades_contracts_to_amount(trades)
+            return trades_dict_to_list(trades)
+        except ccxt.NotSupported as e:
+            raise OperationalException(
+                f"Exchange {self._api.name} does not support watching trades. Message: {e}"
+            ) from e
+        except ccxt.DDoSProtection as e:
+            raise DDosProtection(e) from e
+        except (ccxt.OperationFailed, ccxt.ExchangeError) as e:
+            raise TemporaryError(
+                f"Could not watch trades due to {e.__class__.__name__}. Message: {e}"
+            ) from e
+        except ccxt.BaseError as e:
+            raise OperationalException(f"Could not watch trade data. Msg: {e}") from e
+
     def _valid_trade_pagination_id(self, pair: str, from_id: str) -> bool:
         """
         Verify trade-pagination id is valid.
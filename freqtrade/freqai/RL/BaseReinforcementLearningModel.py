@@ -42,6 +42,9 @@ class BaseReinforcementLearningModel(IFreqaiModel):
     User created Reinforcement Learning Model prediction class
     """
 
+    # Training environments are stored on the model instance
+    parallel_training = False
+
     def __init__(self, **kwargs) -> None:
         super().__init__(config=kwargs["config"])
         self.max_threads = min(
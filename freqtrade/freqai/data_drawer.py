@@ -1,14 +1,17 @@
 import collections
 import importlib
 import logging
+import pickle
 import re
 import shutil
 import threading
 import warnings
+from collections.abc import MutableMapping
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, TypedDict
 
+import joblib
 import numpy as np
 import pandas as pd
 import psutil
@@ -23,6 +26,8 @@ from freqtrade.data.history import load_pair_history
 from freqtrade.enums import CandleType
 from freqtrade.exceptions import OperationalException
 from freqtrade.freqai.data_kitchen import FreqaiDataKitchen
+from freqtrade.freqai.historic_predictions import HistoricPredictions
+from freqtrade.freqai.model_registry import ModelRegistry
 from freqtrade.strategy.interface import IStrategy
 
 
@@ -78,12 +83,15 @@ class FreqaiDataDrawer:
         self.meta_data_dictionary: dict[str, dict[str, Any]] = {}
         self.model_return_values: dict[str, DataFrame] = {}
         self.historic_data: dict[str, dict[str, DataFrame]] = {}
-        self.historic_predictions: dict[str, DataFrame] = {}
         self.full_path = full_path
-        self.historic_predictions_path = Path(self.full_path / "historic_predictions.pkl")
+        self.historic_predictions_path = Path(self.full_path / "historic_predictions")
+        # Single-file format used by earlier versions - migrated on load
+        self.historic_predictions_pkl_path = Path(self.full_path / "historic_predictions.pkl")
         self.historic_predictions_bkp_path = Path(
             self.full_path / "historic_predictions.backup.pkl"
         )
+        self.historic_predictions: MutableMapping[str, DataFrame] = {}
+        self.save_lock = threading.Lock()
         self.pair_dictionary_path = Path(self.full_path / "pair_dictionary.json")
         self.global_metadata_path = Path(self.full_path / "global_metadata.json")
         self.metric_tracker_path = Path(self.full_path / "metric_tracker.json")
@@ -93,9 +101,12 @@ class FreqaiDataDrawer:
         self.load_metric_tracker_from_disk()
         self.training_queue: dict[str, int] = {}
         self.history_lock = threading.Lock()
-        self.save_lock = threading.Lock()
         self.pair_dict_lock = threading.Lock()
         self.metric_tracker_lock = threading.Lock()
+        # Guards publishing (and reading) a pair's model together with its metadata
+        self.model_lock = threading.Lock()
+        # Training workers purge old models concurrently
+        self.purge_lock = threading.Lock()
         self.old_DBSCAN_eps: dict[str, float] = {}
         self.empty_pair_dict: pair_info = {
             "model_filename": "",
@@ -104,6 +115,13 @@ class FreqaiDataDrawer:
             "extras": {},
         }
         self.model_type = self.freqai_info.get("model_save_type", "joblib")
+        registry_path = self.freqai_info.get("model_registry_path")
+        # Shares trained models with other bots running the same identifier
+        self.model_registry: ModelRegistry | None = (
+            ModelRegistry(Path(registry_path), self.freqai_info.get("identifier", "no_id_provided"))
+            if registry_path
+            else None
+        )
 
     def update_metric_tracker(self, metric: str, value: float, pair: str) -> None:
         """
@@ -171,27 +189,37 @@ class FreqaiDataDrawer:
 
     def load_historic_predictions_from_disk(self):
         """
-        Locate and load a previously saved historic predictions.
+        Locate previously saved historic predictions. Pairs are loaded lazily on first access.
+        Predictions saved in the single-file format of earlier versions are migrated.
         :return: bool - whether or not the drawer was located
         """
-        exists = self.historic_predictions_path.is_file()
-        if exists:
+        self.historic_predictions = HistoricPredictions(self.historic_predictions_path)
+        exists = len(self.historic_predictions) > 0
+        if not exists and self.historic_predictions_pkl_path.is_file():
             try:
-                with self.historic_predictions_path.open("rb") as fp:
-                    self.historic_predictions = cloudpickle.load(fp)
-                logger.info(
-                    f"Found existing historic predictions at {self.full_path}, but beware "
-                    "that statistics may be inaccurate if the bot has been offline for "
-                    "an extended period of time."
-                )
+                with self.historic_predictions_pkl_path.open("rb") as fp:
+                    legacy_predictions = cloudpickle.load(fp)
             except EOFError:
                 logger.warning(
                     "Historical prediction file was corrupted. Trying to load backup file."
                 )
                 with self.historic_predictions_bkp_path.open("rb") as fp:
-                    self.historic_predictions = cloudpickle.load(fp)
+                    legacy_predictions = cloudpickle.load(fp)
                 logger.warning("FreqAI successfully loaded the backup historical predictions file.")
+            self.historic_predictions.update(legacy_predictions)
+            self.save_historic_predictions_to_disk()
+            logger.info(
+                f"Migrated historic predictions to {self.historic_predictions_path}. "
+                f"{self.historic_predictions_pkl_path.name} is no longer used and can be removed."
+            )
+            exists = True
 
+        if exists:
+            logger.info(
+                f"Found existing historic predictions at {self.full_path}, but beware "
+                "that statistics may be inaccurate if the bot has been offline for "
+                "an extended period of time."
+            )
         else:
             logger.info("Could not find existing historic_predictions, starting from scratch")
 
@@ -199,13 +227,14 @@ class FreqaiDataDrawer:
 
     def save_historic_predictions_to_disk(self):
         """
-        Save historic predictions pickle to disk
+        Save historic predictions to disk - only rows added since the last save are written.
         """
-        with self.historic_predictions_path.open("wb") as fp:
-            cloudpickle.dump(self.historic_predictions, fp, protocol=cloudpickle.DEFAULT_PROTOCOL)
-
-        # create a backup
-        shutil.copy(self.historic_predictions_path, self.historic_predictions_bkp_path)
+        with self.save_lock:
+            if not isinstance(self.historic_predictions, HistoricPredictions):
+                predictions = HistoricPredictions(self.historic_predictions_path)
+                predictions.update(self.historic_predictions)
+                self.historic_predictions = predictions
+            self.historic_predictions.save()
 
     def save_metric_tracker_to_disk(self):
         """
@@ -344,57 +373,51 @@ class FreqaiDataDrawer:
         the tail is equivalent to the length of the dataframe that entered FreqAI from
         the strategy originally. Doing this allows FreqUI to always display the correct
         historic predictions.
+        `date_pred` keeps its datetime dtype (it used to turn into object when appending).
+        :raises KeyError: if predictions or extra returns hold columns which are not part
+            of the historic predictions
         """
 
         len_df = len(strat_df)
-        index = self.historic_predictions[pair].index[-1:]
-        columns = self.historic_predictions[pair].columns
-
-        zeros_df = pd.DataFrame(np.zeros((1, len(columns))), index=index, columns=columns)
-        self.historic_predictions[pair] = pd.concat(
-            [self.historic_predictions[pair], zeros_df], ignore_index=True, axis=0
-        )
-        df = self.historic_predictions[pair]
+        hist_preds = self.historic_predictions[pair]
+        # Collect the new row first, then append it with a single concat -
+        # setting cells one by one on the full history is expensive with many pairs.
+        row: dict[str, Any] = dict.fromkeys(hist_preds.columns, 0.0)
 
         # model outputs and associated statistics
         for label in predictions.columns:
-            label_loc = df.columns.get_loc(label)
-            pred_label_loc = predictions.columns.get_loc(label)
-            df.iloc[-1, label_loc] = predictions.iloc[-1, pred_label_loc]
-            if df[label].dtype == object:
+            row[label] = predictions[label].iloc[-1]
+            if hist_preds[label].dtype == object or predictions[label].dtype == object:
                 continue
-            label_mean_loc = df.columns.get_loc(f"{label}_mean")
-            label_std_loc = df.columns.get_loc(f"{label}_std")
-            df.iloc[-1, label_mean_loc] = dk.data["labels_mean"][label]
-            df.iloc[-1, label_std_loc] = dk.data["labels_std"][label]
+            row[f"{label}_mean"] = dk.data["labels_mean"][label]
+            row[f"{label}_std"] = dk.data["labels_std"][label]
 
         # outlier indicators
-        do_predict_loc = df.columns.get_loc("do_predict")
-        df.iloc[-1, do_predict_loc] = do_preds[-1]
+        row["do_predict"] = do_preds[-1]
         if self.freqai_info["feature_parameters"].get("DI_threshold", 0) > 0:
-            DI_values_loc = df.columns.get_loc("DI_values")
-            df.iloc[-1, DI_values_loc] = dk.DI_values[-1]
+            row["DI_values"] = dk.DI_values[-1]
 
         # extra values the user added within custom prediction model
         if dk.data["extra_returns_per_train"]:
-            rets = dk.data["extra_returns_per_train"]
-            for return_str in rets:
-                return_loc = df.columns.get_loc(return_str)
-                df.iloc[-1, return_loc] = rets[return_str]
-
-        high_price_loc = df.columns.get_loc("high_price")
-        high_loc = strat_df.columns.get_loc("high")
-        df.iloc[-1, high_price_loc] = strat_df.iloc[-1, high_loc]
-        low_price_loc = df.columns.get_loc("low_price")
-        low_loc = strat_df.columns.get_loc("low")
-        df.iloc[-1, low_price_loc] = strat_df.iloc[-1, low_loc]
-        close_price_loc = df.columns.get_loc("close_price")
-        close_loc = strat_df.columns.get_loc("close")
-        df.iloc[-1, close_price_loc] = strat_df.iloc[-1, close_loc]
-        date_pred_loc = df.columns.get_loc("date_pred")
-        date_loc = strat_df.columns.get_loc("date")
-        df.iloc[-1, date_pred_loc] = strat_df.iloc[-1, date_loc]
+            row.update(dk.data["extra_returns_per_train"])
+
+        row["high_price"] = strat_df["high"].iloc[-1]
+        row["low_price"] = strat_df["low"].iloc[-1]
+        row["close_price"] = strat_df["close"].iloc[-1]
+        row["date_pred"] = strat_df["date"].iloc[-1]
+
+        unknown = row.keys() - set(hist_preds.columns)
+        if unknown:
+            raise KeyError(
+                f"Columns {sorted(unknown)} are not part of the historic predictions of {pair}."
+            )
+
+        # The new row is completed before publishing the dataframe - it may be saved anytime.
+        df = pd.concat(
+            [hist_preds, DataFrame([row], columns=hist_preds.columns)], ignore_index=True, axis=0
+        )
 
+        self.historic_predictions[pair] = df
         self.model_return_values[pair] = df.tail(len_df).reset_index(drop=True)
 
     def attach_return_values_to_return_dataframe(
@@ -444,6 +467,10 @@ class FreqaiDataDrawer:
         elif isinstance(num_keep, bool):
             num_keep = 2
 
+        with self.purge_lock:
+            self._purge_old_models(num_keep)
+
+    def _purge_old_models(self, num_keep: int) -> None:
         model_folders = [x for x in self.full_path.iterdir() if x.is_dir()]
 
         pattern = re.compile(r"sub-train-(\w+)_(\d{10})")
@@ -465,19 +492,20 @@ class FreqaiDataDrawer:
                 delete_dict[coin]["num_folders"] += 1
                 delete_dict[coin]["timestamps"][int(timestamp)] = directory
 
+        # Models published to the registry may still be used by other bots
+        keep = self.model_registry.referenced_paths() if self.model_registry else set()
+
         for coin in delete_dict:
             if delete_dict[coin]["num_folders"] > num_keep:
                 sorted_dict = collections.OrderedDict(
                     sorted(delete_dict[coin]["timestamps"].items())
                 )
                 num_delete = len(sorted_dict) - num_keep
-                deleted = 0
-                for k, v in sorted_dict.items():
-                    if deleted >= num_delete:
-                        break
+                for v in list(sorted_dict.values())[:num_delete]:
+                    if v.resolve() in keep:
+                        continue
                     logger.info(f"Freqai purging old model file {v}")
-                    shutil.rmtree(v)
-                    deleted += 1
+                    shutil.rmtree(v, ignore_errors=True)
 
     def save_metadata(self, dk: FreqaiDataKitchen) -> None:
         """
@@ -515,8 +543,12 @@ class FreqaiDataDrawer:
 
         # Save the trained model
         if self.model_type == "joblib":
-            with (save_path / f"{dk.model_filename}_model.joblib").open("wb") as fp:
-                cloudpickle.dump(model, fp)
+            model_path = save_path / f"{dk.model_filename}_model.joblib"
+            if self.model_registry:
+                self._dump_mmap_compatible(model, model_path)
+            else:
+                with model_path.open("wb") as fp:
+                    cloudpickle.dump(model, fp)
         elif self.model_type == "keras":
             model.save(save_path / f"{dk.model_filename}_model.h5")
         elif self.model_type in ["stable_baselines3", "sb3_contrib", "pytorch"]:
@@ -546,19 +578,69 @@ class FreqaiDataDrawer:
             save_path / f"{dk.model_filename}_trained_dates_df.pkl"
         )
 
-        self.model_dictionary[coin] = model
-        self.pair_dict[coin]["model_filename"] = dk.model_filename
-        self.pair_dict[coin]["data_path"] = str(dk.data_path)
-
-        if coin not in self.meta_data_dictionary:
-            self.meta_data_dictionary[coin] = {}
-        self.meta_data_dictionary[coin][METADATA] = dk.data
-        self.meta_data_dictionary[coin][FEATURE_PIPELINE] = dk.feature_pipeline
-        self.meta_data_dictionary[coin][LABEL_PIPELINE] = dk.label_pipeline
+        # Hand the new model to inference - never mixed with the previous model's metadata
+        with self.model_lock:
+            self.model_dictionary[coin] = model
+            self.meta_data_dictionary[coin] = {
+                METADATA: dk.data,
+                FEATURE_PIPELINE: dk.feature_pipeline,
+                LABEL_PIPELINE: dk.label_pipeline,
+            }
+            self.pair_dict[coin]["model_filename"] = dk.model_filename
+            self.pair_dict[coin]["data_path"] = str(dk.data_path)
         self.save_drawer_to_disk()
 
+        if self.model_registry and self.model_registry.is_owner:
+            self.model_registry.publish(
+                {
+                    "pair": coin,
+                    "trained_timestamp": self.pair_dict[coin]["trained_timestamp"],
+                    "model_filename": dk.model_filename,
+                    "data_path": str(Path(dk.data_path).resolve()),
+                }
+            )
+
         return
 
+    @staticmethod
+    def _dump_mmap_compatible(model: Any, model_path: Path) -> None:
+        """
+        Save a model with joblib, which stores numpy arrays uncompressed so that readers can
+        memory-map them. Falls back to cloudpickle for objects pickle can't handle.
+        """
+        try:
+            joblib.dump(model, model_path)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            with model_path.open("wb") as fp:
+                cloudpickle.dump(model, fp)
+
+    def sync_from_model_registry(self, pairs: list[str]) -> list[str]:
+        """
+        Adopt model versions published to the model registry which are newer than the
+        models in use. Adopted models are loaded on their next use.
+        :param pairs: pairs to check for new model versions
+        :return: pairs with a new model version
+        """
+        if not self.model_registry:
+            return []
+        adopted = []
+        for version in self.model_registry.updated(pairs):
+            pair = version["pair"]
+            with self.model_lock:
+                pair_dict = self.pair_dict.setdefault(pair, self.empty_pair_dict.copy())
+                if version["trained_timestamp"] <= pair_dict["trained_timestamp"]:
+                    continue
+                pair_dict["trained_timestamp"] = version["trained_timestamp"]
+                pair_dict["model_filename"] = version["model_filename"]
+                pair_dict["data_path"] = version["data_path"]
+                self.model_dictionary.pop(pair, None)
+                self.meta_data_dictionary.pop(pair, None)
+            adopted.append(pair)
+            logger.info(f"Using model {version['model_filename']} from the model registry.")
+        if adopted:
+            self.save_drawer_to_disk()
+        return adopted
+
     def load_metadata(self, dk: FreqaiDataKitchen) -> None:
         """
         Load only metadata into datakitchen to increase performance during
@@ -576,17 +658,20 @@ class FreqaiDataDrawer:
         :model: User trained model which can be inferenced for new predictions
         """
 
-        if not self.pair_dict[coin]["model_filename"]:
-            return None
+        with self.model_lock:
+            if not self.pair_dict[coin]["model_filename"]:
+                return None
 
-        if dk.live:
-            dk.model_filename = self.pair_dict[coin]["model_filename"]
-            dk.data_path = Path(self.pair_dict[coin]["data_path"])
+            if dk.live:
+                dk.model_filename = self.pair_dict[coin]["model_filename"]
+                dk.data_path = Path(self.pair_dict[coin]["data_path"])
+            meta_data = self.meta_data_dictionary.get(coin)
+            model = self.model_dictionary.get(coin) if dk.live else None
 
-        if coin in self.meta_data_dictionary:
-            dk.data = self.meta_data_dictionary[coin][METADATA]
-            dk.feature_pipeline = self.meta_data_dictionary[coin][FEATURE_PIPELINE]
-            dk.label_pipeline = self.meta_data_dictionary[coin][LABEL_PIPELINE]
+        if meta_data:
+            dk.data = meta_data[METADATA]
+            dk.feature_pipeline = meta_data[FEATURE_PIPELINE]
+            dk.label_pipeline = meta_data[LABEL_PIPELINE]
         else:
             with (dk.data_path / f"{dk.model_filename}_{METADATA}.json").open("r") as fp:
                 dk.data = rapidjson.load(fp, number_mode=METADATA_NUMBER_MODE)
@@ -600,11 +685,16 @@ class FreqaiDataDrawer:
         dk.label_list = dk.data["label_list"]
 
         # try to access model in memory instead of loading object from disk to save time
-        if dk.live and coin in self.model_dictionary:
-            model = self.model_dictionary[coin]
-        elif self.model_type == "joblib":
-            with (dk.data_path / f"{dk.model_filename}_model.joblib").open("rb") as fp:
-                model = cloudpickle.load(fp)
+        if model is not None:
+            return model
+        if self.model_type == "joblib":
+            model_path = dk.data_path / f"{dk.model_filename}_model.joblib"
+            if self.model_registry and not self.model_registry.is_owner:
+                # Readers never train - memory-mapped arrays are shared with other processes
+                model = joblib.load(model_path, mmap_mode="r")
+            else:
+                with model_path.open("rb") as fp:
+                    model = cloudpickle.load(fp)
         elif "stable_baselines" in self.model_type or "sb3_contrib" == self.model_type:
             mod = importlib.import_module(
                 self.model_type, self.freqai_info["rl_config"]["model_type"]
@@ -623,9 +713,12 @@ class FreqaiDataDrawer:
                 f"Unable to load model, ensure model exists at {dk.data_path} "
             )
 
-        # load it into ram if it was loaded from disk
-        if coin not in self.model_dictionary:
-            self.model_dictionary[coin] = model
+        # load it into ram - unless a newer model was published meanwhile
+        with self.model_lock:
+            if coin not in self.model_dictionary and (
+                not dk.live or self.pair_dict[coin]["model_filename"] == dk.model_filename
+            ):
+                self.model_dictionary[coin] = model
 
         return model
 
@@ -741,14 +834,12 @@ class FreqaiDataDrawer:
         Returns timerange information based on historic predictions file
         :return: timerange calculated from saved live data
         """
-        if not self.historic_predictions_path.is_file():
+        if not self.load_historic_predictions_from_disk():
             raise OperationalException(
                 "Historic predictions not found. Historic predictions data is required "
                 "to run backtest with the freqai-backtest-live-models option "
             )
 
-        self.load_historic_predictions_from_disk()
-
         all_pairs_end_dates = []
         for pair in self.historic_predictions:
             pair_historic_data = self.historic_predictions[pair]
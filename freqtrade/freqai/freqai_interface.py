@@ -3,6 +3,7 @@ import threading
 import time
 from abc import ABC, abstractmethod
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Literal
@@ -56,6 +57,9 @@ class IFreqaiModel(ABC):
     Juha Nykänen @suikula, Wagner Costa @wagnercosta, Johan Vlugt @Jooopieeert
     """
 
+    # Models may be trained for several pairs at the same time (see `training_workers`)
+    parallel_training: bool = True
+
     def __init__(self, config: Config) -> None:
         self.config = config
         self.assert_config(self.config)
@@ -92,10 +96,15 @@ class IFreqaiModel(ABC):
         self.pair_it_train = 0
         self.total_pairs = len(self.config.get("exchange", {}).get("pair_whitelist"))
         self.train_queue = self._set_train_queue()
+        # Time of the last training attempt per pair
+        self._train_attempts: dict[str, float] = {}
         self.inference_time: float = 0
         self.train_time: float = 0
         self.begin_time: float = 0
-        self.begin_time_train: float = 0
+        self._begin_time_train: dict[str, float] = {}
+        self._train_timer_lock = threading.Lock()
+        # Tensorboard logger of the training running in the current thread
+        self._train_local = threading.local()
         self.base_tf_seconds = timeframe_to_seconds(self.config["timeframe"])
         self.continual_learning = self.freqai_info.get("continual_learning", False)
         self.plot_features = self.ft_params.get("plot_feature_importances", 0)
@@ -108,6 +117,8 @@ class IFreqaiModel(ABC):
         self.metadata: dict[str, Any] = self.dd.load_global_metadata_from_disk()
         self.data_provider: DataProvider | None = None
         self.max_system_threads = max(int(psutil.cpu_count() * 2 - 2), 1)
+        self.training_workers = self._get_training_workers()
+        self.persist_interval: float = self.freqai_info.get("persist_interval", 60)
         self.can_short = True  # overridden in start() with strategy.can_short
         self.model: Any = None
         if self.ft_params.get("principal_component_analysis", False) and self.continual_learning:
@@ -123,6 +134,45 @@ class IFreqaiModel(ABC):
         """
         return {}
 
+    @property
+    def tb_logger(self) -> Any:
+        return getattr(self._train_local, "tb_logger", None)
+
+    @tb_logger.setter
+    def tb_logger(self, tb_logger: Any) -> None:
+        self._train_local.tb_logger = tb_logger
+
+    def _get_training_workers(self) -> int:
+        """
+        Number of pairs to train at the same time, limited so that all
+        training threads (workers * threads per model) fit the available CPUs.
+        """
+        workers = max(int(self.freqai_info.get("training_workers", 1)), 1)
+        if workers == 1:
+            return workers
+        if not self.parallel_training:
+            logger.warning(
+                f"{self.__class__.__name__} does not support parallel training, "
+                "using 1 training worker."
+            )
+            return 1
+        params = self.model_training_parameters
+        model_threads = next(
+            (params[key] for key in ("n_jobs", "nthread", "num_threads") if key in params), 1
+        )
+        cpus = psutil.cpu_count() or 1
+        if not isinstance(model_threads, int) or model_threads <= 0:
+            # e.g. n_jobs=-1 - the model uses all cores
+            model_threads = cpus
+        max_workers = max(cpus // model_threads, 1)
+        if workers > max_workers:
+            logger.warning(
+                f"Limiting training_workers to {max_workers}, as models use {model_threads} "
+                f"threads each on {cpus} CPUs."
+            )
+            workers = max_workers
+        return workers
+
     def assert_config(self, config: Config) -> None:
         if not config.get("freqai", {}):
             raise OperationalException("No freqai parameters found in configuration file.")
@@ -210,6 +260,9 @@ class IFreqaiModel(ABC):
                 " False."
             )
 
+        if self.dd.model_registry:
+            self.dd.model_registry.release_ownership()
+
     def start_scanning(self, *args, **kwargs) -> None:
         """
         Start `self._start_scanning` in a separate thread
@@ -221,50 +274,109 @@ class IFreqaiModel(ABC):
     def _start_scanning(self, strategy: IStrategy) -> None:
         """
         Function designed to constantly scan pairs for retraining on a separate thread (intracandle)
-        to improve model youth. This function is agnostic to data preparation/collection/storage,
+        to improve model youth. Pairs due for retraining are trained by a pool of
+        `training_workers` threads - pairs with the oldest models first.
+        This function is agnostic to data preparation/collection/storage,
         it simply trains on what ever data is available in the self.dd.
         :param strategy: IStrategy = The user defined strategy class
         """
-        while not self._stop_event.is_set():
-            time.sleep(1)
-            pair = self.train_queue[0]
+        training: dict[str, Future] = {}
+        last_persist = time.monotonic()
+        persist_pending = False
+        registry = self.dd.model_registry
+        with ThreadPoolExecutor(self.training_workers, thread_name_prefix="freqai_train") as pool:
+            while not self._stop_event.wait(1):
+                for pair in [pair for pair, future in training.items() if future.done()]:
+                    del training[pair]
+                    persist_pending = True
+
+                free_workers = self.training_workers - len(training)
+                if registry:
+                    if self.dd.sync_from_model_registry(list(self.train_queue)):
+                        persist_pending = True
+                    if not registry.is_owner:
+                        if registry.acquire_ownership():
+                            # Models loaded as reader are memory-mapped (read-only) - reload them.
+                            with self.dd.model_lock:
+                                self.dd.model_dictionary.clear()
+                        else:
+                            # Another bot trains - models are taken from the registry.
+                            free_workers = 0
+
+                due = self._get_pairs_to_train(strategy, training) if free_workers > 0 else []
+                for pair, dk, trained_timerange, data_load_timerange in due[:free_workers]:
+                    self._train_attempts[pair] = time.time()
+                    training[pair] = pool.submit(
+                        self._train_pair, pair, strategy, dk, trained_timerange, data_load_timerange
+                    )
+
+                # Persistence is debounced - not written after every trained pair.
+                if persist_pending and time.monotonic() - last_persist >= self.persist_interval:
+                    self._persist_training_state()
+                    last_persist = time.monotonic()
+                    persist_pending = False
+
+        if persist_pending and self.freqai_info.get("write_metrics_to_disk", False):
+            self.dd.save_metric_tracker_to_disk()
 
+    def _get_pairs_to_train(
+        self, strategy: IStrategy, training: dict[str, Future]
+    ) -> list[tuple[str, FreqaiDataKitchen, TimeRange, TimeRange]]:
+        """
+        Pairs due for retraining which are not being trained already, oldest model first.
+        Pairs which failed to train are sorted by the time of their last attempt.
+        """
+        whitelist = strategy.dp.current_whitelist()
+        for pair in [pair for pair in self.train_queue if pair not in whitelist]:
             # ensure pair is available in dp
-            if pair not in strategy.dp.current_whitelist():
-                self.train_queue.popleft()
-                logger.warning(f"{pair} not in current whitelist, removing from train queue.")
-                continue
+            self.train_queue.remove(pair)
+            logger.warning(f"{pair} not in current whitelist, removing from train queue.")
 
+        due: list[tuple[float, int, tuple[str, FreqaiDataKitchen, TimeRange, TimeRange]]] = []
+        for idx, pair in enumerate(self.train_queue):
+            if pair in training:
+                continue
             (_, trained_timestamp) = self.dd.get_pair_dict_info(pair)
-
             dk = FreqaiDataKitchen(self.config, self.live, pair)
             (
                 retrain,
                 new_trained_timerange,
                 data_load_timerange,
             ) = dk.check_if_new_training_required(trained_timestamp)
-
             if retrain:
-                self.train_timer("start")
-                dk.set_paths(pair, new_trained_timerange.stopts)
-                try:
-                    self.extract_data_and_train_model(
-                        new_trained_timerange, pair, strategy, dk, data_load_timerange
-                    )
-                except Exception as msg:
-                    logger.exception(
-                        f"Training {pair} raised exception {msg.__class__.__name__}. "
-                        f"Message: {msg}, skipping."
-                    )
-
-                self.train_timer("stop", pair)
+                age = max(trained_timestamp, self._train_attempts.get(pair, 0))
+                due.append((age, idx, (pair, dk, new_trained_timerange, data_load_timerange)))
+        due.sort(key=lambda entry: entry[:2])
+        return [entry[2] for entry in due]
 
-                # only rotate the queue after the first has been trained.
-                self.train_queue.rotate(-1)
+    def _train_pair(
+        self,
+        pair: str,
+        strategy: IStrategy,
+        dk: FreqaiDataKitchen,
+        new_trained_timerange: TimeRange,
+        data_load_timerange: TimeRange,
+    ) -> None:
+        """
+        Train a model for one pair - runs on a training worker thread.
+        """
+        self.train_timer("start", pair)
+        dk.set_paths(pair, new_trained_timerange.stopts)
+        try:
+            self.extract_data_and_train_model(
+                new_trained_timerange, pair, strategy, dk, data_load_timerange
+            )
+        except Exception as msg:
+            logger.exception(
+                f"Training {pair} raised exception {msg.__class__.__name__}. "
+                f"Message: {msg}, skipping."
+            )
+        self.train_timer("stop", pair)
 
-                self.dd.save_historic_predictions_to_disk()
-                if self.freqai_info.get("write_metrics_to_disk", False):
-                    self.dd.save_metric_tracker_to_disk()
+    def _persist_training_state(self) -> None:
+        self.dd.save_historic_predictions_to_disk()
+        if self.freqai_info.get("write_metrics_to_disk", False):
+            self.dd.save_metric_tracker_to_disk()
 
     def start_backtesting(
         self, dataframe: DataFrame, metadata: dict, dk: FreqaiDataKitchen, strategy: IStrategy
@@ -743,19 +855,20 @@ class IFreqaiModel(ABC):
         FreqAI.
         """
         if do == "start":
-            self.pair_it_train += 1
-            self.begin_time_train = time.time()
+            with self._train_timer_lock:
+                self.pair_it_train += 1
+                self._begin_time_train[pair] = time.time()
         elif do == "stop":
             end = time.time()
-            time_spent = end - self.begin_time_train
+            with self._train_timer_lock:
+                time_spent = end - self._begin_time_train.pop(pair, end)
+                self.train_time += time_spent
+                if self.pair_it_train == self.total_pairs:
+                    logger.info(f"Total time spent training pairlist {self.train_time:.2f} seconds")
+                    self.pair_it_train = 0
+                    self.train_time = 0
             if self.freqai_info.get("write_metrics_to_disk", False):
                 self.dd.collect_metrics(time_spent, pair)
-
-            self.train_time += time_spent
-            if self.pair_it_train == self.total_pairs:
-                logger.info(f"Total time spent training pairlist {self.train_time:.2f} seconds")
-                self.pair_it_train = 0
-                self.train_time = 0
         return
 
     def get_init_model(self, pair: str) -> Any:
@@ -0,0 +1,202 @@
+"""
+Append-only storage of FreqAI historic predictions.
+"""
+
+import logging
+import os
+import pickle
+import threading
+from collections.abc import Iterator, MutableMapping
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+import pandas as pd
+from pandas import DataFrame
+
+
+logger = logging.getLogger(__name__)
+
+BASE_SUFFIXES = (".feather", ".pkl")
+LOG_SUFFIX = ".log"
+# A pair's log is compacted into its base file once it holds more rows than the base,
+# or more than this many records (a record is written per pair and save).
+COMPACT_MAX_RECORDS = 1000
+
+
+@dataclass
+class _PairState:
+    # Rows (and columns) of the in-memory dataframe which are on disk
+    rows: int
+    columns: list
+    base_rows: int
+    log_rows: int = 0
+    log_records: int = 0
+
+
+def _fsync(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class HistoricPredictions(MutableMapping[str, DataFrame]):
+    """
+    Historic predictions per pair, stored in one directory.
+    * Per pair, a compacted base file (feather - or pickle for columns arrow can't represent)
+      and a log of the rows appended since.
+    * Saving only appends the new rows of a pair to its log. The log is periodically compacted
+      into the base file, which is replaced atomically.
+    * An incomplete record at the end of a log (e.g. after a crash) is ignored.
+    * Pairs are loaded from disk on first access.
+    Rows are assumed to be appended only - dataframes which lost rows or changed columns
+    are rewritten completely.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._frames: dict[str, DataFrame] = {}
+        self._state: dict[str, _PairState] = {}
+        self._on_disk: dict[str, None] = {}
+        self._load_lock = threading.Lock()
+        if path.is_dir():
+            for file in sorted(path.iterdir()):
+                if file.suffix in (*BASE_SUFFIXES, LOG_SUFFIX):
+                    self._on_disk[unquote(file.stem)] = None
+
+    def _file(self, pair: str, suffix: str) -> Path:
+        return self.path / f"{quote(pair, safe='')}{suffix}"
+
+    def __getitem__(self, pair: str) -> DataFrame:
+        frame = self._frames.get(pair)
+        if frame is None:
+            if pair not in self._on_disk:
+                raise KeyError(pair)
+            with self._load_lock:
+                frame = self._frames.get(pair)
+                if frame is None:
+                    frame = self._load(pair)
+                    self._frames[pair] = frame
+        return frame
+
+    def __setitem__(self, pair: str, frame: DataFrame) -> None:
+        self._frames[pair] = frame
+
+    def __delitem__(self, pair: str) -> None:
+        if pair not in self:
+            raise KeyError(pair)
+        self._frames.pop(pair, None)
+        self._state.pop(pair, None)
+        self._on_disk.pop(pair, None)
+        for suffix in (*BASE_SUFFIXES, LOG_SUFFIX):
+            self._file(pair, suffix).unlink(missing_ok=True)
+
+    def __contains__(self, pair: object) -> bool:
+        return pair in self._frames or pair in self._on_disk
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(dict.fromkeys([*self._on_disk, *self._frames]))
+
+    def __len__(self) -> int:
+        return len(dict.fromkeys([*self._on_disk, *self._frames]))
+
+    def _load(self, pair: str) -> DataFrame:
+        bases = [f for f in (self._file(pair, s) for s in BASE_SUFFIXES) if f.is_file()]
+        frames = []
+        rows = 0
+        if bases:
+            # Both exist if a crash interrupted switching formats - the newer one is valid.
+            base_file = max(bases, key=lambda f: f.stat().st_mtime)
+            if base_file.suffix == ".feather":
+                frames.append(pd.read_feather(base_file))
+            else:
+                # Written by this bot only, same as the previous pickled historic predictions
+                frames.append(pd.read_pickle(base_file))  # noqa: S301
+            rows = len(frames[0])
+        state = _PairState(rows, [], base_rows=rows)
+
+        log_file = self._file(pair, LOG_SUFFIX)
+        if log_file.is_file():
+            with log_file.open("rb") as fp:
+                while True:
+                    try:
+                        # Local file, written by _append_log
+                        start, chunk = pickle.load(fp)  # noqa: S301
+                    except EOFError:
+                        break
+                    except Exception:
+                        logger.warning(
+                            f"Ignoring incomplete historic predictions record for {pair}."
+                        )
+                        # Appending behind a broken record would be unreadable.
+                        state.log_records = COMPACT_MAX_RECORDS
+                        break
+                    if start < rows:
+                        # Already contained in the base file (crash during compaction)
+                        chunk = chunk.iloc[rows - start :]
+                    if len(chunk) == 0:
+                        continue
+                    frames.append(chunk)
+                    rows += len(chunk)
+                    state.log_rows += len(chunk)
+                    state.log_records += 1
+
+        if not frames:
+            frames.append(DataFrame())
+        frame = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        state.rows = len(frame)
+        state.columns = list(frame.columns)
+        self._state[pair] = state
+        return frame
+
+    def save(self) -> None:
+        """
+        Write the rows which are not on disk yet.
+        Dataframes must be replaced rather than modified in place while this runs
+        (in another thread).
+        """
+        for pair, frame in list(self._frames.items()):
+            state = self._state.get(pair)
+            columns = list(frame.columns)
+            if (
+                state is None
+                or len(frame) < state.rows
+                or columns != state.columns
+                or state.log_rows >= max(state.base_rows, 1)
+                or state.log_records >= COMPACT_MAX_RECORDS
+            ):
+                self.path.mkdir(parents=True, exist_ok=True)
+                self._write_base(pair, frame)
+                self._state[pair] = _PairState(len(frame), columns, base_rows=len(frame))
+            elif len(frame) > state.rows:
+                self._append_log(pair, state.rows, frame.iloc[state.rows :])
+                state.log_rows += len(frame) - state.rows
+                state.log_records += 1
+                state.rows = len(frame)
+            self._on_disk[pair] = None
+
+    def _write_base(self, pair: str, frame: DataFrame) -> None:
+        tmp_file = self._file(pair, ".tmp")
+        frame = frame.reset_index(drop=True)
+        try:
+            frame.to_feather(tmp_file)
+            suffix = ".feather"
+        except (ImportError, ValueError, TypeError):
+            # pyarrow is unavailable, or columns hold mixed types (e.g. classifier labels)
+            frame.to_pickle(tmp_file)
+            suffix = ".pkl"
+        _fsync(tmp_file)
+        tmp_file.replace(self._file(pair, suffix))
+        for other in BASE_SUFFIXES:
+            if other != suffix:
+                self._file(pair, other).unlink(missing_ok=True)
+        # Records still in the log are skipped on load, should removing it fail.
+        self._file(pair, LOG_SUFFIX).unlink(missing_ok=True)
+
+    def _append_log(self, pair: str, start: int, frame: DataFrame) -> None:
+        with self._file(pair, LOG_SUFFIX).open("ab") as fp:
+            pickle.dump((start, frame), fp, protocol=pickle.HIGHEST_PROTOCOL)
+            fp.flush()
+            os.fsync(fp.fileno())
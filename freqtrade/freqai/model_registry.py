@@ -0,0 +1,133 @@
+"""
+Registry of trained FreqAI models, shared by all bots running the same `identifier`.
+"""
+
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import TypedDict
+from urllib.parse import quote
+
+import rapidjson
+
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+else:
+    import fcntl
+
+
+logger = logging.getLogger(__name__)
+
+OWNER_LOCK = "owner.lock"
+
+
+class ModelVersion(TypedDict):
+    pair: str
+    trained_timestamp: int
+    model_filename: str
+    data_path: str
+
+
+class ModelRegistry:
+    """
+    Publishes the latest model version per pair to a directory shared by several bot processes.
+    * One process - the training owner - trains models and publishes new versions.
+      Ownership is an exclusive lock on a file in the registry, released by the operating
+      system when the owner stops (or crashes), so another process can take over.
+    * All other processes are readers - they load the published model files instead of
+      training their own.
+    Versions are keyed by (identifier, pair, trained_timestamp), and written atomically.
+    """
+
+    def __init__(self, path: Path, identifier: str) -> None:
+        self.path = Path(path) / identifier
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.identifier = identifier
+        self._lock_fd: int | None = None
+        self._mtimes: dict[str, int] = {}
+
+    @property
+    def is_owner(self) -> bool:
+        return self._lock_fd is not None
+
+    def acquire_ownership(self) -> bool:
+        """
+        Try to become the training owner. Never blocks.
+        :return: True if this process is the training owner
+        """
+        if self._lock_fd is not None:
+            return True
+        fd = os.open(self.path / OWNER_LOCK, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if sys.platform == "win32":  # pragma: no cover
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._lock_fd = fd
+        logger.info(f"Training owner for models of identifier {self.identifier}.")
+        return True
+
+    def release_ownership(self) -> None:
+        if self._lock_fd is not None:
+            # Closing the file releases the lock
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    def _file(self, pair: str) -> Path:
+        return self.path / f"{quote(pair, safe='')}.json"
+
+    def publish(self, version: ModelVersion) -> None:
+        """
+        Make a new model version available to all readers.
+        """
+        file = self._file(version["pair"])
+        tmp_file = file.with_name(f"{file.name}.{os.getpid()}.tmp")
+        with tmp_file.open("w") as fp:
+            rapidjson.dump(version, fp)
+        tmp_file.replace(file)
+
+    def latest(self, pair: str) -> ModelVersion | None:
+        """
+        Latest published model version for this pair.
+        """
+        try:
+            with self._file(pair).open("r") as fp:
+                return rapidjson.load(fp)
+        except (OSError, rapidjson.JSONDecodeError):
+            return None
+
+    def referenced_paths(self) -> set[Path]:
+        """
+        Model directories of all published versions - these must not be purged.
+        """
+        paths = set()
+        for file in self.path.glob("*.json"):
+            try:
+                with file.open("r") as fp:
+                    paths.add(Path(rapidjson.load(fp)["data_path"]).resolve())
+            except (OSError, KeyError, rapidjson.JSONDecodeError):
+                continue
+        return paths
+
+    def updated(self, pairs: list[str]) -> list[ModelVersion]:
+        """
+        Versions published since the previous call - only changed files are read.
+        """
+        versions = []
+        for pair in pairs:
+            try:
+                mtime = self._file(pair).stat().st_mtime_ns
+            except OSError:
+                continue
+            if self._mtimes.get(pair) == mtime:
+                continue
+            version = self.latest(pair)
+            if version is not None:
+                self._mtimes[pair] = mtime
+                versions.append(version)
+        return versions
@@ -4,6 +4,7 @@ Freqtrade is the main module of this bot. It contains the class Freqtrade()
 
 import logging
 import traceback
+from contextlib import AbstractContextManager, nullcontext
 from copy import deepcopy
 from datetime import datetime, time, timedelta, timezone
 from math import isclose
@@ -47,7 +48,7 @@ from freqtrade.exchange.exchange_types import CcxtOrder
 from freqtrade.leverage.liquidation_price import update_liquidation_prices
 from freqtrade.misc import safe_value_fallback, safe_value_fallback2
 from freqtrade.mixins import LoggingMixin
-from freqtrade.persistence import Order, PairLocks, Trade, init_db
+from freqtrade.persistence import Order, PairLocks, Trade, WriteBehind, init_db
 from freqtrade.persistence.key_value_store import set_startup_time
 from freqtrade.plugins.pairlistmanager import PairListManager
 from freqtrade.plugins.protectionmanager import ProtectionManager
@@ -104,7 +105,8 @@ class FreqtradeBot(LoggingMixin):
             self.config, exchange_config=exchange_config, load_leverage_tiers=True
         )
 
-        init_db(self.config["db_url"])
+        self.write_behind = WriteBehind.from_config(self.config)
+        init_db(self.config["db_url"], write_behind=self.write_behind)
 
         self.wallets = Wallets(self.config, self.exchange)
 
@@ -225,12 +227,23 @@ class FreqtradeBot(LoggingMixin):
             self.emc.shutdown()
         self.exchange.close()
         try:
+            if self.write_behind:
+                self.write_behind.stop()
             Trade.commit()
         except Exception:
             # Exceptions here will be happening if the db disappeared.
             # At which point we can no longer commit anyway.
             logger.exception("Error during cleanup")
 
+    def db_iteration(self) -> AbstractContextManager[None]:
+        """
+        Context of one bot iteration - with `db_durability` set to "fills", commits of
+        non-critical changes within it are written once the iteration ended.
+        """
+        if self.write_behind:
+            return self.write_behind.iteration()
+        return nullcontext()
+
     def startup(self) -> None:
         """
         Called on startup and after reloading the bot - triggers notifications and
@@ -282,31 +295,62 @@ class FreqtradeBot(LoggingMixin):
         with self._measure_execution:
             self.strategy.analyze(self.active_pair_whitelist)
 
-        with self._exit_lock:
-            # Check for exchange cancellations, timeouts and user requested replace
-            self.manage_open_orders()
+        try:
+            self._refresh_order_books(trades)
 
-        # Protect from collisions with force_exit.
-        # Without this, freqtrade may try to recreate stoploss_on_exchange orders
-        # while exiting is in process, since telegram messages arrive in an different thread.
-        with self._exit_lock:
-            trades = Trade.get_open_trades()
-            # First process current opened trades (positions)
-            self.exit_positions(trades)
+            with self._exit_lock:
+                # Check for exchange cancellations, timeouts and user requested replace
+                self.manage_open_orders()
 
-        # Check if we need to adjust our current positions before attempting to enter new trades.
-        if self.strategy.position_adjustment_enable:
+            # Protect from collisions with force_exit.
+            # Without this, freqtrade may try to recreate stoploss_on_exchange orders
+            # while exiting is in process, since telegram messages arrive in an different thread.
             with self._exit_lock:
-                self.process_open_trade_positions()
+                trades = Trade.get_open_trades()
+                # First process current opened trades (positions)
+                self.exit_positions(trades)
 
-        # Then looking for entry opportunities
-        if self.get_free_open_trades():
-            self.enter_positions()
-        self._schedule.run_pending()
-        Trade.commit()
+            # Check if we need to adjust our current positions
+            # before attempting to enter new trades.
+            if self.strategy.position_adjustment_enable:
+                with self._exit_lock:
+                    self.process_open_trade_positions()
+
+            # Then looking for entry opportunities
+            if self.get_free_open_trades():
+                self.enter_positions()
+            self._schedule.run_pending()
+            Trade.commit()
+        finally:
+            # Never trade on a stale snapshot in the next iteration
+            self.exchange.close_order_book_snapshot()
         self.rpc.process_msg_queue(self.dataprovider._msg_queue)
         self.last_process = datetime.now(timezone.utc)
 
+    def _refresh_order_books(self, trades: list[Trade]) -> None:
+        """
+        Start an order book snapshot for this iteration, prefetching the books
+        concurrently for the pairs of open trades which will need them - all of them with
+        order book pricing, otherwise only those with open orders to fill in dry-run.
+        Dry-run fills, order book pricing and depth of market checks then share
+        one order book per pair instead of fetching it for every call.
+        """
+        depth = 0
+        pairs: set[str] = set()
+        for pricing in (self.config["entry_pricing"], self.config["exit_pricing"]):
+            if pricing.get("use_order_book", False):
+                depth = max(depth, pricing.get("order_book_top", 1))
+                pairs.update(trade.pair for trade in trades)
+        if self.config["dry_run"]:
+            # Dry-run fills use a depth of 20
+            open_order_pairs = {
+                trade.pair for trade in trades if trade.has_open_orders or trade.has_open_sl_orders
+            }
+            if open_order_pairs:
+                depth = max(depth, 20)
+                pairs.update(open_order_pairs)
+        self.exchange.refresh_order_books(sorted(pairs), depth)
+
     def process_stopped(self) -> None:
         """
         Close all orders that were left open
@@ -841,7 +885,7 @@ class FreqtradeBot(LoggingMixin):
         """
         conf_bids_to_ask_delta = conf.get("bids_to_ask_delta", 0)
         logger.info(f"Checking depth of market for {pair} ...")
-        order_book = self.exchange.fetch_l2_order_book(pair, 1000)
+        order_book = self.exchange.get_order_book(pair, 1000)
         order_book_data_frame = order_book_to_dataframe(order_book["bids"], order_book["asks"])
         order_book_bids = order_book_data_frame["b_size"].sum()
         order_book_asks = order_book_data_frame["a_size"].sum()
@@ -8,7 +8,7 @@ import logging
 from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, cast
 
 from numpy import nan
 from pandas import DataFrame
@@ -17,7 +17,7 @@ from freqtrade import constants
 from freqtrade.configuration import TimeRange, validate_config_consistency
 from freqtrade.constants import DATETIME_PRINT_FORMAT, Config, IntOrInf, LongShort
 from freqtrade.data import history
-from freqtrade.data.btanalysis import find_existing_backtest_stats, trade_list_to_dataframe
+from freqtrade.data.btanalysis import find_existing_backtest_stats, trade_columns_to_dataframe
 from freqtrade.data.converter import trim_dataframe, trim_dataframes
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.data.metrics import combined_dataframes_with_rel_mean
@@ -42,6 +42,7 @@ from freqtrade.leverage.liquidation_price import update_liquidation_prices
 from freqtrade.mixins import LoggingMixin
 from freqtrade.optimize.backtest_caching import get_strategy_run_id
 from freqtrade.optimize.bt_progress import BTProgress
+from freqtrade.optimize.indicator_cache import IndicatorCache
 from freqtrade.optimize.optimize_reports import (
     generate_backtest_stats,
     generate_rejected_signals,
@@ -50,6 +51,7 @@ from freqtrade.optimize.optimize_reports import (
     store_backtest_results,
 )
 from freqtrade.persistence import (
+    BacktestOrder,
     CustomDataWrapper,
     LocalTrade,
     Order,
@@ -214,6 +216,9 @@ class Backtesting:
         self._can_short = self.trading_mode != TradingMode.SPOT
         self._position_stacking: bool = self.config.get("position_stacking", False)
         self.enable_protections: bool = self.config.get("enable_protections", False)
+        self.indicator_cache: IndicatorCache | None = (
+            IndicatorCache(self.config) if IndicatorCache.enabled(self.config) else None
+        )
         migrate_data(config, self.exchange)
 
         self.init_backtest()
@@ -232,6 +237,7 @@ class Backtesting:
     @staticmethod
     def cleanup():
         LoggingMixin.show_output = True
+        LocalTrade.use_float_math = False
         enable_database_use()
 
     def init_backtest_detail(self) -> None:
@@ -313,6 +319,15 @@ class Backtesting:
         self.progress.set_new_value(1)
         return data, self.timerange
 
+    def advise_all_indicators(self, data: dict[str, DataFrame]) -> dict[str, DataFrame]:
+        """
+        Populate indicators with the current strategy - loading unchanged pairs from the
+        indicator cache, if enabled.
+        """
+        if self.indicator_cache:
+            return self.indicator_cache.advise_all_indicators(self.strategy, data)
+        return self.strategy.advise_all_indicators(data)
+
     def load_bt_data_detail(self) -> None:
         """
         Loads backtest detail data (smaller timeframe) if necessary.
@@ -387,6 +402,8 @@ class Backtesting:
         Backtesting setup method - called once for every call to "backtest()".
         """
         self.disable_database_use()
+        # Set per run, as hyperopt runs backtests in worker processes
+        LocalTrade.use_float_math = self.config.get("backtest_float_math", False)
         PairLocks.reset_locks()
         Trade.reset_trades()
         CustomDataWrapper.reset_custom_data()
@@ -401,6 +418,12 @@ class Backtesting:
         self.dataprovider.clear_cache()
         if enable_protections:
             self._load_protections(self.strategy)
+        # Without backtest_keep_closed_trades, only closed trade objects protections may
+        # still look at are kept. Results of all trades are kept in LocalTrade.bt_trades_results.
+        retention = None
+        if not self.config.get("backtest_keep_closed_trades", True):
+            retention = self.protections.max_lookback_period if enable_protections else timedelta(0)
+        LocalTrade.bt_trades_closed_index.retention = retention
 
     def check_abort(self):
         """
@@ -687,6 +710,15 @@ class Backtesting:
             after_fill=True,
         )
 
+    @staticmethod
+    def _new_order(**kwargs) -> Order:
+        """
+        Create an order for backtesting.
+        BacktestOrder provides the attributes and methods of Order (without the database
+        mapping), so it's passed wherever Order is expected - e.g. to strategy callbacks.
+        """
+        return cast(Order, BacktestOrder(**kwargs))
+
     def _try_close_open_order(
         self, order: Order | None, trade: LocalTrade, current_date: datetime, row: tuple
     ) -> bool:
@@ -838,7 +870,7 @@ class Backtesting:
         if self.handle_similar_order(trade, close_rate, amount, trade.exit_side, exit_candle_time):
             return None
 
-        order = Order(
+        order = self._new_order(
             id=self.order_id_counter,
             ft_trade_id=trade.id,
             order_date=exit_candle_time,
@@ -1130,7 +1162,7 @@ class Backtesting:
 
             trade.adjust_stop_loss(trade.open_rate, self.strategy.stoploss, initial=True)
 
-            order = Order(
+            order = self._new_order(
                 id=self.order_id_counter,
                 ft_trade_id=trade.id,
                 ft_is_open=True,
@@ -1524,6 +1556,8 @@ class Backtesting:
         for current_time in self._time_generator(start_date, end_date):
             # Loop for each main candle.
             self.check_abort()
+            # Locks expired before the previous candle can't affect the remaining backtest.
+            PairLocks.compact_locks(current_time - self.timeframe_td)
             # Reset open trade count for this candle
             # Critical to avoid exceeding max_open_trades in backtesting
             # when timeframe-detail is used and trades close within the opening candle.
@@ -1655,7 +1689,7 @@ class Backtesting:
         self.handle_left_open(LocalTrade.bt_trades_open_pp, data=data)
         self.wallets.update()
 
-        results = trade_list_to_dataframe(LocalTrade.bt_trades)
+        results = trade_columns_to_dataframe(LocalTrade.bt_trades_results.columns)
         return {
             "results": results,
             "config": self.strategy.config,
@@ -1679,7 +1713,7 @@ class Backtesting:
         self._set_strategy(strat)
 
         # need to reprocess data every time to populate signals
-        preprocessed = self.strategy.advise_all_indicators(data)
+        preprocessed = self.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe
         # This only used to determine if trimming would result in an empty dataframe
@@ -16,7 +16,7 @@ from pandas import DataFrame
 from freqtrade.constants import DATETIME_PRINT_FORMAT, Config
 from freqtrade.data.converter import trim_dataframes
 from freqtrade.data.history import get_timerange
-from freqtrade.data.metrics import calculate_market_change
+from freqtrade.data.metrics import calculate_market_change, calculate_trade_metrics
 from freqtrade.enums import HyperoptState
 from freqtrade.exceptions import OperationalException
 from freqtrade.misc import deep_merge_dicts
@@ -331,6 +331,11 @@ class HyperOptimizer:
         processed: dict[str, DataFrame],
     ) -> dict[str, Any]:
         params_details = self._get_params_details(params_dict)
+        starting_balance = get_dry_run_wallet(self.config)
+        # Shared by the results and the loss function
+        trade_metrics = calculate_trade_metrics(
+            backtesting_results["results"], min_date, max_date, starting_balance
+        )
 
         strat_stats = generate_strategy_stats(
             self.pairlist,
@@ -340,6 +345,7 @@ class HyperOptimizer:
             max_date,
             market_change=self.market_change,
             is_hyperopt=True,
+            metrics=trade_metrics,
         )
         results_explanation = HyperoptTools.format_results_explanation_string(
             strat_stats, self.config["stake_currency"]
@@ -365,7 +371,8 @@ class HyperOptimizer:
                 config=self.config,
                 processed=processed,
                 backtest_stats=strat_stats,
-                starting_balance=get_dry_run_wallet(self.config),
+                starting_balance=starting_balance,
+                trade_metrics=trade_metrics,
             )
         return {
             "loss": loss,
@@ -406,7 +413,7 @@ class HyperOptimizer:
         )
 
     def advise_and_trim(self, data: dict[str, DataFrame]) -> dict[str, DataFrame]:
-        preprocessed = self.backtesting.strategy.advise_all_indicators(data)
+        preprocessed = self.backtesting.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe to get correct dates for output.
         # This is only used to keep track of min/max date after trimming.
@@ -9,7 +9,7 @@ from datetime import datetime
 
 from pandas import DataFrame
 
-from freqtrade.data.metrics import calculate_calmar
+from freqtrade.data.metrics import calculate_trade_metrics
 from freqtrade.optimize.hyperopt import IHyperOptLoss
 
 
@@ -34,6 +34,9 @@ class CalmarHyperOptLoss(IHyperOptLoss):
 
         Uses Calmar Ratio calculation.
         """
-        calmar_ratio = calculate_calmar(results, min_date, max_date, starting_balance)
+        metrics = kwargs.get("trade_metrics") or calculate_trade_metrics(
+            results, min_date, max_date, starting_balance
+        )
+        calmar_ratio = metrics.calmar
         # print(expected_returns_mean, max_drawdown, calmar_ratio)
         return -calmar_ratio
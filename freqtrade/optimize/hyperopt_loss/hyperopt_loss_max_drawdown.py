@@ -9,7 +9,7 @@ from datetime import datetime
 
 from pandas import DataFrame
 
-from freqtrade.data.metrics import calculate_max_drawdown
+from freqtrade.data.metrics import calculate_trade_metrics
 from freqtrade.optimize.hyperopt import IHyperOptLoss
 
 
@@ -36,10 +36,9 @@ class MaxDrawDownHyperOptLoss(IHyperOptLoss):
         Uses profit ratio weighted max_drawdown when drawdown is available.
         Otherwise directly optimizes profit ratio.
         """
-        total_profit = results["profit_abs"].sum()
-        try:
-            max_drawdown = calculate_max_drawdown(results, value_col="profit_abs")
-        except ValueError:
+        metrics = kwargs.get("trade_metrics") or calculate_trade_metrics(results)
+        total_profit = metrics.profit_total
+        if metrics.drawdown is None:
             # No losing trade, therefore no drawdown.
             return -total_profit
-        return -total_profit / max_drawdown.drawdown_abs
+        return -total_profit / metrics.drawdown.drawdown_abs
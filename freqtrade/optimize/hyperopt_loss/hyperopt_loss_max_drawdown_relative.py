@@ -5,9 +5,10 @@ This module defines the alternative HyperOptLoss class which can be used for
 Hyperoptimization.
 """
 
+import numpy as np
 from pandas import DataFrame
 
-from freqtrade.data.metrics import calculate_underwater
+from freqtrade.data.metrics import calculate_trade_metrics
 from freqtrade.optimize.hyperopt import IHyperOptLoss
 
 
@@ -29,13 +30,13 @@ class MaxDrawDownRelativeHyperOptLoss(IHyperOptLoss):
         Uses profit ratio weighted max_drawdown when drawdown is available.
         Otherwise directly optimizes profit ratio.
         """
-        total_profit = results["profit_abs"].sum()
+        metrics = kwargs.get("trade_metrics") or calculate_trade_metrics(
+            results, starting_balance=starting_balance
+        )
+        total_profit = metrics.profit_total
         try:
-            drawdown_df = calculate_underwater(
-                results, value_col="profit_abs", starting_balance=starting_balance
-            )
-            max_drawdown = abs(min(drawdown_df["drawdown"]))
-            relative_drawdown = max(drawdown_df["drawdown_relative"])
+            max_drawdown = abs(np.min(metrics.drawdown_series))
+            relative_drawdown = np.max(metrics.drawdown_relative)
             if max_drawdown == 0:
                 return -total_profit
             return -total_profit / max_drawdown / relative_drawdown
@@ -33,7 +33,7 @@ TARGET_TRADE_AMOUNT variable sets the minimum number of trades required to avoid
 import numpy as np
 from pandas import DataFrame
 
-from freqtrade.data.metrics import calculate_expectancy, calculate_max_drawdown
+from freqtrade.data.metrics import calculate_trade_metrics
 from freqtrade.optimize.hyperopt import IHyperOptLoss
 
 
@@ -59,31 +59,26 @@ class MultiMetricHyperOptLoss(IHyperOptLoss):
         starting_balance: float,
         **kwargs,
     ) -> float:
-        total_profit = results["profit_abs"].sum()
+        metrics = kwargs.get("trade_metrics") or calculate_trade_metrics(
+            results, starting_balance=starting_balance
+        )
+        total_profit = metrics.profit_total
 
         # Calculate profit factor
-        winning_profit = results.loc[results["profit_abs"] > 0, "profit_abs"].sum()
-        losing_profit = results.loc[results["profit_abs"] < 0, "profit_abs"].sum()
-        profit_factor = winning_profit / (abs(losing_profit) + 1e-6)
+        profit_factor = metrics.winning_profit / (abs(metrics.losing_profit) + 1e-6)
         log_profit_factor = np.log(profit_factor + PF_CONST)
 
         # Calculate expectancy
-        _, expectancy_ratio = calculate_expectancy(results)
-        log_expectancy_ratio = np.log(min(10, expectancy_ratio) + EXPECTANCY_CONST)
+        log_expectancy_ratio = np.log(min(10, metrics.expectancy_ratio) + EXPECTANCY_CONST)
 
         # Calculate winrate
-        winning_trades = results.loc[results["profit_abs"] > 0]
-        winrate = len(winning_trades) / len(results)
+        winrate = metrics.winning_trades / len(results)
         log_winrate_coef = np.log(WINRATE_CONST + winrate)
 
         # Calculate drawdown
-        try:
-            drawdown = calculate_max_drawdown(
-                results, starting_balance=starting_balance, value_col="profit_abs"
-            )
-            relative_account_drawdown = drawdown.relative_account_drawdown
-        except ValueError:
-            relative_account_drawdown = 0
+        relative_account_drawdown = (
+            metrics.drawdown.relative_account_drawdown if metrics.drawdown else 0
+        )
 
         # Trade Count Penalty
         trade_count_penalty = 1.0  # Default: no penalty
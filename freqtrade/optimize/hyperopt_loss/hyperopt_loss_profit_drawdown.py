@@ -10,7 +10,7 @@ individual needs.
 
 from pandas import DataFrame
 
-from freqtrade.data.metrics import calculate_max_drawdown
+from freqtrade.data.metrics import calculate_trade_metrics
 from freqtrade.optimize.hyperopt import IHyperOptLoss
 
 
@@ -23,15 +23,13 @@ class ProfitDrawDownHyperOptLoss(IHyperOptLoss):
     def hyperopt_loss_function(
         results: DataFrame, starting_balance: float, *args, **kwargs
     ) -> float:
-        total_profit = results["profit_abs"].sum()
-
-        try:
-            drawdown = calculate_max_drawdown(
-                results, starting_balance=starting_balance, value_col="profit_abs"
-            )
-            relative_account_drawdown = drawdown.relative_account_drawdown
-        except ValueError:
-            relative_account_drawdown = 0
+        metrics = kwargs.get("trade_metrics") or calculate_trade_metrics(
+            results, starting_balance=starting_balance
+        )
+        total_profit = metrics.profit_total
+        relative_account_drawdown = (
+            metrics.drawdown.relative_account_drawdown if metrics.drawdown else 0
+        )
 
         return -1 * (
             total_profit - (relative_account_drawdown * total_profit) * (1 - DRAWDOWN_MULT)
@@ -9,7 +9,7 @@ from datetime import datetime
 
 from pandas import DataFrame
 
-from freqtrade.data.metrics import calculate_sharpe
+from freqtrade.data.metrics import calculate_trade_metrics
 from freqtrade.optimize.hyperopt import IHyperOptLoss
 
 
@@ -34,6 +34,9 @@ class SharpeHyperOptLoss(IHyperOptLoss):
 
         Uses Sharpe Ratio calculation.
         """
-        sharp_ratio = calculate_sharpe(results, min_date, max_date, starting_balance)
+        metrics = kwargs.get("trade_metrics") or calculate_trade_metrics(
+            results, min_date, max_date, starting_balance
+        )
+        sharp_ratio = metrics.sharpe
         # print(expected_returns_mean, up_stdev, sharp_ratio)
         return -sharp_ratio
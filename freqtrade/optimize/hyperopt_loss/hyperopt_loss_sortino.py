@@ -9,7 +9,7 @@ from datetime import datetime
 
 from pandas import DataFrame
 
-from freqtrade.data.metrics import calculate_sortino
+from freqtrade.data.metrics import calculate_trade_metrics
 from freqtrade.optimize.hyperopt import IHyperOptLoss
 
 
@@ -34,6 +34,9 @@ class SortinoHyperOptLoss(IHyperOptLoss):
 
         Uses Sortino Ratio calculation.
         """
-        sortino_ratio = calculate_sortino(results, min_date, max_date, starting_balance)
+        metrics = kwargs.get("trade_metrics") or calculate_trade_metrics(
+            results, min_date, max_date, starting_balance
+        )
+        sortino_ratio = metrics.sortino
         # print(expected_returns_mean, down_stdev, sortino_ratio)
         return -sortino_ratio
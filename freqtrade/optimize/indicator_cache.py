@@ -0,0 +1,284 @@
+"""
+On-disk cache of populated indicator dataframes for backtesting and hyperopt.
+"""
+
+import hashlib
+import inspect
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import rapidjson
+from pandas import DataFrame, read_feather
+
+from freqtrade.constants import Config
+from freqtrade.data.history.datahandlers.idatahandler import get_datahandlerclass
+from freqtrade.enums import CandleType
+from freqtrade.strategy.interface import IStrategy
+from freqtrade.strategy.parameters import BaseParameter
+
+
+logger = logging.getLogger(__name__)
+
+INDICATOR_CACHE_DIR = "indicator_cache"
+# Cache files not used for this long are removed
+INDICATOR_CACHE_MAX_AGE = 30 * 86400
+# IStrategy methods which populate indicators - all other IStrategy callbacks don't.
+INDICATOR_METHODS = (
+    "bot_start",
+    "informative_pairs",
+    "populate_indicators",
+    "populate_panel_indicators",
+)
+# Config keys which change the analyzed data
+INDICATOR_CONFIG_KEYS = (
+    "timeframe",
+    "stake_currency",
+    "trading_mode",
+    "margin_mode",
+    "candle_type_def",
+    "dataformat_ohlcv",
+    "exchange.name",
+)
+# Settings and callbacks of IStrategy - incl. attributes which are only annotated (e.g. stoploss)
+_ISTRATEGY_ATTRIBUTES = {*dir(IStrategy), *IStrategy.__annotations__}
+
+
+def _stat_fingerprint(file: Path) -> list | None:
+    try:
+        stat = file.stat()
+    except OSError:
+        return None
+    return [file.name, stat.st_size, stat.st_mtime_ns]
+
+
+class IndicatorCache:
+    """
+    Content-addressed cache of the dataframes returned by `advise_all_indicators()`.
+    A pair's entry is keyed by
+    * the source of the strategy's indicator methods (and of its own helper methods),
+    * the strategy's parameter values and other class attributes - except for settings like
+      ROI, stoploss or protections, which don't change indicators,
+    * a fingerprint of the pair's data file (and of informative data files),
+      plus the candles (timerange) loaded from it.
+    Entries are stored as feather files, so unchanged pairs are loaded instead of analyzed.
+    """
+
+    def __init__(self, config: Config) -> None:
+        self._config = config
+        self.path: Path = config["user_data_dir"] / INDICATOR_CACHE_DIR
+        self._datahandler = get_datahandlerclass(config.get("dataformat_ohlcv", "feather"))
+        self._pruned = False
+
+    @staticmethod
+    def enabled(config: Config) -> bool:
+        """
+        Indicators of freqai models and orderflow (trades) data are not cached.
+        Neither are indicators analyzed per hyperopt epoch, as parameters change every epoch.
+        """
+        return bool(
+            config.get("backtest_indicator_cache", False)
+            and config.get("backtest_cache", "day") != "none"
+            and not config.get("freqai", {}).get("enabled", False)
+            and not config.get("exchange", {}).get("use_public_trades", False)
+            and not config.get("analyze_per_epoch", False)
+        )
+
+    def _data_file(self, pair: str, timeframe: str, candle_type: CandleType | str) -> Path:
+        return self._datahandler._pair_data_filename(
+            self._config["datadir"], pair, timeframe, CandleType.from_string(candle_type)
+        )
+
+    def strategy_key(self, strategy: IStrategy) -> str:
+        """
+        Hash of everything in the strategy which may change indicators.
+        """
+        attributes: dict[str, Any] = {
+            **self._class_attributes(strategy),
+            **self._module_functions(strategy),
+            **self._config_attributes(),
+            "_informative": self._informative_fingerprints(strategy),
+            "_strategy": strategy.get_strategy_name(),
+        }
+        digest = hashlib.sha1()  # noqa: S324
+        digest.update(
+            rapidjson.dumps(attributes, default=str, number_mode=rapidjson.NM_NAN).encode("utf-8")
+        )
+        return digest.hexdigest().lower()
+
+    @staticmethod
+    def _source(value: Any) -> str:
+        try:
+            return inspect.getsource(value)
+        except (OSError, TypeError):
+            return getattr(value, "__qualname__", type(value).__name__)
+
+    @classmethod
+    def _class_attributes(cls, strategy: IStrategy) -> dict[str, Any]:
+        """
+        Parameter values, other class attributes and the source of methods
+        defined by the strategy (and its base classes other than IStrategy).
+        """
+        attributes: dict[str, Any] = {}
+        for klass in reversed(type(strategy).__mro__):
+            if klass in IStrategy.__mro__:
+                continue
+            for name, value in vars(klass).items():
+                if name.startswith("__"):
+                    continue
+                if isinstance(value, BaseParameter):
+                    attributes[name] = getattr(strategy, name).value
+                elif callable(value) or isinstance(value, property | staticmethod | classmethod):
+                    if name in _ISTRATEGY_ATTRIBUTES and name not in INDICATOR_METHODS:
+                        continue
+                    if isinstance(value, property):
+                        value = value.fget
+                    elif isinstance(value, staticmethod | classmethod):
+                        value = value.__func__
+                    attributes[name] = cls._source(value)
+                elif name not in _ISTRATEGY_ATTRIBUTES or name == "startup_candle_count":
+                    attributes[name] = value
+        return attributes
+
+    @staticmethod
+    def _module_functions(strategy: IStrategy) -> dict[str, str]:
+        """
+        Source of helper functions in the strategy file
+        """
+        module = type(strategy).__module__
+        functions: dict[str, str] = {}
+        for name, value in inspect.getmembers(sys.modules.get(module), inspect.isfunction):
+            if value.__module__ != module:
+                continue
+            try:
+                functions[f"_module.{name}"] = inspect.getsource(value)
+            except (OSError, TypeError):
+                pass
+        return functions
+
+    def _config_attributes(self) -> dict[str, Any]:
+        attributes: dict[str, Any] = {}
+        for key in INDICATOR_CONFIG_KEYS:
+            section, _, subkey = key.partition(".")
+            value = self._config.get(section)
+            attributes[key] = value.get(subkey) if subkey and isinstance(value, dict) else value
+        return attributes
+
+    def _informative_fingerprints(self, strategy: IStrategy) -> list:
+        """
+        Informative pairs are analyzed together with each pair.
+        """
+        informative = sorted(
+            {
+                (pair, timeframe, CandleType.from_string(candle_type).value)
+                for pair, timeframe, candle_type in strategy.gather_informative_pairs()
+            }
+        )
+        return [
+            (pair, _stat_fingerprint(self._data_file(pair, timeframe, candle_type)))
+            for pair, timeframe, candle_type in informative
+        ]
+
+    def _pair_file(self, strategy_key: str, pair: str, dataframe: DataFrame) -> Path | None:
+        fingerprint = _stat_fingerprint(
+            self._data_file(
+                pair,
+                self._config["timeframe"],
+                self._config.get("candle_type_def", CandleType.SPOT),
+            )
+        )
+        if fingerprint is None or dataframe.empty:
+            return None
+        digest = hashlib.sha1()  # noqa: S324
+        digest.update(
+            rapidjson.dumps(
+                [
+                    strategy_key,
+                    pair,
+                    fingerprint,
+                    len(dataframe),
+                    str(dataframe["date"].iloc[0]),
+                    str(dataframe["date"].iloc[-1]),
+                ]
+            ).encode("utf-8")
+        )
+        return self.path / f"{digest.hexdigest().lower()}.feather"
+
+    def _prune(self) -> None:
+        """
+        Remove cache files which have not been used for a while.
+        """
+        if self._pruned or not self.path.is_dir():
+            return
+        self._pruned = True
+        limit = time.time() - INDICATOR_CACHE_MAX_AGE
+        for file in self.path.glob("*.feather"):
+            try:
+                if file.stat().st_mtime < limit:
+                    file.unlink()
+            except OSError:
+                pass
+
+    def advise_all_indicators(
+        self, strategy: IStrategy, data: dict[str, DataFrame]
+    ) -> dict[str, DataFrame]:
+        """
+        Same as `strategy.advise_all_indicators(data)` - loading unchanged pairs from the cache.
+        :param strategy: Strategy to analyze the data with
+        :param data: Dictionary of pair to candle (OHLCV) dataframe
+        :return: Dictionary of pair to analyzed dataframe
+        """
+        self._prune()
+        strategy_key = self.strategy_key(strategy)
+        files = {pair: self._pair_file(strategy_key, pair, df) for pair, df in data.items()}
+
+        result: dict[str, DataFrame] = {}
+        for pair, file in files.items():
+            if file is None or not file.is_file():
+                continue
+            try:
+                dataframe = read_feather(file)
+            except Exception as e:
+                logger.warning(f"Could not load cached indicators for {pair}: {e}")
+                continue
+            if len(dataframe) != len(data[pair]):
+                continue
+            dataframe.index = data[pair].index
+            result[pair] = dataframe
+            os.utime(file)
+
+        missing = {pair: df for pair, df in data.items() if pair not in result}
+        logger.info(
+            f"Loaded indicators of {len(result)} pairs from the indicator cache, "
+            f"analyzing {len(missing)} pairs."
+        )
+        if result:
+            logger.warning(
+                "Indicator methods are not called for pairs loaded from the indicator cache - "
+                "state the strategy builds while populating indicators "
+                "(e.g. in `self.custom_info`) is missing for these pairs."
+            )
+        if missing:
+            analyzed = strategy.advise_all_indicators(missing)
+            self.path.mkdir(parents=True, exist_ok=True)
+            for pair, dataframe in analyzed.items():
+                file = files[pair]
+                if file is not None:
+                    self._store(file, dataframe)
+            result.update(analyzed)
+        # Keep the order of the data
+        return {pair: result[pair] for pair in data if pair in result}
+
+    @staticmethod
+    def _store(file: Path, dataframe: DataFrame) -> None:
+        tmp_file = file.with_name(f"{file.name}.{os.getpid()}.tmp")
+        try:
+            dataframe.reset_index(drop=True).to_feather(tmp_file)
+            tmp_file.replace(file)
+        except (ImportError, ValueError, TypeError) as e:
+            # pyarrow is unavailable, or columns can't be represented (e.g. mixed types)
+            logger.debug(f"Not caching indicators in {file.name}: {e}")
+            tmp_file.unlink(missing_ok=True)
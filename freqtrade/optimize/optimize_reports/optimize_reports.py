@@ -8,15 +8,10 @@ from pandas import DataFrame, Series, concat, to_datetime
 
 from freqtrade.constants import BACKTEST_BREAKDOWNS, DATETIME_PRINT_FORMAT
 from freqtrade.data.metrics import (
+    TradeMetrics,
     calculate_cagr,
-    calculate_calmar,
-    calculate_csum,
-    calculate_expectancy,
     calculate_market_change,
-    calculate_max_drawdown,
-    calculate_sharpe,
-    calculate_sortino,
-    calculate_sqn,
+    calculate_trade_metrics,
 )
 from freqtrade.ft_types import BacktestResultType
 from freqtrade.util import decimals_per_coin, fmt_coin, get_dry_run_wallet
@@ -367,6 +362,7 @@ def generate_strategy_stats(
     max_date: datetime,
     market_change: float,
     is_hyperopt: bool = False,
+    metrics: TradeMetrics | None = None,
 ) -> dict[str, Any]:
     """
     :param pairlist: List of pairs to backtest
@@ -376,6 +372,7 @@ def generate_strategy_stats(
     :param min_date: Backtest start date
     :param max_date: Backtest end date
     :param market_change: float indicating the market change
+    :param metrics: Trade metrics of the results, if already calculated
     :return: Dictionary containing results per strategy and a strategy summary.
     """
     results: DataFrame = content["results"]
@@ -435,11 +432,9 @@ def generate_strategy_stats(
         if len(pair_results) > 1
         else None
     )
-    winning_profit = results.loc[results["profit_abs"] > 0, "profit_abs"].sum()
-    losing_profit = results.loc[results["profit_abs"] < 0, "profit_abs"].sum()
-    profit_factor = winning_profit / abs(losing_profit) if losing_profit else 0.0
+    if metrics is None:
+        metrics = calculate_trade_metrics(results, min_date, max_date, start_balance)
 
-    expectancy, expectancy_ratio = calculate_expectancy(results)
     backtest_days = (max_date - min_date).days or 1
     trades_dict = results.to_dict(orient="records")
     strat_stats = {
@@ -466,13 +461,13 @@ def generate_strategy_stats(
         "profit_total_long_abs": results.loc[~results["is_short"], "profit_abs"].sum(),
         "profit_total_short_abs": results.loc[results["is_short"], "profit_abs"].sum(),
         "cagr": calculate_cagr(backtest_days, start_balance, content["final_balance"]),
-        "expectancy": expectancy,
-        "expectancy_ratio": expectancy_ratio,
-        "sortino": calculate_sortino(results, min_date, max_date, start_balance),
-        "sharpe": calculate_sharpe(results, min_date, max_date, start_balance),
-        "calmar": calculate_calmar(results, min_date, max_date, start_balance),
-        "sqn": calculate_sqn(results, start_balance),
-        "profit_factor": profit_factor,
+        "expectancy": metrics.expectancy,
+        "expectancy_ratio": metrics.expectancy_ratio,
+        "sortino": metrics.sortino,
+        "sharpe": metrics.sharpe,
+        "calmar": metrics.calmar,
+        "sqn": metrics.sqn,
+        "profit_factor": metrics.profit_factor,
         "backtest_start": min_date.strftime(DATETIME_PRINT_FORMAT),
         "backtest_start_ts": int(min_date.timestamp() * 1000),
         "backtest_end": max_date.strftime(DATETIME_PRINT_FORMAT),
@@ -523,15 +518,10 @@ def generate_strategy_stats(
         **trade_stats,
     }
 
-    try:
-        drawdown = calculate_max_drawdown(
-            results, value_col="profit_abs", starting_balance=start_balance
-        )
-        # max_relative_drawdown = Underwater
-        underwater = calculate_max_drawdown(
-            results, value_col="profit_abs", starting_balance=start_balance, relative=True
-        )
-
+    drawdown = metrics.drawdown
+    # max_relative_drawdown = Underwater
+    underwater = metrics.relative_drawdown
+    if drawdown is not None and underwater is not None:
         strat_stats.update(
             {
                 "max_drawdown_account": drawdown.relative_account_drawdown,
@@ -543,13 +533,11 @@ def generate_strategy_stats(
                 "drawdown_end_ts": drawdown.low_date.timestamp() * 1000,
                 "max_drawdown_low": drawdown.low_value,
                 "max_drawdown_high": drawdown.high_value,
+                "csum_min": metrics.csum_min,
+                "csum_max": metrics.csum_max,
             }
         )
-
-        csum_min, csum_max = calculate_csum(results, start_balance)
-        strat_stats.update({"csum_min": csum_min, "csum_max": csum_max})
-
-    except ValueError:
+    else:
         strat_stats.update(
             {
                 "max_drawdown_account": 0.0,
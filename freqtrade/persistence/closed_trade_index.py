@@ -0,0 +1,139 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from freqtrade.persistence.trade_model import LocalTrade
+
+# Number of closed trades after which all pairs are checked for trades to release
+RELEASE_SWEEP_INTERVAL = 1000
+
+
+class _ClosedTradeBucket:
+    __slots__ = ("dates", "entries", "in_order")
+
+    def __init__(self) -> None:
+        self.dates: list[datetime] = []
+        # (close_date, insertion sequence, trade)
+        self.entries: list[tuple[datetime, int, LocalTrade]] = []
+        # True while close dates were added in chronological order
+        self.in_order = True
+
+    def add(self, close_date: datetime, seq: int, trade: "LocalTrade") -> None:
+        if not self.dates or close_date >= self.dates[-1]:
+            self.dates.append(close_date)
+            self.entries.append((close_date, seq, trade))
+        else:
+            self.in_order = False
+            idx = bisect_right(self.dates, close_date)
+            self.dates.insert(idx, close_date)
+            # seq is unique, so trades themselves are never compared
+            insort(self.entries, (close_date, seq, trade))
+
+    def release_before(self, close_date: datetime) -> None:
+        """
+        Drop trades closed before close_date.
+        Trades are only dropped in batches (once they are at least half of the bucket),
+        so the cost of dropping them stays constant per trade.
+        """
+        idx = bisect_left(self.dates, close_date)
+        if idx and idx * 2 >= len(self.dates):
+            del self.dates[:idx]
+            del self.entries[:idx]
+
+
+class ClosedTradeIndex:
+    """
+    Closed backtesting trades, sorted by close_date - globally and per pair.
+    Used to answer lookback queries (close_date > x) via bisection.
+
+    With a retention period, only trades closed within this period before the latest close
+    are kept (e.g. the longest lookback of the enabled protections). Results of all closed
+    trades are stored in ClosedTradeColumns - so older trade objects can be released.
+    """
+
+    def __init__(self, retention: timedelta | None = None) -> None:
+        self.retention = retention
+        self._all = _ClosedTradeBucket()
+        self._pairs: dict[str, _ClosedTradeBucket] = {}
+        # (insertion sequence, trade) of trades without close_date
+        self._undated: list[tuple[int, LocalTrade]] = []
+        self._seq = 0
+
+    def __len__(self) -> int:
+        """Number of trades added - including released ones"""
+        return self._seq
+
+    def clear(self) -> None:
+        self._all = _ClosedTradeBucket()
+        self._pairs = {}
+        self._undated = []
+        self._seq = 0
+
+    def add(self, trade: "LocalTrade") -> None:
+        """
+        Add a closed trade.
+        """
+        seq = self._seq
+        self._seq += 1
+        if not trade.close_date:
+            # Can't match any close_date query
+            self._undated.append((seq, trade))
+            return
+        pair_bucket = self._pairs.setdefault(trade.pair, _ClosedTradeBucket())
+        self._all.add(trade.close_date, seq, trade)
+        pair_bucket.add(trade.close_date, seq, trade)
+        if self.retention is not None:
+            release_before = self._all.dates[-1] - self.retention
+            self._all.release_before(release_before)
+            pair_bucket.release_before(release_before)
+            if self._seq % RELEASE_SWEEP_INTERVAL == 0:
+                # Pairs without recent trades are checked periodically
+                for bucket in self._pairs.values():
+                    bucket.release_before(release_before)
+
+    def closed_after(self, pair: str | None, close_date: datetime) -> list["LocalTrade"]:
+        """
+        Trades (optionally filtered by pair) closed after close_date,
+        in the order they were added.
+        """
+        bucket = self._pairs.get(pair) if pair else self._all
+        if bucket is None:
+            return []
+        entries = bucket.entries[bisect_right(bucket.dates, close_date) :]
+        if not bucket.in_order:
+            entries.sort(key=lambda e: e[1])
+        return [e[2] for e in entries]
+
+    def trades(self) -> list["LocalTrade"]:
+        """
+        All closed trades (which weren't released yet), in the order they were added.
+        """
+        entries = [(e[1], e[2]) for e in self._all.entries]
+        if self._undated or not self._all.in_order:
+            entries.extend(self._undated)
+            entries.sort(key=lambda e: e[0])
+        return [e[1] for e in entries]
+
+
+class ClosedTradeColumns:
+    """
+    Results (`to_json(minified=True)`) of closed backtesting trades, stored column-wise.
+    Filled as trades close - so the results table doesn't have to be built from all trade
+    objects at the end of the backtest.
+    """
+
+    __slots__ = ("columns", "count")
+
+    def __init__(self) -> None:
+        self.columns: dict[str, list] = {}
+        self.count = 0
+
+    def add(self, trade: "LocalTrade") -> None:
+        for key, value in trade.to_json(True).items():
+            column = self.columns.get(key)
+            if column is None:
+                column = self.columns[key] = [None] * self.count
+            column.append(value)
+        self.count += 1
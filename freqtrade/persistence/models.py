@@ -7,7 +7,7 @@ import threading
 from contextvars import ContextVar
 from typing import Any, Final
 
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.exc import NoSuchModuleError
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -19,6 +19,7 @@ from freqtrade.persistence.key_value_store import _KeyValueStoreModel
 from freqtrade.persistence.migrations import check_migrate
 from freqtrade.persistence.pairlock import PairLock
 from freqtrade.persistence.trade_model import Order, Trade
+from freqtrade.persistence.write_behind import WriteBehind
 
 
 logger = logging.getLogger(__name__)
@@ -43,12 +44,23 @@ def get_request_or_thread_id() -> str | None:
 _SQL_DOCS_URL = "http://docs.sqlalchemy.org/en/latest/core/engines.html#database-urls"
 
 
-def init_db(db_url: str) -> None:
+def _set_sqlite_wal_mode(dbapi_connection, connection_record) -> None:
+    """
+    Writes go to the write-ahead log - which is only synced to disk on checkpoints.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+def init_db(db_url: str, write_behind: WriteBehind | None = None) -> None:
     """
     Initializes this module with the given config,
     registers all known command handlers
     and starts polling for message updates
     :param db_url: Database to use
+    :param write_behind: Write-behind mode for commits of the trading loop
     :return: None
     """
     kwargs: dict[str, Any] = {}
@@ -70,6 +82,9 @@ def init_db(db_url: str) -> None:
                 "connect_args": {"check_same_thread": False},
             }
         )
+        if write_behind:
+            # Wait for deferred commits of the trading loop to be written
+            kwargs["connect_args"]["timeout"] = max(30, write_behind.flush_interval * 3)
 
     try:
         engine = create_engine(db_url, future=True, **kwargs)
@@ -77,12 +92,18 @@ def init_db(db_url: str) -> None:
         raise OperationalException(
             f"Given value for db_url: '{db_url}' is no valid database URL! (See {_SQL_DOCS_URL})"
         )
+    session_kwargs: dict[str, Any] = {}
+    if write_behind:
+        session_kwargs = write_behind.sessionmaker_kwargs()
+        if db_url.startswith("sqlite:///"):
+            event.listen(engine, "connect", _set_sqlite_wal_mode)
 
     # https://docs.sqlalchemy.org/en/13/orm/contextual.html#thread-local-scope
     # Scoped sessions proxy requests to the appropriate thread-local session.
     # Since we also use fastAPI, we need to make it aware of the request id, too
     Trade.session = scoped_session(
-        sessionmaker(bind=engine, autoflush=False), scopefunc=get_request_or_thread_id
+        sessionmaker(bind=engine, autoflush=False, **session_kwargs),
+        scopefunc=get_request_or_thread_id,
     )
     Order.session = Trade.session
     PairLock.session = Trade.session
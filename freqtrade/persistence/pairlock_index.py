@@ -0,0 +1,81 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+
+from freqtrade.persistence.models import PairLock
+
+
+class PairLockIndex:
+    """
+    In-memory index of PairLocks, used when the database is disabled (backtesting).
+    Locks are grouped by pair and side, and kept sorted by lock end time -
+    so active locks are found by bisection instead of scanning all locks.
+    """
+
+    def __init__(self) -> None:
+        # pair -> side -> (sorted lock end times, [(insertion sequence, lock)])
+        self._buckets: dict[str, dict[str, tuple[list[datetime], list[tuple[int, PairLock]]]]] = {}
+        self._seq = 0
+        self._min_end: datetime | None = None
+
+    def clear(self) -> None:
+        self._buckets = {}
+        self._seq = 0
+        self._min_end = None
+
+    def add(self, lock: PairLock) -> None:
+        ends, locks = self._buckets.setdefault(lock.pair, {}).setdefault(lock.side, ([], []))
+        idx = bisect_right(ends, lock.lock_end_time)
+        ends.insert(idx, lock.lock_end_time)
+        locks.insert(idx, (self._seq, lock))
+        self._seq += 1
+        if self._min_end is None or lock.lock_end_time < self._min_end:
+            self._min_end = lock.lock_end_time
+
+    def query(self, pair: str | None, now: datetime, side: str | None) -> list[PairLock]:
+        """
+        Active locks ending at or after now, in insertion order.
+        Matches the semantics of PairLocks.get_pair_locks().
+        """
+        if pair is None:
+            pair_buckets = list(self._buckets.values())
+        elif pair in self._buckets:
+            pair_buckets = [self._buckets[pair]]
+        else:
+            return []
+
+        result: list[tuple[int, PairLock]] = []
+        for buckets in pair_buckets:
+            for lock_side, (ends, locks) in buckets.items():
+                if side is not None and lock_side != "*" and lock_side != side:
+                    continue
+                idx = bisect_left(ends, now)
+                result.extend(entry for entry in locks[idx:] if entry[1].active is True)
+        if len(result) > 1:
+            result.sort(key=lambda entry: entry[0])
+        return [entry[1] for entry in result]
+
+    def compact(self, before: datetime) -> None:
+        """
+        Remove locks which ended before the given date from the index.
+        Only valid if no query for an earlier date will follow.
+        """
+        if self._min_end is None or before <= self._min_end:
+            return
+        min_end: datetime | None = None
+        for pair in list(self._buckets):
+            buckets = self._buckets[pair]
+            for lock_side in list(buckets):
+                ends, locks = buckets[lock_side]
+                idx = bisect_left(ends, before)
+                del ends[:idx]
+                del locks[:idx]
+                if not ends:
+                    del buckets[lock_side]
+                elif min_end is None or ends[0] < min_end:
+                    min_end = ends[0]
+            if not buckets:
+                del self._buckets[pair]
+        self._min_end = min_end
+
+    def __len__(self) -> int:
+        return sum(len(ends) for buckets in self._buckets.values() for ends, _ in buckets.values())
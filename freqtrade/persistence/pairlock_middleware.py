@@ -6,6 +6,7 @@ from sqlalchemy import select
 
 from freqtrade.exchange import timeframe_to_next_date
 from freqtrade.persistence.models import PairLock
+from freqtrade.persistence.pairlock_index import PairLockIndex
 
 
 logger = logging.getLogger(__name__)
@@ -20,6 +21,8 @@ class PairLocks:
 
     use_db = True
     locks: list[PairLock] = []
+    # Index on top of locks, used to query locks without scanning all locks.
+    _index: PairLockIndex = PairLockIndex()
 
     timeframe: str = ""
 
@@ -30,6 +33,17 @@ class PairLocks:
         """
         if not PairLocks.use_db:
             PairLocks.locks = []
+            PairLocks._index.clear()
+
+    @staticmethod
+    def compact_locks(before: datetime) -> None:
+        """
+        Drop locks which expired before the given date from the lookup index.
+        Only active for backtesting mode. Callers must not query locks for earlier dates afterwards.
+        All locks remain available through get_all_locks().
+        """
+        if not PairLocks.use_db:
+            PairLocks._index.compact(before)
 
     @staticmethod
     def lock_pair(
@@ -63,6 +77,7 @@ class PairLocks:
             PairLock.session.commit()
         else:
             PairLocks.locks.append(lock)
+            PairLocks._index.add(lock)
         return lock
 
     @staticmethod
@@ -82,17 +97,7 @@ class PairLocks:
         if PairLocks.use_db:
             return PairLock.query_pair_locks(pair, now, side).all()
         else:
-            locks = [
-                lock
-                for lock in PairLocks.locks
-                if (
-                    lock.lock_end_time >= now
-                    and lock.active is True
-                    and (pair is None or lock.pair == pair)
-                    and (side is None or lock.side == "*" or lock.side == side)
-                )
-            ]
-            return locks
+            return PairLocks._index.query(pair, now, side)
 
     @staticmethod
     def get_pair_longest_lock(
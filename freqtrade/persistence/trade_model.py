@@ -3,12 +3,13 @@ This module contains the class to persist trades into SQLite
 """
 
 import logging
+import warnings
 from collections import defaultdict
 from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from math import isclose
-from typing import Any, ClassVar, Optional, cast
+from typing import TYPE_CHECKING, Any, ClassVar, Optional, cast
 
 from sqlalchemy import (
     Enum,
@@ -48,6 +49,7 @@ from freqtrade.exchange.exchange_types import CcxtOrder
 from freqtrade.leverage import interest
 from freqtrade.misc import safe_value_fallback
 from freqtrade.persistence.base import ModelBase, SessionType
+from freqtrade.persistence.closed_trade_index import ClosedTradeColumns, ClosedTradeIndex
 from freqtrade.persistence.custom_data import CustomDataWrapper, _CustomData
 from freqtrade.util import FtPrecise, dt_from_ts, dt_now, dt_ts, dt_ts_none
 
@@ -63,59 +65,48 @@ class ProfitStruct:
     total_profit_ratio: float
 
 
-class Order(ModelBase):
+class LocalOrder:
     """
-    Order database model
-    Keeps a record of all orders placed on the exchange
-
-    One to many relationship with Trades:
-      - One trade can have many orders
-      - One Order can only be associated with one Trade
-
-    Mirrors CCXT Order structure
+    Order behavior, shared by the database model (Order)
+    and the lightweight order objects used in backtesting (BacktestOrder).
     """
 
-    __tablename__ = "orders"
-    __allow_unmapped__ = True
-    session: ClassVar[SessionType]
-
-    # Uniqueness should be ensured over pair, order_id
-    # its likely that order_id is unique per Pair on some exchanges.
-    __table_args__ = (UniqueConstraint("ft_pair", "order_id", name="_order_pair_order_id"),)
-
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    ft_trade_id: Mapped[int] = mapped_column(Integer, ForeignKey("trades.id"), index=True)
-
-    _trade_live: Mapped["Trade"] = relationship("Trade", back_populates="orders", lazy="immediate")
-    _trade_bt: "LocalTrade" = None  # type: ignore
-
-    # order_side can only be 'buy', 'sell' or 'stoploss'
-    ft_order_side: Mapped[str] = mapped_column(String(25), nullable=False)
-    ft_pair: Mapped[str] = mapped_column(String(25), nullable=False)
-    ft_is_open: Mapped[bool] = mapped_column(nullable=False, default=True, index=True)
-    ft_amount: Mapped[float] = mapped_column(Float(), nullable=False)
-    ft_price: Mapped[float] = mapped_column(Float(), nullable=False)
-    ft_cancel_reason: Mapped[str] = mapped_column(String(CUSTOM_TAG_MAX_LENGTH), nullable=True)
-
-    order_id: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
-    status: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    symbol: Mapped[str | None] = mapped_column(String(25), nullable=True)
-    order_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
-    side: Mapped[str] = mapped_column(String(25), nullable=True)
-    price: Mapped[float | None] = mapped_column(Float(), nullable=True)
-    average: Mapped[float | None] = mapped_column(Float(), nullable=True)
-    amount: Mapped[float | None] = mapped_column(Float(), nullable=True)
-    filled: Mapped[float | None] = mapped_column(Float(), nullable=True)
-    remaining: Mapped[float | None] = mapped_column(Float(), nullable=True)
-    cost: Mapped[float | None] = mapped_column(Float(), nullable=True)
-    stop_price: Mapped[float | None] = mapped_column(Float(), nullable=True)
-    order_date: Mapped[datetime] = mapped_column(nullable=True, default=dt_now)
-    order_filled_date: Mapped[datetime | None] = mapped_column(nullable=True)
-    order_update_date: Mapped[datetime | None] = mapped_column(nullable=True)
-    funding_fee: Mapped[float | None] = mapped_column(Float(), nullable=True)
-
-    ft_fee_base: Mapped[float | None] = mapped_column(Float(), nullable=True)
-    ft_order_tag: Mapped[str | None] = mapped_column(String(CUSTOM_TAG_MAX_LENGTH), nullable=True)
+    __slots__ = ()
+
+    if TYPE_CHECKING:
+        # Columns of Order - declared for type checking only, so they are not picked up by
+        # the SQLAlchemy declarative mapping. Mapped[] resolves to the value type on instances.
+        id: Mapped[int]
+        ft_trade_id: Mapped[int]
+        _trade_live: Mapped["Trade"]
+        _trade_bt: "LocalTrade"
+
+        ft_order_side: Mapped[str]
+        ft_pair: Mapped[str]
+        ft_is_open: Mapped[bool]
+        ft_amount: Mapped[float]
+        ft_price: Mapped[float]
+        ft_cancel_reason: Mapped[str]
+
+        order_id: Mapped[str]
+        status: Mapped[str | None]
+        symbol: Mapped[str | None]
+        order_type: Mapped[str | None]
+        side: Mapped[str]
+        price: Mapped[float | None]
+        average: Mapped[float | None]
+        amount: Mapped[float | None]
+        filled: Mapped[float | None]
+        remaining: Mapped[float | None]
+        cost: Mapped[float | None]
+        stop_price: Mapped[float | None]
+        order_date: Mapped[datetime]
+        order_filled_date: Mapped[datetime | None]
+        order_update_date: Mapped[datetime | None]
+        funding_fee: Mapped[float | None]
+
+        ft_fee_base: Mapped[float | None]
+        ft_order_tag: Mapped[str | None]
 
     @property
     def order_date_utc(self) -> datetime:
@@ -322,6 +313,61 @@ class Order(ModelBase):
                 trade.is_stop_loss_trailing = False
             trade.adjust_stop_loss(trade.open_rate, trade.stop_loss_pct)
 
+
+class Order(ModelBase, LocalOrder):
+    """
+    Order database model
+    Keeps a record of all orders placed on the exchange
+
+    One to many relationship with Trades:
+      - One trade can have many orders
+      - One Order can only be associated with one Trade
+
+    Mirrors CCXT Order structure
+    """
+
+    __tablename__ = "orders"
+    __allow_unmapped__ = True
+    session: ClassVar[SessionType]
+
+    # Uniqueness should be ensured over pair, order_id
+    # its likely that order_id is unique per Pair on some exchanges.
+    __table_args__ = (UniqueConstraint("ft_pair", "order_id", name="_order_pair_order_id"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    ft_trade_id: Mapped[int] = mapped_column(Integer, ForeignKey("trades.id"), index=True)
+
+    _trade_live: Mapped["Trade"] = relationship("Trade", back_populates="orders", lazy="immediate")
+    _trade_bt: "LocalTrade" = None  # type: ignore
+
+    # order_side can only be 'buy', 'sell' or 'stoploss'
+    ft_order_side: Mapped[str] = mapped_column(String(25), nullable=False)
+    ft_pair: Mapped[str] = mapped_column(String(25), nullable=False)
+    ft_is_open: Mapped[bool] = mapped_column(nullable=False, default=True, index=True)
+    ft_amount: Mapped[float] = mapped_column(Float(), nullable=False)
+    ft_price: Mapped[float] = mapped_column(Float(), nullable=False)
+    ft_cancel_reason: Mapped[str] = mapped_column(String(CUSTOM_TAG_MAX_LENGTH), nullable=True)
+
+    order_id: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    status: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    symbol: Mapped[str | None] = mapped_column(String(25), nullable=True)
+    order_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    side: Mapped[str] = mapped_column(String(25), nullable=True)
+    price: Mapped[float | None] = mapped_column(Float(), nullable=True)
+    average: Mapped[float | None] = mapped_column(Float(), nullable=True)
+    amount: Mapped[float | None] = mapped_column(Float(), nullable=True)
+    filled: Mapped[float | None] = mapped_column(Float(), nullable=True)
+    remaining: Mapped[float | None] = mapped_column(Float(), nullable=True)
+    cost: Mapped[float | None] = mapped_column(Float(), nullable=True)
+    stop_price: Mapped[float | None] = mapped_column(Float(), nullable=True)
+    order_date: Mapped[datetime] = mapped_column(nullable=True, default=dt_now)
+    order_filled_date: Mapped[datetime | None] = mapped_column(nullable=True)
+    order_update_date: Mapped[datetime | None] = mapped_column(nullable=True)
+    funding_fee: Mapped[float | None] = mapped_column(Float(), nullable=True)
+
+    ft_fee_base: Mapped[float | None] = mapped_column(Float(), nullable=True)
+    ft_order_tag: Mapped[str | None] = mapped_column(String(CUSTOM_TAG_MAX_LENGTH), nullable=True)
+
     @staticmethod
     def update_orders(orders: list["Order"], order: CcxtOrder):
         """
@@ -380,6 +426,68 @@ class Order(ModelBase):
         return Order.session.scalars(select(Order).filter(Order.order_id == order_id)).first()
 
 
+class BacktestOrder(LocalOrder):
+    """
+    Order used in backtesting.
+    Same attributes and behavior as Order, but a plain slotted object - without the
+    SQLAlchemy instrumentation and per-instance attribute dict of the database model.
+    """
+
+    __slots__ = (
+        "id",
+        "ft_trade_id",
+        "_trade_bt",
+        "ft_order_side",
+        "ft_pair",
+        "ft_is_open",
+        "ft_amount",
+        "ft_price",
+        "ft_cancel_reason",
+        "order_id",
+        "status",
+        "symbol",
+        "order_type",
+        "side",
+        "price",
+        "average",
+        "amount",
+        "filled",
+        "remaining",
+        "cost",
+        "stop_price",
+        "order_date",
+        "order_filled_date",
+        "order_update_date",
+        "funding_fee",
+        "ft_fee_base",
+        "ft_order_tag",
+    )
+
+    _trade_live: "Trade" = None  # type: ignore
+
+    def __init__(self, **kwargs):
+        for key in self.__slots__:
+            setattr(self, key, None)
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+
+class _DeprecatedBtTrades:
+    """
+    LocalTrade.bt_trades - the list of closed backtesting trades, replaced by
+    bt_trades_closed_index. Read-only.
+    """
+
+    def __get__(self, instance: Any, owner: Any = None) -> list["LocalTrade"]:
+        warnings.warn(
+            "LocalTrade.bt_trades is deprecated, "
+            "use LocalTrade.get_trades_proxy(is_open=False) instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return LocalTrade.bt_trades_closed_index.trades()
+
+
 class LocalTrade:
     """
     Trade database model.
@@ -387,12 +495,20 @@ class LocalTrade:
     """
 
     use_db: bool = False
+    # Calculate profits with floats instead of FtPrecise (string math) - faster, but subject to
+    # float rounding. Selected by backtesting and hyperopt via `backtest_float_math`.
+    use_float_math: bool = False
     # Trades container for backtesting
-    bt_trades: list["LocalTrade"] = []
     bt_trades_open: list["LocalTrade"] = []
     # Copy of trades_open - but indexed by pair
     bt_trades_open_pp: dict[str, list["LocalTrade"]] = defaultdict(list)
     bt_open_open_trade_count: int = 0
+    # Closed trades, sorted by close_date for lookback queries (e.g. from protections)
+    bt_trades_closed_index: ClosedTradeIndex = ClosedTradeIndex()
+    # Deprecated - closed trades are in bt_trades_closed_index
+    bt_trades = _DeprecatedBtTrades()
+    # Results of closed trades, collected as they close
+    bt_trades_results: ClosedTradeColumns = ClosedTradeColumns()
     bt_total_profit: float = 0
     realized_profit: float = 0
 
@@ -766,7 +882,8 @@ class LocalTrade:
         """
         Resets all trades. Only active for backtesting mode.
         """
-        LocalTrade.bt_trades = []
+        LocalTrade.bt_trades_closed_index = ClosedTradeIndex()
+        LocalTrade.bt_trades_results = ClosedTradeColumns()
         LocalTrade.bt_trades_open = []
         LocalTrade.bt_trades_open_pp = defaultdict(list)
         LocalTrade.bt_open_open_trade_count = 0
@@ -1027,6 +1144,10 @@ class LocalTrade:
         Calculate the open_rate including open_fee.
         :return: Price in of the open trade incl. Fees
         """
+        if self.use_float_math:
+            open_trade_f = float(amount) * float(open_rate)
+            fees_f = open_trade_f * self.fee_open
+            return open_trade_f - fees_f if self.is_short else open_trade_f + fees_f
         open_trade = FtPrecise(amount) * FtPrecise(open_rate)
         fees = open_trade * FtPrecise(self.fee_open)
         if self.is_short:
@@ -1044,6 +1165,7 @@ class LocalTrade:
     def calculate_interest(self) -> FtPrecise:
         """
         Calculate interest for this trade. Only applicable for Margin trading.
+        Always uses FtPrecise - margin trading is not available in backtesting.
         """
         zero = FtPrecise(0.0)
         # If nothing was borrowed
@@ -1079,8 +1201,20 @@ class LocalTrade:
         if rate is None and not self.close_rate:
             return 0.0
 
-        amount1 = FtPrecise(amount or self.amount)
         trading_mode = self.trading_mode or TradingMode.SPOT
+        if self.use_float_math and trading_mode != TradingMode.MARGIN:
+            close_trade = float(amount or self.amount) * rate
+            fees = close_trade * (self.fee_close or 0.0)
+            if trading_mode == TradingMode.SPOT:
+                return close_trade + fees if self.is_short else close_trade - fees
+            elif trading_mode == TradingMode.FUTURES:
+                funding_fees = self.funding_fees or 0.0
+                if self.is_short:
+                    return close_trade + fees - funding_fees
+                else:
+                    return close_trade - fees + funding_fees
+
+        amount1 = FtPrecise(amount or self.amount)
 
         if trading_mode == TradingMode.SPOT:
             return float(self._calc_base_close(amount1, rate, self.fee_close))
@@ -1198,12 +1332,13 @@ class LocalTrade:
         return float(f"{profit_ratio:.8f}")
 
     def recalc_trade_from_orders(self, *, is_closing: bool = False):
-        ZERO = FtPrecise(0.0)
-        current_amount = FtPrecise(0.0)
-        current_stake = FtPrecise(0.0)
-        max_stake_amount = FtPrecise(0.0)
+        num: Any = float if self.use_float_math else FtPrecise
+        ZERO = num(0.0)
+        current_amount = num(0.0)
+        current_stake = num(0.0)
+        max_stake_amount = num(0.0)
         total_stake = 0.0  # Total stake after all buy orders (does not subtract!)
-        avg_price = FtPrecise(0.0)
+        avg_price = num(0.0)
         close_profit = 0.0
         close_profit_abs = 0.0
         # Reset funding fees
@@ -1214,11 +1349,11 @@ class LocalTrade:
             if o.ft_is_open or not o.filled:
                 continue
             funding_fees += o.funding_fee or 0.0
-            tmp_amount = FtPrecise(o.safe_amount_after_fee)
-            tmp_price = FtPrecise(o.safe_price)
+            tmp_amount = num(o.safe_amount_after_fee)
+            tmp_price = num(o.safe_price)
 
             is_exit = o.ft_order_side != self.entry_side
-            side = FtPrecise(-1 if is_exit else 1)
+            side = num(-1 if is_exit else 1)
             if tmp_amount > ZERO and tmp_price is not None:
                 current_amount += tmp_amount * side
                 price = avg_price if is_exit else tmp_price
@@ -1434,7 +1569,7 @@ class LocalTrade:
         Helper function to query Trades.
         Returns a List of trades, filtered on the parameters given.
         In live mode, converts the filter to a database query and returns all rows
-        In Backtest mode, uses filters on Trade.bt_trades to get the result.
+        In Backtest mode, uses filters on the backtesting trades to get the result.
 
         :param pair: Filter by pair
         :param is_open: Filter by open/closed status
@@ -1445,15 +1580,22 @@ class LocalTrade:
         """
 
         # Offline mode - without database
+        if is_open is False and close_date:
+            # Lookback query (used by protections) - answered from the close_date index
+            sel_trades = LocalTrade.bt_trades_closed_index.closed_after(pair, close_date)
+            if open_date:
+                sel_trades = [trade for trade in sel_trades if trade.open_date > open_date]
+            return sel_trades
+
         if is_open is not None:
             if is_open:
                 sel_trades = LocalTrade.bt_trades_open
             else:
-                sel_trades = LocalTrade.bt_trades
+                sel_trades = LocalTrade.bt_trades_closed_index.trades()
 
         else:
             # Not used during backtesting, but might be used by a strategy
-            sel_trades = list(LocalTrade.bt_trades + LocalTrade.bt_trades_open)
+            sel_trades = LocalTrade.bt_trades_closed_index.trades() + LocalTrade.bt_trades_open
 
         if pair:
             sel_trades = [trade for trade in sel_trades if trade.pair == pair]
@@ -1471,7 +1613,8 @@ class LocalTrade:
         LocalTrade.bt_trades_open.remove(trade)
         LocalTrade.bt_trades_open_pp[trade.pair].remove(trade)
         LocalTrade.bt_open_open_trade_count -= 1
-        LocalTrade.bt_trades.append(trade)
+        LocalTrade.bt_trades_closed_index.add(trade)
+        LocalTrade.bt_trades_results.add(trade)
         LocalTrade.bt_total_profit += trade.close_profit_abs
 
     @staticmethod
@@ -1481,7 +1624,8 @@ class LocalTrade:
             LocalTrade.bt_trades_open_pp[trade.pair].append(trade)
             LocalTrade.bt_open_open_trade_count += 1
         else:
-            LocalTrade.bt_trades.append(trade)
+            LocalTrade.bt_trades_closed_index.add(trade)
+            LocalTrade.bt_trades_results.add(trade)
 
     @staticmethod
     def remove_bt_trade(trade):
@@ -1640,6 +1784,7 @@ class Trade(ModelBase, LocalTrade):
     session: ClassVar[SessionType]
 
     use_db: bool = True
+    use_float_math: bool = False
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)  # type: ignore
 
@@ -1800,7 +1945,7 @@ class Trade(ModelBase, LocalTrade):
         Helper function to query Trades.j
         Returns a List of trades, filtered on the parameters given.
         In live mode, converts the filter to a database query and returns all rows
-        In Backtest mode, uses filters on Trade.bt_trades to get the result.
+        In Backtest mode, uses filters on the backtesting trades to get the result.
 
         :return: unsorted List[Trade]
         """
@@ -0,0 +1,181 @@
+"""
+Write-behind commits for the trading loop.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from freqtrade.constants import Config
+from freqtrade.persistence.trade_model import Order, Trade
+
+
+logger = logging.getLogger(__name__)
+
+# Session.info key - set once the session flushed changes which must be written immediately
+_IMMEDIATE_KEY = "ft_write_immediately"
+_WRITE_BEHIND_KEY = "ft_write_behind"
+
+
+def _has_changed(obj: Any, attributes: tuple[str, ...]) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[attr].history.has_changes() for attr in attributes)
+
+
+def _writes_immediately(obj: Any, is_new: bool) -> bool:
+    """
+    New orders, fills and exits are written immediately - everything else may be delayed.
+    """
+    if isinstance(obj, Order):
+        return is_new or _has_changed(obj, ("ft_is_open", "status", "filled"))
+    if isinstance(obj, Trade):
+        return is_new or _has_changed(obj, ("is_open",))
+    return False
+
+
+class WriteBehindSession(Session):
+    """
+    Session which leaves commits within a bot iteration to the write-behind writer.
+    """
+
+    def commit(self) -> None:
+        write_behind: WriteBehind | None = self.info.get(_WRITE_BEHIND_KEY)
+        if write_behind is not None and write_behind.defer_commit(self):
+            return
+        super().commit()
+        if write_behind is not None:
+            write_behind.committed(self)
+
+
+@event.listens_for(WriteBehindSession, "before_flush")
+def _check_immediate_changes(session: Session, flush_context, instances) -> None:
+    if (
+        any(_writes_immediately(obj, True) for obj in session.new)
+        or any(_writes_immediately(obj, False) for obj in session.dirty)
+        or any(isinstance(obj, Order | Trade) for obj in session.deleted)
+    ):
+        session.info[_IMMEDIATE_KEY] = True
+
+
+class WriteBehind:
+    """
+    Write-behind mode for the database session of the trading loop.
+    Within a bot iteration, commits only flush changes to the database. New orders, fills and
+    exits are committed immediately (together with all changes flushed so far).
+    All other changes are committed by a writer thread once the iteration ended - at most
+    every `flush_interval` seconds - so their disk writes don't delay the trading loop.
+    Changes which are not committed yet are lost if the bot crashes.
+    """
+
+    def __init__(self, flush_interval: float) -> None:
+        self.flush_interval = flush_interval
+        # Held during bot iterations, and while the writer commits.
+        self._lock = threading.RLock()
+        self._owner: int | None = None
+        self._flushing = False
+        self._session: Session | None = None
+        self._pending_since: float | None = None
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @staticmethod
+    def from_config(config: Config) -> "WriteBehind | None":
+        if config.get("db_durability", "full") != "fills":
+            return None
+        return WriteBehind(config.get("db_flush_interval", 2))
+
+    def sessionmaker_kwargs(self) -> dict[str, Any]:
+        return {"class_": WriteBehindSession, "info": {_WRITE_BEHIND_KEY: self}}
+
+    @property
+    def pending(self) -> bool:
+        return self._pending_since is not None
+
+    @contextmanager
+    def iteration(self) -> Iterator[None]:
+        """
+        Context of one bot iteration - commits within it are deferred.
+        """
+        with self._lock:
+            self._owner = threading.get_ident()
+            try:
+                yield
+            finally:
+                self._owner = None
+        if self.pending:
+            self._wakeup.set()
+
+    def defer_commit(self, session: Session) -> bool:
+        """
+        Called on commit - flushes the session, deferring the actual commit if possible.
+        :return: True if the commit was deferred.
+        """
+        if self._flushing or self._owner != threading.get_ident():
+            return False
+        session.flush()
+        if session.info.pop(_IMMEDIATE_KEY, False):
+            return False
+        if self._pending_since is None:
+            self._pending_since = time.monotonic()
+        self._session = session
+        self._start_writer()
+        return True
+
+    def committed(self, session: Session) -> None:
+        session.info.pop(_IMMEDIATE_KEY, None)
+        if session is self._session:
+            self._session = None
+            self._pending_since = None
+
+    def flush(self) -> None:
+        """
+        Commit deferred changes. Waits for a running bot iteration to end.
+        """
+        with self._lock:
+            session = self._session
+            if session is None:
+                return
+            self._flushing = True
+            try:
+                session.commit()
+            except Exception:
+                logger.exception("Could not write deferred database changes.")
+                session.rollback()
+                self.committed(session)
+            finally:
+                self._flushing = False
+
+    def _start_writer(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="ft_write_behind", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._pending_since is None:
+                continue
+            delay = self._pending_since + self.flush_interval - time.monotonic()
+            if delay > 0 and self._stop.wait(delay):
+                break
+            self.flush()
+
+    def stop(self) -> None:
+        """
+        Stop the writer - after committing deferred changes.
+        """
+        if self._thread is not None:
+            self._stop.set()
+            self._wakeup.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
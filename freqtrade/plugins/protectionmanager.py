@@ -3,7 +3,7 @@ Protection manager class
 """
 
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from freqtrade.constants import Config, LongShort
@@ -41,6 +41,13 @@ class ProtectionManager:
         """
         return [p.name for p in self._protection_handlers]
 
+    @property
+    def max_lookback_period(self) -> timedelta:
+        """
+        Longest period of closed trades any of the protections looks at
+        """
+        return max((p.lookback_period for p in self._protection_handlers), default=timedelta(0))
+
     def short_desc(self) -> list[dict]:
         """
         List of short_desc for each Pairlist Handler
@@ -84,6 +84,13 @@ class IProtection(LoggingMixin, ABC):
         else:
             return f"{self._lookback_period} {plural(self._lookback_period, 'minute', 'minutes')}"
 
+    @property
+    def lookback_period(self) -> timedelta:
+        """
+        Period of closed trades the protection looks at
+        """
+        return timedelta(minutes=self._lookback_period)
+
     @property
     def unlock_reason_time_element(self) -> str:
         """
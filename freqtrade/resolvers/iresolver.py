@@ -14,6 +14,7 @@ from typing import Any
 
 from freqtrade.constants import Config
 from freqtrade.exceptions import OperationalException
+from freqtrade.resolvers.resolver_index import RESOLVER_INDEX_FILE, ResolverIndex
 
 
 logger = logging.getLogger(__name__)
@@ -128,14 +129,30 @@ class IResolver:
             # The __module__ check ensures we only use strategies that are defined in this folder.
             return valid_objects_gen
 
+    @staticmethod
+    def get_index_file(config: Config) -> Path | None:
+        """
+        Location of the resolver index - None if no user_data directory is configured.
+        """
+        if user_data_dir := config.get("user_data_dir"):
+            return Path(user_data_dir) / RESOLVER_INDEX_FILE
+        return None
+
     @classmethod
     def _search_object(
-        cls, directory: Path, *, object_name: str, add_source: bool = False
+        cls,
+        directory: Path,
+        *,
+        object_name: str,
+        add_source: bool = False,
+        index: ResolverIndex | None = None,
     ) -> tuple[Any, Path] | tuple[None, None]:
         """
         Search for the objectname in the given directory
         :param directory: relative or absolute directory path
         :param object_name: ClassName of the object to load
+        :param index: Resolver index - if given, only files which may define object_name
+            are imported.
         :return: object class
         """
         logger.debug(f"Searching for {cls.object_type.__name__} {object_name} in '{directory}'")
@@ -148,6 +165,8 @@ class IResolver:
                 logger.debug("Ignoring broken symlink %s", entry)
                 continue
             module_path = entry.resolve()
+            if index is not None and not index.may_define(module_path, object_name):
+                continue
 
             obj = next(cls._get_valid_object(module_path, object_name), None)
 
@@ -160,26 +179,44 @@ class IResolver:
 
     @classmethod
     def _load_object(
-        cls, paths: list[Path], *, object_name: str, add_source: bool = False, kwargs: dict
+        cls,
+        paths: list[Path],
+        *,
+        object_name: str,
+        add_source: bool = False,
+        kwargs: dict,
+        index_file: Path | None = None,
     ) -> Any | None:
         """
         Try to load object from path list.
+        :param index_file: Resolver index to use - so only files which define object_name
+            are imported. Falls back to importing all files if the object isn't found.
         """
-
-        for _path in paths:
-            try:
-                (module, module_path) = cls._search_object(
-                    directory=_path, object_name=object_name, add_source=add_source
-                )
-                if module:
-                    logger.info(
-                        f"Using resolved {cls.object_type.__name__.lower()[1:]} {object_name} "
-                        f"from '{module_path}'..."
+        index = ResolverIndex(index_file) if index_file else None
+        try:
+            for _path in paths:
+                try:
+                    (module, module_path) = cls._search_object(
+                        directory=_path, object_name=object_name, add_source=add_source, index=index
                     )
-                    return module(**kwargs)
-            except FileNotFoundError:
-                logger.warning('Path "%s" does not exist.', _path.resolve())
-
+                    if module:
+                        logger.info(
+                            f"Using resolved {cls.object_type.__name__.lower()[1:]} {object_name} "
+                            f"from '{module_path}'..."
+                        )
+                        return module(**kwargs)
+                except FileNotFoundError:
+                    logger.warning('Path "%s" does not exist.', _path.resolve())
+        finally:
+            if index is not None:
+                index.save()
+
+        if index is not None:
+            # Classes can also be defined dynamically - which the index doesn't detect.
+            logger.debug(f"{object_name} not found in resolver index, searching all files.")
+            return cls._load_object(
+                paths=paths, object_name=object_name, add_source=add_source, kwargs=kwargs
+            )
         return None
 
     @classmethod
@@ -203,7 +240,12 @@ class IResolver:
             config, user_subdir=cls.user_subdir, extra_dirs=extra_dirs
         )
 
-        found_object = cls._load_object(paths=abs_paths, object_name=object_name, kwargs=kwargs)
+        found_object = cls._load_object(
+            paths=abs_paths,
+            object_name=object_name,
+            kwargs=kwargs,
+            index_file=cls.get_index_file(config),
+        )
         if found_object:
             return found_object
         raise OperationalException(
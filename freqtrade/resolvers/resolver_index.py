@@ -0,0 +1,125 @@
+"""
+On-disk index of the names defined by python files in resolver search paths.
+"""
+
+import ast
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+import rapidjson
+
+
+logger = logging.getLogger(__name__)
+
+RESOLVER_INDEX_FILE = ".resolver_index.json"
+RESOLVER_INDEX_VERSION = 1
+
+
+def defined_names(source: bytes) -> list[str] | None:
+    """
+    Names of classes and variables a module defines (outside of functions and classes)
+    - without importing the module.
+    :param source: Source code of the module
+    :return: List of names, or None if the source can't be parsed
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return None
+    names: list[str] = []
+    nodes: list[ast.AST] = list(tree.body)
+    while nodes:
+        node = nodes.pop(0)
+        if isinstance(node, ast.ClassDef):
+            names.append(node.name)
+        elif isinstance(node, ast.Assign):
+            names.extend(target.id for target in node.targets if isinstance(target, ast.Name))
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            names.append(node.target.id)
+        elif not isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+            # Conditional definitions (if / try / with blocks)
+            nodes.extend(
+                child
+                for child in ast.iter_child_nodes(node)
+                if isinstance(child, ast.stmt | ast.excepthandler)
+            )
+    return names
+
+
+class ResolverIndex:
+    """
+    Maps python files to the names they define, so resolvers only import the file(s) which may
+    contain the requested class.
+    Entries are keyed by the file's modification time and size, and by the hash of its content
+    - files are only parsed again once their content changed.
+    """
+
+    def __init__(self, file: Path | None) -> None:
+        self.file = file
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._changed = False
+        if file is not None and file.is_file():
+            try:
+                content = rapidjson.loads(file.read_text())
+                if content.get("version") == RESOLVER_INDEX_VERSION:
+                    self._entries = content["files"]
+            except Exception as e:
+                # Unreadable or invalid index - it's rebuilt.
+                logger.debug(f"Ignoring invalid resolver index {file}: {e}")
+
+    def names(self, module_path: Path) -> list[str] | None:
+        """
+        Names defined in the given file - parsing it if it changed since it was indexed.
+        :param module_path: Absolute path of the python file
+        :return: List of names, or None if the file could not be parsed
+        """
+        key = str(module_path)
+        try:
+            stat = module_path.stat()
+        except OSError:
+            return None
+        entry = self._entries.get(key)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry["names"]
+        try:
+            source = module_path.read_bytes()
+            digest = hashlib.sha1(source).hexdigest()  # noqa: S324
+        except Exception as e:
+            # Unreadable files are imported - as without index.
+            logger.debug(f"Could not index {module_path}: {e}")
+            return None
+        if not entry or entry["sha1"] != digest:
+            logger.debug(f"Indexing {module_path}")
+            entry = {"sha1": digest, "names": defined_names(source)}
+        entry.update({"mtime_ns": stat.st_mtime_ns, "size": stat.st_size})
+        self._entries[key] = entry
+        self._changed = True
+        return entry["names"]
+
+    def may_define(self, module_path: Path, name: str) -> bool:
+        """
+        Check if the given file may define `name`. Files which can't be parsed always may.
+        """
+        names = self.names(module_path)
+        return names is None or name in names
+
+    def save(self) -> None:
+        """
+        Store the index - if it changed. Entries of removed files are dropped.
+        """
+        if not self._changed or self.file is None or not self.file.parent.is_dir():
+            return
+        files = {key: entry for key, entry in self._entries.items() if Path(key).is_file()}
+        tmp_file = self.file.with_name(f"{self.file.name}.{os.getpid()}.tmp")
+        try:
+            tmp_file.write_text(
+                rapidjson.dumps({"version": RESOLVER_INDEX_VERSION, "files": files})
+            )
+            tmp_file.replace(self.file)
+            self._changed = False
+        except OSError as e:
+            logger.debug(f"Could not store resolver index {self.file}: {e}")
+            tmp_file.unlink(missing_ok=True)
@@ -298,6 +298,7 @@ class StrategyResolver(IResolver):
             object_name=strategy_name,
             add_source=True,
             kwargs={"config": config},
+            index_file=StrategyResolver.get_index_file(config),
         )
 
         if strategy:
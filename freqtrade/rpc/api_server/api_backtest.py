@@ -25,11 +25,13 @@ from freqtrade.ft_types import get_BacktestResultType_default
 from freqtrade.misc import deep_merge_dicts, is_file_in_dir
 from freqtrade.rpc.api_server.api_schemas import (
     BacktestHistoryEntry,
+    BacktestJobResponse,
     BacktestMarketChange,
     BacktestMetadataUpdate,
     BacktestRequest,
     BacktestResponse,
 )
+from freqtrade.rpc.api_server.backtest_queue import BacktestQueue
 from freqtrade.rpc.api_server.deps import get_config
 from freqtrade.rpc.api_server.webserver_bgwork import ApiBG
 from freqtrade.rpc.rpc import RPCException
@@ -124,15 +126,7 @@ def __run_backtest_bg(btconfig: Config):
         ApiBG.bgtask_running = False
 
 
-@router.post("/backtest", response_model=BacktestResponse, tags=["webserver", "backtest"])
-async def api_start_backtest(
-    bt_settings: BacktestRequest, background_tasks: BackgroundTasks, config=Depends(get_config)
-):
-    ApiBG.bt["bt_error"] = None
-    """Start backtesting if not done so already"""
-    if ApiBG.bgtask_running:
-        raise RPCException("Bot Background task already running")
-
+def _get_backtest_config(bt_settings: BacktestRequest, config: Config) -> Config:
     if ":" in bt_settings.strategy:
         raise HTTPException(status_code=500, detail="base64 encoded strategies are not allowed.")
 
@@ -151,6 +145,19 @@ async def api_start_backtest(
 
     # Force dry-run for backtesting
     btconfig["dry_run"] = True
+    return btconfig
+
+
+@router.post("/backtest", response_model=BacktestResponse, tags=["webserver", "backtest"])
+async def api_start_backtest(
+    bt_settings: BacktestRequest, background_tasks: BackgroundTasks, config=Depends(get_config)
+):
+    ApiBG.bt["bt_error"] = None
+    """Start backtesting if not done so already"""
+    if ApiBG.bgtask_running:
+        raise RPCException("Bot Background task already running")
+
+    btconfig = _get_backtest_config(bt_settings, config)
 
     # Start backtesting
     # Initialize backtesting object
@@ -183,7 +190,7 @@ def api_get_backtest():
                 ApiBG.bt["bt"].progress.action if ApiBG.bt["bt"] else str(BacktestState.STARTUP)
             ),
             "progress": ApiBG.bt["bt"].progress.progress if ApiBG.bt["bt"] else 0,
-            "trade_count": len(LocalTrade.bt_trades),
+            "trade_count": len(LocalTrade.bt_trades_closed_index),
             "status_msg": "Backtest running",
         }
 
@@ -370,3 +377,48 @@ def api_get_backtest_market_change(file: str, config=Depends(get_config)):
         "data": df.values.tolist(),
         "length": len(df),
     }
+
+
+def _get_backtest_queue(config: Config) -> BacktestQueue:
+    if not ApiBG.backtest_queue:
+        ApiBG.backtest_queue = BacktestQueue(config["api_server"].get("backtest_workers", 1))
+    return ApiBG.backtest_queue
+
+
+@router.post("/backtest/jobs", response_model=BacktestJobResponse, tags=["webserver", "backtest"])
+def api_backtest_job_submit(bt_settings: BacktestRequest, config=Depends(get_config)):
+    """Queue a backtest - which runs once a worker is available"""
+    btconfig = _get_backtest_config(bt_settings, config)
+    job = _get_backtest_queue(config).submit(ApiBG.get_job_id(), btconfig)
+    return job.to_dict()
+
+
+@router.get(
+    "/backtest/jobs", response_model=list[BacktestJobResponse], tags=["webserver", "backtest"]
+)
+def api_backtest_job_list(config=Depends(get_config)):
+    return [job.to_dict() for job in _get_backtest_queue(config).list_jobs()]
+
+
+@router.get(
+    "/backtest/jobs/{job_id}",
+    response_model=BacktestJobResponse,
+    tags=["webserver", "backtest"],
+)
+def api_backtest_job(job_id: str, config=Depends(get_config)):
+    """Get status, progress and - once finished - the result of a backtest job"""
+    if not (job := _get_backtest_queue(config).get(job_id)):
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return job.to_dict(with_result=True)
+
+
+@router.delete(
+    "/backtest/jobs/{job_id}",
+    response_model=BacktestJobResponse,
+    tags=["webserver", "backtest"],
+)
+def api_backtest_job_cancel(job_id: str, config=Depends(get_config)):
+    """Cancel a queued or running backtest job - or remove a finished job from the list"""
+    if not (job := _get_backtest_queue(config).cancel(job_id)):
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return job.to_dict()
@@ -583,6 +583,21 @@ class BacktestResponse(BaseModel):
     backtest_result: dict[str, Any] | None = None
 
 
+class BacktestJobResponse(BaseModel):
+    job_id: str
+    strategy: str
+    status: str
+    running: bool
+    step: str
+    progress: float
+    trade_count: float | None = None
+    created_at: datetime
+    finished_at: datetime | None = None
+    filename: str | None = None
+    error: str | None = None
+    backtest_result: dict[str, Any] | None = None
+
+
 # TODO: This is a copy of BacktestHistoryEntryType
 class BacktestHistoryEntry(BaseModel):
     filename: str
@@ -2,7 +2,7 @@ import logging
 from copy import deepcopy
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from fastapi.exceptions import HTTPException
 
 from freqtrade import __version__
@@ -88,7 +88,10 @@ logger = logging.getLogger(__name__)
 # 2.40: Add hyperopt-loss endpoint
 # 2.41: Add download-data endpoint
 # 2.42: Add /pair_history endpoint with live data
-API_VERSION = 2.42
+# 2.43: pair_candles supports ETag / If-None-Match and Arrow responses
+API_VERSION = 2.43
+
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
 
 # Public API, requires no auth.
 router_public = APIRouter()
@@ -333,16 +336,64 @@ def reload_config(rpc: RPC = Depends(get_rpc)):
     return rpc._rpc_reload_config()
 
 
+def _pair_candles_response(
+    request: Request,
+    rpc: RPC,
+    pair: str,
+    timeframe: str,
+    limit: int | None,
+    columns: list[str] | None,
+) -> Response:
+    """
+    Analyzed candles as JSON - or as Arrow IPC stream if requested via the Accept header.
+    Responses carry an ETag. Requests sending it as If-None-Match get "304 Not Modified"
+    until the pair is analyzed again.
+    """
+    known_etags = [
+        etag.strip().removeprefix("W/")
+        for etag in request.headers.get("if-none-match", "").split(",")
+        if etag.strip()
+    ]
+    if ARROW_MEDIA_TYPE in request.headers.get("accept", ""):
+        etag, content = rpc._rpc_analysed_dataframe_cached(
+            pair, timeframe, limit, columns, encoding="arrow", known_etags=known_etags
+        )
+        media_type = ARROW_MEDIA_TYPE
+    else:
+        etag, content = rpc._rpc_analysed_dataframe_cached(
+            pair,
+            timeframe,
+            limit,
+            columns,
+            encoding="json",
+            encoder=lambda res: PairHistory.model_validate(res).model_dump_json(),
+            known_etags=known_etags,
+        )
+        media_type = "application/json"
+    headers = {"ETag": etag, "Vary": "Accept"}
+    if content is None:
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type=media_type, headers=headers)
+
+
 @router.get("/pair_candles", response_model=PairHistory, tags=["candle data"])
-def pair_candles(pair: str, timeframe: str, limit: int | None = None, rpc: RPC = Depends(get_rpc)):
-    return rpc._rpc_analysed_dataframe(pair, timeframe, limit, None)
+def pair_candles(
+    request: Request,
+    pair: str,
+    timeframe: str,
+    limit: int | None = None,
+    rpc: RPC = Depends(get_rpc),
+):
+    return _pair_candles_response(request, rpc, pair, timeframe, limit, None)
 
 
 @router.post("/pair_candles", response_model=PairHistory, tags=["candle data"])
-def pair_candles_filtered(payload: PairCandlesRequest, rpc: RPC = Depends(get_rpc)):
+def pair_candles_filtered(
+    request: Request, payload: PairCandlesRequest, rpc: RPC = Depends(get_rpc)
+):
     # Advanced pair_candles endpoint with column filtering
-    return rpc._rpc_analysed_dataframe(
-        payload.pair, payload.timeframe, payload.limit, payload.columns
+    return _pair_candles_response(
+        request, rpc, payload.pair, payload.timeframe, payload.limit, payload.columns
     )
 
 
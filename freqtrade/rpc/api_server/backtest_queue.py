@@ -0,0 +1,372 @@
+"""
+Queue of backtest jobs for webserver mode, executed by a pool of worker processes.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing import get_context
+from multiprocessing.managers import SyncManager
+from typing import Any
+
+import rapidjson
+from cachetools import LRUCache
+
+from freqtrade.constants import Config
+from freqtrade.enums import BacktestState
+from freqtrade.exceptions import DependencyException, OperationalException
+
+
+logger = logging.getLogger(__name__)
+
+# Warm backtesting instances (with loaded data) kept per worker process
+BACKTEST_QUEUE_CACHE_SIZE = 2
+# Seconds between progress updates of a running job
+BACKTEST_QUEUE_PROGRESS_INTERVAL = 0.5
+# Finished jobs kept in the job list
+BACKTEST_QUEUE_MAX_FINISHED = 100
+
+# Per worker process - maps data key to {"bt": Backtesting, "data": ..., "timerange": ...}
+_data_cache: LRUCache = LRUCache(maxsize=BACKTEST_QUEUE_CACHE_SIZE)
+
+
+class _LogDispatcher(logging.Handler):
+    """
+    Hands log records of worker processes to the logger they were emitted by.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+def _init_worker(log_queue, verbosity: int) -> None:
+    root = logging.getLogger()
+    root.setLevel(verbosity)
+    root.addHandler(QueueHandler(log_queue))
+
+
+def _data_key(btconfig: Config, timeframe: str) -> str:
+    """
+    Jobs with the same key use the same candle data - and can share a warm backtesting instance.
+    """
+    exchange = btconfig.get("exchange", {})
+    return rapidjson.dumps(
+        [
+            timeframe,
+            btconfig.get("timeframe_detail"),
+            btconfig.get("timerange"),
+            exchange.get("name"),
+            exchange.get("pair_whitelist"),
+            exchange.get("pair_blacklist"),
+            btconfig.get("pairlists"),
+            btconfig.get("trading_mode"),
+            btconfig.get("margin_mode"),
+            btconfig.get("datadir"),
+            btconfig.get("dataformat_ohlcv"),
+        ],
+        default=str,
+    )
+
+
+class _JobMonitor(threading.Thread):
+    """
+    Publishes the progress of the running backtest, and aborts it once cancellation is requested.
+    """
+
+    def __init__(self, progress, cancel_event) -> None:
+        super().__init__(daemon=True)
+        self.bt: Any = None
+        self._progress = progress
+        self._cancel_event = cancel_event
+        self._stop_event = threading.Event()
+
+    def publish(self) -> None:
+        from freqtrade.persistence import LocalTrade
+
+        if self.bt is None:
+            return
+        self._progress.update(
+            {
+                "step": self.bt.progress.action,
+                "progress": self.bt.progress.progress,
+                "trade_count": len(LocalTrade.bt_trades_closed_index),
+            }
+        )
+
+    def check_cancel(self) -> None:
+        if self._cancel_event.is_set():
+            raise DependencyException("Stop requested")
+
+    def run(self) -> None:
+        while not self._stop_event.wait(BACKTEST_QUEUE_PROGRESS_INTERVAL):
+            if self.bt is not None and self._cancel_event.is_set():
+                self.bt.abort = True
+            self.publish()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+def run_backtest_job(job_id: str, btconfig: Config, progress, cancel_event) -> dict[str, Any]:
+    """
+    Run one backtest job - executed in a worker process.
+    Backtesting instances (and their data) are kept for following jobs with the same pairs,
+    timeframe and timerange.
+    :param job_id: Id of the job, used for the result filename
+    :param btconfig: Backtest configuration
+    :param progress: Shared dict receiving status and progress of the job
+    :param cancel_event: Shared event, set to cancel the job
+    :return: Dict with the backtest result and the filename it's stored in
+    """
+    from freqtrade.configuration.config_validation import validate_config_consistency
+    from freqtrade.data.metrics import combined_dataframes_with_rel_mean
+    from freqtrade.ft_types import get_BacktestResultType_default
+    from freqtrade.optimize.backtesting import Backtesting
+    from freqtrade.optimize.optimize_reports import generate_backtest_stats, store_backtest_results
+    from freqtrade.resolvers import StrategyResolver
+
+    monitor = _JobMonitor(progress, cancel_event)
+    monitor.check_cancel()
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    progress.update({"status": "running", "step": str(BacktestState.STARTUP), "progress": 0})
+    monitor.start()
+    try:
+        strat = StrategyResolver.load_strategy(btconfig)
+        validate_config_consistency(btconfig)
+
+        key = _data_key(btconfig, strat.timeframe)
+        entry = _data_cache.get(key)
+        if entry is None:
+            bt = Backtesting(btconfig)
+            monitor.bt = bt
+            bt.load_bt_data_detail()
+            data, timerange = bt.load_bt_data()
+            entry = {"bt": bt, "data": data, "timerange": timerange}
+            _data_cache[key] = entry
+        else:
+            logger.info("Reusing loaded data of a previous backtest job.")
+            bt = entry["bt"]
+            bt.config = btconfig
+            bt.init_backtest()
+            monitor.bt = bt
+        monitor.check_cancel()
+
+        bt.enable_protections = btconfig.get("enable_protections", False)
+        bt.strategylist = [strat]
+        bt.results = get_BacktestResultType_default()
+        bt.load_prior_backtest()
+        bt.abort = False
+
+        strategy_name = strat.get_strategy_name()
+        if bt.results and strategy_name in bt.results["strategy"]:
+            # Results are already stored - reuse them and skip backtesting.
+            logger.info(f"Reusing result of previous backtest for {strategy_name}")
+            results = bt.results
+        else:
+            min_date, max_date = bt.backtest_one_strategy(strat, entry["data"], entry["timerange"])
+            results = generate_backtest_stats(
+                entry["data"], bt.all_results, min_date=min_date, max_date=max_date
+            )
+            fn = store_backtest_results(
+                btconfig,
+                results,
+                f"{datetime.now():%Y-%m-%d_%H-%M-%S}_{job_id[:8]}",
+                market_change_data=combined_dataframes_with_rel_mean(
+                    entry["data"], min_date, max_date
+                ),
+            )
+            results["metadata"][strategy_name]["filename"] = str(fn.stem)
+            results["metadata"][strategy_name]["strategy"] = strategy_name
+        monitor.publish()
+        logger.info(f"Backtest job {job_id} finished.")
+        return {
+            "result": results,
+            "filename": results["metadata"].get(strategy_name, {}).get("filename"),
+        }
+    finally:
+        monitor.stop()
+        # Don't keep results of this job in the cached instance
+        if monitor.bt is not None:
+            monitor.bt.results = get_BacktestResultType_default()
+            monitor.bt.all_results = {}
+
+
+@dataclass
+class BacktestJob:
+    job_id: str
+    strategy: str
+    config: Config
+    progress: Any
+    cancel_event: Any
+    future: Future | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: datetime | None = None
+    cancelled: bool = False
+    result: dict[str, Any] | None = None
+    filename: str | None = None
+    error: str | None = None
+    final_progress: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def status(self) -> str:
+        if self.finished_at is None:
+            return "cancelling" if self.cancelled else self.progress.get("status", "queued")
+        if self.cancelled:
+            return "cancelled"
+        return "error" if self.error else "ended"
+
+    def to_dict(self, with_result: bool = False) -> dict[str, Any]:
+        status = self.status
+        progress = dict(self.progress) if self.finished_at is None else self.final_progress
+        return {
+            "job_id": self.job_id,
+            "strategy": self.strategy,
+            "status": status,
+            "running": status in ("running", "cancelling"),
+            "step": progress.get("step", ""),
+            "progress": 1 if status == "ended" else progress.get("progress", 0),
+            "trade_count": progress.get("trade_count"),
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "filename": self.filename,
+            "error": self.error,
+            "backtest_result": self.result if with_result else None,
+        }
+
+
+class BacktestQueue:
+    """
+    Runs backtest jobs in a pool of `workers` processes, in the order they are submitted.
+    Each worker keeps the data of its most recent jobs loaded, so jobs with the same pairs,
+    timeframe and timerange don't reload their data.
+    """
+
+    def __init__(self, workers: int = 1) -> None:
+        self.workers = workers
+        self._jobs: dict[str, BacktestJob] = {}
+        self._lock = threading.Lock()
+        self._executor: Executor | None = None
+        self._manager: SyncManager | None = None
+        self._log_queue: Any = None
+        self._log_listener: QueueListener | None = None
+
+    def _create_manager(self) -> SyncManager:
+        return get_context("spawn").Manager()
+
+    def _create_executor(self) -> Executor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self._log_queue, logging.getLogger().getEffectiveLevel()),
+        )
+
+    def _start(self) -> None:
+        if self._manager is None:
+            self._manager = self._create_manager()
+            self._log_queue = self._manager.Queue()
+            self._log_listener = QueueListener(self._log_queue, _LogDispatcher())
+            self._log_listener.start()
+        if self._executor is None:
+            logger.info(f"Starting {self.workers} backtest worker processes.")
+            self._executor = self._create_executor()
+
+    def submit(self, job_id: str, btconfig: Config) -> BacktestJob:
+        """
+        Queue a backtest.
+        :param job_id: Id of the new job
+        :param btconfig: Backtest configuration, including the strategy to test
+        :return: The queued job
+        """
+        with self._lock:
+            self._start()
+            if self._manager is None or self._executor is None:
+                raise OperationalException("Backtest worker processes are not running.")
+            job = BacktestJob(
+                job_id=job_id,
+                strategy=btconfig["strategy"],
+                config=btconfig,
+                progress=self._manager.dict(),
+                cancel_event=self._manager.Event(),
+            )
+            self._jobs[job_id] = job
+            self._prune()
+            job.future = self._executor.submit(
+                run_backtest_job, job_id, btconfig, job.progress, job.cancel_event
+            )
+        job.future.add_done_callback(lambda future: self._job_done(job, future))
+        return job
+
+    def _job_done(self, job: BacktestJob, future: Future) -> None:
+        if future.cancelled():
+            job.cancelled = True
+        elif (exc := future.exception()) is not None:
+            if job.cancelled:
+                logger.info(f"Backtest job {job.job_id} cancelled.")
+            else:
+                logger.error(f"Backtest job {job.job_id} caused an error: {exc}")
+                job.error = str(exc) or type(exc).__name__
+        else:
+            res = future.result()
+            job.result = res["result"]
+            job.filename = res["filename"]
+        try:
+            job.final_progress = dict(job.progress)
+        except Exception as e:
+            # Manager is shut down
+            logger.debug(f"Could not read final progress of backtest job {job.job_id}: {e}")
+        job.finished_at = datetime.now(timezone.utc)
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished_at is not None]
+        for job_id in finished[: max(0, len(finished) - BACKTEST_QUEUE_MAX_FINISHED)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> BacktestJob | None:
+        return self._jobs.get(job_id)
+
+    def list_jobs(self) -> list[BacktestJob]:
+        return list(self._jobs.values())
+
+    def cancel(self, job_id: str) -> BacktestJob | None:
+        """
+        Cancel a queued or running job - or remove a finished job from the job list.
+        :param job_id: Id of the job
+        :return: The job, or None if it doesn't exist
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        if job.finished_at is not None:
+            with self._lock:
+                self._jobs.pop(job_id, None)
+            return job
+        job.cancelled = True
+        job.cancel_event.set()
+        if job.future is not None:
+            # Only succeeds if the job didn't start yet
+            job.future.cancel()
+        return job
+
+    def shutdown(self) -> None:
+        """
+        Cancel all jobs, and stop worker processes.
+        """
+        for job in list(self._jobs.values()):
+            if job.finished_at is None:
+                self.cancel(job.job_id)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+            self._log_queue = None
+        self._jobs = {}
@@ -89,6 +89,9 @@ class ApiServer(RPCHandler):
         del ApiServer._rpc
         ApiBG.exchanges = {}
         ApiBG.jobs = {}
+        if ApiBG.backtest_queue:
+            ApiBG.backtest_queue.shutdown()
+            ApiBG.backtest_queue = None
         if self._server and not self._standalone:
             logger.info("Stopping API Server")
             # self._server.force_exit, self._server.should_exit = True, True
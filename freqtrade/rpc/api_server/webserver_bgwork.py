@@ -1,4 +1,4 @@
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 from uuid import uuid4
 
 from typing_extensions import NotRequired, TypedDict
@@ -6,6 +6,10 @@ from typing_extensions import NotRequired, TypedDict
 from freqtrade.exchange.exchange import Exchange
 
 
+if TYPE_CHECKING:
+    from freqtrade.rpc.api_server.backtest_queue import BacktestQueue
+
+
 class ProgressTask(TypedDict):
     progress: float
     total: float
@@ -32,6 +36,8 @@ class ApiBG:
         "bt_error": None,
     }
     bgtask_running: bool = False
+    # Queued backtest jobs - started on first use
+    backtest_queue: "BacktestQueue | None" = None
     # Exchange - only available in webserver mode.
     exchanges: dict[str, Exchange] = {}
 
@@ -10,6 +10,18 @@ logger = logging.getLogger(__name__)
 
 
 class Discord(Webhook):
+    # Trade notifications can be combined into one message (up to 10 embeds)
+    _batch_types = (
+        RPCMessageType.ENTRY,
+        RPCMessageType.ENTRY_FILL,
+        RPCMessageType.ENTRY_CANCEL,
+        RPCMessageType.EXIT,
+        RPCMessageType.EXIT_FILL,
+        RPCMessageType.EXIT_CANCEL,
+        RPCMessageType.PROTECTION_TRIGGER,
+        RPCMessageType.PROTECTION_TRIGGER_GLOBAL,
+    )
+
     def __init__(self, rpc: "RPC", config: Config):
         self._config = config
         self.rpc = rpc
@@ -22,13 +34,10 @@ class Discord(Webhook):
         self._retries = 1
         self._retry_delay = 0.1
         self._timeout = self._config["discord"].get("timeout", 10)
+        self._dispatcher = self._init_dispatcher(self._config["discord"], batch_size=10)
 
-    def cleanup(self) -> None:
-        """
-        Cleanup pending module resources.
-        This will do nothing for webhooks, they will simply not be called anymore
-        """
-        pass
+    def _merge_batch(self, payloads: list[dict]) -> dict:
+        return {"embeds": [embed for payload in payloads for embed in payload["embeds"]]}
 
     def send_msg(self, msg) -> None:
         if fields := self._config["discord"].get(msg["type"].value):
@@ -58,4 +67,4 @@ class Discord(Webhook):
 
             # Send the message to discord channel
             payload = {"embeds": embeds}
-            self._send_msg(payload)
+            self._send_msg(payload, msg["type"])
@@ -0,0 +1,172 @@
+"""
+Background delivery of outbound notifications (webhooks, discord).
+"""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import aiohttp
+
+
+logger = logging.getLogger(__name__)
+
+SendFunction = Callable[[aiohttp.ClientSession, list[Any]], Awaitable[None]]
+
+
+class NotificationDispatcher:
+    """
+    Delivers notifications to one destination from a background thread running an asyncio loop,
+    so callers (the trading loop) never wait on network I/O.
+    * One http session per destination, reusing connections.
+    * Failed deliveries are retried with exponential backoff.
+    * Consecutive batchable messages arriving within batch_delay are delivered together.
+    * The queue is bounded - on overflow, the oldest message is dropped.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        send: SendFunction,
+        *,
+        queue_size: int = 1000,
+        retries: int = 0,
+        retry_delay: float = 0.1,
+        max_retry_delay: float = 30.0,
+        batch_size: int = 1,
+        batch_delay: float = 0.5,
+    ) -> None:
+        """
+        :param name: Name of the destination, used for logging
+        :param send: Coroutine function delivering a list of payloads using the given session.
+                     Must raise an exception if delivery failed.
+        :param queue_size: Maximum number of pending messages
+        :param retries: Number of retries for failed deliveries
+        :param retry_delay: Delay before the first retry, doubled for every further retry
+        :param max_retry_delay: Upper bound for the delay between retries
+        :param batch_size: Maximum number of batchable messages delivered together
+        :param batch_delay: Time to wait for further batchable messages
+        """
+        self._name = name
+        self._send = send
+        self._queue_size = queue_size
+        self._retries = retries
+        self._retry_delay = retry_delay
+        self._max_retry_delay = max_retry_delay
+        self._batch_size = batch_size
+        self._batch_delay = batch_delay
+
+        self._queue: deque[tuple[Any, bool]] = deque()
+        self._lock = threading.Lock()
+        self._stopping = False
+        self.metrics: dict[str, int] = {
+            "queued": 0,
+            "sent": 0,
+            "failed": 0,
+            "dropped": 0,
+            "retries": 0,
+            "batches": 0,
+        }
+
+        self._loop = asyncio.new_event_loop()
+        self._wakeup = asyncio.Event()
+        self._thread = threading.Thread(target=self._run, name=f"notify_{name}", daemon=True)
+        self._thread.start()
+
+    def enqueue(self, payload: Any, batchable: bool = False) -> None:
+        """
+        Queue a message for delivery. Never blocks.
+        :param payload: Payload passed to the send function
+        :param batchable: Message may be delivered together with other batchable messages
+        """
+        if self._stopping:
+            logger.warning(f"Notification for {self._name} dropped, dispatcher stopped.")
+            return
+        with self._lock:
+            if len(self._queue) >= self._queue_size:
+                self._queue.popleft()
+                self.metrics["dropped"] += 1
+                if self.metrics["dropped"] % 100 == 1:
+                    logger.warning(
+                        f"Notification queue for {self._name} is full, dropped "
+                        f"{self.metrics['dropped']} messages so far."
+                    )
+            self._queue.append((payload, batchable))
+            self.metrics["queued"] += 1
+        try:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            # Loop closed while stopping
+            pass
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Deliver pending messages (waiting at most timeout seconds) and stop the worker thread.
+        """
+        if self._stopping:
+            return
+        self._stopping = True
+        self._loop.call_soon_threadsafe(self._wakeup.set)
+        self._thread.join(timeout)
+        if self._queue:
+            logger.warning(f"{len(self._queue)} notifications for {self._name} not delivered.")
+        logger.info(f"Notification metrics for {self._name}: {self.metrics}")
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._worker())
+        finally:
+            self._loop.close()
+
+    def _pop(self, batchable_only: bool) -> tuple[Any, bool] | None:
+        with self._lock:
+            if not self._queue or (batchable_only and not self._queue[0][1]):
+                return None
+            return self._queue.popleft()
+
+    async def _next_batch(self) -> list[Any]:
+        first = self._pop(False)
+        if first is None:
+            return []
+        payload, batchable = first
+        batch = [payload]
+        if batchable and self._batch_size > 1:
+            if not self._stopping:
+                await asyncio.sleep(self._batch_delay)
+            while len(batch) < self._batch_size and (item := self._pop(True)):
+                batch.append(item[0])
+        return batch
+
+    async def _worker(self) -> None:
+        async with aiohttp.ClientSession(trust_env=True) as session:
+            while True:
+                batch = await self._next_batch()
+                if batch:
+                    await self._deliver(session, batch)
+                    continue
+                if self._stopping:
+                    break
+                self._wakeup.clear()
+                if not self._queue:
+                    await self._wakeup.wait()
+
+    async def _deliver(self, session: aiohttp.ClientSession, batch: list[Any]) -> None:
+        for attempt in range(self._retries + 1):
+            if attempt:
+                self.metrics["retries"] += 1
+                await asyncio.sleep(
+                    min(self._retry_delay * 2 ** (attempt - 1), self._max_retry_delay)
+                )
+            try:
+                await self._send(session, batch)
+                self.metrics["sent"] += len(batch)
+                if len(batch) > 1:
+                    self.metrics["batches"] += 1
+                return
+            except Exception as e:
+                logger.warning(f"Could not deliver notification to {self._name}. Exception: {e}")
+        self.metrics["failed"] += len(batch)
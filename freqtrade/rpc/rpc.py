@@ -2,13 +2,18 @@
 This module contains class to define a RPC communications
 """
 
+import hashlib
 import logging
 from abc import abstractmethod
-from collections.abc import Generator, Sequence
+from collections.abc import Callable, Generator, Sequence
+from copy import deepcopy
 from datetime import date, datetime, timedelta, timezone
+from threading import Lock
 from typing import TYPE_CHECKING, Any
 
 import psutil
+import rapidjson
+from cachetools import LRUCache
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import tzlocal
 from numpy import inf, int64, isnan, mean, nan
@@ -53,6 +58,9 @@ from freqtrade.wallets import PositionWallet, Wallet
 
 logger = logging.getLogger(__name__)
 
+# Number of (pair, timeframe, limit, columns) combinations of analyzed dataframes kept converted
+ANALYSED_DATAFRAME_CACHE_SIZE = 64
+
 
 class RPCException(Exception):
     """
@@ -120,6 +128,9 @@ class RPC:
         self._config: Config = freqtrade.config
         if self._config.get("fiat_display_currency"):
             self._fiat_converter = CryptoToFiatConverter(self._config)
+        # Converted analyzed dataframes - (pair, timeframe, limit, columns) -> (version, formats)
+        self._analysed_dataframe_cache: LRUCache = LRUCache(maxsize=ANALYSED_DATAFRAME_CACHE_SIZE)
+        self._analysed_dataframe_lock = Lock()
 
     @staticmethod
     def _rpc_show_config(
@@ -1300,6 +1311,39 @@ class RPC:
             raise RPCException("Edge is not enabled.")
         return self._freqtrade.edge.accepted_pairs()
 
+    @staticmethod
+    def _prepare_dataframe(
+        dataframe: DataFrame, selected_cols: list[str] | None
+    ) -> tuple[DataFrame, dict[str, int]]:
+        """
+        Select columns and add the timestamp and signal close columns used for plotting.
+        :param dataframe: Analyzed dataframe - modified in place if no columns are selected
+        :param selected_cols: Columns to include (OHLCV and signal columns are always included)
+        :return: Tuple of (dataframe, number of signals per signal type)
+        """
+        signals = {
+            "enter_long": 0,
+            "exit_long": 0,
+            "enter_short": 0,
+            "exit_short": 0,
+        }
+        if len(dataframe) == 0:
+            return dataframe, signals
+        if selected_cols is not None:
+            # Ensure OHLCV columns are always present
+            cols_set = set(DEFAULT_DATAFRAME_COLUMNS + list(signals.keys()) + selected_cols)
+            df_cols = [col for col in dataframe.columns if col in cols_set]
+            dataframe = dataframe.loc[:, df_cols]
+
+        dataframe.loc[:, "__date_ts"] = dataframe.loc[:, "date"].astype(int64) // 1000 // 1000
+        # Move signal close to separate column when signal for easy plotting
+        for sig_type in signals.keys():
+            if sig_type in dataframe.columns:
+                mask = dataframe[sig_type] == 1
+                signals[sig_type] = int(mask.sum())
+                dataframe.loc[mask, f"_{sig_type}_signal_close"] = dataframe.loc[mask, "close"]
+        return dataframe, signals
+
     @staticmethod
     def _convert_dataframe_to_dict(
         strategy: str,
@@ -1311,27 +1355,8 @@ class RPC:
     ) -> dict[str, Any]:
         has_content = len(dataframe) != 0
         dataframe_columns = list(dataframe.columns)
-        signals = {
-            "enter_long": 0,
-            "exit_long": 0,
-            "enter_short": 0,
-            "exit_short": 0,
-        }
+        dataframe, signals = RPC._prepare_dataframe(dataframe, selected_cols)
         if has_content:
-            if selected_cols is not None:
-                # Ensure OHLCV columns are always present
-                cols_set = set(DEFAULT_DATAFRAME_COLUMNS + list(signals.keys()) + selected_cols)
-                df_cols = [col for col in dataframe_columns if col in cols_set]
-                dataframe = dataframe.loc[:, df_cols]
-
-            dataframe.loc[:, "__date_ts"] = dataframe.loc[:, "date"].astype(int64) // 1000 // 1000
-            # Move signal close to separate column when signal for easy plotting
-            for sig_type in signals.keys():
-                if sig_type in dataframe.columns:
-                    mask = dataframe[sig_type] == 1
-                    signals[sig_type] = int(mask.sum())
-                    dataframe.loc[mask, f"_{sig_type}_signal_close"] = dataframe.loc[mask, "close"]
-
             # band-aid until this is fixed:
             # https://github.com/pandas-dev/pandas/issues/45836
             datetime_types = ["datetime", "datetime64", "datetime64[ns, UTC]"]
@@ -1375,14 +1400,120 @@ class RPC:
             )
         return res
 
+    @staticmethod
+    def _convert_dataframe_to_arrow(
+        strategy: str,
+        pair: str,
+        timeframe: str,
+        dataframe: DataFrame,
+        last_analyzed: datetime,
+        selected_cols: list[str] | None,
+    ) -> bytes:
+        """
+        Convert the analyzed dataframe to an Arrow IPC stream - columnar and binary.
+        Values are not converted. Missing values (NaN) stay NaN, dates are timestamps.
+        The remaining fields of the dict response are stored in the schema metadata
+        (key "freqtrade") as JSON.
+        """
+        from pyarrow import BufferOutputStream, Table, ipc
+
+        dataframe_columns = list(dataframe.columns)
+        dataframe, signals = RPC._prepare_dataframe(dataframe, selected_cols)
+        metadata = {
+            "pair": pair,
+            "timeframe": timeframe,
+            "timeframe_ms": timeframe_to_msecs(timeframe),
+            "strategy": strategy,
+            "all_columns": dataframe_columns,
+            "length": len(dataframe),
+            "enter_long_signals": signals["enter_long"],
+            "exit_long_signals": signals["exit_long"],
+            "enter_short_signals": signals["enter_short"],
+            "exit_short_signals": signals["exit_short"],
+            "last_analyzed_ts": int(last_analyzed.timestamp()),
+        }
+        try:
+            table = Table.from_pandas(dataframe, preserve_index=False)
+        except (TypeError, ValueError) as e:
+            # e.g. columns with mixed types
+            raise RPCException(f"Dataframe of {pair} can't be converted to Arrow: {e}")
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), b"freqtrade": rapidjson.dumps(metadata)}
+        )
+        sink = BufferOutputStream()
+        with ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    def _rpc_analysed_dataframe_cached(
+        self,
+        pair: str,
+        timeframe: str,
+        limit: int | None,
+        selected_cols: list[str] | None,
+        encoding: str = "dict",
+        encoder: Callable[[dict[str, Any]], Any] | None = None,
+        known_etags: Sequence[str] = (),
+    ) -> tuple[str, Any]:
+        """
+        Analyzed dataframe in the requested encoding.
+        Conversions are cached until the pair is analyzed again, so polling clients don't
+        convert the same dataframe over and over.
+        :param encoding: "dict", "arrow" - or the name of the encoder's result
+        :param encoder: Function encoding the dict form (e.g. to JSON)
+        :param known_etags: ETags of responses the client already has
+        :return: Tuple of (ETag, payload). Payload is None if the ETag is in known_etags.
+        """
+        dataframe, last_analyzed = self._freqtrade.dataprovider.get_analyzed_dataframe(
+            pair, timeframe
+        )
+        key = (pair, timeframe, limit, tuple(selected_cols) if selected_cols is not None else None)
+        # Backtest / webserver modes slice the dataframe without analyzing again
+        version = (
+            last_analyzed,
+            len(dataframe),
+            dataframe["date"].iloc[-1] if len(dataframe) else None,
+        )
+        digest = hashlib.sha1(repr((key, version)).encode()).hexdigest()  # noqa: S324
+        current_etag = f'"{encoding}-{digest}"'
+        if current_etag in known_etags:
+            return current_etag, None
+
+        with self._analysed_dataframe_lock:
+            cached = self._analysed_dataframe_cache.get(key)
+            if cached is None or cached[0] != version:
+                cached = (version, {})
+                self._analysed_dataframe_cache[key] = cached
+        formats: dict[str, Any] = cached[1]
+        if encoding in formats:
+            return current_etag, formats[encoding]
+
+        if limit:
+            dataframe = dataframe.iloc[-limit:]
+        strategy = self._freqtrade.config["strategy"]
+        payload: Any
+        if encoding == "arrow":
+            payload = RPC._convert_dataframe_to_arrow(
+                strategy, pair, timeframe, dataframe.copy(), last_analyzed, selected_cols
+            )
+        else:
+            res: dict[str, Any] | None = formats.get("dict")
+            if res is None:
+                res = RPC._convert_dataframe_to_dict(
+                    strategy, pair, timeframe, dataframe.copy(), last_analyzed, selected_cols
+                )
+                formats["dict"] = res
+            payload = encoder(res) if encoder is not None else res
+        formats[encoding] = payload
+        return current_etag, payload
+
     def _rpc_analysed_dataframe(
         self, pair: str, timeframe: str, limit: int | None, selected_cols: list[str] | None
     ) -> dict[str, Any]:
         """Analyzed dataframe in Dict form"""
-
-        _data, last_analyzed = self.__rpc_analysed_dataframe_raw(pair, timeframe, limit)
-        return RPC._convert_dataframe_to_dict(
-            self._freqtrade.config["strategy"], pair, timeframe, _data, last_analyzed, selected_cols
+        # Copy, so callers can't modify the cached result
+        return deepcopy(
+            self._rpc_analysed_dataframe_cached(pair, timeframe, limit, selected_cols)[1]
         )
 
     def __rpc_analysed_dataframe_raw(
@@ -1396,12 +1527,11 @@ class RPC:
         :param limit: The amount of candles in the dataframe
         """
         _data, last_analyzed = self._freqtrade.dataprovider.get_analyzed_dataframe(pair, timeframe)
-        _data = _data.copy()
 
         if limit:
             _data = _data.iloc[-limit:]
 
-        return _data, last_analyzed
+        return _data.copy(), last_analyzed
 
     def _ws_all_analysed_dataframes(
         self, pairlist: list[str], limit: int | None
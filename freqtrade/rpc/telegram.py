@@ -16,6 +16,7 @@ from functools import partial, wraps
 from html import escape
 from itertools import chain
 from math import isnan
+from pathlib import Path
 from threading import Thread
 from typing import Any, Literal
 
@@ -41,6 +42,14 @@ from freqtrade.misc import chunks, plural
 from freqtrade.persistence import Trade
 from freqtrade.rpc import RPC, RPCException, RPCHandler
 from freqtrade.rpc.rpc_types import RPCEntryMsg, RPCExitMsg, RPCOrderMsg, RPCSendMsg
+from freqtrade.rpc.telegram_sender import (
+    CHAT_RATE_LIMIT,
+    GLOBAL_RATE_LIMIT,
+    RATE_LIMIT_DIR,
+    TelegramSender,
+    get_telegram_sender,
+    message_priority,
+)
 from freqtrade.util import (
     dt_from_ts,
     dt_humanize_delta,
@@ -147,6 +156,7 @@ class Telegram(RPCHandler):
 
         self._app: Application
         self._loop: asyncio.AbstractEventLoop
+        self._sender: TelegramSender | None = None
         self._init_keyboard()
         self._start_thread()
 
@@ -255,6 +265,16 @@ class Telegram(RPCHandler):
             asyncio.set_event_loop(self._loop)
 
         self._app = self._init_telegram_app()
+        tg_config = self._config["telegram"]
+        rate_limit_dir = tg_config.get("rate_limit_dir", RATE_LIMIT_DIR)
+        self._sender = get_telegram_sender(
+            self._app.bot,
+            self._loop,
+            rate_limit_dir=Path(rate_limit_dir) if rate_limit_dir else None,
+            global_rate=tg_config.get("global_rate_limit", GLOBAL_RATE_LIMIT),
+            chat_rate=tg_config.get("chat_rate_limit", CHAT_RATE_LIMIT),
+            coalesce=tg_config.get("coalesce_messages", True),
+        )
 
         # Register command handler and start telegram message polling
         handles = [
@@ -350,6 +370,8 @@ class Telegram(RPCHandler):
                     break
 
     async def _cleanup_telegram(self) -> None:
+        if self._sender:
+            await self._sender.close()
         if self._app.updater:
             await self._app.updater.stop()
         await self._app.stop()
@@ -602,7 +624,17 @@ class Telegram(RPCHandler):
             return
 
         message = self.compose_message(deepcopy(msg))
-        if message:
+        if message and self._sender:
+            self._sender.enqueue(
+                self._config["telegram"]["chat_id"],
+                message,
+                priority=message_priority(msg["type"]),
+                parse_mode=ParseMode.MARKDOWN,
+                reply_markup=ReplyKeyboardMarkup(self._keyboard, resize_keyboard=True),
+                disable_notification=(noti == "silent"),
+                message_thread_id=self._config["telegram"].get("topic_id"),
+            )
+        elif message:
             asyncio.run_coroutine_threadsafe(
                 self._send_msg(message, disable_notification=(noti == "silent")), self._loop
             )
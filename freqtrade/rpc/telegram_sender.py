@@ -0,0 +1,443 @@
+"""
+Rate-limit aware delivery of Telegram messages, shared by all users of one bot token.
+"""
+
+import asyncio
+import hashlib
+import heapq
+import logging
+import os
+import struct
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import timedelta
+from enum import IntEnum
+from itertools import count
+from pathlib import Path
+from typing import Any
+
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Windows - rate limits can't be shared between processes
+    fcntl = None  # type: ignore[assignment]
+
+from telegram import Bot
+from telegram.constants import MessageLimit
+from telegram.error import NetworkError, RetryAfter, TelegramError
+
+from freqtrade.enums import RPCMessageType
+
+
+logger = logging.getLogger(__name__)
+
+# Limits documented by telegram - 30 messages per second overall, 1 per second per chat
+GLOBAL_RATE_LIMIT = 30.0
+CHAT_RATE_LIMIT = 1.0
+# State of the global limit of each bot token, shared by all processes using that token
+RATE_LIMIT_DIR = Path(tempfile.gettempdir()) / "freqtrade_telegram"
+
+
+class MessagePriority(IntEnum):
+    """Lower values are delivered first"""
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+def message_priority(msg_type: RPCMessageType) -> MessagePriority:
+    """Fills and exits are delivered before entries, and entries before status messages"""
+    if msg_type in (
+        RPCMessageType.ENTRY_FILL,
+        RPCMessageType.EXIT,
+        RPCMessageType.EXIT_FILL,
+        RPCMessageType.EXIT_CANCEL,
+        RPCMessageType.PROTECTION_TRIGGER,
+        RPCMessageType.PROTECTION_TRIGGER_GLOBAL,
+    ):
+        return MessagePriority.HIGH
+    if msg_type in (RPCMessageType.ENTRY, RPCMessageType.ENTRY_CANCEL, RPCMessageType.WARNING):
+        return MessagePriority.NORMAL
+    return MessagePriority.LOW
+
+
+class TokenBucket:
+    """Allows rate messages per second, with bursts of up to capacity messages"""
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + max(now - self._last, 0) * self.rate)
+        self._last = now
+
+    def delay(self, now: float) -> float:
+        """Seconds until the next message may be sent"""
+        self._refill(now)
+        return 0.0 if self._tokens >= 1.0 else (1.0 - self._tokens) / self.rate
+
+    def consume(self, now: float) -> None:
+        self._refill(now)
+        self._tokens -= 1.0
+
+    def pause(self, now: float, seconds: float) -> None:
+        """Block the bucket for the given time (e.g. after a flood-limit response)"""
+        self._refill(now)
+        self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+    def acquire(self, now: float) -> float:
+        """
+        Consume a token if one is available.
+        :return: 0 if a message may be sent now, otherwise seconds until the next token
+        """
+        if (wait := self.delay(now)) == 0:
+            self.consume(now)
+        return wait
+
+    def close(self) -> None:
+        pass
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    Token bucket shared by all processes using the same state file -
+    e.g. all bots (and the multi-user manager) sending messages with one bot token.
+    The bucket's state is kept in the file, guarded by an exclusive file lock.
+    Uses wall-clock time, as monotonic clocks are not comparable between processes.
+    """
+
+    _STATE = struct.Struct("dd")
+
+    def __init__(self, path: Path, rate: float, capacity: float = 1.0) -> None:
+        super().__init__(rate, capacity)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd: int | None = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    @contextmanager
+    def _shared_state(self) -> Iterator[float]:
+        """Lock the state file and load the state - storing it again when done"""
+        if self._fd is None:
+            raise ValueError("Shared token bucket is closed.")
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            data = os.pread(self._fd, self._STATE.size, 0)
+            if len(data) == self._STATE.size:
+                self._tokens, self._last = self._STATE.unpack(data)
+            else:
+                self._tokens, self._last = self.capacity, time.time()
+            yield time.time()
+            os.pwrite(self._fd, self._STATE.pack(self._tokens, self._last), 0)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def delay(self, now: float) -> float:
+        with self._shared_state() as wall_now:
+            return super().delay(wall_now)
+
+    def consume(self, now: float) -> None:
+        with self._shared_state() as wall_now:
+            super().consume(wall_now)
+
+    def pause(self, now: float, seconds: float) -> None:
+        with self._shared_state() as wall_now:
+            super().pause(wall_now, seconds)
+
+    def acquire(self, now: float) -> float:
+        with self._shared_state() as wall_now:
+            return super().acquire(wall_now)
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def shared_rate_limit_file(token: str, directory: Path = RATE_LIMIT_DIR) -> Path:
+    """State file of the global rate limit of a bot token (the token itself is not stored)"""
+    return directory / f"{hashlib.sha256(token.encode()).hexdigest()[:16]}.bucket"
+
+
+@dataclass(order=True)
+class _Pending:
+    priority: int
+    seq: int
+    enqueued: float = field(compare=False)
+    text: str = field(compare=False)
+    kwargs: dict[str, Any] = field(compare=False)
+    coalesce: bool = field(compare=False)
+
+
+class TelegramSender:
+    """
+    Delivers messages for one bot token from a single worker task.
+    * A global and a per-chat token bucket keep delivery within Telegram's flood limits.
+      The global bucket may be shared with other processes using the same token.
+    * Messages pending for the same chat (with identical send options) are coalesced
+      into one message.
+    * Per chat, messages are delivered by priority, then in order of arrival.
+    Use get_telegram_sender() to share one sender between all users of a bot token.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        loop: asyncio.AbstractEventLoop,
+        *,
+        global_rate: float = GLOBAL_RATE_LIMIT,
+        chat_rate: float = CHAT_RATE_LIMIT,
+        chat_burst: int = 3,
+        coalesce: bool = True,
+        global_bucket: TokenBucket | None = None,
+    ) -> None:
+        """
+        :param bot: Bot used to send messages
+        :param loop: Event loop the bot (and the sender's worker) runs in
+        :param global_rate: Messages per second, across all chats
+        :param chat_rate: Messages per second, per chat
+        :param chat_burst: Messages which may be sent to one chat in a burst
+        :param coalesce: Combine messages pending for the same chat
+        :param global_bucket: Bucket enforcing global_rate (e.g. a SharedTokenBucket).
+            Defaults to a bucket local to this sender.
+        """
+        self._bot = bot
+        self._loop = loop
+        self._chat_rate = chat_rate
+        self._chat_burst = chat_burst
+        self._coalesce = coalesce
+        self._global_bucket = global_bucket or TokenBucket(global_rate, global_rate)
+        self._chat_buckets: dict[int | str, TokenBucket] = {}
+        self._pending: dict[int | str, list[_Pending]] = {}
+        self._seq = count()
+        self._wakeup = asyncio.Event()
+        self._worker: asyncio.Task | None = None
+        self._stopping = False
+        self._refs = 0
+        self.metrics: dict[str, float] = {
+            "queued": 0,
+            "sent": 0,
+            "coalesced": 0,
+            "failed": 0,
+            "retries": 0,
+            "latency_avg": 0.0,
+            "latency_max": 0.0,
+        }
+        self._latency_sum = 0.0
+        self._delivered = 0
+
+    @property
+    def queue_size(self) -> int:
+        return sum(len(pending) for pending in self._pending.values())
+
+    def enqueue(
+        self,
+        chat_id: int | str,
+        text: str,
+        priority: MessagePriority = MessagePriority.NORMAL,
+        coalesce: bool = True,
+        **kwargs,
+    ) -> None:
+        """
+        Queue a message for delivery. Thread-safe, never blocks.
+        :param chat_id: Chat to send the message to
+        :param text: Message text
+        :param priority: Delivery priority within this chat
+        :param coalesce: Message may be combined with other messages to this chat
+        :param kwargs: Additional arguments for bot.send_message()
+        """
+        item = _Pending(
+            priority, next(self._seq), time.monotonic(), text, kwargs, coalesce and self._coalesce
+        )
+        try:
+            self._loop.call_soon_threadsafe(self._put, chat_id, item)
+        except RuntimeError:
+            logger.warning(f"Telegram message to {chat_id} dropped, event loop is closed.")
+
+    def _put(self, chat_id: int | str, item: _Pending) -> None:
+        if self._stopping:
+            logger.warning(f"Telegram message to {chat_id} dropped, sender stopped.")
+            return
+        heapq.heappush(self._pending.setdefault(chat_id, []), item)
+        self.metrics["queued"] += 1
+        if self._worker is None:
+            self._worker = self._loop.create_task(self._run())
+        self._wakeup.set()
+
+    def _chat_bucket(self, chat_id: int | str) -> TokenBucket:
+        if chat_id not in self._chat_buckets:
+            self._chat_buckets[chat_id] = TokenBucket(self._chat_rate, self._chat_burst)
+        return self._chat_buckets[chat_id]
+
+    def _next_chat(self, now: float) -> tuple[int | str | None, float]:
+        """
+        Chat with the most urgent message which may be sent now.
+        :return: (chat_id, 0) - or (None, seconds until a chat may be sent to)
+        """
+        best: _Pending | None = None
+        best_chat: int | str | None = None
+        wait = float("inf")
+        for chat_id, pending in self._pending.items():
+            delay = self._chat_bucket(chat_id).delay(now)
+            if delay > 0:
+                wait = min(wait, delay)
+            elif best is None or pending[0] < best:
+                best, best_chat = pending[0], chat_id
+        return best_chat, 0.0 if best_chat is not None else wait
+
+    def _take(self, chat_id: int | str) -> list[_Pending]:
+        """Pop the next message for this chat, combined with compatible pending messages"""
+        pending = self._pending[chat_id]
+        batch = [heapq.heappop(pending)]
+        if batch[0].coalesce:
+            length = len(batch[0].text)
+            while (
+                pending
+                and pending[0].coalesce
+                and pending[0].kwargs == batch[0].kwargs
+                and length + len(pending[0].text) + 2 <= MessageLimit.MAX_TEXT_LENGTH
+            ):
+                item = heapq.heappop(pending)
+                length += len(item.text) + 2
+                batch.append(item)
+        if not pending:
+            del self._pending[chat_id]
+        return batch
+
+    async def _sleep(self, seconds: float) -> None:
+        """Sleep, waking up early if new messages arrive"""
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _run(self) -> None:
+        while self._pending or not self._stopping:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            now = time.monotonic()
+            chat_id, wait = self._next_chat(now)
+            if chat_id is None:
+                await self._sleep(wait)
+                continue
+            if (wait := self._global_bucket.acquire(now)) > 0:
+                await asyncio.sleep(wait)
+                continue
+            self._chat_bucket(chat_id).consume(now)
+            batch = self._take(chat_id)
+            try:
+                await self._deliver(chat_id, batch)
+            except Exception:
+                # Keep the worker running - otherwise all further messages would pile up.
+                logger.exception(f"Unexpected error sending Telegram message to {chat_id}.")
+                self.metrics["failed"] += len(batch)
+
+    async def _deliver(self, chat_id: int | str, batch: list[_Pending]) -> None:
+        text = "\n\n".join(item.text for item in batch)
+        try:
+            try:
+                await self._bot.send_message(chat_id, text=text, **batch[0].kwargs)
+            except NetworkError as network_err:
+                # Sometimes the telegram server resets the current connection,
+                # if this is the case we send the message again.
+                logger.warning(
+                    "Telegram NetworkError: %s! Trying one more time.", network_err.message
+                )
+                await self._bot.send_message(chat_id, text=text, **batch[0].kwargs)
+        except RetryAfter as flood_err:
+            retry_after = flood_err.retry_after
+            if isinstance(retry_after, timedelta):
+                retry_after = retry_after.total_seconds()
+            logger.warning(f"Telegram flood limit reached, retrying in {retry_after}s.")
+            self.metrics["retries"] += 1
+            now = time.monotonic()
+            self._global_bucket.pause(now, float(retry_after))
+            for item in batch:
+                heapq.heappush(self._pending.setdefault(chat_id, []), item)
+            return
+        except TelegramError as telegram_err:
+            logger.warning("TelegramError: %s! Giving up on that message.", telegram_err.message)
+            self.metrics["failed"] += len(batch)
+            return
+
+        now = time.monotonic()
+        self.metrics["sent"] += 1
+        self.metrics["coalesced"] += len(batch) - 1
+        for item in batch:
+            latency = now - item.enqueued
+            self._latency_sum += latency
+            self.metrics["latency_max"] = max(self.metrics["latency_max"], latency)
+        self._delivered += len(batch)
+        self.metrics["latency_avg"] = self._latency_sum / self._delivered
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """
+        Release this sender. The last user stops it, delivering pending messages
+        for at most timeout seconds.
+        Must be called from the sender's event loop.
+        """
+        self._refs -= 1
+        if self._refs > 0:
+            return
+        _senders.pop(self._bot.token, None)
+        # Let messages enqueued from other threads arrive first
+        await asyncio.sleep(0)
+        self._stopping = True
+        self._wakeup.set()
+        if self._worker:
+            try:
+                await asyncio.wait_for(self._worker, timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"{self.queue_size} Telegram messages not delivered.")
+        self._global_bucket.close()
+        logger.info(f"Telegram sender metrics: {self.metrics}")
+
+
+_senders: dict[str, TelegramSender] = {}
+
+
+def get_telegram_sender(
+    bot: Bot,
+    loop: asyncio.AbstractEventLoop | None = None,
+    *,
+    rate_limit_dir: Path | None = RATE_LIMIT_DIR,
+    **kwargs,
+) -> TelegramSender:
+    """
+    Get the sender for this bot token, creating it if necessary.
+    All users of one token share the sender - and therefore its rate limits.
+    The global rate limit is also shared with other processes using the same token
+    (e.g. bots started by the multi-user manager).
+    Each call must be paired with a call to TelegramSender.close().
+    :param bot: Bot used to send messages
+    :param loop: Event loop the bot runs in. Defaults to the running loop.
+    :param rate_limit_dir: Directory for the shared rate limit state.
+        None limits the rate of this process only.
+    :param kwargs: Passed to TelegramSender() when creating a new sender
+    """
+    sender = _senders.get(bot.token)
+    if sender is None:
+        global_bucket = None
+        if rate_limit_dir is not None and fcntl is not None and isinstance(bot.token, str):
+            global_rate = kwargs.get("global_rate", GLOBAL_RATE_LIMIT)
+            try:
+                global_bucket = SharedTokenBucket(
+                    shared_rate_limit_file(bot.token, rate_limit_dir), global_rate, global_rate
+                )
+            except OSError as e:
+                logger.warning(f"Could not share the Telegram rate limit with other processes: {e}")
+        sender = TelegramSender(
+            bot, loop or asyncio.get_running_loop(), global_bucket=global_bucket, **kwargs
+        )
+        _senders[bot.token] = sender
+    sender._refs += 1
+    return sender
@@ -6,11 +6,13 @@ import logging
 import time
 from typing import Any
 
+import aiohttp
 from requests import RequestException, post
 
 from freqtrade.constants import Config
 from freqtrade.enums import RPCMessageType
 from freqtrade.rpc import RPC, RPCHandler
+from freqtrade.rpc.notification_dispatcher import NotificationDispatcher
 from freqtrade.rpc.rpc_types import RPCSendMsg
 
 
@@ -22,6 +24,9 @@ logger.debug("Included module rpc.webhook ...")
 class Webhook(RPCHandler):
     """This class handles all webhook communication"""
 
+    # Message types which may be delivered together (if supported by the destination)
+    _batch_types: tuple[RPCMessageType, ...] = ()
+
     def __init__(self, rpc: RPC, config: Config) -> None:
         """
         Init the Webhook class, and init the super class RPCHandler
@@ -36,13 +41,32 @@ class Webhook(RPCHandler):
         self._retries = self._config["webhook"].get("retries", 0)
         self._retry_delay = self._config["webhook"].get("retry_delay", 0.1)
         self._timeout = self._config["webhook"].get("timeout", 10)
+        self._dispatcher = self._init_dispatcher(self._config["webhook"])
+
+    def _init_dispatcher(
+        self, whconfig: dict[str, Any], batch_size: int = 1
+    ) -> NotificationDispatcher | None:
+        """
+        Start background delivery, unless disabled via "async_delivery".
+        """
+        if not whconfig.get("async_delivery", True):
+            return None
+        return NotificationDispatcher(
+            self.name,
+            self._async_send_msg,
+            queue_size=whconfig.get("queue_size", 1000),
+            retries=self._retries,
+            retry_delay=self._retry_delay,
+            batch_size=batch_size,
+        )
 
     def cleanup(self) -> None:
         """
         Cleanup pending module resources.
-        This will do nothing for webhooks, they will simply not be called anymore
+        Delivers pending messages when using background delivery.
         """
-        pass
+        if self._dispatcher:
+            self._dispatcher.stop()
 
     def _get_value_dict(self, msg: RPCSendMsg) -> dict[str, Any] | None:
         whconfig = self._config["webhook"]
@@ -91,14 +115,49 @@ class Webhook(RPCHandler):
                 return
 
             payload = {key: value.format(**msg) for (key, value) in valuedict.items()}
-            self._send_msg(payload)
+            self._send_msg(payload, msg["type"])
         except KeyError as exc:
             logger.exception(
                 "Problem calling Webhook. Please check your webhook configuration. Exception: %s",
                 exc,
             )
 
-    def _send_msg(self, payload: dict) -> None:
+    def _send_msg(self, payload: dict, msg_type: RPCMessageType | None = None) -> None:
+        """
+        Queue the payload for background delivery, or send it right away
+        if background delivery is disabled.
+        """
+        if self._dispatcher:
+            self._dispatcher.enqueue(payload, batchable=msg_type in self._batch_types)
+        else:
+            self._send_msg_sync(payload)
+
+    def _merge_batch(self, payloads: list[dict]) -> dict:
+        """
+        Combine multiple payloads into one request.
+        Webhook payloads are user-defined, so they're never batched.
+        """
+        return payloads[0]
+
+    async def _async_send_msg(self, session: aiohttp.ClientSession, payloads: list[dict]) -> None:
+        """Call the webhook from the notification dispatcher"""
+        payload = self._merge_batch(payloads)
+        kwargs: dict[str, Any]
+        if self._format == "form":
+            kwargs = {"data": payload}
+        elif self._format == "json":
+            kwargs = {"json": payload}
+        elif self._format == "raw":
+            kwargs = {"data": payload["data"], "headers": {"Content-Type": "text/plain"}}
+        else:
+            raise NotImplementedError(f"Unknown format: {self._format}")
+
+        async with session.post(
+            self._url, timeout=aiohttp.ClientTimeout(total=self._timeout), **kwargs
+        ) as response:
+            response.raise_for_status()
+
+    def _send_msg_sync(self, payload: dict) -> None:
         """do the actual call to the webhook"""
 
         success = False
@@ -133,7 +133,18 @@ def _create_and_merge_informative_pair(
 
     inf_metadata = {"pair": asset, "timeframe": timeframe}
     inf_dataframe = strategy.dp.get_pair_dataframe(asset, timeframe, candle_type)
-    inf_dataframe = populate_indicators(strategy, inf_dataframe, inf_metadata)
+    if inf_data.asset and not inf_dataframe.empty:
+        # Same informative for every pair - only populate once per informative candle.
+        cache_key = (asset, timeframe, candle_type, populate_indicators)
+        candle = strategy.preserve_df(inf_dataframe)
+        cached = strategy._ft_informative_cache.get(cache_key)
+        if cached and cached[0] == candle:
+            inf_dataframe = cached[1]
+        else:
+            inf_dataframe = populate_indicators(strategy, inf_dataframe, inf_metadata)
+            strategy._ft_informative_cache[cache_key] = (candle, inf_dataframe)
+    else:
+        inf_dataframe = populate_indicators(strategy, inf_dataframe, inf_metadata)
 
     formatter: Any = None
     if callable(fmt):
@@ -146,7 +157,10 @@ def _create_and_merge_informative_pair(
         "asset": asset,
         "timeframe": timeframe,
     }
-    inf_dataframe.rename(columns=lambda column: formatter(column=column, **fmt_args), inplace=True)
+    # Not in place - the populated dataframe may be shared with other pairs.
+    inf_dataframe = inf_dataframe.rename(
+        columns=lambda column: formatter(column=column, **fmt_args)
+    )
 
     date_column = formatter(column="date", **fmt_args)
     if date_column in dataframe.columns:
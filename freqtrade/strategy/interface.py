@@ -35,6 +35,7 @@ from freqtrade.strategy.informative_decorator import (
     _create_and_merge_informative_pair,
     _format_pair_name,
 )
+from freqtrade.strategy.panel_indicators import IndicatorPanel
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
 from freqtrade.util import dt_now
 from freqtrade.wallets import Wallets
@@ -150,6 +151,15 @@ class IStrategy(ABC, HyperStrategyMixin):
 
         # Gather informative pairs from @informative-decorated methods.
         self._ft_informative: list[tuple[InformativeData, PopulateIndicators]] = []
+        # Populated informative dataframes of fixed assets, shared by all pairs.
+        # (asset, timeframe, candle_type, function) -> (last candle, dataframe)
+        self._ft_informative_cache: dict[tuple, tuple[tuple, DataFrame]] = {}
+        # Strategies opt in to panel indicators by implementing populate_panel_indicators().
+        self._ft_use_panel = (
+            type(self).populate_panel_indicators is not IStrategy.populate_panel_indicators
+        )
+        # Set while advise_all_indicators() has populated the panel for all pairs.
+        self._ft_panel_populated = False
         for attr_name in dir(self.__class__):
             cls_method = getattr(self.__class__, attr_name)
             if not callable(cls_method):
@@ -227,6 +237,16 @@ class IStrategy(ABC, HyperStrategyMixin):
         """
         return dataframe
 
+    def populate_panel_indicators(self, panel: IndicatorPanel) -> None:
+        """
+        Populate indicators for all pairs at once - before populate_indicators() is called.
+        Columns are read as 2D arrays (candles x pairs) - e.g. `panel["close"]` - and
+        indicators assigned to the panel are added to the dataframe of every pair.
+        Use the functions of `freqtrade.strategy.panel_indicators` to calculate them.
+        :param panel: IndicatorPanel with the candle (OHLCV) data of all pairs
+        """
+        pass
+
     def populate_buy_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         DEPRECATED - please migrate to populate_entry_trend
@@ -1679,10 +1699,28 @@ class IStrategy(ABC, HyperStrategyMixin):
         Has positive effects on memory usage for whatever reason - also when
         using only one strategy.
         """
-        return {
-            pair: self.advise_indicators(pair_data.copy(), {"pair": pair}).copy()
-            for pair, pair_data in data.items()
-        }
+        # Parameters may have changed since the last call (hyperopt)
+        self._ft_informative_cache.clear()
+        if self._ft_use_panel:
+            data = self._populate_panel(data)
+            self._ft_panel_populated = True
+        try:
+            return {
+                pair: self.advise_indicators(pair_data.copy(), {"pair": pair}).copy()
+                for pair, pair_data in data.items()
+            }
+        finally:
+            self._ft_panel_populated = False
+
+    def _populate_panel(self, data: dict[str, DataFrame]) -> dict[str, DataFrame]:
+        """
+        Call populate_panel_indicators() with the data of all pairs.
+        :param data: Dictionary of pair to dataframe
+        :return: Dictionary of pair to dataframe, including the panel indicators
+        """
+        panel = IndicatorPanel(data)
+        self.populate_panel_indicators(panel)
+        return panel.apply()
 
     def ft_advise_signals(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
@@ -1727,6 +1765,10 @@ class IStrategy(ABC, HyperStrategyMixin):
         """
         logger.debug(f"Populating indicators for pair {metadata.get('pair')}.")
 
+        if self._ft_use_panel and not self._ft_panel_populated:
+            # Dry / live runs analyze one pair at a time.
+            dataframe = self._populate_panel({metadata["pair"]: dataframe})[metadata["pair"]]
+
         # call populate_indicators_Nm() which were tagged with @informative decorator.
         for inf_data, populate_fn in self._ft_informative:
             dataframe = _create_and_merge_informative_pair(
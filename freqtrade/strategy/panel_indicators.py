@@ -0,0 +1,279 @@
+"""
+Indicators for many pairs at once.
+
+The columns of all pairs are stacked into 2D arrays (candles x pairs) - an IndicatorPanel -
+and every indicator is computed in one vectorized pass over all pairs.
+Results match the functions of the same name in `freqtrade.vendor.qtpylib.indicators`,
+applied to each pair separately.
+"""
+
+import warnings
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from pandas import DataFrame
+
+
+# Rolling windows are reduced in blocks of about this many values, to limit temporary memory.
+_BLOCK_VALUES = 2**22
+
+
+class IndicatorPanel:
+    """
+    Columns of several pairs as 2D arrays (candles x pairs).
+    Pairs are stacked by candle position - row i holds the i-th candle of every pair, and
+    shorter pairs are padded with NaN at the end. As the pairs of a backtest usually cover
+    the same dates, rows are typically aligned in time as well.
+    Indicators assigned to the panel are added to the dataframes of all pairs by `apply()`.
+    """
+
+    def __init__(self, data: dict[str, DataFrame]) -> None:
+        self.pairs = list(data)
+        self.lengths = [len(df) for df in data.values()]
+        self.shape = (max(self.lengths, default=0), len(self.pairs))
+        self._data = data
+        self._columns: dict[str, np.ndarray] = {}
+        self._indicators: list[str] = []
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        values = self._columns.get(column)
+        if values is None:
+            values = np.full(self.shape, np.nan)
+            for idx, df in enumerate(self._data.values()):
+                values[: len(df), idx] = df[column].to_numpy(dtype=np.float64)
+            self._columns[column] = values
+        return values
+
+    def __setitem__(self, column: str, values: np.ndarray) -> None:
+        if values.shape != self.shape:
+            raise ValueError(f"Indicator {column} has shape {values.shape}, expected {self.shape}.")
+        self._columns[column] = values
+        if column not in self._indicators:
+            self._indicators.append(column)
+
+    def __contains__(self, column: object) -> bool:
+        return column in self._columns or (
+            bool(self._data) and column in next(iter(self._data.values())).columns
+        )
+
+    def apply(self) -> dict[str, DataFrame]:
+        """
+        Add the indicators assigned to the panel to the dataframe of each pair.
+        :return: Dictionary of pair to dataframe, including the indicators
+        """
+        return {
+            pair: df.assign(
+                **{
+                    column: self._columns[column][: self.lengths[idx], idx]
+                    for column in self._indicators
+                }
+            )
+            for idx, (pair, df) in enumerate(self._data.items())
+        }
+
+
+# ---------------------------------------------
+
+
+def _shift(values: np.ndarray, periods: int = 1) -> np.ndarray:
+    return np.concatenate([np.full((periods, values.shape[1]), np.nan), values[:-periods]])
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Sum of the last `window` values - NaN must be replaced before.
+    """
+    cumsum = np.cumsum(values, axis=0)
+    result = cumsum.copy()
+    result[window:] -= cumsum[:-window]
+    return result
+
+
+def _rolling_count(values: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_sum((~np.isnan(values)).astype(np.float64), window)
+
+
+def _rolling_reduce(values: np.ndarray, window: int, min_periods: int, reduce) -> np.ndarray:
+    """
+    Apply reduce(windows) -> (rows, pairs) to the windows (rows, pairs, window) of values.
+    Results of windows with less than min_periods values are NaN.
+    """
+    rows, pairs = values.shape
+    padded = np.concatenate([np.full((window - 1, pairs), np.nan), values])
+    windows = sliding_window_view(padded, window, axis=0)
+    result = np.empty((rows, pairs))
+    step = max(1, _BLOCK_VALUES // max(1, pairs * window))
+    for start in range(0, rows, step):
+        result[start : start + step] = reduce(np.ascontiguousarray(windows[start : start + step]))
+    result[_rolling_count(values, window) < max(min_periods, 1)] = np.nan
+    return result
+
+
+def _scan(values: np.ndarray, factor: float, initial: np.ndarray | None = None) -> np.ndarray:
+    """
+    result[t] = factor * result[t - 1] + values[t], with result[-1] = initial (or 0).
+    Computed blockwise as factor^t * cumsum(values[t] / factor^t) - blocks are short enough
+    for factor^t to stay within float range.
+    """
+    result = np.empty_like(values)
+    if factor == 0:
+        result[:] = values
+        return result
+    block = max(1, int(230 / -np.log(factor)))
+    powers = factor ** np.arange(min(block, len(values)), dtype=np.float64)[:, None]
+    previous = np.zeros(values.shape[1]) if initial is None else initial
+    for start in range(0, len(values), block):
+        chunk = values[start : start + block]
+        scale = powers[: len(chunk)]
+        result[start : start + block] = scale * (
+            np.cumsum(chunk / scale, axis=0) + factor * previous
+        )
+        previous = result[start + len(chunk) - 1]
+    return result
+
+
+def _ffill(values: np.ndarray) -> np.ndarray:
+    rows = np.where(np.isnan(values), 0, np.arange(len(values))[:, None])
+    np.maximum.accumulate(rows, axis=0, out=rows)
+    return values[rows, np.arange(values.shape[1])]
+
+
+# ---------------------------------------------
+
+
+def rolling_mean(values: np.ndarray, window: int = 200, min_periods: int | None = None):
+    min_periods = window if min_periods is None else min_periods
+    valid = ~np.isnan(values)
+    # Center the columns, so cumulative sums stay small
+    with np.errstate(all="ignore"), warnings.catch_warnings():
+        # All-NaN columns
+        warnings.simplefilter("ignore", RuntimeWarning)
+        offset = np.nan_to_num(np.nanmean(values, axis=0))
+        total = _rolling_sum(np.where(valid, values - offset, 0.0), window)
+        count = _rolling_sum(valid.astype(np.float64), window)
+        result = total / count + offset
+    result[count < max(min_periods, 1)] = np.nan
+    return result
+
+
+def rolling_std(values: np.ndarray, window: int = 200, min_periods: int | None = None):
+    min_periods = window if min_periods is None else min_periods
+    with np.errstate(all="ignore"), warnings.catch_warnings():
+        # Windows with less than 2 values
+        warnings.simplefilter("ignore", RuntimeWarning)
+        if min_periods == window:
+            return _rolling_reduce(
+                values, window, min_periods, lambda w: np.std(w, axis=-1, ddof=1)
+            )
+        return _rolling_reduce(values, window, min_periods, lambda w: np.nanstd(w, axis=-1, ddof=1))
+
+
+def rolling_min(values: np.ndarray, window: int = 14, min_periods: int | None = None):
+    min_periods = window if min_periods is None else min_periods
+    return _rolling_reduce(values, window, min_periods, lambda w: np.fmin.reduce(w, axis=-1))
+
+
+def rolling_max(values: np.ndarray, window: int = 14, min_periods: int | None = None):
+    min_periods = window if min_periods is None else min_periods
+    return _rolling_reduce(values, window, min_periods, lambda w: np.fmax.reduce(w, axis=-1))
+
+
+def rolling_weighted_mean(
+    values: np.ndarray, window: float = 200, min_periods: float | None = None
+):
+    """
+    Exponentially weighted mean - like `ewm(span=window).mean()`
+    """
+    min_periods = window if min_periods is None else min_periods
+    factor = 1.0 - 2.0 / (window + 1.0)
+    valid = ~np.isnan(values)
+    with np.errstate(all="ignore"):
+        result = _scan(np.where(valid, values, 0.0), factor) / _scan(
+            valid.astype(np.float64), factor
+        )
+    result[np.cumsum(valid, axis=0) < max(min_periods, 1)] = np.nan
+    return result
+
+
+def hull_moving_average(values: np.ndarray, window: int = 200, min_periods: int | None = None):
+    min_periods = window if min_periods is None else min_periods
+    ma = (2 * rolling_weighted_mean(values, window / 2, min_periods)) - rolling_weighted_mean(
+        values, window, min_periods
+    )
+    return rolling_weighted_mean(ma, np.sqrt(window), min_periods)
+
+
+def sma(values: np.ndarray, window: int = 200, min_periods: int | None = None):
+    return rolling_mean(values, window=window, min_periods=min_periods)
+
+
+def wma(values: np.ndarray, window: int = 200, min_periods: int | None = None):
+    return rolling_weighted_mean(values, window=window, min_periods=min_periods)
+
+
+def hma(values: np.ndarray, window: int = 200, min_periods: int | None = None):
+    return hull_moving_average(values, window=window, min_periods=min_periods)
+
+
+def bollinger_bands(values: np.ndarray, window: int = 20, stds: float = 2) -> dict:
+    ma = rolling_mean(values, window=window, min_periods=1)
+    std = rolling_std(values, window=window, min_periods=1)
+    return {"upper": ma + std * stds, "mid": ma, "lower": ma - std * stds}
+
+
+def rsi(values: np.ndarray, window: int = 14):
+    """
+    Relative strength index - with qtpylib's seeding of the first `window` values.
+    """
+    deltas = np.diff(values, axis=0)
+    seed = deltas[: window + 1]
+    with np.errstate(all="ignore"):
+        ups = np.where(seed > 0, seed, 0.0).sum(axis=0) / window
+        downs = -np.where(seed < 0, seed, 0.0).sum(axis=0) / window
+        result = np.zeros_like(values, dtype=np.float64)
+        result[:window] = 100.0 - 100.0 / (1.0 + ups / downs)
+        if len(values) > window:
+            period = deltas[window - 1 :]
+            factor = (window - 1) / window
+            ups = _scan(np.where(period > 0, period, 0.0) / window, factor, ups)
+            downs = _scan(np.where(period > 0, 0.0, -period) / window, factor, downs)
+            result[window:] = 100.0 - 100.0 / (1.0 + ups / downs)
+    return result
+
+
+# ---------------------------------------------
+
+
+def typical_price(panel: IndicatorPanel):
+    return (panel["high"] + panel["low"] + panel["close"]) / 3.0
+
+
+def true_range(panel: IndicatorPanel):
+    previous_close = _shift(panel["close"])
+    return np.fmax.reduce(
+        [
+            panel["high"] - panel["low"],
+            np.abs(panel["high"] - previous_close),
+            np.abs(panel["low"] - previous_close),
+        ]
+    )
+
+
+def atr(panel: IndicatorPanel, window: int = 14, exp: bool = False):
+    tr = true_range(panel)
+    if exp:
+        return rolling_weighted_mean(tr, window)
+    return rolling_mean(tr, window)
+
+
+def rolling_vwap(panel: IndicatorPanel, window: int = 200, min_periods: int | None = None):
+    min_periods = window if min_periods is None else min_periods
+    weighted = panel["volume"] * typical_price(panel)
+    volume = panel["volume"]
+    with np.errstate(all="ignore"):
+        left = _rolling_sum(np.nan_to_num(weighted, nan=0.0), window)
+        right = _rolling_sum(np.nan_to_num(volume, nan=0.0), window)
+        result = left / right
+    result[_rolling_count(weighted, window) < max(min_periods, 1)] = np.nan
+    result[np.isinf(result)] = np.nan
+    return _ffill(result)
@@ -96,11 +96,12 @@ class Worker:
             logger.info(
                 f"Changing state{f' from {old_state.name}' if old_state else ''} to: {state.name}"
             )
-            if state == State.RUNNING:
-                self.freqtrade.startup()
+            with self.freqtrade.db_iteration():
+                if state == State.RUNNING:
+                    self.freqtrade.startup()
 
-            if state == State.STOPPED:
-                self.freqtrade.check_for_open_trades()
+                if state == State.STOPPED:
+                    self.freqtrade.check_for_open_trades()
 
             # Reset heartbeat timestamp to log the heartbeat message at
             # first throttling iteration when the state changes
@@ -188,11 +189,13 @@ class Worker:
         time.sleep(sleep_duration)
 
     def _process_stopped(self) -> None:
-        self.freqtrade.process_stopped()
+        with self.freqtrade.db_iteration():
+            self.freqtrade.process_stopped()
 
     def _process_running(self) -> None:
         try:
-            self.freqtrade.process()
+            with self.freqtrade.db_iteration():
+                self.freqtrade.process()
         except TemporaryError as error:
             logger.warning(f"Error: {error}, retrying in {RETRY_TIMEOUT} seconds...")
             time.sleep(RETRY_TIMEOUT)
@@ -27,6 +27,10 @@ from hyperliquid.utils import constants
 from dotenv import load_dotenv
 import pymongo
 
+from freqtrade.rpc.telegram_sender import (
+    CHAT_RATE_LIMIT, GLOBAL_RATE_LIMIT, MessagePriority, TelegramSender, get_telegram_sender
+)
+
 # Load environment variables
 load_dotenv()
 
@@ -90,6 +94,8 @@ class MultiUserManager:
         
         self.app = Application.builder().token(token).build()
         self.bot = None
+        # Shared, rate limited sender - created once the application is running
+        self.sender: Optional[TelegramSender] = None
         self._add_handlers()
         
         # Create user_data directory if it doesn't exist
@@ -103,6 +109,24 @@ class MultiUserManager:
             import shutil
             shutil.copy('hyperliquid_sample_strategy.py', strategy_path)
     
+    async def _reply(self, update: Update, text: str, **kwargs):
+        """
+        Reply to the chat of an update.
+        Replies go through the shared sender, which keeps all chats within
+        Telegram's flood limits.
+        
+        Args:
+            update: Update to reply to
+            text: Message text
+            **kwargs: Additional arguments for send_message
+        """
+        if self.sender is None:
+            await update.effective_chat.send_message(text, **kwargs)
+            return
+        self.sender.enqueue(
+            update.effective_chat.id, text, priority=MessagePriority.NORMAL, **kwargs
+        )
+    
     def _add_handlers(self):
         """Add command handlers to the telegram bot."""
         # Connect wallet conversation
@@ -153,7 +177,7 @@ class MultiUserManager:
                 "For help, type /help."
             )
         
-        await update.message.reply_text(message)
+        await self._reply(update, message)
     
     async def _help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /help command."""
@@ -173,11 +197,12 @@ class MultiUserManager:
             "/count - Show trade counts\n"
             "/daily - Show daily profit\n"
         )
-        await update.message.reply_text(message)
+        await self._reply(update, message)
     
     async def _connect_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /connect command."""
-        await update.message.reply_text(
+        await self._reply(
+            update,
             "Please send your Hyperliquid private key. This will be used to trade on your behalf.\n\n"
             "⚠️ Security Warning: Your private key will be stored in our database. "
             "For production use, consider using an API wallet with limited permissions.\n\n"
@@ -199,7 +224,7 @@ class MultiUserManager:
         
         try:
             # Testing connection to Hyperliquid
-            await update.message.reply_text("Testing connection to Hyperliquid...")
+            await self._reply(update, "Testing connection to Hyperliquid...")
             
             # Get wallet address from private key
             wallet = Web3().eth.account.from_key(private_key)
@@ -232,7 +257,8 @@ class MultiUserManager:
             # Create user-specific config
             self._create_user_config(str(chat_id), wallet_address, private_key)
             
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 f"Wallet connected successfully! 🎉\n\n"
                 f"Wallet address: {wallet_address}\n"
                 f"Balance: {account_value} USDC\n\n"
@@ -241,7 +267,8 @@ class MultiUserManager:
         
         except Exception as e:
             logger.error(f"Error connecting wallet: {e}")
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 f"Error connecting to Hyperliquid: {str(e)}\n"
                 "Please check your private key and try again."
             )
@@ -250,7 +277,7 @@ class MultiUserManager:
     
     async def _cancel_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Cancel the current conversation."""
-        await update.message.reply_text("Operation cancelled.")
+        await self._reply(update, "Operation cancelled.")
         return ConversationHandler.END
     
     def _create_user_config(self, user_id: str, wallet_address: str, private_key: str) -> str:
@@ -313,7 +340,8 @@ class MultiUserManager:
         # Check if instance is running
         if (user_id not in freqtrade_instances or 
             freqtrade_instances[user_id]["process"].poll() is not None):
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 "Your trading bot is not running. Start it with /start_trading first."
             )
             return
@@ -328,7 +356,8 @@ class MultiUserManager:
         user = self.collection.find_one({"chat_id": chat_id})
         
         if not user:
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 "You need to connect your wallet first. Use /connect command."
             )
             return
@@ -338,12 +367,12 @@ class MultiUserManager:
         # Check if instance is already running
         if (user_id in freqtrade_instances and 
             freqtrade_instances[user_id]["process"].poll() is None):
-            await update.message.reply_text("Trading bot is already running!")
+            await self._reply(update, "Trading bot is already running!")
             return
         
         try:
             # Start trading instance
-            await update.message.reply_text("Starting trading bot... This may take a moment.")
+            await self._reply(update, "Starting trading bot... This may take a moment.")
             
             config_path = os.path.join("user_data", f"user_{user_id}", "config.json")
             if not os.path.exists(config_path):
@@ -390,13 +419,15 @@ class MultiUserManager:
                 {"$set": {"status": "trading", "instance_started_at": datetime.now()}}
             )
             
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 "Trading bot started successfully! 🚀\n"
                 "Use /status to check your trades or /stop_trading to stop the bot."
             )
         except Exception as e:
             logger.error(f"Error starting trading bot: {e}")
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 f"Error starting trading bot: {str(e)}\n"
                 "Please try again later or contact support."
             )
@@ -408,12 +439,12 @@ class MultiUserManager:
         
         if (user_id not in freqtrade_instances or 
             freqtrade_instances[user_id]["process"].poll() is not None):
-            await update.message.reply_text("Trading bot is not currently running.")
+            await self._reply(update, "Trading bot is not currently running.")
             return
         
         try:
             # Stop the process
-            await update.message.reply_text("Stopping trading bot...")
+            await self._reply(update, "Stopping trading bot...")
             
             process = freqtrade_instances[user_id]["process"]
             
@@ -435,10 +466,11 @@ class MultiUserManager:
             # Clean up
             del freqtrade_instances[user_id]
             
-            await update.message.reply_text("Trading bot stopped successfully.")
+            await self._reply(update, "Trading bot stopped successfully.")
         except Exception as e:
             logger.error(f"Error stopping trading bot: {e}")
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 f"Error stopping trading bot: {str(e)}\n"
                 "Please try again later or contact support."
             )
@@ -452,7 +484,7 @@ class MultiUserManager:
         if (user_id in freqtrade_instances and 
             freqtrade_instances[user_id]["process"].poll() is None):
             try:
-                await update.message.reply_text("Stopping current trading bot...")
+                await self._reply(update, "Stopping current trading bot...")
                 process = freqtrade_instances[user_id]["process"]
                 process.terminate()
                 try:
@@ -462,7 +494,8 @@ class MultiUserManager:
                 del freqtrade_instances[user_id]
             except Exception as e:
                 logger.error(f"Error stopping trading bot during restart: {e}")
-                await update.message.reply_text(
+                await self._reply(
+                    update,
                     f"Error stopping trading bot: {str(e)}\n"
                     "Restart failed. Please try again later."
                 )
@@ -476,7 +509,7 @@ class MultiUserManager:
         """Handler for /admin_stats command (admin only)."""
         # Check if user is admin
         if update.effective_chat.id not in ADMIN_USER_IDS:
-            await update.message.reply_text("This command is only available to admins.")
+            await self._reply(update, "This command is only available to admins.")
             return
         
         try:
@@ -507,10 +540,10 @@ class MultiUserManager:
                 f"Latest Users:\n{latest_users_text}"
             )
             
-            await update.message.reply_text(message)
+            await self._reply(update, message)
         except Exception as e:
             logger.error(f"Error fetching admin stats: {e}")
-            await update.message.reply_text(f"Error: {str(e)}")
+            await self._reply(update, f"Error: {str(e)}")
     
     async def start(self):
         """Start the application."""
@@ -518,6 +551,13 @@ class MultiUserManager:
         await self.app.initialize()
         await self.app.start()
         self.bot = self.app.bot
+        telegram_config = self.base_config.get('telegram', {})
+        self.sender = get_telegram_sender(
+            self.bot,
+            global_rate=telegram_config.get('global_rate_limit', GLOBAL_RATE_LIMIT),
+            chat_rate=telegram_config.get('chat_rate_limit', CHAT_RATE_LIMIT),
+            coalesce=telegram_config.get('coalesce_messages', True),
+        )
         
         # Add signal handlers for graceful shutdown
         for sig in (signal.SIGINT, signal.SIGTERM):
@@ -565,6 +605,11 @@ class MultiUserManager:
                 except subprocess.TimeoutExpired:
                     process.kill()
         
+        # Deliver pending replies
+        if self.sender:
+            await self.sender.close()
+            self.sender = None
+        
         # Stop telegram polling
         if self.app.updater and self.app.updater.running:
             await self.app.updater.stop()
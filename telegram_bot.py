@@ -19,6 +19,9 @@ from mongodb_models import DatabaseManager
 from config_manager import ConfigManager
 from instance_manager import InstanceManager
 from hyperliquid_utils import HyperliquidWalletUtils
+from freqtrade.rpc.telegram_sender import (
+    CHAT_RATE_LIMIT, GLOBAL_RATE_LIMIT, MessagePriority, TelegramSender, get_telegram_sender
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -61,8 +64,28 @@ class MultiUserBot:
         
         # Setup telegram application
         self.app = Application.builder().token(token).build()
+        # Shared, rate limited sender - created once the application is running
+        self.sender: Optional[TelegramSender] = None
         self._add_handlers()
     
+    async def _reply(self, update: Update, text: str, **kwargs):
+        """
+        Reply to the chat of an update.
+        Replies go through the shared sender, which keeps all chats within
+        Telegram's flood limits.
+        
+        Args:
+            update: Update to reply to
+            text: Message text
+            **kwargs: Additional arguments for send_message (e.g. parse_mode)
+        """
+        if self.sender is None:
+            await update.effective_chat.send_message(text, **kwargs)
+            return
+        self.sender.enqueue(
+            update.effective_chat.id, text, priority=MessagePriority.NORMAL, **kwargs
+        )
+    
     def _add_handlers(self):
         """Add command handlers to the telegram bot."""
         # Basic commands
@@ -114,7 +137,7 @@ class MultiUserBot:
                 "For help, type /help."
             )
         
-        await update.message.reply_text(message, parse_mode='Markdown')
+        await self._reply(update, message, parse_mode='Markdown')
     
     async def _help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /help command."""
@@ -131,11 +154,12 @@ class MultiUserBot:
             "/start_trading - Start automated trading\n"
             "/stop_trading - Stop automated trading\n"
         )
-        await update.message.reply_text(message, parse_mode='Markdown')
+        await self._reply(update, message, parse_mode='Markdown')
     
     async def _connect_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /connect command."""
-        await update.message.reply_text(
+        await self._reply(
+            update,
             "Please send your Hyperliquid private key. This will be used to trade on your behalf.\n\n"
             "⚠️ *Security Warning*: Your private key will be stored in our database. "
             "For production use, consider using an API wallet with limited permissions.\n\n"
@@ -154,7 +178,8 @@ class MultiUserBot:
         
         # Validate private key format (basic check)
         if not private_key.startswith('0x') or len(private_key) != 66:
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 "Invalid private key format. Please ensure it starts with '0x' and is 66 characters long.\n"
                 "Type /connect to try again."
             )
@@ -165,11 +190,12 @@ class MultiUserBot:
             wallet_address = self.wallet_utils.get_wallet_from_private_key(private_key)
             
             # Test connection to Hyperliquid
-            await update.message.reply_text("Testing connection to Hyperliquid...")
+            await self._reply(update, "Testing connection to Hyperliquid...")
             test_result = await self.wallet_utils.test_connection(private_key)
             
             if not test_result["success"]:
-                await update.message.reply_text(
+                await self._reply(
+                    update,
                     f"Error connecting to Hyperliquid: {test_result['error']}\n"
                     "Please check your private key and try again."
                 )
@@ -190,7 +216,8 @@ class MultiUserBot:
             success = self.db_manager.save_user(user_data)
             
             if not success:
-                await update.message.reply_text(
+                await self._reply(
+                    update,
                     "Error saving your wallet information. Please try again later."
                 )
                 return ConversationHandler.END
@@ -200,7 +227,8 @@ class MultiUserBot:
                 str(chat_id), wallet_address, private_key
             )
             
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 f"Wallet connected successfully! 🎉\n\n"
                 f"Wallet address: `{wallet_address}`\n"
                 f"Balance: `{test_result.get('balance', 0)} USDC`\n\n"
@@ -210,7 +238,8 @@ class MultiUserBot:
         
         except Exception as e:
             logger.error(f"Error connecting wallet: {e}")
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 f"Error connecting wallet: {str(e)}\n"
                 "Please try again later or contact support."
             )
@@ -219,7 +248,7 @@ class MultiUserBot:
     
     async def _cancel_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Cancel the current conversation."""
-        await update.message.reply_text("Operation cancelled.")
+        await self._reply(update, "Operation cancelled.")
         return ConversationHandler.END
     
     async def _balance_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -228,7 +257,8 @@ class MultiUserBot:
         user = self.db_manager.get_user_by_chat_id(chat_id)
         
         if not user:
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 "You need to connect your wallet first. Use /connect command."
             )
             return
@@ -238,7 +268,7 @@ class MultiUserBot:
             private_key = user["private_key"]
             
             # Get latest balance from Hyperliquid
-            await update.message.reply_text("Fetching your balance information...")
+            await self._reply(update, "Fetching your balance information...")
             balance_info = await self.wallet_utils.get_wallet_balance(wallet_address)
             
             # Format message
@@ -257,7 +287,7 @@ class MultiUserBot:
             else:
                 message += "No open positions."
             
-            await update.message.reply_text(message, parse_mode='Markdown')
+            await self._reply(update, message, parse_mode='Markdown')
             
             # Update user balance in database
             self.db_manager.save_user({
@@ -269,7 +299,8 @@ class MultiUserBot:
         
         except Exception as e:
             logger.error(f"Error fetching balance: {e}")
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 f"Error fetching balance information: {str(e)}\n"
                 "Please try again later."
             )
@@ -280,7 +311,8 @@ class MultiUserBot:
         user = self.db_manager.get_user_by_chat_id(chat_id)
         
         if not user:
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 "You need to connect your wallet first. Use /connect command."
             )
             return
@@ -290,18 +322,20 @@ class MultiUserBot:
             instance_status = self.instance_manager.get_instance_status(str(chat_id))
             
             if not instance_status or not instance_status["is_running"]:
-                await update.message.reply_text(
+                await self._reply(
+                    update,
                     "Trading bot is not currently running for your account.\n"
                     "Start it with /start_trading command."
                 )
                 return
             
             # Execute status command on the instance
-            await update.message.reply_text("Fetching trade status...")
+            await self._reply(update, "Fetching trade status...")
             result = await self.instance_manager.execute_command(str(chat_id), "status")
             
             if not result or not result["success"]:
-                await update.message.reply_text(
+                await self._reply(
+                    update,
                     f"Error fetching status: {result.get('error', 'Unknown error')}"
                 )
                 return
@@ -309,7 +343,8 @@ class MultiUserBot:
             # Format message
             if "text" in result:
                 # Raw text output from command
-                await update.message.reply_text(
+                await self._reply(
+                    update,
                     f"*Status of your trading bot:*\n\n{result['text']}",
                     parse_mode='Markdown'
                 )
@@ -321,11 +356,12 @@ class MultiUserBot:
                 # Extract relevant information from status data
                 # The exact format depends on freqtrade's output format
                 
-                await update.message.reply_text(message, parse_mode='Markdown')
+                await self._reply(update, message, parse_mode='Markdown')
         
         except Exception as e:
             logger.error(f"Error fetching status: {e}")
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 f"Error fetching status information: {str(e)}\n"
                 "Please try again later."
             )
@@ -336,7 +372,8 @@ class MultiUserBot:
         user = self.db_manager.get_user_by_chat_id(chat_id)
         
         if not user:
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 "You need to connect your wallet first. Use /connect command."
             )
             return
@@ -346,18 +383,20 @@ class MultiUserBot:
             instance_status = self.instance_manager.get_instance_status(str(chat_id))
             
             if not instance_status or not instance_status["is_running"]:
-                await update.message.reply_text(
+                await self._reply(
+                    update,
                     "Trading bot is not currently running for your account.\n"
                     "Start it with /start_trading command."
                 )
                 return
             
             # Execute performance command on the instance
-            await update.message.reply_text("Fetching performance data...")
+            await self._reply(update, "Fetching performance data...")
             result = await self.instance_manager.execute_command(str(chat_id), "performance")
             
             if not result or not result["success"]:
-                await update.message.reply_text(
+                await self._reply(
+                    update,
                     f"Error fetching performance: {result.get('error', 'Unknown error')}"
                 )
                 return
@@ -365,7 +404,8 @@ class MultiUserBot:
             # Format message
             if "text" in result:
                 # Raw text output from command
-                await update.message.reply_text(
+                await self._reply(
+                    update,
                     f"*Performance of your trading bot:*\n\n{result['text']}",
                     parse_mode='Markdown'
                 )
@@ -377,11 +417,12 @@ class MultiUserBot:
                 # Extract relevant information from performance data
                 # The exact format depends on freqtrade's output format
                 
-                await update.message.reply_text(message, parse_mode='Markdown')
+                await self._reply(update, message, parse_mode='Markdown')
         
         except Exception as e:
             logger.error(f"Error fetching performance: {e}")
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 f"Error fetching performance information: {str(e)}\n"
                 "Please try again later."
             )
@@ -392,7 +433,8 @@ class MultiUserBot:
         user = self.db_manager.get_user_by_chat_id(chat_id)
         
         if not user:
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 "You need to connect your wallet first. Use /connect command."
             )
             return
@@ -400,7 +442,8 @@ class MultiUserBot:
         # Check if instance is already running
         instance_status = self.instance_manager.get_instance_status(str(chat_id))
         if instance_status and instance_status["is_running"]:
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 "Trading bot is already running for your account.\n"
                 "Use /status to check its status."
             )
@@ -408,12 +451,13 @@ class MultiUserBot:
         
         try:
             # Start trading instance
-            await update.message.reply_text("Starting trading bot... This may take a moment.")
+            await self._reply(update, "Starting trading bot... This may take a moment.")
             
             success = await self.instance_manager.start_instance(str(chat_id))
             
             if not success:
-                await update.message.reply_text(
+                await self._reply(
+                    update,
                     "Failed to start trading bot. Please try again later or contact support."
                 )
                 return
@@ -423,14 +467,16 @@ class MultiUserBot:
                 "instance_started_at": datetime.now()
             })
             
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 "Trading bot started successfully! 🚀\n"
                 "Use /status to check your trades or /stop_trading to stop the bot."
             )
         
         except Exception as e:
             logger.error(f"Error starting trading bot: {e}")
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 f"Error starting trading bot: {str(e)}\n"
                 "Please try again later or contact support."
             )
@@ -442,19 +488,21 @@ class MultiUserBot:
         # Check if instance is running
         instance_status = self.instance_manager.get_instance_status(str(chat_id))
         if not instance_status or not instance_status["is_running"]:
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 "Trading bot is not currently running for your account."
             )
             return
         
         try:
             # Stop trading instance
-            await update.message.reply_text("Stopping trading bot...")
+            await self._reply(update, "Stopping trading bot...")
             
             success = await self.instance_manager.stop_instance(str(chat_id))
             
             if not success:
-                await update.message.reply_text(
+                await self._reply(
+                    update,
                     "Failed to stop trading bot. Please try again later or contact support."
                 )
                 return
@@ -464,14 +512,16 @@ class MultiUserBot:
                 "instance_stopped_at": datetime.now()
             })
             
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 "Trading bot stopped successfully.\n"
                 "Use /start_trading to start it again."
             )
         
         except Exception as e:
             logger.error(f"Error stopping trading bot: {e}")
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 f"Error stopping trading bot: {str(e)}\n"
                 "Please try again later or contact support."
             )
@@ -483,7 +533,7 @@ class MultiUserBot:
         admin_chat_id = int(self.base_config["telegram"].get("chat_id", 0))
         
         if chat_id != admin_chat_id:
-            await update.message.reply_text("This command is only available to admins.")
+            await self._reply(update, "This command is only available to admins.")
             return
         
         try:
@@ -507,11 +557,12 @@ class MultiUserBot:
             for status, count in status_counts.items():
                 message += f"- {status.capitalize()}: {count}\n"
             
-            await update.message.reply_text(message, parse_mode='Markdown')
+            await self._reply(update, message, parse_mode='Markdown')
         
         except Exception as e:
             logger.error(f"Error fetching admin stats: {e}")
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 f"Error fetching admin statistics: {str(e)}"
             )
     
@@ -538,6 +589,13 @@ class MultiUserBot:
             # Start polling
             await self.app.initialize()
             await self.app.start()
+            telegram_config = self.base_config.get('telegram', {})
+            self.sender = get_telegram_sender(
+                self.app.bot,
+                global_rate=telegram_config.get('global_rate_limit', GLOBAL_RATE_LIMIT),
+                chat_rate=telegram_config.get('chat_rate_limit', CHAT_RATE_LIMIT),
+                coalesce=telegram_config.get('coalesce_messages', True),
+            )
             
             # Check if updater exists (it might not in certain configurations)
             if self.app.updater:
@@ -563,6 +621,11 @@ class MultiUserBot:
         """Shutdown the bot and clean up resources."""
         logger.info("Shutting down telegram bot...")
         
+        # Deliver pending replies
+        if self.sender:
+            await self.sender.close()
+            self.sender = None
+        
         # Stop telegram polling
         if self.app.updater:
             await self.app.updater.stop()
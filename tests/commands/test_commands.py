@@ -27,6 +27,7 @@ from freqtrade.commands import (
     start_list_strategies,
     start_list_timeframes,
     start_new_strategy,
+    start_record_data,
     start_show_config,
     start_show_trades,
     start_strategy_update,
@@ -977,6 +978,39 @@ def test_download_data_data_invalid(mocker):
         start_download_data(pargs)
 
 
+def test_start_record_data(mocker, markets):
+    record_mock = mocker.patch("freqtrade.data.history.data_recorder.DataRecorder.run")
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=markets))
+    mocker.patch(f"{EXMS}.exchange_has", return_value=True)
+    args = [
+        "record-data",
+        "--exchange",
+        "binance",
+        "--pairs",
+        "ETH/BTC",
+        "XRP/BTC",
+        "-t",
+        "1m",
+        "5m",
+        "--record-trades",
+        "--flush-interval",
+        "30",
+        "--data-format-ohlcv",
+        "partitioned",
+    ]
+    pargs = get_args(args)
+    pargs["config"] = None
+    start_record_data(pargs)
+    assert record_mock.call_count == 1
+
+    args = ["record-data", "--exchange", "binance"]
+    pargs = get_args(args)
+    pargs["config"] = None
+    with pytest.raises(OperationalException, match=r"Recording data requires a list of pairs.*"):
+        start_record_data(pargs)
+
+
 def test_start_convert_trades(mocker):
     convert_mock = mocker.patch(
         "freqtrade.data.converter.convert_trades_to_ohlcv", MagicMock(return_value=[])
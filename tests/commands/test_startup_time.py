@@ -1,10 +1,30 @@
 import subprocess
+import sys
 import time
 
+import pytest
+
 from tests.conftest import is_arm, is_mac
 
 
 MAXIMUM_STARTUP_TIME = 0.7 if is_mac() and not is_arm() else 0.5
+# Cumulative import time of freqtrade.main, in seconds
+MAXIMUM_IMPORT_TIME = 0.45 if is_mac() and not is_arm() else 0.3
+# Modules only the commands using them may import - never the argument parsing.
+HEAVY_MODULES = (
+    "ccxt",
+    "numpy",
+    "optuna",
+    "pandas",
+    "plotly",
+    "sqlalchemy",
+    "freqtrade.data",
+    "freqtrade.exchange",
+    "freqtrade.freqtradebot",
+    "freqtrade.optimize",
+    "freqtrade.persistence",
+    "freqtrade.plot",
+)
 
 
 def test_startup_time():
@@ -18,3 +38,54 @@ def test_startup_time():
         "The startup time is too long, try to use lazy import in the command entry function"
         f" (maximum {MAXIMUM_STARTUP_TIME}s, got {elapsed}s)"
     )
+
+
+def _import_times(code: str) -> dict[str, int]:
+    """
+    Run code with `python -X importtime`.
+    :return: Dict of imported module -> cumulative import time in microseconds
+    """
+    res = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in res.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module = line.removeprefix("import time:").split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_startup_import_time():
+    # warm up to generate pyc
+    _import_times("import freqtrade.main")
+
+    times = _import_times(
+        "from freqtrade.main import main\n"
+        "from freqtrade.commands import Arguments\n"
+        "Arguments(['trade']).get_parsed_arg()\n"
+    )
+    heavy = [
+        module
+        for module in times
+        if any(module == name or module.startswith(f"{name}.") for name in HEAVY_MODULES)
+    ]
+    assert not heavy, (
+        f"Parsing arguments imports {', '.join(heavy)} - "
+        "use lazy imports in the command entry function"
+    )
+    # Commands are only imported once they run
+    assert "freqtrade.commands.trade_commands" not in times
+
+
+@pytest.mark.longrun
+def test_startup_import_time_limit():
+    # Wall-clock time depends on the machine - only checked with --longrun
+    _import_times("import freqtrade.main")
+    times = _import_times("import freqtrade.main")
+    import_time = times["freqtrade.main"] / 1e6
+    assert import_time < MAXIMUM_IMPORT_TIME, (
+        f"Importing freqtrade.main is too slow (maximum {MAXIMUM_IMPORT_TIME}s, got {import_time}s)"
+    )
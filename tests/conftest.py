@@ -21,7 +21,8 @@ from freqtrade.enums import CandleType, MarginMode, RunMode, SignalDirection, Tr
 from freqtrade.exchange import Exchange, timeframe_to_minutes, timeframe_to_seconds
 from freqtrade.freqtradebot import FreqtradeBot
 from freqtrade.persistence import LocalTrade, Order, Trade, init_db
-from freqtrade.resolvers import ExchangeResolver
+from freqtrade.resolvers import ExchangeResolver, IResolver
+from freqtrade.resolvers.resolver_index import RESOLVER_INDEX_FILE
 from freqtrade.util import dt_now, dt_ts
 from freqtrade.worker import Worker
 from tests.conftest_trades import (
@@ -64,6 +65,14 @@ def pytest_addoption(parser):
         default=False,
         help="Enable long-run tests (ccxt compat)",
     )
+    parser.addoption(
+        "--float-math-tolerance",
+        action="store",
+        type=float,
+        dest="float_math_tolerance",
+        default=1e-9,
+        help="Relative tolerance for float profit math compared to precise math",
+    )
 
 
 def pytest_configure(config):
@@ -549,6 +558,16 @@ def user_dir(mocker, tmp_path) -> Path:
     return user_dir
 
 
+@pytest.fixture(autouse=True)
+def resolver_index_file(mocker, tmp_path) -> MagicMock:
+    """
+    Keep the resolver index out of the (relative) user_data directory of default_conf.
+    """
+    return mocker.patch.object(
+        IResolver, "get_index_file", return_value=tmp_path / RESOLVER_INDEX_FILE
+    )
+
+
 @pytest.fixture(autouse=True)
 def patch_coingecko(mocker) -> None:
     """
@@ -15,19 +15,21 @@ from freqtrade.data.converter import (
     ohlcv_fill_up_missing_data,
     ohlcv_to_dataframe,
     reduce_dataframe_footprint,
+    trades_chunks_to_ohlcv,
     trades_df_remove_duplicates,
     trades_dict_to_list,
     trades_to_ohlcv,
     trim_dataframe,
 )
 from freqtrade.data.history import (
+    get_datahandler,
     get_timerange,
     load_data,
     load_pair_history,
     validate_backtest_data,
 )
 from freqtrade.data.history.datahandlers import IDataHandler
-from freqtrade.enums import CandleType
+from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_seconds
 from tests.conftest import generate_test_data, generate_trades_history, log_has, log_has_re
 from tests.data.test_history import _clean_test_file
@@ -588,3 +590,48 @@ def test_convert_trades_to_ohlcv(testdatadir, tmp_path, caplog):
         candle_type=CandleType.SPOT,
     )
     assert log_has(msg, caplog)
+
+
+def test_convert_trades_to_ohlcv_workers(testdatadir, tmp_path, caplog):
+    pairs = ["XRP/ETH", "XRP/BTC", "NoDatapair"]
+    copyfile(testdatadir / "XRP_ETH-trades.json.gz", tmp_path / "XRP_ETH-trades.json.gz")
+    copyfile(testdatadir / "XRP_ETH-trades.json.gz", tmp_path / "XRP_BTC-trades.json.gz")
+    dfbak_5m = load_pair_history(datadir=testdatadir, timeframe="5m", pair="XRP/ETH")
+
+    convert_trades_to_ohlcv(
+        pairs,
+        timeframes=["1m", "5m"],
+        data_format_trades="jsongz",
+        datadir=tmp_path,
+        timerange=TimeRange(),
+        erase=False,
+        data_format_ohlcv="feather",
+        candle_type=CandleType.SPOT,
+        workers=2,
+        chunk_size=1000,
+    )
+    assert log_has("Converting 3 pairs using 2 worker processes.", caplog)
+    assert log_has("Could not convert NoDatapair to OHLCV.", caplog)
+    assert not log_has("Could not convert XRP/BTC to OHLCV.", caplog)
+    for pair in pairs[:2]:
+        df_5m = load_pair_history(datadir=tmp_path, timeframe="5m", pair=pair)
+        assert_frame_equal(dfbak_5m, df_5m)
+
+
+def test_trades_chunks_to_ohlcv(testdatadir):
+    trades = get_datahandler(testdatadir, "feather").trades_load("XRP/ETH", TradingMode.SPOT)
+    timeframes = ["1m", "5m", "1h", "3d", "1w"]
+    chunks = [trades.iloc[start : start + 500] for start in range(0, len(trades), 500)]
+    assert len(chunks) > 2
+
+    result = trades_chunks_to_ohlcv(chunks, timeframes)
+    assert list(result) == timeframes
+    for timeframe in timeframes:
+        expected = trades_to_ohlcv(trades, timeframe)
+        assert_frame_equal(result[timeframe], expected.reset_index(drop=True))
+
+    # Single chunk - same result as converting all trades at once
+    result = trades_chunks_to_ohlcv([trades], ["5m"])
+    assert_frame_equal(result["5m"], trades_to_ohlcv(trades, "5m"), check_exact=True)
+
+    assert trades_chunks_to_ohlcv([], timeframes) == {}
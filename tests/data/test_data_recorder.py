@@ -0,0 +1,224 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import pytest
+
+from freqtrade.data.history import get_datahandler
+from freqtrade.data.history.data_recorder import DataRecorder, record_data_main
+from freqtrade.enums import CandleType, TradingMode
+from freqtrade.exceptions import OperationalException
+from freqtrade.util import dt_ts
+from tests.conftest import EXMS, get_mock_coro, get_patched_exchange, log_has_re
+
+
+def _candles(start: datetime, count: int, tf_ms: int = 3600 * 1000) -> list[list]:
+    return [[dt_ts(start) + i * tf_ms, 1.0, 2.0, 0.5, 1.5, 10.0] for i in range(count)]
+
+
+def _trades(start_ts: int, count: int, first_id: int = 0) -> list[list]:
+    return [
+        [start_ts + i * 100, str(first_id + i), None, "buy", 1.0, 1.0, 1.0] for i in range(count)
+    ]
+
+
+async def test_data_recorder_poll_ohlcv(mocker, default_conf, tmp_path, caplog, time_machine):
+    time_machine.move_to(datetime(2024, 1, 1, 10, 0, 30, tzinfo=timezone.utc), tick=False)
+    exchange = get_patched_exchange(mocker, default_conf)
+    mocker.patch(f"{EXMS}.ohlcv_candle_limit", return_value=10)
+    # Last candle is still open
+    hist_mock = mocker.patch(
+        f"{EXMS}._async_get_historic_ohlcv",
+        get_mock_coro(
+            (
+                "ETH/BTC",
+                "1h",
+                CandleType.SPOT,
+                _candles(datetime(2024, 1, 1, tzinfo=timezone.utc), 11),
+                True,
+            )
+        ),
+    )
+    dh = get_datahandler(tmp_path, "partitioned")
+    recorder = DataRecorder(exchange, dh, dh, pairs=["ETH/BTC"], timeframes=["1h"])
+    recorder._init_state()
+
+    await recorder._poll_ohlcv("ETH/BTC", "1h")
+    # New pair - backfills the available window
+    assert hist_mock.call_args[0][2] == dt_ts(datetime(2024, 1, 1, tzinfo=timezone.utc))
+    assert len(recorder._ohlcv_buffer[("ETH/BTC", "1h")]) == 10
+    recorder._write(*recorder._take_buffers())
+    assert recorder._ohlcv_buffer[("ETH/BTC", "1h")] == []
+    data = dh.ohlcv_load("ETH/BTC", "1h", CandleType.SPOT)
+    assert len(data) == 10
+    assert data.iloc[-1]["date"] == datetime(2024, 1, 1, 9, tzinfo=timezone.utc)
+
+    # 10:00 candle is no longer available
+    time_machine.move_to(datetime(2024, 1, 1, 12, 0, 30, tzinfo=timezone.utc), tick=False)
+    hist_mock.side_effect = get_mock_coro(
+        (
+            "ETH/BTC",
+            "1h",
+            CandleType.SPOT,
+            _candles(datetime(2024, 1, 1, 11, tzinfo=timezone.utc), 2),
+            True,
+        )
+    )
+    await recorder._poll_ohlcv("ETH/BTC", "1h")
+    assert hist_mock.call_args[0][2] == dt_ts(datetime(2024, 1, 1, 10, tzinfo=timezone.utc))
+    assert log_has_re(
+        r"Gap in recorded candles for ETH/BTC, 1h: missing 2024-01-01T10:00.*", caplog
+    )
+    assert len(recorder._ohlcv_buffer[("ETH/BTC", "1h")]) == 1
+    assert recorder._next_candle[("ETH/BTC", "1h")] == dt_ts(
+        datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+    )
+
+
+async def test_data_recorder_poll_ohlcv_limited_history(
+    mocker, default_conf, tmp_path, time_machine
+):
+    time_machine.move_to(datetime(2024, 1, 1, 10, 0, 30, tzinfo=timezone.utc), tick=False)
+    exchange = get_patched_exchange(mocker, default_conf)
+    exchange._ft_has["ohlcv_has_history"] = False
+    mocker.patch(f"{EXMS}.ohlcv_candle_limit", return_value=5)
+    hist_mock = mocker.patch(
+        f"{EXMS}._async_get_historic_ohlcv",
+        get_mock_coro(("ETH/BTC", "1h", CandleType.SPOT, [], True)),
+    )
+    dh = get_datahandler(tmp_path, "feather")
+    recorder = DataRecorder(exchange, dh, dh, pairs=["ETH/BTC"], timeframes=["1h"])
+    recorder._init_state()
+    recorder._next_candle[("ETH/BTC", "1h")] = dt_ts(datetime(2023, 1, 1, tzinfo=timezone.utc))
+
+    await recorder._poll_ohlcv("ETH/BTC", "1h")
+    # Only the available window is requested
+    assert hist_mock.call_args[0][2] == dt_ts(datetime(2024, 1, 1, 5, tzinfo=timezone.utc))
+    assert recorder._ohlcv_buffer[("ETH/BTC", "1h")] == []
+
+
+async def test_data_recorder_add_trades(mocker, default_conf, tmp_path, caplog):
+    exchange = get_patched_exchange(mocker, default_conf)
+    mocker.patch(f"{EXMS}.exchange_has", return_value=True)
+    dh = get_datahandler(tmp_path, "partitioned")
+    recorder = DataRecorder(exchange, dh, dh, pairs=["ETH/BTC"], timeframes=[], record_trades=True)
+    recorder._init_state()
+    start = dt_ts(datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    await recorder._add_trades("ETH/BTC", _trades(start, 5))
+    assert len(recorder._trades_buffer["ETH/BTC"]) == 5
+    # Overlapping trades are only recorded once
+    await recorder._add_trades("ETH/BTC", _trades(start + 300, 5, first_id=3))
+    assert len(recorder._trades_buffer["ETH/BTC"]) == 8
+    assert not log_has_re(r"Possible gap in recorded trades.*", caplog)
+
+    # No overlap - trades may have been missed
+    await recorder._add_trades("ETH/BTC", _trades(start + 10000, 3, first_id=100))
+    assert len(recorder._trades_buffer["ETH/BTC"]) == 11
+    assert log_has_re(r"Possible gap in recorded trades for ETH/BTC.*", caplog)
+
+    recorder._write(*recorder._take_buffers())
+    trades = dh.trades_load("ETH/BTC", TradingMode.SPOT)
+    assert len(trades) == 11
+    assert dh.trades_data_min_max("ETH/BTC", TradingMode.SPOT)[2] == 11
+
+
+async def test_data_recorder_flush_failed(mocker, default_conf, tmp_path, caplog):
+    exchange = get_patched_exchange(mocker, default_conf)
+    mocker.patch(f"{EXMS}.exchange_has", return_value=True)
+    dh = get_datahandler(tmp_path, "feather")
+    recorder = DataRecorder(
+        exchange,
+        dh,
+        dh,
+        pairs=["ETH/BTC"],
+        timeframes=["1h"],
+        record_trades=True,
+        max_buffer_rows=8,
+    )
+    recorder._init_state()
+    recorder._flush_lock = asyncio.Lock()
+    recorder._writer = ThreadPoolExecutor(max_workers=1)
+    write_mock = mocker.patch.object(recorder, "_write", side_effect=OSError("Disk full"))
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    candles = _candles(start, 6)
+    trades = _trades(dt_ts(start), 6)
+    recorder._ohlcv_buffer[("ETH/BTC", "1h")] = candles[:4]
+    recorder._trades_buffer["ETH/BTC"] = trades[:4]
+    try:
+        # Failed data is kept for the next flush
+        await recorder.flush()
+        assert write_mock.call_count == 1
+        assert log_has_re(r"Could not store recorded data, retrying on next flush\.", caplog)
+        assert recorder._ohlcv_buffer[("ETH/BTC", "1h")] == candles[:4]
+
+        # Buffers kept after failed writes are capped - dropping the oldest rows
+        recorder._ohlcv_buffer[("ETH/BTC", "1h")] += candles[4:] + candles[:4]
+        recorder._trades_buffer["ETH/BTC"] += trades[4:] + trades[:4]
+        await recorder.flush()
+        assert recorder._ohlcv_buffer[("ETH/BTC", "1h")] == candles[2:] + candles[:4]
+        assert recorder._trades_buffer["ETH/BTC"] == trades[2:] + trades[:4]
+        assert log_has_re(r"Dropping the oldest 2 unwritten candles of ETH/BTC, 1h.*", caplog)
+        assert log_has_re(r"Dropping the oldest 2 unwritten trades of ETH/BTC.*", caplog)
+    finally:
+        recorder._writer.shutdown()
+
+
+def test_data_recorder_no_public_trades(mocker, default_conf, tmp_path):
+    exchange = get_patched_exchange(mocker, default_conf)
+    mocker.patch(f"{EXMS}.exchange_has", return_value=False)
+    dh = get_datahandler(tmp_path, "feather")
+    with pytest.raises(OperationalException, match=r"Exchange .* does not provide public trades.*"):
+        DataRecorder(exchange, dh, dh, pairs=["ETH/BTC"], timeframes=["1h"], record_trades=True)
+
+
+def test_data_recorder_run(mocker, default_conf, tmp_path, time_machine):
+    time_machine.move_to(datetime(2024, 1, 1, 10, 0, 30, tzinfo=timezone.utc), tick=False)
+    exchange = get_patched_exchange(mocker, default_conf)
+    mocker.patch(f"{EXMS}.exchange_has", return_value=True)
+    mocker.patch(f"{EXMS}.ohlcv_candle_limit", return_value=10)
+    mocker.patch(
+        f"{EXMS}._async_get_historic_ohlcv",
+        get_mock_coro(
+            (
+                "ETH/BTC",
+                "1h",
+                CandleType.SPOT,
+                _candles(datetime(2024, 1, 1, tzinfo=timezone.utc), 11),
+                True,
+            )
+        ),
+    )
+    dh = get_datahandler(tmp_path, "feather")
+    recorder = DataRecorder(
+        exchange, dh, dh, pairs=["ETH/BTC"], timeframes=["1h"], record_trades=True
+    )
+    start = dt_ts(datetime(2024, 1, 1, 10, tzinfo=timezone.utc))
+
+    def stop(*args, **kwargs):
+        recorder.stop()
+        return _trades(start + 500, 5, first_id=5)
+
+    watch_mock = mocker.patch(
+        f"{EXMS}._async_watch_trades", get_mock_coro(side_effect=[_trades(start, 5), stop])
+    )
+    recorder.run()
+
+    assert watch_mock.call_count >= 2
+    # Remaining data is flushed when stopping
+    assert len(dh.ohlcv_load("ETH/BTC", "1h", CandleType.SPOT)) == 10
+    assert len(dh.trades_load("ETH/BTC", TradingMode.SPOT)) == 10
+
+
+def test_record_data_main_no_pairs(mocker, default_conf):
+    exchange = get_patched_exchange(mocker, default_conf)
+    mocker.patch(
+        "freqtrade.resolvers.exchange_resolver.ExchangeResolver.load_exchange",
+        return_value=exchange,
+    )
+    mocker.patch(f"{EXMS}.get_markets", return_value={})
+    default_conf["pairs"] = ["ETH/BTC"]
+    run_mock = mocker.patch("freqtrade.data.history.data_recorder.DataRecorder.run")
+    with pytest.raises(OperationalException, match=r"No pairs available for recording\."):
+        record_data_main(default_conf)
+    assert run_mock.call_count == 0
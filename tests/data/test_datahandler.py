@@ -5,12 +5,13 @@ from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pandas as pd
 import pytest
 from pandas import DataFrame, Timestamp
 from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import AVAILABLE_DATAHANDLERS
+from freqtrade.constants import DEFAULT_TRADES_COLUMNS
 from freqtrade.data.history.datahandlers.featherdatahandler import FeatherDataHandler
 from freqtrade.data.history.datahandlers.idatahandler import (
     IDataHandler,
@@ -19,9 +20,10 @@ from freqtrade.data.history.datahandlers.idatahandler import (
 )
 from freqtrade.data.history.datahandlers.jsondatahandler import JsonDataHandler, JsonGzDataHandler
 from freqtrade.data.history.datahandlers.parquetdatahandler import ParquetDataHandler
+from freqtrade.data.history.datahandlers.partitioneddatahandler import PartitionedDataHandler
 from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exceptions import OperationalException
-from tests.conftest import log_has, log_has_re
+from tests.conftest import generate_test_data, log_has, log_has_re
 
 
 def test_datahandler_ohlcv_get_pairs(testdatadir):
@@ -290,7 +292,7 @@ def test_jsondatahandler_trades_load(testdatadir, caplog):
     assert log_has(logmsg, caplog)
 
 
-@pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
+@pytest.mark.parametrize("datahandler", ["json", "jsongz", "feather", "parquet"])
 def test_datahandler_ohlcv_append(
     datahandler,
     testdatadir,
@@ -302,7 +304,7 @@ def test_datahandler_ohlcv_append(
         dh.ohlcv_append("UNITTEST/ETH", "5m", DataFrame(), CandleType.MARK)
 
 
-@pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
+@pytest.mark.parametrize("datahandler", ["json", "jsongz", "feather", "parquet"])
 def test_datahandler_trades_append(datahandler, testdatadir):
     dh = get_datahandler(testdatadir, datahandler)
     with pytest.raises(NotImplementedError):
@@ -417,6 +419,32 @@ def test_datahandler_trades_load(testdatadir, datahandler):
     assert trades1.empty
 
 
+@pytest.mark.parametrize("datahandler", ["jsongz", "feather", "parquet", "partitioned"])
+def test_datahandler_trades_load_chunks(testdatadir, tmp_path, datahandler):
+    trades = get_datahandler(testdatadir, "feather").trades_load("XRP/ETH", TradingMode.SPOT)
+    dh = get_datahandler(tmp_path, datahandler)
+    # Write multiple record batches / row groups
+    data = trades.loc[:, DEFAULT_TRADES_COLUMNS].reset_index(drop=True)
+    if datahandler == "feather":
+        data.to_feather(tmp_path / "XRP_NEW-trades.feather", chunksize=1000)
+    elif datahandler == "parquet":
+        data.to_parquet(tmp_path / "XRP_NEW-trades.parquet", row_group_size=1000)
+    else:
+        dh.trades_store("XRP/NEW", trades, TradingMode.SPOT)
+
+    chunks = list(dh.trades_load_chunks("XRP/NEW", TradingMode.SPOT, chunk_size=1000))
+    assert len(chunks) > 1
+    # Trades of one timestamp are never split between chunks
+    for chunk, next_chunk in zip(chunks[:-1], chunks[1:], strict=True):
+        assert chunk["timestamp"].iloc[-1] < next_chunk["timestamp"].iloc[0]
+    loaded = dh.trades_load("XRP/NEW", TradingMode.SPOT)
+    assert_frame_equal(
+        pd.concat(chunks, ignore_index=True), loaded.reset_index(drop=True), check_exact=True
+    )
+
+    assert list(dh.trades_load_chunks("UNITTEST/NONEXIST", TradingMode.SPOT)) == []
+
+
 @pytest.mark.parametrize("datahandler", ["jsongz", "feather", "parquet"])
 def test_datahandler_trades_store(testdatadir, tmp_path, datahandler):
     dh = get_datahandler(testdatadir, datahandler)
@@ -495,6 +523,10 @@ def test_gethandlerclass():
     assert cl == ParquetDataHandler
     assert issubclass(cl, IDataHandler)
 
+    cl = get_datahandlerclass("partitioned")
+    assert cl == PartitionedDataHandler
+    assert issubclass(cl, IDataHandler)
+
     with pytest.raises(ValueError, match=r"No datahandler for .*"):
         get_datahandlerclass("DeadBeef")
 
@@ -506,3 +538,131 @@ def test_get_datahandler(testdatadir):
     assert isinstance(dh, JsonGzDataHandler)
     dh1 = get_datahandler(testdatadir, "jsongz", dh)
     assert id(dh1) == id(dh)
+
+
+@pytest.mark.parametrize("candle_type", [CandleType.SPOT, CandleType.MARK])
+def test_partitioneddatahandler_store_load(tmp_path, mocker, candle_type):
+    # 3 months of 1h candles - 2020-07-05 to 2020-10-03
+    ohlcv = generate_test_data("1h", 24 * 90, "2020-07-05")
+    dh = get_datahandler(tmp_path, "partitioned")
+    dh.ohlcv_store("UNITTEST/NEW", "1h", ohlcv, candle_type)
+
+    pair_dir = dh._pair_data_filename(tmp_path, "UNITTEST/NEW", "1h", candle_type)
+    assert pair_dir.is_dir()
+    assert {p.name for p in pair_dir.iterdir()} == {
+        "2020-07.feather",
+        "2020-08.feather",
+        "2020-09.feather",
+        "2020-10.feather",
+        "manifest.json",
+    }
+    trading_mode = TradingMode.SPOT if candle_type == CandleType.SPOT else TradingMode.FUTURES
+    assert ("UNITTEST/NEW", "1h", candle_type) in dh.ohlcv_get_available_data(
+        tmp_path, trading_mode
+    )
+
+    loaded = dh.ohlcv_load("UNITTEST/NEW", "1h", candle_type, fill_missing=False)
+    assert_frame_equal(loaded, ohlcv.reset_index(drop=True), check_dtype=False)
+
+    min_max = dh.ohlcv_data_min_max("UNITTEST/NEW", "1h", candle_type)
+    assert min_max == (
+        ohlcv.iloc[0]["date"].to_pydatetime(),
+        ohlcv.iloc[-1]["date"].to_pydatetime(),
+        len(ohlcv),
+    )
+
+    # Only overlapping partitions are read
+    read_mock = mocker.spy(dh, "_read_partitions")
+    timerange = TimeRange.parse_timerange("20200810-20200820")
+    loaded = dh.ohlcv_load("UNITTEST/NEW", "1h", candle_type, timerange=timerange)
+    assert read_mock.call_count == 1
+    assert read_mock.call_args[0][1] == ["2020-08"]
+    assert loaded.iloc[0]["date"] == Timestamp("2020-08-10", tz="UTC")
+    assert loaded.iloc[-1]["date"] == Timestamp("2020-08-20", tz="UTC")
+
+    assert dh.ohlcv_purge("UNITTEST/NEW", "1h", candle_type)
+    assert not pair_dir.exists()
+    assert not dh.ohlcv_purge("UNITTEST/NEW", "1h", candle_type)
+
+
+def test_partitioneddatahandler_ohlcv_append(tmp_path, mocker):
+    ohlcv = generate_test_data("1h", 24 * 90, "2020-07-05")
+    dh = get_datahandler(tmp_path, "partitioned")
+    dh.ohlcv_store("UNITTEST/NEW", "1h", ohlcv.iloc[:-10], CandleType.SPOT)
+
+    write_mock = mocker.spy(dh, "_write_partitions")
+    # Overlapping data - new candles win
+    new_data = ohlcv.iloc[-15:].copy()
+    new_data.loc[new_data.index[0], "close"] = 42.0
+    dh.ohlcv_append("UNITTEST/NEW", "1h", new_data, CandleType.SPOT)
+
+    # Only the tail partition was rewritten
+    assert write_mock.call_count == 1
+    assert set(dh._ohlcv_partition_names(write_mock.call_args[0][1])) == {"2020-10"}
+
+    loaded = dh.ohlcv_load("UNITTEST/NEW", "1h", CandleType.SPOT, fill_missing=False)
+    assert len(loaded) == len(ohlcv)
+    assert loaded["date"].is_monotonic_increasing
+    assert loaded.iloc[-15]["close"] == 42.0
+    assert dh.ohlcv_data_min_max("UNITTEST/NEW", "1h", CandleType.SPOT)[2] == len(ohlcv)
+
+    # Appending to a non-existing pair stores the data
+    dh.ohlcv_append("UNITTEST/NEW2", "1h", ohlcv.iloc[:10], CandleType.SPOT)
+    assert len(dh.ohlcv_load("UNITTEST/NEW2", "1h", CandleType.SPOT)) == 10
+
+
+def test_partitioneddatahandler_store_empty(testdatadir, tmp_path):
+    ohlcv = generate_test_data("1h", 24 * 40, "2020-07-05")
+    dh = get_datahandler(tmp_path, "partitioned")
+    dh.ohlcv_store("UNITTEST/NEW", "1h", ohlcv, CandleType.SPOT)
+
+    # Storing empty data keeps the stored history
+    dh.ohlcv_store("UNITTEST/NEW", "1h", ohlcv.iloc[:0], CandleType.SPOT)
+    loaded = dh.ohlcv_load("UNITTEST/NEW", "1h", CandleType.SPOT, fill_missing=False)
+    assert len(loaded) == len(ohlcv)
+
+    # Nothing is written for new pairs
+    dh.ohlcv_store("UNITTEST/NEW2", "1h", ohlcv.iloc[:0], CandleType.SPOT)
+    assert not dh._pair_data_filename(tmp_path, "UNITTEST/NEW2", "1h", CandleType.SPOT).exists()
+    assert dh.ohlcv_load("UNITTEST/NEW2", "1h", CandleType.SPOT).empty
+
+    trades = get_datahandler(testdatadir, "feather").trades_load("XRP/ETH", TradingMode.SPOT)
+    dh.trades_store("XRP/NEW", trades, TradingMode.SPOT)
+    dh.trades_store("XRP/NEW", trades.iloc[:0], TradingMode.SPOT)
+    assert len(dh.trades_load("XRP/NEW", TradingMode.SPOT)) == len(trades)
+
+
+def test_partitioneddatahandler_trades(testdatadir, tmp_path, mocker):
+    trades = get_datahandler(testdatadir, "feather").trades_load("XRP/ETH", TradingMode.SPOT)
+    # Trades span 2019-10-11 to 2019-10-13
+    dh = get_datahandler(tmp_path, "partitioned")
+    dh.trades_store("XRP/NEW", trades.iloc[:-100], TradingMode.SPOT)
+    pair_dir = tmp_path / "XRP_NEW-trades.partitioned"
+    assert {p.name for p in pair_dir.iterdir()} == {
+        "2019-10-11.feather",
+        "2019-10-12.feather",
+        "2019-10-13.feather",
+        "manifest.json",
+    }
+    assert dh.trades_get_available_data(tmp_path, TradingMode.SPOT) == ["XRP/NEW"]
+
+    write_mock = mocker.spy(dh, "_write_partitions")
+    # Overlapping trades are not duplicated
+    dh.trades_append("XRP/NEW", trades.iloc[-150:], TradingMode.SPOT)
+    assert write_mock.call_count == 1
+    assert set(dh._trades_partition_names(write_mock.call_args[0][1])) == {"2019-10-13"}
+
+    trades_new = dh.trades_load("XRP/NEW", TradingMode.SPOT)
+    assert_frame_equal(trades, trades_new, check_exact=True)
+    min_max = dh.trades_data_min_max("XRP/NEW", TradingMode.SPOT)
+    assert min_max == (
+        datetime(2019, 10, 11, 0, 0, 11, 620000, tzinfo=timezone.utc),
+        datetime(2019, 10, 13, 11, 19, 28, 844000, tzinfo=timezone.utc),
+        len(trades),
+    )
+
+    timerange = TimeRange.parse_timerange("20191012-20191012")
+    assert len(dh.trades_load("XRP/NEW", TradingMode.SPOT, timerange=timerange)) < len(trades)
+
+    assert dh.trades_purge("XRP/NEW", TradingMode.SPOT)
+    assert not pair_dir.exists()
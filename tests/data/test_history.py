@@ -6,10 +6,10 @@ import uuid
 from datetime import timedelta
 from pathlib import Path
 from shutil import copyfile
-from unittest.mock import MagicMock, PropertyMock
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import pytest
-from pandas import DataFrame
+from pandas import DataFrame, concat
 from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
@@ -17,6 +17,7 @@ from freqtrade.constants import DATETIME_PRINT_FORMAT
 from freqtrade.data.converter import ohlcv_to_dataframe
 from freqtrade.data.history import get_datahandler
 from freqtrade.data.history.datahandlers.jsondatahandler import JsonDataHandler, JsonGzDataHandler
+from freqtrade.data.history.download_scheduler import CHECKPOINT_FILENAME
 from freqtrade.data.history.history_utils import (
     _download_pair_history,
     _download_trades_history,
@@ -37,6 +38,7 @@ from freqtrade.util import dt_ts, dt_utc
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
     EXMS,
+    generate_test_data,
     get_patched_exchange,
     log_has,
     log_has_re,
@@ -352,6 +354,65 @@ def test_download_pair_history(
     assert file2_5.is_file()
 
 
+def test_download_pair_history_incremental(mocker, default_conf, tmp_path) -> None:
+    ohlcv = generate_test_data("1h", 24 * 60, "2020-07-05")
+    exchange = get_patched_exchange(mocker, default_conf)
+    dh = get_datahandler(tmp_path, "partitioned")
+    dh.ohlcv_store("MEME/BTC", "1h", ohlcv.iloc[:-24], CandleType.SPOT)
+
+    dl_mock = mocker.patch.object(exchange, "get_historic_ohlcv", return_value=ohlcv.iloc[-30:])
+    store_mock = mocker.spy(dh, "ohlcv_store")
+    assert _download_pair_history(
+        datadir=tmp_path,
+        exchange=exchange,
+        pair="MEME/BTC",
+        timeframe="1h",
+        data_handler=dh,
+        candle_type=CandleType.SPOT,
+    )
+    # Download starts at the last complete stored candle
+    assert dl_mock.call_args[1]["since_ms"] == dt_ts(ohlcv.iloc[-26]["date"])
+    assert dl_mock.call_args[1]["is_new_pair"] is False
+    # Data is appended, not rewritten
+    assert store_mock.call_count == 0
+    data = dh.ohlcv_load("MEME/BTC", "1h", CandleType.SPOT, fill_missing=False)
+    assert len(data) == len(ohlcv)
+
+
+@pytest.mark.parametrize("prepend", [False, True])
+def test_download_pair_history_incremental_gap(mocker, default_conf, tmp_path, prepend) -> None:
+    ohlcv = generate_test_data("1h", 24 * 60, "2020-07-05")
+    exchange = get_patched_exchange(mocker, default_conf)
+    dh = get_datahandler(tmp_path, "partitioned")
+    # Gaps right after the first and before the last stored candle
+    stored = concat([ohlcv.iloc[24:25], ohlcv.iloc[30:-30], ohlcv.iloc[-25:-24]])
+    dh.ohlcv_store("MEME/BTC", "1h", stored, CandleType.SPOT)
+
+    new_data = ohlcv.iloc[:25] if prepend else ohlcv.iloc[-25:]
+    dl_mock = mocker.patch.object(exchange, "get_historic_ohlcv", return_value=new_data)
+    store_mock = mocker.spy(dh, "ohlcv_store")
+    assert _download_pair_history(
+        datadir=tmp_path,
+        exchange=exchange,
+        pair="MEME/BTC",
+        timeframe="1h",
+        data_handler=dh,
+        candle_type=CandleType.SPOT,
+        prepend=prepend,
+    )
+    if prepend:
+        assert dl_mock.call_args[1]["until_ms"] == dt_ts(ohlcv.iloc[24]["date"])
+    else:
+        assert dl_mock.call_args[1]["since_ms"] == dt_ts(ohlcv.iloc[-25]["date"])
+    assert dl_mock.call_args[1]["is_new_pair"] is False
+    # Existing history is kept
+    assert store_mock.call_count == 0
+    data = dh.ohlcv_load("MEME/BTC", "1h", CandleType.SPOT, fill_missing=False)
+    assert len(data) == len(stored) + 24
+    assert data.iloc[0]["date"] == (ohlcv.iloc[0]["date"] if prepend else stored.iloc[0]["date"])
+    assert data.iloc[-1]["date"] == ohlcv.iloc[-1 if not prepend else -25]["date"]
+
+
 def test_download_pair_history2(mocker, default_conf, testdatadir, ohlcv_history) -> None:
     json_dump_mock = mocker.patch(
         "freqtrade.data.history.datahandlers.featherdatahandler.FeatherDataHandler.ohlcv_store",
@@ -571,6 +632,102 @@ def test_refresh_backtest_ohlcv_data(
         assert log_has_re(r"Downloading pair ETH/BTC, mark, interval 4h\.", caplog)
 
 
+@pytest.mark.parametrize(
+    "trademode,callcount",
+    [
+        ("spot", 4),
+        ("margin", 4),
+        ("futures", 8),  # Called 8 times - 4 normal, 2 funding and 2 mark/index calls
+    ],
+)
+def test_refresh_backtest_ohlcv_data_concurrent(
+    mocker, default_conf, markets, tmp_path, ohlcv_history, trademode, callcount
+):
+    default_conf["trading_mode"] = trademode
+    ex = get_patched_exchange(mocker, default_conf, exchange="bybit")
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=markets))
+    dl_mock = mocker.patch.object(
+        ex, "_async_get_historic_ohlcv_df", AsyncMock(return_value=ohlcv_history)
+    )
+    timerange = TimeRange.parse_timerange("20190101-20190102")
+
+    unav_pairs = refresh_backtest_ohlcv_data(
+        exchange=ex,
+        pairs=["ETH/BTC", "XRP/BTC", "NOPAIR/BTC"],
+        timeframes=["1m", "5m"],
+        datadir=tmp_path,
+        timerange=timerange,
+        erase=True,
+        trading_mode=trademode,
+        concurrency=4,
+    )
+    assert dl_mock.call_count == callcount
+    assert unav_pairs == ["NOPAIR/BTC: Pair not available on exchange."]
+    candle_type = CandleType.get_default(trademode)
+    dh = get_datahandler(tmp_path, "feather")
+    assert ("ETH/BTC", "5m", candle_type) in dh.ohlcv_get_available_data(tmp_path, trademode)
+    # Successful run removes the checkpoint
+    assert not (tmp_path / CHECKPOINT_FILENAME).is_file()
+
+
+def test_refresh_backtest_ohlcv_data_concurrent_resume(
+    mocker, default_conf, markets, tmp_path, ohlcv_history, caplog
+):
+    ex = get_patched_exchange(mocker, default_conf, exchange="bybit")
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=markets))
+
+    async def fail_xrp(pair, **kwargs):
+        if pair == "XRP/BTC":
+            raise ValueError("Network down")
+        return ohlcv_history
+
+    dl_mock = mocker.patch.object(ex, "_async_get_historic_ohlcv_df", side_effect=fail_xrp)
+    timerange = TimeRange.parse_timerange("20190101-20190102")
+    kwargs = dict(
+        exchange=ex,
+        pairs=["ETH/BTC", "XRP/BTC"],
+        timeframes=["1m", "5m"],
+        datadir=tmp_path,
+        timerange=timerange,
+        trading_mode="spot",
+        concurrency=2,
+    )
+    refresh_backtest_ohlcv_data(**kwargs)
+    assert dl_mock.call_count == 4
+    assert log_has_re(r'Failed to download history data for pair: "XRP/BTC".*', caplog)
+    assert (tmp_path / CHECKPOINT_FILENAME).is_file()
+
+    # Rerun only downloads the failed jobs
+    dl_mock.reset_mock()
+    dl_mock.side_effect = None
+    dl_mock.return_value = ohlcv_history
+    refresh_backtest_ohlcv_data(**kwargs)
+    assert dl_mock.call_count == 2
+    assert {c[1]["pair"] for c in dl_mock.call_args_list} == {"XRP/BTC"}
+    assert log_has("Resuming interrupted download, 2 jobs already done.", caplog)
+    assert not (tmp_path / CHECKPOINT_FILENAME).is_file()
+
+    # Changed settings don't reuse an outdated checkpoint
+    (tmp_path / CHECKPOINT_FILENAME).write_text(
+        json.dumps({"signature": "other", "completed": ["ETH/BTC|1m|spot"]})
+    )
+    dl_mock.reset_mock()
+    refresh_backtest_ohlcv_data(**kwargs)
+    assert dl_mock.call_count == 4
+
+    # So do a changed pair list or data format
+    for changed in ({"pairs": ["ETH/BTC"]}, {"data_format": "json"}):
+        dl_mock.side_effect = fail_xrp
+        refresh_backtest_ohlcv_data(**kwargs)
+        assert (tmp_path / CHECKPOINT_FILENAME).is_file()
+        dl_mock.reset_mock()
+        dl_mock.side_effect = None
+        refresh_backtest_ohlcv_data(**{**kwargs, **changed})
+        # ETH/BTC jobs are downloaded again
+        assert {c[1]["pair"] for c in dl_mock.call_args_list} >= {"ETH/BTC"}
+        (tmp_path / CHECKPOINT_FILENAME).unlink(missing_ok=True)
+
+
 def test_download_data_no_markets(mocker, default_conf, caplog, testdatadir):
     dl_mock = mocker.patch(
         "freqtrade.data.history.history_utils._download_pair_history", MagicMock()
@@ -0,0 +1,213 @@
+# pragma pylint: disable=missing-docstring, protected-access, invalid-name
+import math
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from freqtrade.data.metrics import (
+    TradeMetrics,
+    calculate_calmar,
+    calculate_csum,
+    calculate_expectancy,
+    calculate_max_drawdown,
+    calculate_sharpe,
+    calculate_sortino,
+    calculate_sqn,
+    calculate_trade_metrics,
+    calculate_underwater,
+)
+
+
+# Per-metric pandas implementations, as used before calculate_trade_metrics()
+def _ref_drawdown_df(trades, starting_balance, value_col="profit_abs"):
+    profit_results = trades.sort_values("close_date").reset_index(drop=True)
+    df = pd.DataFrame()
+    df["cumulative"] = profit_results[value_col].cumsum()
+    df["high_value"] = df["cumulative"].cummax()
+    df["drawdown"] = df["cumulative"] - df["high_value"]
+    df["date"] = profit_results.loc[:, "close_date"]
+    if starting_balance:
+        cumulative_balance = starting_balance + df["cumulative"]
+        max_balance = starting_balance + df["high_value"]
+        df["drawdown_relative"] = (max_balance - cumulative_balance) / max_balance
+    else:
+        df["drawdown_relative"] = (df["high_value"] - df["cumulative"]) / df["high_value"]
+    return profit_results, df
+
+
+def _ref_max_drawdown(trades, starting_balance, relative=False):
+    profit_results, df = _ref_drawdown_df(trades, starting_balance)
+    idxmin = df["drawdown_relative"].idxmax() if relative else df["drawdown"].idxmin()
+    if idxmin == 0:
+        return None
+    high_idx = df.iloc[:idxmin]["high_value"].idxmax()
+    return (
+        abs(df.loc[idxmin, "drawdown"]),
+        profit_results.loc[high_idx, "close_date"],
+        profit_results.loc[idxmin, "close_date"],
+        df.loc[high_idx, "cumulative"],
+        df.loc[idxmin, "cumulative"],
+        df.loc[idxmin, "drawdown_relative"],
+    )
+
+
+def _ref_ratios(trades, min_date, max_date, starting_balance):
+    total_profit = trades["profit_abs"] / starting_balance
+    days_period = max(1, (max_date - min_date).days)
+    expected_returns_mean = total_profit.sum() / days_period
+    up_stdev = np.std(total_profit)
+    sharpe = expected_returns_mean / up_stdev * np.sqrt(365) if up_stdev != 0 else -100
+    down_stdev = np.std(trades.loc[trades["profit_abs"] < 0, "profit_abs"] / starting_balance)
+    if down_stdev != 0 and not np.isnan(down_stdev):
+        sortino = expected_returns_mean / down_stdev * np.sqrt(365)
+    else:
+        sortino = -100
+    drawdown = _ref_max_drawdown(trades, starting_balance)
+    max_drawdown = drawdown[5] if drawdown else 0
+    calmar_mean = trades["profit_abs"].sum() / starting_balance / days_period * 100
+    calmar = calmar_mean / max_drawdown * math.sqrt(365) if max_drawdown != 0 else -100
+    profits_std = total_profit.std()
+    if profits_std != 0 and not np.isnan(profits_std):
+        sqn = round(math.sqrt(len(trades)) * (total_profit.mean() / profits_std), 4)
+    else:
+        sqn = -100.0
+    return sharpe, sortino, calmar, sqn
+
+
+def _ref_expectancy(trades):
+    winning = trades.loc[trades["profit_abs"] > 0, "profit_abs"]
+    losing = trades.loc[trades["profit_abs"] < 0, "profit_abs"]
+    average_win = winning.sum() / len(winning) if len(winning) else 0
+    average_loss = abs(losing.sum()) / len(losing) if len(losing) else 0
+    winrate = len(winning) / len(trades)
+    expectancy = winrate * average_win - len(losing) / len(trades) * average_loss
+    ratio = ((1 + average_win / average_loss) * winrate) - 1 if average_loss > 0 else 100.0
+    return expectancy, ratio
+
+
+def generate_trades(count, seed=42, losing=True):
+    rng = np.random.default_rng(seed)
+    start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    # Unordered close dates, with duplicates
+    minutes = rng.integers(0, count * 10, size=count) // 5 * 5
+    profits = rng.normal(0.5 if losing else 5, 2, size=count)
+    if not losing:
+        profits = np.abs(profits)
+    return pd.DataFrame(
+        {
+            "profit_abs": profits,
+            "profit_ratio": profits / 100,
+            "close_date": pd.to_datetime(start) + pd.to_timedelta(minutes, unit="min"),
+        }
+    )
+
+
+@pytest.mark.parametrize("count", [1, 2, 10, 500])
+@pytest.mark.parametrize("starting_balance", [0, 1000])
+def test_calculate_trade_metrics_parity(count, starting_balance):
+    trades = generate_trades(count, seed=count)
+    min_date = trades["close_date"].min() - timedelta(days=3)
+    max_date = trades["close_date"].max()
+    metrics = calculate_trade_metrics(trades, min_date, max_date, starting_balance)
+
+    assert metrics.trade_count == count
+    assert metrics.profit_total == pytest.approx(trades["profit_abs"].sum())
+    expectancy, expectancy_ratio = _ref_expectancy(trades)
+    assert metrics.expectancy == pytest.approx(expectancy)
+    assert metrics.expectancy_ratio == pytest.approx(expectancy_ratio)
+    assert calculate_expectancy(trades) == pytest.approx((expectancy, expectancy_ratio))
+    csum = trades["profit_abs"].cumsum()
+    assert metrics.csum_min == pytest.approx(csum.min() + starting_balance)
+    assert metrics.csum_max == pytest.approx(csum.max() + starting_balance)
+
+    for relative, result in ((False, metrics.drawdown), (True, metrics.relative_drawdown)):
+        expected = _ref_max_drawdown(trades, starting_balance, relative)
+        if expected is None:
+            assert result is None
+            continue
+        assert result.drawdown_abs == pytest.approx(expected[0])
+        assert result.high_date == expected[1]
+        assert result.low_date == expected[2]
+        assert result.high_value == pytest.approx(expected[3])
+        assert result.low_value == pytest.approx(expected[4])
+        assert result.relative_account_drawdown == pytest.approx(expected[5], nan_ok=True)
+        assert (
+            calculate_max_drawdown(trades, starting_balance=starting_balance, relative=relative)
+            == result
+        )
+
+    _, underwater = _ref_drawdown_df(trades, starting_balance, "profit_ratio")
+    pd.testing.assert_frame_equal(
+        calculate_underwater(trades, starting_balance=starting_balance), underwater
+    )
+
+    if starting_balance:
+        sharpe, sortino, calmar, sqn = _ref_ratios(trades, min_date, max_date, starting_balance)
+        assert metrics.sharpe == pytest.approx(sharpe)
+        assert metrics.sortino == pytest.approx(sortino)
+        assert metrics.calmar == pytest.approx(calmar)
+        assert metrics.sqn == pytest.approx(sqn)
+        assert calculate_sharpe(trades, min_date, max_date, starting_balance) == metrics.sharpe
+        assert calculate_sortino(trades, min_date, max_date, starting_balance) == metrics.sortino
+        assert calculate_calmar(trades, min_date, max_date, starting_balance) == metrics.calmar
+        assert calculate_sqn(trades, starting_balance) == metrics.sqn
+        assert calculate_csum(trades, starting_balance) == pytest.approx(
+            (metrics.csum_min, metrics.csum_max)
+        )
+
+
+def test_calculate_trade_metrics_edge_cases():
+    metrics = calculate_trade_metrics(pd.DataFrame())
+    assert metrics.trade_count == 0
+    assert metrics.drawdown is None
+    assert metrics.expectancy_ratio == TradeMetrics.expectancy_ratio
+
+    # Only winning trades - no drawdown
+    trades = generate_trades(20, losing=False)
+    metrics = calculate_trade_metrics(trades, None, None, 1000)
+    assert metrics.drawdown is None
+    assert metrics.losing_trades == 0
+    assert metrics.profit_factor == 0.0
+    assert metrics.expectancy_ratio == 100.0
+    # No date range - no ratios
+    assert metrics.sharpe == 0.0
+    assert metrics.calmar == 0.0
+    with pytest.raises(ValueError, match="No losing trade, therefore no drawdown."):
+        calculate_max_drawdown(trades)
+
+    # Without dates, no drawdown is calculated
+    metrics = calculate_trade_metrics(trades[["profit_abs"]], starting_balance=1000)
+    assert metrics.dates is None
+    assert metrics.drawdown is None
+    assert metrics.sqn == calculate_sqn(trades, 1000)
+    with pytest.raises(ValueError, match="Trade dataframe has no column close_date."):
+        calculate_underwater(trades[["profit_ratio"]])
+
+
+@pytest.mark.longrun
+def test_calculate_trade_metrics_benchmark():
+    trades = generate_trades(100_000)
+    min_date = trades["close_date"].min()
+    max_date = trades["close_date"].max()
+    starting_balance = 1000
+
+    start = time.perf_counter()
+    _ref_expectancy(trades)
+    _ref_ratios(trades, min_date, max_date, starting_balance)
+    _ref_max_drawdown(trades, starting_balance)
+    _ref_max_drawdown(trades, starting_balance, relative=True)
+    trades["profit_abs"].cumsum().min()
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    calculate_trade_metrics(trades, min_date, max_date, starting_balance)
+    metrics_time = time.perf_counter() - start
+
+    print(
+        f"100k trades: per metric {reference_time * 1000:.1f}ms, "
+        f"single pass {metrics_time * 1000:.1f}ms ({reference_time / metrics_time:.1f}x)"
+    )
+    assert metrics_time < reference_time
@@ -751,7 +751,7 @@ def patch_binance_vision_ohlcv(mocker, start, archive_end, api_end, timeframe):
     # (pair, timeframe, candle_type, ohlcv, True)
     candle_history = [None, None, None, ohlcv, None]
 
-    def get_historic_ohlcv(
+    async def get_historic_ohlcv(
         # self,
         pair: str,
         timeframe: str,
@@ -782,7 +782,7 @@ def patch_binance_vision_ohlcv(mocker, start, archive_end, api_end, timeframe):
         ]
 
     candle_mock = mocker.patch(f"{EXMS}._async_get_candle_history", return_value=candle_history)
-    api_mock = mocker.patch(f"{EXMS}.get_historic_ohlcv", side_effect=get_historic_ohlcv)
+    api_mock = mocker.patch(f"{EXMS}._async_get_historic_ohlcv_df", side_effect=get_historic_ohlcv)
     archive_mock = mocker.patch(
         "freqtrade.exchange.binance.download_archive_ohlcv", side_effect=download_archive_ohlcv
     )
@@ -975,6 +975,41 @@ def test_get_historic_ohlcv_binance(
         api_mock.assert_called_once()
 
 
+@pytest.mark.parametrize(
+    "timeframe,since,until,last_date,archive_called,api_called",
+    [
+        # fast path - archive only
+        ("1m", dt_utc(2020, 1, 1), dt_utc(2020, 1, 2), dt_utc(2020, 1, 1, 23, 59), True, False),
+        # fast path - archive with rest API for the remainder
+        ("1m", dt_utc(2020, 1, 1), dt_utc(2020, 1, 3), dt_utc(2020, 1, 2, 23, 59), True, True),
+        # fallback - timeframe not available on data.binance.vision
+        ("1h", dt_utc(2020, 1, 1), dt_utc(2020, 1, 2), dt_utc(2020, 1, 1, 23), False, True),
+    ],
+)
+async def test__async_get_historic_ohlcv_df_binance(
+    mocker, default_conf, timeframe, since, until, last_date, archive_called, api_called
+):
+    exchange = get_patched_exchange(mocker, default_conf, exchange="binance")
+    candle_mock, api_mock, archive_mock = patch_binance_vision_ohlcv(
+        mocker,
+        start=dt_utc(2020, 1, 1),
+        archive_end=dt_utc(2020, 1, 2),
+        api_end=dt_utc(2020, 1, 3),
+        timeframe=timeframe,
+    )
+
+    df = await exchange._async_get_historic_ohlcv_df(
+        "BTC/USDT", timeframe, dt_ts(since), CandleType.SPOT, True, dt_ts(until)
+    )
+
+    assert df["date"].iloc[0] == dt_utc(2020, 1, 1)
+    assert df["date"].iloc[-1] == last_date
+    assert (df["date"].diff().iloc[1:] == timedelta(seconds=timeframe_to_seconds(timeframe))).all()
+    candle_mock.assert_called_once()
+    assert archive_mock.call_count == int(archive_called)
+    assert api_mock.call_count == int(api_called)
+
+
 @pytest.mark.parametrize(
     "pair,notional_value,mm_ratio,amt",
     [
@@ -0,0 +1,116 @@
+# pragma pylint: disable=missing-docstring, protected-access, invalid-name
+import pytest
+
+from freqtrade.exchange.dry_run_matching import L2QueueMatchingEngine, create_matching_engine
+
+
+def get_book(bids, asks=None):
+    return {
+        "symbol": "LTC/USDT",
+        "bids": bids,
+        "asks": asks if asks is not None else [[101.0, 3.0], [102.0, 4.0]],
+    }
+
+
+def get_order(side="buy", price=100.0, amount=4.0, order_id="dry_1", filled=0.0):
+    return {
+        "id": order_id,
+        "symbol": "LTC/USDT",
+        "side": side,
+        "price": price,
+        "amount": amount,
+        "filled": filled,
+    }
+
+
+def test_create_matching_engine():
+    assert create_matching_engine("price_cross") is None
+    assert isinstance(create_matching_engine("l2_queue"), L2QueueMatchingEngine)
+
+
+def test_l2_queue_touch_fills():
+    engine = L2QueueMatchingEngine()
+    order = get_order()
+    assert engine.add_order(order, get_book([[100.0, 5.0], [99.0, 10.0]])) == 0
+    assert engine._orders["dry_1"].queue_ahead == 5
+
+    # Volume joining behind the order doesn't change its position
+    assert engine.match(order, get_book([[100.0, 7.0], [99.0, 10.0]])) == 0
+    assert engine._orders["dry_1"].queue_ahead == 5
+
+    # Trades at the best level fill the queue ahead of the order first
+    assert engine.match(order, get_book([[100.0, 4.0], [99.0, 10.0]])) == 0
+    assert engine._orders["dry_1"].queue_ahead == 2
+    book = get_book([[100.0, 1.0], [99.0, 10.0]])
+    assert engine.match(order, book) == 1
+    assert engine._orders["dry_1"].queue_ahead == 0
+    # The same snapshot doesn't fill twice - even as a copy
+    assert engine.match(order, get_book([[100.0, 1.0], [99.0, 10.0]])) == 0
+
+    # Price moved through the order's level
+    order["filled"] = 1.0
+    assert engine.match(order, get_book([[99.5, 2.0], [99.0, 10.0]])) == 3
+
+    engine.remove_order("dry_1")
+    assert engine._orders == {}
+
+
+def test_l2_queue_deep_level():
+    engine = L2QueueMatchingEngine()
+    order = get_order(price=98.0)
+    engine.add_order(order, get_book([[100.0, 5.0], [98.0, 10.0], [97.0, 1.0]]))
+    state = engine._orders["dry_1"]
+    assert state.queue_ahead == 10
+    assert state.at_touch is False
+
+    # Volume leaving deeper levels is canceled - evenly ahead of and behind the order
+    assert engine.match(order, get_book([[100.0, 5.0], [98.0, 5.0], [97.0, 1.0]])) == 0
+    assert state.queue_ahead == 5
+
+    # Level became the best level - no fill without trades
+    assert engine.match(order, get_book([[98.0, 5.0], [97.0, 1.0]])) == 0
+    assert state.at_touch is True
+    assert engine.match(order, get_book([[98.0, 2.0], [97.0, 1.0]])) == 0
+    assert state.queue_ahead == 2
+    assert engine.match(order, get_book([[98.0, 1.0], [97.0, 1.0]])) == 0
+    assert state.queue_ahead == 1
+
+    # Beyond the visible depth - nothing changes
+    order2 = get_order(price=90.0, order_id="dry_2")
+    engine.add_order(order2, get_book([[100.0, 5.0], [98.0, 10.0]]))
+    assert engine.match(order2, get_book([[95.0, 5.0], [94.0, 10.0]])) == 0
+    assert engine._orders["dry_2"].queue_ahead == 0
+    assert engine._orders["dry_2"].level_volume == 0
+
+
+@pytest.mark.parametrize("side", ["buy", "sell"])
+def test_l2_queue_crossing(side):
+    engine = L2QueueMatchingEngine()
+    if side == "buy":
+        book = get_book([[98.0, 5.0]], [[99.0, 4.0], [100.0, 3.0], [101.0, 5.0]])
+    else:
+        book = get_book([[101.0, 4.0], [100.0, 3.0], [99.0, 5.0]], [[102.0, 5.0]])
+    order = get_order(side, amount=10)
+    # Fills up to the volume at or better than the order's price
+    assert engine.add_order(order, book) == 7
+    # Volume is only handed out once per snapshot
+    order2 = get_order(side, amount=5, order_id="dry_2")
+    assert engine.add_order(order2, book) == 0
+
+    # Opposite side crossing the order's price on a later snapshot fills it (as maker)
+    order["filled"] = 7.0
+    if side == "buy":
+        book = get_book([[98.0, 5.0]], [[100.0, 2.0], [101.0, 5.0]])
+    else:
+        book = get_book([[100.0, 2.0], [99.0, 5.0]], [[102.0, 5.0]])
+    assert engine.match(order, book) == 2
+    assert engine.match(order2, book) == 0
+
+
+def test_l2_queue_restored_order():
+    engine = L2QueueMatchingEngine()
+    order = get_order(filled=1.0)
+    # Unknown orders (e.g. after a restart) join the queue without filling
+    assert engine.match(order, get_book([[100.0, 5.0]], [[100.0, 5.0]])) == 0
+    assert engine._orders["dry_1"].queue_ahead == 5
+    assert engine.match(order, get_book([[100.0, 5.0]], [[99.5, 1.0], [100.0, 5.0]])) == 3
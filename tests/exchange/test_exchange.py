@@ -37,6 +37,7 @@ from freqtrade.exchange.common import (
     calculate_backoff,
     remove_exchange_credentials,
 )
+from freqtrade.exchange.dry_run_matching import L2QueueMatchingEngine
 from freqtrade.resolvers.exchange_resolver import ExchangeResolver
 from freqtrade.util import dt_now, dt_ts
 from tests.conftest import (
@@ -1198,6 +1199,67 @@ def test_create_dry_run_order_limit_fill(
     order_closed = exchange.fetch_dry_run_order(order["id"])
 
 
+def test_create_dry_run_order_l2_queue(default_conf, mocker, order_book_l2_usd):
+    default_conf["dry_run"] = True
+    default_conf["exchange"]["dry_run_matching"] = "l2_queue"
+    exchange = get_patched_exchange(mocker, default_conf)
+    book = order_book_l2_usd.return_value
+
+    def get_book(best_bid_volume, crossing_ask=None):
+        asks = [[25.563, crossing_ask]] if crossing_ask else []
+        return {
+            **book,
+            "bids": [[25.563, best_bid_volume]] + book["bids"][1:],
+            "asks": asks + book["asks"],
+        }
+
+    mocker.patch.multiple(
+        EXMS,
+        exchange_has=MagicMock(return_value=True),
+        fetch_l2_order_book=MagicMock(
+            side_effect=[
+                get_book(5.0),
+                # 5 joined the queue behind the order
+                get_book(10.0),
+                # 7 traded - 5 ahead of the order
+                get_book(3.0),
+                get_book(3.0, crossing_ask=4.0),
+                get_book(3.0, crossing_ask=4.0),
+            ]
+        ),
+        get_fee=MagicMock(return_value=0.001),
+    )
+    assert isinstance(exchange._dry_matching, L2QueueMatchingEngine)
+
+    order = exchange.create_order(
+        pair="LTC/USDT", ordertype="limit", side="buy", amount=15, rate=25.563, leverage=1.0
+    )
+    assert order["status"] == "open"
+    assert order["filled"] == 0
+    assert order["fee"] is None
+
+    order = exchange.fetch_dry_run_order(order["id"])
+    assert order["filled"] == 0
+
+    order = exchange.fetch_dry_run_order(order["id"])
+    assert order["status"] == "open"
+    assert order["filled"] == 2
+    assert order["remaining"] == 13
+    assert order["cost"] == 2 * 25.563
+
+    # Sell order crossing the order's price
+    order = exchange.fetch_dry_run_order(order["id"])
+    assert order["filled"] == 6
+    assert pytest.approx(order["fee"]["cost"]) == 6 * 25.563 * 0.001
+    assert order["fee"]["rate"] == pytest.approx(0.001)
+
+    cancelled = exchange.cancel_order(order["id"], "LTC/USDT")
+    assert cancelled["status"] == "canceled"
+    assert cancelled["filled"] == 6
+    assert cancelled["remaining"] == 9
+    assert exchange._dry_matching._orders == {}
+
+
 @pytest.mark.parametrize(
     "side,rate,amount,endprice",
     [
@@ -2886,6 +2948,82 @@ def test_fetch_l2_order_book_exception(default_conf, mocker, exchange_name):
         exchange.fetch_l2_order_book(pair="ETH/BTC", limit=50)
 
 
+def test_get_order_book_snapshot(default_conf, mocker, order_book_l2):
+    api_mock = MagicMock()
+    api_mock.fetch_l2_order_book = order_book_l2
+    exchange = get_patched_exchange(mocker, default_conf, api_mock)
+
+    # No snapshot - every call fetches
+    exchange.get_order_book("ETH/BTC", 20)
+    exchange.get_order_book("ETH/BTC", 20)
+    assert order_book_l2.call_count == 2
+
+    order_book_l2.reset_mock()
+    exchange.refresh_order_books([], 20)
+    assert order_book_l2.call_count == 0
+    assert len(exchange.get_order_book("ETH/BTC", 20)["bids"]) == 10
+    assert order_book_l2.call_count == 1
+    # Shallower requests are served from the deeper book
+    order_book = exchange.get_order_book("ETH/BTC", 5)
+    assert order_book_l2.call_count == 1
+    assert order_book["bids"] == order_book_l2.return_value["bids"][:5]
+    assert order_book["asks"] == order_book_l2.return_value["asks"][:5]
+    # Same depth after mapping to the exchange's supported limits
+    exchange.get_order_book("ETH/BTC", 12)
+    assert order_book_l2.call_count == 1
+    # Deeper requests fetch again - and replace the cached book
+    exchange.get_order_book("ETH/BTC", 100)
+    assert order_book_l2.call_count == 2
+    assert order_book_l2.call_args[0] == ("ETH/BTC", 100)
+    exchange.get_order_book("ETH/BTC", 50)
+    exchange.get_order_book("ETH/BTC", 20)
+    assert order_book_l2.call_count == 2
+    exchange.get_order_book("XRP/BTC", 20)
+    assert order_book_l2.call_count == 3
+
+    exchange.close_order_book_snapshot()
+    exchange.get_order_book("ETH/BTC", 20)
+    assert order_book_l2.call_count == 4
+
+
+def test_refresh_order_books(default_conf, mocker, order_book_l2, caplog):
+    api_mock = MagicMock()
+    api_mock.fetch_l2_order_book = order_book_l2
+    exchange = get_patched_exchange(mocker, default_conf, api_mock)
+    mocker.patch(f"{EXMS}.exchange_has", return_value=True)
+
+    def fetch_order_book(pair, limit):
+        if pair == "LTC/BTC":
+            raise ccxt.BaseError("DeadBeef")
+        return order_book_l2.return_value
+
+    # Sync and async api share the same mock otherwise
+    exchange._api_async = MagicMock()
+    exchange._api_async.fetch_l2_order_book = get_mock_coro(side_effect=fetch_order_book)
+    exchange.refresh_order_books(["ETH/BTC", "LTC/BTC", "XRP/BTC"], 15)
+
+    # All pairs are fetched concurrently
+    assert exchange._api_async.fetch_l2_order_book.call_count == 3
+    assert exchange._api_async.fetch_l2_order_book.call_args_list[0][0] == ("ETH/BTC", 20)
+    assert log_has_re(r"Could not fetch order book for LTC/BTC: DeadBeef", caplog)
+
+    assert exchange.get_order_book("ETH/BTC", 1) == {
+        **order_book_l2.return_value,
+        "bids": order_book_l2.return_value["bids"][:5],
+        "asks": order_book_l2.return_value["asks"][:5],
+    }
+    exchange.get_order_book("XRP/BTC", 20)
+    assert order_book_l2.call_count == 0
+    # Failed pairs are fetched on demand
+    exchange.get_order_book("LTC/BTC", 20)
+    assert order_book_l2.call_count == 1
+
+    # A new snapshot drops the previous one
+    exchange.refresh_order_books([], 20)
+    exchange.get_order_book("ETH/BTC", 20)
+    assert order_book_l2.call_count == 2
+
+
 @pytest.mark.parametrize("side,ask,bid,last,last_ab,expected", get_entry_rate_data)
 def test_get_entry_rate(
     mocker, default_conf, caplog, side, ask, bid, last, last_ab, expected, time_machine
@@ -3316,6 +3454,26 @@ async def test__async_fetch_trades(
     exchange.close()
 
 
+async def test__async_watch_trades(default_conf, mocker, fetch_trades_result):
+    exchange = get_patched_exchange(mocker, default_conf)
+    exchange._api_async.watch_trades = get_mock_coro(fetch_trades_result)
+
+    res = await exchange._async_watch_trades("ETH/BTC")
+    assert len(res) == len(fetch_trades_result)
+    assert res[0] == [1565798399463, "126181329", None, "buy", 0.019627, 0.04, 0.00078508]
+    assert exchange._api_async.watch_trades.call_count == 1
+    assert exchange._api_async.watch_trades.call_args[0][0] == "ETH/BTC"
+
+    exchange._api_async.watch_trades = MagicMock(side_effect=ccxt.NetworkError("Closed"))
+    with pytest.raises(TemporaryError, match=r"Could not watch trades due to NetworkError.*"):
+        await exchange._async_watch_trades("ETH/BTC")
+
+    exchange._api_async.watch_trades = MagicMock(side_effect=ccxt.NotSupported("Not supported"))
+    with pytest.raises(OperationalException, match=r"Exchange.* does not support watching trades"):
+        await exchange._async_watch_trades("ETH/BTC")
+    exchange.close()
+
+
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 async def test__async_fetch_trades_contract_size(
     default_conf, mocker, caplog, exchange_name, fetch_trades_result
@@ -3572,6 +3730,33 @@ def test_cancel_order_dry_run(default_conf, mocker, exchange_name):
     assert cancel_order["status"] == "canceled"
 
 
+def test_cancel_order_dry_run_partially_filled(default_conf, mocker):
+    default_conf["dry_run"] = True
+    exchange = get_patched_exchange(mocker, default_conf)
+    mocker.patch(f"{EXMS}._dry_is_price_crossed", return_value=False)
+
+    order = exchange.create_order(
+        pair="ETH/BTC", ordertype="limit", side="buy", amount=5, rate=0.55, leverage=1.0
+    )
+    assert order["status"] == "open"
+    exchange._dry_run_open_orders[order["id"]]["filled"] = 2.0
+
+    cancel_order = exchange.cancel_order(order_id=order["id"], pair="ETH/BTC")
+    assert cancel_order["status"] == "canceled"
+    assert cancel_order["filled"] == 2.0
+    assert cancel_order["remaining"] == 3.0
+
+    # Orders without amount are canceled without remaining
+    order = exchange.create_order(
+        pair="ETH/BTC", ordertype="limit", side="buy", amount=5, rate=0.55, leverage=1.0
+    )
+    exchange._dry_run_open_orders[order["id"]]["amount"] = None
+    cancel_order = exchange.cancel_order(order_id=order["id"], pair="ETH/BTC")
+    assert cancel_order["status"] == "canceled"
+    assert cancel_order["filled"] == 0.0
+    assert cancel_order["remaining"] is None
+
+
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 @pytest.mark.parametrize(
     "order,result",
@@ -1,7 +1,9 @@
+import pickle
 import shutil
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -9,7 +11,9 @@ from freqtrade.configuration import TimeRange
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.exceptions import OperationalException
 from freqtrade.freqai.data_kitchen import FreqaiDataKitchen
-from tests.conftest import get_patched_exchange
+from freqtrade.freqai.historic_predictions import HistoricPredictions
+from freqtrade.freqai.model_registry import ModelRegistry
+from tests.conftest import get_patched_exchange, log_has, log_has_re
 from tests.freqai.conftest import get_patched_freqai_strategy
 
 
@@ -136,6 +140,191 @@ def test_get_timerange_from_backtesting_live_df_pred_not_found(mocker, freqai_co
         freqai.dd.get_timerange_from_live_historic_predictions()
 
 
+def get_predictions(start: int, rows: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "date_pred": pd.date_range("2023-01-01", periods=start + rows, freq="5min", tz="UTC")[
+                start:
+            ],
+            "&-s_close": [float(i) for i in range(start, start + rows)],
+            "do_predict": [1] * rows,
+        }
+    )
+
+
+def test_historic_predictions_append_and_compact(tmp_path):
+    path = tmp_path / "historic_predictions"
+    store = HistoricPredictions(path)
+    store["ADA/BTC"] = get_predictions(0, 3)
+    store.save()
+    base_file = path / "ADA%2FBTC.feather"
+    log_file = path / "ADA%2FBTC.log"
+    assert base_file.is_file()
+    assert not log_file.is_file()
+
+    # Only new rows are appended
+    store["ADA/BTC"] = pd.concat([store["ADA/BTC"], get_predictions(3, 1)], ignore_index=True)
+    store.save()
+    store.save()
+    assert log_file.is_file()
+    assert store._state["ADA/BTC"].log_records == 1
+
+    # Pairs are loaded on first access
+    store2 = HistoricPredictions(path)
+    assert "ADA/BTC" in store2
+    assert list(store2) == ["ADA/BTC"]
+    assert store2._frames == {}
+    pd.testing.assert_frame_equal(store2["ADA/BTC"], get_predictions(0, 4))
+
+    # Log holds as many rows as the base file - compacted on the next save
+    store2["ADA/BTC"] = pd.concat([store2["ADA/BTC"], get_predictions(4, 2)], ignore_index=True)
+    store2.save()
+    assert log_file.is_file()
+    store2.save()
+    assert not log_file.is_file()
+    pd.testing.assert_frame_equal(HistoricPredictions(path)["ADA/BTC"], get_predictions(0, 6))
+
+    del store2["ADA/BTC"]
+    assert not base_file.is_file()
+    assert "ADA/BTC" not in HistoricPredictions(path)
+
+
+def test_historic_predictions_crash_safety(tmp_path, caplog):
+    path = tmp_path / "historic_predictions"
+    store = HistoricPredictions(path)
+    store["ETH/USDT:USDT"] = get_predictions(0, 4)
+    store.save()
+    log_file = path / "ETH%2FUSDT%3AUSDT.log"
+    with log_file.open("ab") as fp:
+        # Already contained in the base file - e.g. crash before the log was removed
+        pickle.dump((2, get_predictions(2, 3)), fp)
+        # Incomplete record
+        fp.write(pickle.dumps((5, get_predictions(5, 1)))[:-10])
+
+    store = HistoricPredictions(path)
+    pd.testing.assert_frame_equal(store["ETH/USDT:USDT"], get_predictions(0, 5))
+    assert log_has("Ignoring incomplete historic predictions record for ETH/USDT:USDT.", caplog)
+    # Broken log is replaced on the next save
+    store.save()
+    assert not log_file.is_file()
+    pd.testing.assert_frame_equal(HistoricPredictions(path)["ETH/USDT:USDT"], get_predictions(0, 5))
+
+
+def test_load_historic_predictions_migrate(mocker, freqai_conf, caplog):
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    dd = strategy.freqai.dd
+    assert dd.load_historic_predictions_from_disk() is False
+    dd.full_path.mkdir(parents=True, exist_ok=True)
+    with dd.historic_predictions_pkl_path.open("wb") as fp:
+        pickle.dump({"ADA/BTC": get_predictions(0, 3)}, fp)
+
+    assert dd.load_historic_predictions_from_disk() is True
+    assert log_has_re(r"Migrated historic predictions to .*", caplog)
+    assert (dd.historic_predictions_path / "ADA%2FBTC.feather").is_file()
+    assert dd.load_historic_predictions_from_disk() is True
+    assert isinstance(dd.historic_predictions, HistoricPredictions)
+    pd.testing.assert_frame_equal(dd.historic_predictions["ADA/BTC"], get_predictions(0, 3))
+
+
+def test_model_registry_ownership(tmp_path):
+    owner = ModelRegistry(tmp_path, "unique-id")
+    reader = ModelRegistry(tmp_path, "unique-id")
+    assert owner.acquire_ownership() is True
+    assert owner.acquire_ownership() is True
+    # Only one bot trains
+    assert reader.acquire_ownership() is False
+    assert reader.is_owner is False
+
+    version = {
+        "pair": "ADA/BTC",
+        "trained_timestamp": 1516406400,
+        "model_filename": "cb_ada_1516406400",
+        "data_path": str(tmp_path / "sub-train-ADA_1516406400"),
+    }
+    owner.publish(version)
+    assert reader.latest("ADA/BTC") == version
+    assert reader.latest("ETH/BTC") is None
+    assert reader.updated(["ADA/BTC", "ETH/BTC"]) == [version]
+    # Unchanged versions are not read again
+    assert reader.updated(["ADA/BTC", "ETH/BTC"]) == []
+
+    # Another bot takes over once the owner stops
+    owner.release_ownership()
+    assert reader.acquire_ownership() is True
+    reader.release_ownership()
+
+
+def test_sync_from_model_registry(mocker, freqai_conf, tmp_path):
+    freqai_conf["freqai"]["model_registry_path"] = str(tmp_path / "registry")
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    dd = strategy.freqai.dd
+    assert dd.model_registry.path == tmp_path / "registry" / freqai_conf["freqai"]["identifier"]
+    owner = ModelRegistry(tmp_path / "registry", freqai_conf["freqai"]["identifier"])
+    dd.pair_dict["ADA/BTC"] = {
+        "model_filename": "cb_ada_1516400000",
+        "trained_timestamp": 1516400000,
+        "data_path": "old",
+        "extras": {},
+    }
+    dd.model_dictionary["ADA/BTC"] = "model"
+    dd.meta_data_dictionary["ADA/BTC"] = {}
+
+    owner.publish(
+        {
+            "pair": "ADA/BTC",
+            "trained_timestamp": 1516406400,
+            "model_filename": "cb_ada_1516406400",
+            "data_path": "new",
+        }
+    )
+    assert dd.sync_from_model_registry(["ADA/BTC", "ETH/BTC"]) == ["ADA/BTC"]
+    assert dd.pair_dict["ADA/BTC"]["model_filename"] == "cb_ada_1516406400"
+    assert dd.pair_dict["ADA/BTC"]["trained_timestamp"] == 1516406400
+    assert dd.pair_dict["ADA/BTC"]["data_path"] == "new"
+    # Loaded again on next use
+    assert "ADA/BTC" not in dd.model_dictionary
+    assert "ADA/BTC" not in dd.meta_data_dictionary
+    assert dd.sync_from_model_registry(["ADA/BTC"]) == []
+
+    # Older versions are ignored
+    dd.pair_dict["ADA/BTC"]["trained_timestamp"] = 1516500000
+    owner.publish(
+        {
+            "pair": "ADA/BTC",
+            "trained_timestamp": 1516406400,
+            "model_filename": "cb_ada_1516406400",
+            "data_path": "new",
+        }
+    )
+    dd.model_registry._mtimes.clear()
+    assert dd.sync_from_model_registry(["ADA/BTC"]) == []
+
+
+def test_purge_old_models_keeps_registry_versions(mocker, freqai_conf, tmp_path):
+    freqai_conf["freqai"]["model_registry_path"] = str(tmp_path / "registry")
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    dd = strategy.freqai.dd
+    dd.full_path = tmp_path / "models"
+    folders = [dd.full_path / f"sub-train-ADA_151640{i}000" for i in range(5)]
+    for folder in folders:
+        folder.mkdir(parents=True)
+    # Oldest version is still published to other bots
+    dd.model_registry.publish(
+        {
+            "pair": "ADA/BTC",
+            "trained_timestamp": 1516400000,
+            "model_filename": "cb_ada_1516400000",
+            "data_path": str(folders[0]),
+        }
+    )
+
+    dd.purge_old_models()
+    assert [f.is_dir() for f in folders] == [True, False, False, True, True]
+    # Purging again is a no-op
+    dd.purge_old_models()
+    assert [f.is_dir() for f in folders] == [True, False, False, True, True]
+
+
 def test_set_initial_return_values(mocker, freqai_conf):
     """
     Simple test of the set initial return values that ensures
@@ -237,3 +426,62 @@ def test_set_initial_return_values_warning(mocker, freqai_conf):
 
     # Ensure logger error is not called
     mock_logger_warning.assert_called()
+
+
+def test_append_model_predictions(mocker, freqai_conf):
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    dd = strategy.freqai.dd
+    dk = FreqaiDataKitchen(freqai_conf)
+    dk.data = {
+        "labels_mean": {"&-s_close": 0.5},
+        "labels_std": {"&-s_close": 0.1},
+        "extra_returns_per_train": {"extra": 3.0},
+    }
+    dk.DI_values = np.array([0.2, 0.7])
+    dates = pd.date_range("2023-01-01", periods=3, freq="5min", tz="UTC")
+    dd.historic_predictions["ADA/BTC"] = pd.DataFrame(
+        {
+            "&-s_close": [0.1, 0.2],
+            "&-s_close_mean": 0.0,
+            "&-s_close_std": 0.0,
+            "do_predict": 0,
+            "DI_values": 0.0,
+            "extra": 0.0,
+            "high_price": [2.0, 2.1],
+            "low_price": [1.0, 1.1],
+            "close_price": [1.5, 1.6],
+            "date_pred": dates[:2],
+        }
+    )
+    strat_df = pd.DataFrame(
+        {"date": dates[1:], "high": [2.1, 2.2], "low": [1.1, 1.2], "close": [1.6, 1.7]}
+    )
+
+    dd.append_model_predictions(
+        "ADA/BTC", pd.DataFrame({"&-s_close": [0.3]}), np.array([1]), dk, strat_df
+    )
+    hist_preds = dd.historic_predictions["ADA/BTC"]
+    assert len(hist_preds) == 3
+    assert hist_preds.iloc[-1].to_dict() == {
+        "&-s_close": 0.3,
+        "&-s_close_mean": 0.5,
+        "&-s_close_std": 0.1,
+        "do_predict": 1,
+        "DI_values": 0.7,
+        "extra": 3.0,
+        "high_price": 2.2,
+        "low_price": 1.2,
+        "close_price": 1.7,
+        "date_pred": dates[2],
+    }
+    # No longer turns into object dtype
+    assert hist_preds["date_pred"].dtype == dates.dtype
+    assert len(dd.model_return_values["ADA/BTC"]) == 2
+
+    # Unknown extra returns are an error, as before
+    dk.data["extra_returns_per_train"] = {"unknown": 1.0}
+    with pytest.raises(KeyError, match=r"unknown"):
+        dd.append_model_predictions(
+            "ADA/BTC", pd.DataFrame({"&-s_close": [0.4]}), np.array([1]), dk, strat_df
+        )
+    assert len(dd.historic_predictions["ADA/BTC"]) == 3
@@ -1,5 +1,7 @@
 import logging
 import shutil
+import time
+from collections import deque
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -19,6 +21,7 @@ from tests.conftest import (
     get_patched_exchange,
     is_arm,
     is_mac,
+    log_has,
     log_has_re,
 )
 from tests.freqai.conftest import (
@@ -531,6 +534,83 @@ def test_start_set_train_queue(mocker, freqai_conf, caplog):
     )
 
 
+def test_get_training_workers(mocker, freqai_conf, caplog):
+    mocker.patch("freqtrade.freqai.freqai_interface.psutil.cpu_count", return_value=8)
+    freqai_conf["freqai"]["training_workers"] = 4
+    freqai_conf["freqai"]["model_training_parameters"].update({"n_jobs": 4})
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    freqai = strategy.freqai
+
+    assert freqai.training_workers == 2
+    assert log_has(
+        "Limiting training_workers to 2, as models use 4 threads each on 8 CPUs.", caplog
+    )
+
+    freqai.model_training_parameters = {"n_jobs": -1}
+    assert freqai._get_training_workers() == 1
+    freqai.model_training_parameters = {"nthread": 2}
+    assert freqai._get_training_workers() == 4
+
+    freqai.parallel_training = False
+    assert freqai._get_training_workers() == 1
+    assert log_has_re(r".* does not support parallel training, using 1 training worker\.", caplog)
+
+
+def test_get_pairs_to_train(mocker, freqai_conf, caplog):
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    strategy.dp = MagicMock()
+    strategy.dp.current_whitelist = MagicMock(return_value=["ADA/BTC", "ETH/BTC", "LTC/BTC"])
+    freqai = strategy.freqai
+    freqai.live = True
+    freqai.train_queue = deque(["ADA/BTC", "DASH/BTC", "ETH/BTC", "LTC/BTC"])
+    for pair, trained_timestamp in (("ADA/BTC", 300), ("ETH/BTC", 0), ("LTC/BTC", 200)):
+        freqai.dd.pair_dict[pair] = {**freqai.dd.empty_pair_dict}
+        freqai.dd.pair_dict[pair]["trained_timestamp"] = trained_timestamp
+
+    due = freqai._get_pairs_to_train(strategy, {})
+    assert [entry[0] for entry in due] == ["ETH/BTC", "LTC/BTC", "ADA/BTC"]
+    assert due[0][1].pair == "ETH/BTC"
+    assert log_has("DASH/BTC not in current whitelist, removing from train queue.", caplog)
+    assert "DASH/BTC" not in freqai.train_queue
+
+    # Pairs being trained are skipped, failed attempts are sorted by time of the attempt
+    freqai._train_attempts["ETH/BTC"] = time.time()
+    due = freqai._get_pairs_to_train(strategy, {"LTC/BTC": MagicMock()})
+    assert [entry[0] for entry in due] == ["ADA/BTC", "ETH/BTC"]
+
+
+def test_start_scanning_training_pool(mocker, freqai_conf):
+    freqai_conf["freqai"]["training_workers"] = 2
+    freqai_conf["freqai"]["persist_interval"] = 0
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    pairs = freqai_conf["exchange"]["pair_whitelist"]
+    strategy.dp = MagicMock()
+    strategy.dp.current_whitelist = MagicMock(return_value=pairs)
+    freqai = strategy.freqai
+    freqai.live = True
+    freqai.training_workers = 2
+    freqai.train_queue = deque(pairs)
+
+    trained = []
+    mocker.patch.object(freqai, "_train_pair", side_effect=lambda pair, *args: trained.append(pair))
+    persist_mock = mocker.patch.object(freqai, "_persist_training_state")
+    iterations = [False, False, True]
+
+    def wait(timeout):
+        if len(iterations) < 3:
+            # Let the trainings finish
+            time.sleep(0.1)
+        return iterations.pop(0)
+
+    mocker.patch.object(freqai._stop_event, "wait", side_effect=wait)
+    freqai._start_scanning(strategy)
+
+    # Pairs without model first, in queue order
+    assert sorted(trained[:2]) == ["ADA/BTC", "DASH/BTC"]
+    assert sorted(trained[2:]) == ["ETH/BTC", "LTC/BTC"]
+    assert persist_mock.call_count == 1
+
+
 def test_get_required_data_timerange(mocker, freqai_conf):
     time_range = get_required_data_timerange(freqai_conf)
     assert (time_range.stopts - time_range.startts) == 177300
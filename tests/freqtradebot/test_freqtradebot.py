@@ -4410,6 +4410,53 @@ def test_check_depth_of_market(default_conf_usdt, mocker, order_book_l2) -> None
     assert freqtrade._check_depth_of_market("ETH/BTC", conf, side=SignalDirection.LONG) is False
 
 
+def test_refresh_order_books(default_conf_usdt, mocker) -> None:
+    patch_RPCManager(mocker)
+    patch_exchange(mocker)
+    refresh_mock = mocker.patch(f"{EXMS}.refresh_order_books")
+    close_mock = mocker.patch(f"{EXMS}.close_order_book_snapshot")
+    freqtrade = FreqtradeBot(default_conf_usdt)
+    patch_get_signal(freqtrade, enter_long=False)
+
+    freqtrade.process()
+    assert refresh_mock.call_count == 1
+    assert close_mock.call_count == 1
+
+    # The snapshot is closed even if the iteration fails
+    mocker.patch.object(freqtrade, "manage_open_orders", side_effect=ValueError("DeadBeef"))
+    with pytest.raises(ValueError, match="DeadBeef"):
+        freqtrade.process()
+    assert refresh_mock.call_count == 2
+    assert close_mock.call_count == 2
+
+    trades = [
+        MagicMock(pair="XRP/USDT", has_open_orders=True, has_open_sl_orders=False),
+        MagicMock(pair="ETH/USDT", has_open_orders=False, has_open_sl_orders=False),
+        MagicMock(pair="LTC/USDT", has_open_orders=False, has_open_sl_orders=True),
+        MagicMock(pair="XRP/USDT", has_open_orders=False, has_open_sl_orders=False),
+    ]
+    # Dry-run fills use a depth of 20 - only pairs with open orders are fetched
+    freqtrade._refresh_order_books(trades)
+    assert refresh_mock.call_args[0] == (["LTC/USDT", "XRP/USDT"], 20)
+
+    freqtrade._refresh_order_books(trades[1:2])
+    assert refresh_mock.call_args[0] == ([], 0)
+
+    freqtrade.config["dry_run"] = False
+    freqtrade._refresh_order_books(trades)
+    # Snapshot is still started - but nothing is prefetched
+    assert refresh_mock.call_args[0] == ([], 0)
+
+    freqtrade.config["exit_pricing"]["use_order_book"] = True
+    freqtrade.config["exit_pricing"]["order_book_top"] = 3
+    freqtrade._refresh_order_books(trades)
+    assert refresh_mock.call_args[0] == (["ETH/USDT", "LTC/USDT", "XRP/USDT"], 3)
+
+    freqtrade.config["dry_run"] = True
+    freqtrade._refresh_order_books(trades)
+    assert refresh_mock.call_args[0] == (["ETH/USDT", "LTC/USDT", "XRP/USDT"], 20)
+
+
 @pytest.mark.parametrize("is_short", [False, True])
 def test_order_book_exit_pricing(
     default_conf_usdt,
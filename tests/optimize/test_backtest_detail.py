@@ -1400,7 +1400,7 @@ def test_backtest_results(default_conf, mocker, caplog, data: BTContainer) -> No
         assert res.open_date == _get_frame_time_from_offset(trade.open_tick)
         assert res.close_date == _get_frame_time_from_offset(trade.close_tick)
         assert res.is_short == trade.is_short
-    assert len(LocalTrade.bt_trades) == len(data.trades)
+    assert len(LocalTrade.bt_trades_closed_index) == len(data.trades)
     assert len(LocalTrade.bt_trades_open) == 0, "Left open trade"
     backtesting.cleanup()
     del backtesting
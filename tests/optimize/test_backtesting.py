@@ -15,7 +15,11 @@ from freqtrade import constants
 from freqtrade.commands.optimize_commands import setup_optimize_configuration, start_backtesting
 from freqtrade.configuration import TimeRange
 from freqtrade.data import history
-from freqtrade.data.btanalysis import BT_DATA_COLUMNS, evaluate_result_multi
+from freqtrade.data.btanalysis import (
+    BT_DATA_COLUMNS,
+    evaluate_result_multi,
+    trade_list_to_dataframe,
+)
 from freqtrade.data.converter import clean_ohlcv_dataframe, ohlcv_fill_up_missing_data
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.data.history import get_timerange
@@ -24,7 +28,7 @@ from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange import timeframe_to_next_date, timeframe_to_prev_date
 from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename, get_strategy_run_id
 from freqtrade.optimize.backtesting import Backtesting
-from freqtrade.persistence import LocalTrade, Trade
+from freqtrade.persistence import BacktestOrder, LocalTrade, Trade
 from freqtrade.resolvers import StrategyResolver
 from freqtrade.util.datetime_helpers import dt_utc
 from tests.conftest import (
@@ -832,6 +836,10 @@ def test_backtest_one(default_conf, mocker, testdatadir) -> None:
     )
     pd.testing.assert_frame_equal(results, expected)
     assert "orders" in results.columns
+    # Results collected while trades close match the closed trade objects
+    closed_trades = LocalTrade.get_trades_proxy(is_open=False)
+    pd.testing.assert_frame_equal(results, trade_list_to_dataframe(closed_trades))
+    assert all(isinstance(o, BacktestOrder) for t in closed_trades for o in t.orders)
     data_pair = processed[pair]
     # Called once per order
     assert backtesting.strategy.order_filled.call_count == 4
@@ -1044,7 +1052,7 @@ def test_backtest_one_detail_futures(
             <= round(t["close_rate"], 6)
             <= round(ln2.iloc[0]["high"], 6)
         )
-    assert pytest.approx(Trade.bt_trades[1].funding_fees) == exp_funding_fee
+    assert pytest.approx(Trade.get_trades_proxy(is_open=False)[1].funding_fees) == exp_funding_fee
     assert ff_spy.call_count == exp_ff_updates
     # assert late_entry > 0
 
@@ -1139,7 +1147,7 @@ def test_backtest_one_detail_futures_funding_fees(
     # Additional counts will happen due each successful entry, which needs to call this, too.
     assert ff_spy.call_count == ff_updates
 
-    for t in Trade.bt_trades:
+    for t in Trade.get_trades_proxy(is_open=False):
         # At least 6 adjustment orders
         assert t.nr_of_successful_entries == entries
         # Funding fees will vary depending on the number of adjustment orders
@@ -1296,14 +1304,19 @@ def test_backtest_dataprovider_analyzed_df(default_conf, fee, mocker, testdatadi
     assert count == 5
 
 
-def test_backtest_pricecontours_protections(default_conf, fee, mocker, testdatadir) -> None:
+@pytest.mark.parametrize("keep_closed_trades", [True, False])
+def test_backtest_pricecontours_protections(
+    default_conf, fee, mocker, testdatadir, keep_closed_trades
+) -> None:
     # While this test IS a copy of test_backtest_pricecontours, it's needed to ensure
     # results do not carry-over to the next run, which is not given by using parametrize.
     patch_exchange(mocker)
+    default_conf["backtest_keep_closed_trades"] = keep_closed_trades
     default_conf["_strategy_protections"] = [
         {
             "method": "CooldownPeriod",
             "stop_duration": 3,
+            "lookback_period": 10,
         }
     ]
 
@@ -1338,6 +1351,9 @@ def test_backtest_pricecontours_protections(default_conf, fee, mocker, testdatad
             end_date=max_date,
         )
         assert len(results["results"]) == numres
+        # Closed trades older than the protection lookback are released
+        closed_trades = len(LocalTrade.bt_trades_closed_index.trades())
+        assert closed_trades == numres if keep_closed_trades else closed_trades < max(numres, 1)
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,93 @@
+# pragma pylint: disable=missing-docstring, protected-access, invalid-name
+import os
+
+import pandas as pd
+import pytest
+
+from freqtrade.configuration import TimeRange
+from freqtrade.data import history
+from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.indicator_cache import INDICATOR_CACHE_MAX_AGE, IndicatorCache
+from tests.conftest import log_has_re, patch_exchange
+
+
+@pytest.mark.parametrize(
+    "conf,expected",
+    [
+        ({}, False),
+        ({"backtest_indicator_cache": True}, True),
+        ({"backtest_indicator_cache": True, "backtest_cache": "none"}, False),
+        ({"backtest_indicator_cache": True, "freqai": {"enabled": True}}, False),
+        ({"backtest_indicator_cache": True, "exchange": {"use_public_trades": True}}, False),
+        ({"backtest_indicator_cache": True, "analyze_per_epoch": True}, False),
+    ],
+)
+def test_indicator_cache_enabled(conf, expected):
+    assert IndicatorCache.enabled(conf) is expected
+
+
+def test_indicator_cache(mocker, default_conf, testdatadir, tmp_path, caplog):
+    default_conf["user_data_dir"] = tmp_path
+    default_conf["backtest_indicator_cache"] = True
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    assert backtesting.indicator_cache is not None
+    backtesting._set_strategy(backtesting.strategylist[0])
+    strategy = backtesting.strategy
+    cache_dir = tmp_path / "indicator_cache"
+    pair = "UNITTEST/BTC"
+
+    data = history.load_data(
+        datadir=testdatadir,
+        timeframe="5m",
+        pairs=[pair],
+        timerange=TimeRange("date", None, 1517227800, 0),
+    )
+    advise_mock = mocker.spy(strategy, "advise_all_indicators")
+    processed = backtesting.advise_all_indicators(data)
+    assert advise_mock.call_count == 1
+    assert len(list(cache_dir.glob("*.feather"))) == 1
+    assert not log_has_re(r"Indicator methods are not called .*", caplog)
+
+    processed2 = backtesting.advise_all_indicators(data)
+    assert advise_mock.call_count == 1
+    assert log_has_re(r"Indicator methods are not called .*", caplog)
+    pd.testing.assert_frame_equal(processed2[pair], processed[pair])
+
+    key = backtesting.indicator_cache.strategy_key(strategy)
+    # Settings which don't change indicators keep the cache
+    mocker.patch.object(type(strategy), "stoploss", -0.5)
+    mocker.patch.object(type(strategy), "minimal_roi", {"0": 0.5})
+    assert backtesting.indicator_cache.strategy_key(strategy) == key
+
+    # Parameter values and other attributes do change it
+    mocker.patch.object(strategy.buy_rsi, "value", 42)
+    key2 = backtesting.indicator_cache.strategy_key(strategy)
+    assert key2 != key
+    mocker.patch.object(type(strategy), "custom_setting", 5, create=True)
+    assert backtesting.indicator_cache.strategy_key(strategy) not in (key, key2)
+    backtesting.advise_all_indicators(data)
+    assert advise_mock.call_count == 2
+    assert len(list(cache_dir.glob("*.feather"))) == 2
+
+    # Different timerange - different entry
+    data2 = {pair: data[pair].iloc[:-10]}
+    backtesting.advise_all_indicators(data2)
+    assert advise_mock.call_count == 3
+    assert len(list(cache_dir.glob("*.feather"))) == 3
+
+
+def test_indicator_cache_prune(default_conf, tmp_path):
+    default_conf["user_data_dir"] = tmp_path
+    cache = IndicatorCache(default_conf)
+    cache.path.mkdir()
+    old_file = cache.path / "old.feather"
+    old_file.touch()
+    old_time = old_file.stat().st_mtime - INDICATOR_CACHE_MAX_AGE - 10
+    os.utime(old_file, (old_time, old_time))
+    new_file = cache.path / "new.feather"
+    new_file.touch()
+
+    cache._prune()
+    assert not old_file.exists()
+    assert new_file.exists()
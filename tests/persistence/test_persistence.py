@@ -1,4 +1,6 @@
 # pragma pylint: disable=missing-docstring, C0103
+import pickle
+import random
 from datetime import datetime, timedelta, timezone
 from types import FunctionType
 
@@ -9,7 +11,8 @@ from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH, DATETIME_PRINT_FORMAT
 from freqtrade.enums import TradingMode
 from freqtrade.exceptions import DependencyException
 from freqtrade.exchange.exchange_utils import TICK_SIZE
-from freqtrade.persistence import LocalTrade, Order, Trade, init_db
+from freqtrade.persistence import BacktestOrder, LocalTrade, Order, Trade, init_db
+from freqtrade.persistence.closed_trade_index import ClosedTradeIndex
 from freqtrade.util import dt_now
 from tests.conftest import (
     create_mock_trades,
@@ -1889,6 +1892,118 @@ def test_get_trades_proxy(fee, use_db, is_short):
     Trade.use_db = True
 
 
+def test_get_trades_proxy_closed_index():
+    rng = random.Random(42)
+    LocalTrade.reset_trades()
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    pairs = ["ETH/BTC", "XRP/BTC", "LTC/BTC"]
+    for i in range(300):
+        open_date = start + timedelta(minutes=5 * i)
+        trade = LocalTrade(
+            pair=rng.choice(pairs),
+            stake_amount=0.001,
+            amount=10,
+            open_rate=0.01,
+            fee_open=0.0025,
+            fee_close=0.0025,
+            exchange="binance",
+            open_date=open_date,
+            is_open=True,
+        )
+        close_date = open_date + timedelta(minutes=rng.randint(5, 300))
+        if i % 10 == 0:
+            # Closed trades added directly - not in close_date order
+            trade.is_open = False
+            trade.close_date = close_date
+            LocalTrade.add_bt_trade(trade)
+        else:
+            LocalTrade.add_bt_trade(trade)
+            trade.is_open = False
+            trade.close_date = close_date
+            trade.close_profit_abs = 0.0
+            LocalTrade.close_bt_trade(trade)
+
+    for _ in range(200):
+        pair = rng.choice(pairs + [None, "NEO/BTC"])
+        close_date = start + timedelta(minutes=rng.randint(-60, 1800))
+        open_date = rng.choice([None, start + timedelta(minutes=rng.randint(0, 1500))])
+        # Reference - list filtering as used before the index
+        expected = [
+            t
+            for t in LocalTrade.get_trades_proxy(is_open=False)
+            if (not pair or t.pair == pair)
+            and (not open_date or t.open_date > open_date)
+            and t.close_date
+            and t.close_date > close_date
+        ]
+        res = LocalTrade.get_trades_proxy(
+            pair=pair, is_open=False, close_date=close_date, open_date=open_date
+        )
+        assert res == expected
+
+    LocalTrade.reset_trades()
+    assert LocalTrade.get_trades_proxy(is_open=False, close_date=start) == []
+
+
+def test_closed_trade_index_retention(mocker):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    index = ClosedTradeIndex(retention=timedelta(hours=1))
+    trades = []
+    for i in range(100):
+        trade = LocalTrade(
+            pair="ETH/BTC" if i < 50 else "XRP/BTC",
+            stake_amount=0.001,
+            amount=10,
+            open_rate=0.01,
+            exchange="binance",
+            open_date=start + timedelta(minutes=5 * i),
+            close_date=start + timedelta(minutes=5 * i + 5),
+            is_open=False,
+        )
+        trades.append(trade)
+        index.add(trade)
+
+    assert len(index) == 100
+    # Trades within the retention period are always available
+    latest = trades[-1].close_date
+    within = [t for t in trades if t.close_date > latest - timedelta(hours=1)]
+    assert index.closed_after(None, latest - timedelta(hours=1)) == within
+    assert index.closed_after("XRP/BTC", latest - timedelta(hours=1)) == within
+    # Older trades are released
+    assert len(index.trades()) < 100
+    assert index.trades()[-1] is trades[-1]
+
+    # Pairs without recent trades are released periodically
+    assert len(index._pairs["ETH/BTC"].entries) > 0
+    mocker.patch("freqtrade.persistence.closed_trade_index.RELEASE_SWEEP_INTERVAL", 101)
+    index.add(trades[-1])
+    assert len(index._pairs["ETH/BTC"].entries) == 0
+
+    # Without retention, all trades are kept
+    index = ClosedTradeIndex()
+    for trade in trades:
+        index.add(trade)
+    assert index.trades() == trades
+
+
+def test_local_trade_bt_trades_deprecated():
+    LocalTrade.reset_trades()
+    trade = LocalTrade(
+        pair="ETH/BTC",
+        stake_amount=0.001,
+        amount=10,
+        open_rate=0.01,
+        exchange="binance",
+        open_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        close_date=datetime(2024, 1, 1, 1, tzinfo=timezone.utc),
+        is_open=False,
+    )
+    LocalTrade.add_bt_trade(trade)
+    with pytest.warns(DeprecationWarning, match=r"LocalTrade\.bt_trades is deprecated"):
+        assert LocalTrade.bt_trades == [trade]
+    LocalTrade.reset_trades()
+
+
 @pytest.mark.usefixtures("init_persistence")
 @pytest.mark.parametrize("is_short", [True, False])
 def test_get_trades__query(fee, is_short):
@@ -2142,6 +2257,8 @@ def test_Trade_object_idem():
     )
     EXCLUDES2 = (
         "bt_trades",
+        "bt_trades_closed_index",
+        "bt_trades_results",
         "bt_trades_open",
         "bt_trades_open_pp",
         "bt_open_open_trade_count",
@@ -2713,6 +2830,70 @@ def test_select_filled_orders_usdt(fee):
     assert orders[0].stake_amount_filled == 0
 
 
+def test_backtest_order(fee):
+    def get_trade():
+        return LocalTrade(
+            pair="ADA/USDT",
+            stake_amount=60.0,
+            open_rate=2.0,
+            amount=30.0,
+            is_open=True,
+            open_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            fee_open=fee.return_value,
+            fee_close=fee.return_value,
+            exchange="binance",
+            leverage=1.0,
+            orders=[],
+        )
+
+    order_kwargs = {
+        "id": 1,
+        "ft_trade_id": 1,
+        "ft_pair": "ADA/USDT",
+        "ft_is_open": True,
+        "order_id": "1",
+        "symbol": "ADA/USDT",
+        "ft_order_side": "buy",
+        "side": "buy",
+        "order_type": "limit",
+        "status": "open",
+        "order_date": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "ft_price": 2.0,
+        "price": 2.0,
+        "average": 2.0,
+        "amount": 30.0,
+        "filled": 0,
+        "remaining": 30.0,
+        "cost": 60.0,
+        "ft_order_tag": "tag",
+    }
+    order = Order(**order_kwargs)
+    bt_order = BacktestOrder(**order_kwargs)
+    for o in (order, bt_order):
+        o._trade_bt = get_trade()
+        o._trade_bt.orders.append(o)
+
+    assert not hasattr(bt_order, "__dict__")
+    assert bt_order.funding_fee is None
+    assert bt_order.trade is bt_order._trade_bt
+    assert bt_order.stake_amount == order.stake_amount == 60.0
+    assert bt_order.to_json("buy") == order.to_json("buy")
+    assert bt_order.to_ccxt_object() == order.to_ccxt_object()
+    assert repr(bt_order) == repr(order)
+
+    close_date = datetime(2024, 1, 1, 0, 5, tzinfo=timezone.utc)
+    order.close_bt_order(close_date, order.trade)
+    bt_order.close_bt_order(close_date, bt_order.trade)
+    assert bt_order.to_json("buy", True) == order.to_json("buy", True)
+    assert bt_order.trade.to_json(True) == order.trade.to_json(True)
+    assert bt_order.safe_amount_after_fee == 30.0
+    assert not bt_order.ft_is_open
+
+    # Round-trips an object pickled by this test
+    restored = pickle.loads(pickle.dumps(bt_order))  # noqa: S301
+    assert restored.to_json("buy") == bt_order.to_json("buy")
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_order_to_ccxt(limit_buy_order_open, limit_sell_order_usdt_open):
     order = Order.parse_from_ccxt_object(limit_buy_order_open, "mocked", "buy")
@@ -2889,3 +3070,98 @@ def test_recalc_trade_from_orders_dca(data) -> None:
     trade = Trade.session.scalars(select(Trade)).first()
     assert trade
     assert not trade.has_open_orders
+
+
+def build_float_math_trade(seed: int, trading_mode: TradingMode, is_short: bool) -> LocalTrade:
+    rng = random.Random(seed)
+    open_rate = 10 ** rng.uniform(-6, 5)
+    amount = round(10 ** rng.uniform(-2, 4), 4)
+    fee = rng.choice([0.0, 0.0005, 0.001, 0.0025])
+    leverage = 1.0 if trading_mode == spot else round(rng.uniform(1, 10), 1)
+    open_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    trade = LocalTrade(
+        pair="ADA/USDT",
+        stake_amount=amount * open_rate / leverage,
+        amount=amount,
+        open_rate=open_rate,
+        fee_open=fee,
+        fee_close=fee,
+        exchange="binance",
+        open_date=open_date,
+        is_open=True,
+        is_short=is_short,
+        leverage=leverage,
+        trading_mode=trading_mode,
+    )
+    entry_side, exit_side = ("sell", "buy") if is_short else ("buy", "sell")
+    position = 0.0
+    for i in range(rng.randint(1, 4)):
+        # Partial exits of at most half the position - the trade remains open
+        if i > 0 and rng.random() < 0.3:
+            side = exit_side
+            order_amount = round(position * rng.uniform(0.1, 0.5), 4)
+            position -= order_amount
+        else:
+            side = entry_side
+            order_amount = round(amount * rng.uniform(0.1, 1.5), 4)
+            position += order_amount
+        price = open_rate * rng.uniform(0.8, 1.2)
+        trade.orders.append(
+            Order(
+                ft_order_side=side,
+                ft_pair=trade.pair,
+                ft_is_open=False,
+                status="closed",
+                symbol=trade.pair,
+                order_type="market",
+                side=side,
+                price=price,
+                average=price,
+                filled=order_amount,
+                remaining=0,
+                cost=order_amount * price,
+                order_date=open_date + timedelta(hours=i),
+                order_filled_date=open_date + timedelta(hours=i),
+                funding_fee=round(rng.uniform(-1, 1), 6) if trading_mode == futures else None,
+            )
+        )
+    return trade
+
+
+@pytest.mark.parametrize(
+    "trading_mode,is_short", [(spot, False), (futures, False), (futures, True)]
+)
+def test_float_math_parity(request, trading_mode, is_short):
+    """
+    Property test - float math stays within tolerance of the precise (FtPrecise) calculation.
+    """
+    tolerance = request.config.getoption("float_math_tolerance")
+    try:
+        for seed in range(300):
+            results = []
+            for use_float_math in (False, True):
+                LocalTrade.use_float_math = use_float_math
+                trade = build_float_math_trade(seed, trading_mode, is_short)
+                trade.recalc_trade_from_orders()
+                rate = trade.open_rate * random.Random(seed).uniform(0.5, 1.5)
+                profit = trade.calculate_profit(rate)
+                results.append(
+                    [
+                        trade.open_rate,
+                        trade.amount,
+                        trade.stake_amount,
+                        trade.max_stake_amount,
+                        trade.open_trade_value,
+                        trade.realized_profit,
+                        trade.calc_close_trade_value(rate),
+                        profit.profit_abs,
+                        profit.profit_ratio,
+                        profit.total_profit,
+                        profit.total_profit_ratio,
+                    ]
+                )
+            precise, fast = results
+            # Profits are rounded to 8 decimals - allow for a differently rounded last digit
+            assert fast == pytest.approx(precise, rel=tolerance, abs=1e-8), f"seed {seed}"
+    finally:
+        LocalTrade.use_float_math = False
@@ -0,0 +1,212 @@
+import sqlite3
+import subprocess
+import sys
+import time
+from contextlib import closing
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from freqtrade.persistence import KeyValueStore, Order, Trade, WriteBehind, init_db
+from freqtrade.persistence.pairlock import PairLock
+from freqtrade.util import dt_now
+
+
+def _create_trade(pair: str = "ETH/USDT") -> Trade:
+    trade = Trade(
+        pair=pair,
+        stake_amount=30.0,
+        amount=30.0,
+        open_rate=1.0,
+        fee_open=0.001,
+        fee_close=0.001,
+        exchange="binance",
+        open_date=dt_now(),
+        is_open=True,
+        stop_loss=0.8,
+        max_rate=1.0,
+    )
+    trade.orders.append(
+        Order(
+            ft_order_side="buy",
+            ft_pair=pair,
+            ft_is_open=True,
+            ft_amount=30.0,
+            ft_price=1.0,
+            order_id=f"{pair}-buy",
+            status="open",
+            order_type="limit",
+            side="buy",
+            price=1.0,
+            amount=30.0,
+            filled=0.0,
+            remaining=30.0,
+        )
+    )
+    return trade
+
+
+def _fill_order(order: Order) -> None:
+    order.status = "closed"
+    order.ft_is_open = False
+    order.filled = order.amount
+    order.remaining = 0.0
+
+
+def _committed(db_file: Path, query: str) -> list[tuple]:
+    """
+    Query the database through a separate connection - which only sees committed changes.
+    """
+    with closing(sqlite3.connect(db_file)) as conn:
+        return conn.execute(query).fetchall()
+
+
+def _wait_for(condition, timeout: float = 5) -> bool:
+    end = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > end:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+@pytest.fixture
+def db_file(tmp_path, default_conf):
+    yield tmp_path / "tradesv3.sqlite"
+    # Restore the in-memory database for other tests
+    init_db(default_conf["db_url"])
+
+
+def test_write_behind_coalesces_commits(db_file):
+    write_behind = WriteBehind(flush_interval=60)
+    init_db(f"sqlite:///{db_file}", write_behind=write_behind)
+    assert _committed(db_file, "PRAGMA journal_mode") == [("wal",)]
+
+    with write_behind.iteration():
+        trade = _create_trade()
+        Trade.session.add(trade)
+        Trade.commit()
+        # New trades and orders are written immediately
+        assert _committed(db_file, "SELECT pair, stop_loss FROM trades") == [("ETH/USDT", 0.8)]
+        assert _committed(db_file, "SELECT status FROM orders") == [("open",)]
+        assert not write_behind.pending
+
+        trade.stop_loss = 0.9
+        Trade.commit()
+        assert write_behind.pending
+        assert _committed(db_file, "SELECT stop_loss FROM trades") == [(0.8,)]
+
+        # Fills are written immediately - together with all changes so far
+        _fill_order(trade.orders[0])
+        Trade.commit()
+        assert not write_behind.pending
+        assert _committed(db_file, "SELECT stop_loss FROM trades") == [(0.9,)]
+        assert _committed(db_file, "SELECT status, filled FROM orders") == [("closed", 30.0)]
+
+        trade.max_rate = 1.2
+        Trade.commit()
+        assert write_behind.pending
+
+    # Writer waits for the flush interval
+    assert _committed(db_file, "SELECT max_rate FROM trades") == [(1.0,)]
+    write_behind.stop()
+    assert not write_behind.pending
+    assert _committed(db_file, "SELECT max_rate FROM trades") == [(1.2,)]
+
+    with write_behind.iteration():
+        # Exits are written immediately
+        trade.is_open = False
+        trade.close_rate = 1.1
+        Trade.commit()
+        assert not write_behind.pending
+        assert _committed(db_file, "SELECT is_open, close_rate FROM trades") == [(0, 1.1)]
+
+    write_behind.stop()
+
+
+def test_write_behind_outside_iteration(db_file):
+    write_behind = WriteBehind(flush_interval=60)
+    init_db(f"sqlite:///{db_file}", write_behind=write_behind)
+    trade = _create_trade()
+    Trade.session.add(trade)
+    Trade.commit()
+
+    # Commits outside of bot iterations (e.g. startup, API) are not deferred
+    trade.stop_loss = 0.9
+    Trade.commit()
+    assert not write_behind.pending
+    assert _committed(db_file, "SELECT stop_loss FROM trades") == [(0.9,)]
+    write_behind.stop()
+
+
+def test_write_behind_writer(db_file):
+    write_behind = WriteBehind(flush_interval=0.1)
+    init_db(f"sqlite:///{db_file}", write_behind=write_behind)
+
+    with write_behind.iteration():
+        PairLock.session.add(
+            PairLock(
+                pair="ETH/USDT",
+                lock_time=dt_now(),
+                lock_end_time=dt_now() + timedelta(minutes=5),
+                side="*",
+                active=True,
+            )
+        )
+        PairLock.session.commit()
+        KeyValueStore.store_value("test", "value")
+        assert write_behind.pending
+        time.sleep(0.3)
+        # The writer doesn't commit during bot iterations
+        assert _committed(db_file, "SELECT pair FROM pairlocks") == []
+        assert _committed(db_file, "SELECT string_value FROM KeyValueStore") == []
+
+    assert _wait_for(lambda: not write_behind.pending)
+    assert _committed(db_file, "SELECT pair FROM pairlocks") == [("ETH/USDT",)]
+    assert _committed(db_file, "SELECT string_value FROM KeyValueStore") == [("value",)]
+    write_behind.stop()
+
+
+def test_write_behind_disabled(default_conf):
+    assert WriteBehind.from_config(default_conf) is None
+    default_conf["db_durability"] = "fills"
+    default_conf["db_flush_interval"] = 5
+    write_behind = WriteBehind.from_config(default_conf)
+    assert write_behind.flush_interval == 5
+
+
+def test_write_behind_crash_recovery(db_file):
+    script = f"""
+import os
+
+from freqtrade.persistence import Trade, WriteBehind, init_db
+from tests.persistence.test_write_behind import _create_trade, _fill_order
+
+write_behind = WriteBehind(flush_interval=60)
+init_db("sqlite:///{db_file.as_posix()}", write_behind=write_behind)
+with write_behind.iteration():
+    trade = _create_trade()
+    Trade.session.add(trade)
+    Trade.commit()
+    _fill_order(trade.orders[0])
+    Trade.commit()
+    trade.stop_loss = 0.9
+    Trade.commit()
+    # Crash without committing deferred changes
+    os._exit(1)
+"""
+    res = subprocess.run(
+        [sys.executable, "-c", script], cwd=Path(__file__).parents[2], capture_output=True
+    )
+    assert res.returncode == 1, res.stderr.decode()
+
+    assert _committed(db_file, "PRAGMA integrity_check") == [("ok",)]
+    assert _committed(db_file, "PRAGMA journal_mode") == [("wal",)]
+    # The fill survived, the deferred change is lost
+    assert _committed(db_file, "SELECT status, filled FROM orders") == [("closed", 30.0)]
+    assert _committed(db_file, "SELECT stop_loss FROM trades") == [(0.8,)]
+
+    init_db(f"sqlite:///{db_file}")
+    trade = Trade.session.scalars(Trade.get_trades_query([Trade.is_open.is_(True)])).first()
+    assert trade.nr_of_successful_entries == 1
@@ -1,3 +1,4 @@
+import random
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -158,3 +159,77 @@ def test_PairLocks_reason(use_db):
 
     PairLocks.reset_locks()
     PairLocks.use_db = True
+
+
+def _scan_pair_locks(locks, pair, now, side):
+    # Reference implementation - list scan as used before the lock index
+    return [
+        lock
+        for lock in locks
+        if (
+            lock.lock_end_time >= now
+            and lock.active is True
+            and (pair is None or lock.pair == pair)
+            and (side is None or lock.side == "*" or lock.side == side)
+        )
+    ]
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_PairLocks_index_parity():
+    rng = random.Random(42)
+    PairLocks.timeframe = "5m"
+    PairLocks.use_db = False
+    PairLocks.reset_locks()
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    pairs = ["*", "ETH/BTC", "XRP/BTC", "LTC/BTC"]
+    sides = ["*", "long", "short"]
+
+    for i in range(500):
+        now = start + timedelta(minutes=5 * i)
+        lock = PairLocks.lock_pair(
+            rng.choice(pairs),
+            now + timedelta(minutes=rng.randint(0, 240)),
+            reason=rng.choice(["r1", "r2"]),
+            now=now,
+            side=rng.choice(sides),
+        )
+        if rng.random() < 0.1:
+            lock.active = False
+    PairLocks.unlock_reason("r2", start + timedelta(hours=20))
+
+    all_locks = list(PairLocks.get_all_locks())
+    assert len(all_locks) == 500
+
+    def check_parity(query_start):
+        for _ in range(300):
+            now = query_start + timedelta(minutes=rng.randint(0, 3000))
+            pair = rng.choice(pairs + [None, "NEO/BTC"])
+            side = rng.choice(sides + [None])
+            expected = _scan_pair_locks(all_locks, pair, now, side)
+            assert PairLocks.get_pair_locks(pair, now, side) == expected
+            assert PairLocks.is_pair_locked(pair or "ETH/BTC", now, side or "*") == (
+                len(_scan_pair_locks(all_locks, pair or "ETH/BTC", now, side or "*")) > 0
+                or len(_scan_pair_locks(all_locks, "*", now, side or "*")) > 0
+            )
+
+    check_parity(start - timedelta(hours=1))
+
+    # Expired locks are removed from the index, but remain available
+    compact_time = start + timedelta(hours=24)
+    PairLocks.compact_locks(compact_time)
+    assert len(PairLocks._index) == len(
+        [lock for lock in all_locks if lock.lock_end_time >= compact_time]
+    )
+    assert len(PairLocks._index) < len(all_locks)
+    assert len(PairLocks.get_all_locks()) == 500
+    check_parity(compact_time)
+
+    # Compacting to an earlier date doesn't change anything
+    index_len = len(PairLocks._index)
+    PairLocks.compact_locks(start)
+    assert len(PairLocks._index) == index_len
+
+    PairLocks.reset_locks()
+    assert len(PairLocks._index) == 0
+    PairLocks.use_db = True
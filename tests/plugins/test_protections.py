@@ -252,6 +252,21 @@ def test_protections_init(default_conf, timeframe, expected_lookback, expected_s
         assert man._protection_handlers[0]._unlock_at == expected_stop
 
 
+def test_protectionmanager_max_lookback_period(default_conf):
+    default_conf["timeframe"] = "5m"
+    man = ProtectionManager(default_conf, [])
+    assert man.max_lookback_period == timedelta(0)
+    man = ProtectionManager(
+        default_conf,
+        [
+            {"method": "CooldownPeriod", "stop_duration": 10},
+            {"method": "StoplossGuard", "lookback_period_candles": 24, "stop_duration": 10},
+            {"method": "LowProfitPairs", "lookback_period": 60, "stop_duration": 10},
+        ],
+    )
+    assert man.max_lookback_period == timedelta(minutes=120)
+
+
 @pytest.mark.parametrize("is_short", [False, True])
 @pytest.mark.usefixtures("init_persistence")
 def test_stoploss_guard(mocker, default_conf, fee, caplog, is_short):
@@ -4,12 +4,17 @@ Unit test file for rpc/api_server.py
 
 import asyncio
 import logging
+import queue
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import ANY, MagicMock, PropertyMock
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 import rapidjson
 import uvicorn
@@ -26,8 +31,10 @@ from freqtrade.loggers import setup_logging, setup_logging_pre
 from freqtrade.optimize.backtesting import Backtesting
 from freqtrade.persistence import Trade
 from freqtrade.rpc import RPC
-from freqtrade.rpc.api_server import ApiServer
+from freqtrade.rpc.api_server import ApiServer, backtest_queue
 from freqtrade.rpc.api_server.api_auth import create_token, get_user_from_token
+from freqtrade.rpc.api_server.api_v1 import ARROW_MEDIA_TYPE
+from freqtrade.rpc.api_server.backtest_queue import BacktestQueue, run_backtest_job
 from freqtrade.rpc.api_server.uvicorn_threaded import UvicornServer
 from freqtrade.rpc.api_server.webserver_bgwork import ApiBG
 from freqtrade.util.datetime_helpers import format_date
@@ -1909,6 +1916,79 @@ def test_api_pair_candles(botclient, ohlcv_history):
     ]
 
 
+def test_api_pair_candles_cached(botclient, ohlcv_history, mocker):
+    ftbot, client = botclient
+    timeframe = "5m"
+    ohlcv_history["enter_long"] = 0
+    ohlcv_history.loc[1, "enter_long"] = 1
+    ftbot.dataprovider._set_cached_df("XRP/BTC", timeframe, ohlcv_history, CandleType.SPOT)
+    convert_mock = mocker.spy(RPC, "_convert_dataframe_to_dict")
+    url = f"{BASE_URI}/pair_candles?limit=3&pair=XRP%2FBTC&timeframe={timeframe}"
+    headers = {"Authorization": _basic_auth_str(_TEST_USER, _TEST_PASS)}
+
+    rc = client.get(url, headers=headers)
+    assert_response(rc, needs_cors=False)
+    etag = rc.headers["ETag"]
+    resp = rc.json()
+    assert resp["length"] == 3
+    assert resp["enter_long_signals"] == 1
+    assert convert_mock.call_count == 1
+
+    # Converted once per analysis
+    rc = client.get(url, headers=headers)
+    assert rc.json() == resp
+    assert rc.headers["ETag"] == etag
+    assert convert_mock.call_count == 1
+
+    rc = client.get(url, headers={**headers, "If-None-Match": f'W/"other", {etag}'})
+    assert rc.status_code == 304
+    assert rc.content == b""
+
+    # Other columns / limits are converted separately
+    rc = client.get(url.replace("limit=3", "limit=2"), headers=headers)
+    assert rc.json()["length"] == 2
+    assert rc.headers["ETag"] != etag
+    assert convert_mock.call_count == 2
+
+    # Analyzing again invalidates the cache
+    ftbot.dataprovider._set_cached_df(
+        "XRP/BTC", timeframe, ohlcv_history.iloc[:-1], CandleType.SPOT
+    )
+    rc = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert_response(rc, needs_cors=False)
+    assert rc.headers["ETag"] != etag
+    assert rc.json()["data_stop_ts"] < resp["data_stop_ts"]
+    assert convert_mock.call_count == 3
+
+    # Arrow IPC stream
+    rc = client.get(url, headers={**headers, "Accept": ARROW_MEDIA_TYPE})
+    assert rc.status_code == 200
+    assert rc.headers["content-type"] == ARROW_MEDIA_TYPE
+    arrow_etag = rc.headers["ETag"]
+    table = pa.ipc.open_stream(rc.content).read_all()
+    metadata = rapidjson.loads(table.schema.metadata[b"freqtrade"])
+    assert metadata["pair"] == "XRP/BTC"
+    # 2 candles left after analyzing again
+    assert metadata["length"] == 2
+    df = table.to_pandas()
+    assert len(df) == 2
+    assert "__date_ts" in df.columns
+    assert "_enter_long_signal_close" in df.columns
+    pd.testing.assert_frame_equal(
+        df[["date", "close"]], ohlcv_history.iloc[:-1][["date", "close"]].reset_index(drop=True)
+    )
+    rc = client.get(
+        url, headers={**headers, "Accept": ARROW_MEDIA_TYPE, "If-None-Match": arrow_etag}
+    )
+    assert rc.status_code == 304
+
+    # Dict results are copies - modifying them doesn't change the cache
+    rpc = RPC(ftbot)
+    res = rpc._rpc_analysed_dataframe("XRP/BTC", timeframe, 3, None)
+    res["data"].clear()
+    assert len(rpc._rpc_analysed_dataframe("XRP/BTC", timeframe, 3, None)["data"]) == 2
+
+
 def test_api_pair_history(botclient, tmp_path, mocker):
     _ftbot, client = botclient
     _ftbot.config["user_data_dir"] = tmp_path
@@ -2642,6 +2722,161 @@ def test_api_backtesting(botclient, mocker, fee, caplog, tmp_path):
         Backtesting.cleanup()
 
 
+def _wait_for_job(job, timeout=30):
+    start = time.time()
+    while job.finished_at is None and time.time() - start < timeout:
+        time.sleep(0.05)
+    assert job.finished_at is not None
+
+
+def test_api_backtest_jobs(botclient, mocker, fee, caplog, tmp_path):
+    ftbot, client = botclient
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    # Run jobs in threads of this process, so mocks apply.
+    mocker.patch.object(
+        BacktestQueue, "_create_executor", lambda self: ThreadPoolExecutor(max_workers=1)
+    )
+    mocker.patch.object(
+        BacktestQueue,
+        "_create_manager",
+        lambda self: SimpleNamespace(
+            dict=dict, Event=threading.Event, Queue=queue.Queue, shutdown=MagicMock()
+        ),
+    )
+    try:
+        rc = client_get(client, f"{BASE_URI}/backtest/jobs")
+        assert_response(rc, 503)
+
+        ftbot.config["runmode"] = RunMode.WEBSERVER
+        ftbot.config["api_server"]["backtest_workers"] = 1
+        ftbot.config["user_data_dir"] = tmp_path
+        ftbot.config["exportfilename"] = tmp_path / "backtest_results"
+        ftbot.config["exportfilename"].mkdir()
+        data = {
+            "strategy": CURRENT_TEST_STRATEGY,
+            "timeframe": "5m",
+            "timerange": "20180110-20180111",
+            "max_open_trades": 3,
+            "stake_amount": 100,
+            "dry_run_wallet": 1000,
+            "enable_protections": False,
+        }
+        rc = client_post(client, f"{BASE_URI}/backtest/jobs", data=data)
+        assert_response(rc)
+        result = rc.json()
+        job_id = result["job_id"]
+        assert result["strategy"] == CURRENT_TEST_STRATEGY
+        assert result["status"] in ("queued", "running")
+        assert ApiBG.backtest_queue.workers == 1
+        _wait_for_job(ApiBG.backtest_queue.get(job_id))
+
+        rc = client_get(client, f"{BASE_URI}/backtest/jobs/{job_id}")
+        assert_response(rc)
+        result = rc.json()
+        assert result["status"] == "ended"
+        assert not result["running"]
+        assert result["progress"] == 1
+        assert result["error"] is None
+        assert result["backtest_result"]["strategy"][CURRENT_TEST_STRATEGY]
+        assert job_id[:8] in result["filename"]
+        # Results are stored, even without export
+        assert (tmp_path / "backtest_results" / f"{result['filename']}.zip").is_file()
+
+        # Same data - reuses the loaded data
+        data["stake_amount"] = 101
+        load_mock = mocker.spy(Backtesting, "load_bt_data")
+        rc = client_post(client, f"{BASE_URI}/backtest/jobs", data=data)
+        job_id2 = rc.json()["job_id"]
+        _wait_for_job(ApiBG.backtest_queue.get(job_id2))
+        assert load_mock.call_count == 0
+        assert log_has("Reusing loaded data of a previous backtest job.", caplog)
+
+        mocker.patch(
+            "freqtrade.optimize.backtesting.Backtesting.backtest_one_strategy",
+            side_effect=DependencyException("DeadBeef"),
+        )
+        data["stake_amount"] = 102
+        rc = client_post(client, f"{BASE_URI}/backtest/jobs", data=data)
+        job_id3 = rc.json()["job_id"]
+        _wait_for_job(ApiBG.backtest_queue.get(job_id3))
+        assert log_has(f"Backtest job {job_id3} caused an error: DeadBeef", caplog)
+
+        rc = client_get(client, f"{BASE_URI}/backtest/jobs")
+        assert_response(rc)
+        result = rc.json()
+        assert [job["job_id"] for job in result] == [job_id, job_id2, job_id3]
+        assert [job["status"] for job in result] == ["ended", "ended", "error"]
+        assert result[2]["error"] == "DeadBeef"
+        assert all(job["backtest_result"] is None for job in result)
+
+        # Cancel a job which didn't start yet
+        executor = ApiBG.backtest_queue._executor
+        ApiBG.backtest_queue._executor = MagicMock()
+        ApiBG.backtest_queue._executor.submit = MagicMock(side_effect=lambda *args: Future())
+        rc = client_post(client, f"{BASE_URI}/backtest/jobs", data=data)
+        job_id4 = rc.json()["job_id"]
+        assert rc.json()["status"] == "queued"
+        rc = client_delete(client, f"{BASE_URI}/backtest/jobs/{job_id4}")
+        assert_response(rc)
+        assert rc.json()["status"] == "cancelled"
+        assert ApiBG.backtest_queue.get(job_id4).cancel_event.is_set()
+        ApiBG.backtest_queue._executor = executor
+
+        # Remove finished jobs
+        rc = client_delete(client, f"{BASE_URI}/backtest/jobs/{job_id}")
+        assert_response(rc)
+        assert rc.json()["status"] == "ended"
+        rc = client_get(client, f"{BASE_URI}/backtest/jobs/{job_id}")
+        assert_response(rc, 404)
+        rc = client_delete(client, f"{BASE_URI}/backtest/jobs/{job_id}")
+        assert_response(rc, 404)
+
+        # Disallow base64 strategies
+        data["strategy"] = "xx:cHJpbnQoImhlbGxvIHdvcmxkIik="
+        rc = client_post(client, f"{BASE_URI}/backtest/jobs", data=data)
+        assert_response(rc, 500)
+    finally:
+        if ApiBG.backtest_queue:
+            ApiBG.backtest_queue.shutdown()
+            ApiBG.backtest_queue = None
+        backtest_queue._data_cache.clear()
+        Backtesting.cleanup()
+
+
+def test_backtest_queue_not_started(default_conf, mocker, caplog):
+    caplog.set_level(logging.DEBUG)
+    bt_queue = BacktestQueue()
+    mocker.patch.object(bt_queue, "_start")
+    with pytest.raises(OperationalException, match="Backtest worker processes are not running"):
+        bt_queue.submit("abcd", default_conf)
+
+    # Progress of a shut down manager can't be read
+    progress = MagicMock()
+    progress.keys.side_effect = EOFError()
+    job = backtest_queue.BacktestJob(
+        job_id="abcd",
+        strategy=CURRENT_TEST_STRATEGY,
+        config=default_conf,
+        progress=progress,
+        cancel_event=threading.Event(),
+    )
+    future = Future()
+    future.set_result({"result": {}, "filename": "abcd"})
+    bt_queue._job_done(job, future)
+    assert job.finished_at is not None
+    assert job.final_progress == {}
+    assert log_has_re(r"Could not read final progress of backtest job abcd", caplog)
+
+
+def test_run_backtest_job_cancelled(default_conf):
+    cancel_event = threading.Event()
+    cancel_event.set()
+    progress = {}
+    with pytest.raises(DependencyException, match="Stop requested"):
+        run_backtest_job("abcd", default_conf, progress, cancel_event)
+    assert progress == {}
+
+
 def test_api_backtest_history(botclient, mocker, testdatadir):
     ftbot, client = botclient
     mocker.patch(
@@ -38,6 +38,7 @@ from freqtrade.persistence.models import Order
 from freqtrade.rpc import RPC
 from freqtrade.rpc.rpc import RPCException
 from freqtrade.rpc.telegram import Telegram, authorized_only
+from freqtrade.rpc.telegram_sender import MessagePriority
 from freqtrade.util.datetime_helpers import dt_now
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
@@ -62,6 +63,8 @@ def mock_exchange_loop(mocker):
 def default_conf(default_conf) -> dict:
     # Telegram is enabled by default
     default_conf["telegram"]["enabled"] = True
+    # Don't share the rate limit through the system's temporary directory
+    default_conf["telegram"]["rate_limit_dir"] = None
     return default_conf
 
 
@@ -2763,6 +2766,51 @@ async def test__send_msg_network_error(default_conf, mocker, caplog) -> None:
     assert log_has("Telegram NetworkError: Oh snap! Trying one more time.", caplog)
 
 
+def test_send_msg_telegram_sender(default_conf, mocker) -> None:
+    default_conf["telegram"]["notification_settings"]["exit_fill"] = "silent"
+    telegram, _, msg_mock = get_telegram_testobject(mocker, default_conf)
+    telegram._sender = MagicMock()
+
+    telegram.send_msg({"type": RPCMessageType.STATUS, "status": "running"})
+    telegram.send_msg(
+        {
+            "type": RPCMessageType.EXIT_FILL,
+            "trade_id": 1,
+            "exchange": "Binance",
+            "pair": "KEY/ETH",
+            "leverage": 1.0,
+            "direction": "Long",
+            "gain": "loss",
+            "limit": 3.201e-05,
+            "amount": 1333.3333333333335,
+            "order_type": "limit",
+            "open_rate": 7.5e-05,
+            "close_rate": 3.201e-05,
+            "profit_amount": -0.05746268,
+            "profit_ratio": -0.57405275,
+            "stake_currency": "ETH",
+            "quote_currency": "ETH",
+            "base_currency": "KEY",
+            "fiat_currency": None,
+            "enter_tag": "buy_signal1",
+            "exit_reason": ExitType.STOP_LOSS.value,
+            "open_date": dt_now() - timedelta(days=1),
+            "close_date": dt_now(),
+        }
+    )
+    # Notifications are queued to the shared sender
+    assert msg_mock.call_count == 0
+    assert telegram._sender.enqueue.call_count == 2
+    args, kwargs = telegram._sender.enqueue.call_args_list[0]
+    assert args == (default_conf["telegram"]["chat_id"], "*Status:* `running`")
+    assert kwargs["priority"] == MessagePriority.LOW
+    assert kwargs["disable_notification"] is False
+    args, kwargs = telegram._sender.enqueue.call_args_list[1]
+    assert "Exited KEY/ETH" in args[1]
+    assert kwargs["priority"] == MessagePriority.HIGH
+    assert kwargs["disable_notification"] is True
+
+
 @pytest.mark.filterwarnings("ignore:.*ChatPermissions")
 async def test__send_msg_keyboard(default_conf, mocker, caplog) -> None:
     mocker.patch("freqtrade.rpc.telegram.Telegram._init", MagicMock())
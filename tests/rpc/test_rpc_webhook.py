@@ -1,6 +1,9 @@
 # pragma pylint: disable=missing-docstring, C0103, protected-access
 
+import asyncio
 import logging
+import threading
+import time
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 
@@ -9,14 +12,16 @@ from requests import RequestException
 from freqtrade.enums import ExitType, RPCMessageType
 from freqtrade.rpc import RPC
 from freqtrade.rpc.discord import Discord
+from freqtrade.rpc.notification_dispatcher import NotificationDispatcher
 from freqtrade.rpc.webhook import Webhook
-from tests.conftest import get_patched_freqtradebot, log_has
+from tests.conftest import get_patched_freqtradebot, log_has, log_has_re
 
 
 def get_webhook_dict() -> dict:
     return {
         "enabled": True,
         "url": "https://maker.ifttt.com/trigger/freqtrade_test/with/key/c764udvJ5jfSlswVRukZZ2/",
+        "async_delivery": False,
         "webhookentry": {
             # Intentionally broken, as "entry" should have priority.
             "value1": "Buying {pair55555}",
@@ -65,6 +70,8 @@ def test__init__(mocker, default_conf):
     default_conf["webhook"] = {"enabled": True, "url": "https://DEADBEEF.com"}
     webhook = Webhook(RPC(get_patched_freqtradebot(mocker, default_conf)), default_conf)
     assert webhook._config == default_conf
+    assert isinstance(webhook._dispatcher, NotificationDispatcher)
+    webhook.cleanup()
 
 
 def test_send_msg_webhook(default_conf, mocker):
@@ -445,7 +452,11 @@ def test__send_msg_with_raw_format(default_conf, mocker, caplog):
 
 
 def test_send_msg_discord(default_conf, mocker):
-    default_conf["discord"] = {"enabled": True, "webhook_url": "https://webhookurl..."}
+    default_conf["discord"] = {
+        "enabled": True,
+        "webhook_url": "https://webhookurl...",
+        "async_delivery": False,
+    }
     msg_mock = MagicMock()
     mocker.patch("freqtrade.rpc.webhook.Webhook._send_msg", msg_mock)
     discord = Discord(RPC(get_patched_freqtradebot(mocker, default_conf)), default_conf)
@@ -477,3 +488,85 @@ def test_send_msg_discord(default_conf, mocker):
     assert "title" in msg_mock.call_args_list[0][0][0]["embeds"][0]
     assert "color" in msg_mock.call_args_list[0][0][0]["embeds"][0]
     assert "fields" in msg_mock.call_args_list[0][0][0]["embeds"][0]
+    assert msg_mock.call_args_list[0][0][1] == RPCMessageType.EXIT_FILL
+
+
+def _wait_for(condition, timeout=5) -> None:
+    end = time.time() + timeout
+    while not condition() and time.time() < end:
+        time.sleep(0.01)
+
+
+def test_notification_dispatcher_send_retry(caplog):
+    calls = []
+
+    async def send(session, payloads):
+        calls.append(payloads)
+        if len(calls) < 3:
+            raise ValueError("Failed")
+
+    dispatcher = NotificationDispatcher("test", send, retries=2, retry_delay=0.01)
+    dispatcher.enqueue({"value": 1})
+    _wait_for(lambda: dispatcher.metrics["sent"] == 1)
+    # Delivered on the 2nd retry
+    assert calls == [[{"value": 1}]] * 3
+    assert dispatcher.metrics["retries"] == 2
+    assert log_has_re(r"Could not deliver notification to test\. Exception: Failed", caplog)
+
+    dispatcher.enqueue({"value": 2})
+    _wait_for(lambda: len(calls) == 4)
+    dispatcher.stop()
+    assert dispatcher.metrics == {
+        "queued": 2,
+        "sent": 2,
+        "failed": 0,
+        "dropped": 0,
+        "retries": 2,
+        "batches": 0,
+    }
+    # Not accepted after stopping
+    dispatcher.enqueue({"value": 3})
+    assert log_has("Notification for test dropped, dispatcher stopped.", caplog)
+
+
+def test_notification_dispatcher_batch_overflow(caplog):
+    calls = []
+    gate = threading.Event()
+
+    async def send(session, payloads):
+        calls.append(payloads)
+        await asyncio.to_thread(gate.wait)
+
+    dispatcher = NotificationDispatcher("test", send, queue_size=4, batch_size=2, batch_delay=0.01)
+    dispatcher.enqueue("x")
+    # Worker is blocked delivering "x", so further messages pile up
+    _wait_for(lambda: len(calls) == 1)
+    for payload in ("a", "b", "c"):
+        dispatcher.enqueue(payload, batchable=True)
+    dispatcher.enqueue("d")
+    dispatcher.enqueue("e", batchable=True)
+    assert log_has_re(r"Notification queue for test is full, dropped 1 messages so far\.", caplog)
+    gate.set()
+    dispatcher.stop()
+
+    # "a" was dropped, "d" is not batchable
+    assert calls == [["x"], ["b", "c"], ["d"], ["e"]]
+    assert dispatcher.metrics["dropped"] == 1
+    assert dispatcher.metrics["sent"] == 5
+    assert dispatcher.metrics["batches"] == 1
+
+
+async def test_webhook_async_send_msg(default_conf, mocker):
+    default_conf["discord"] = {"enabled": True, "webhook_url": "https://webhookurl..."}
+    discord = Discord(RPC(get_patched_freqtradebot(mocker, default_conf)), default_conf)
+    discord.cleanup()
+    session = MagicMock()
+    response = MagicMock()
+    session.post.return_value.__aenter__.return_value = response
+
+    payloads = [{"embeds": [{"title": "a"}]}, {"embeds": [{"title": "b"}]}]
+    await discord._async_send_msg(session, payloads)
+    assert session.post.call_count == 1
+    assert session.post.call_args[0] == ("https://webhookurl...",)
+    assert session.post.call_args[1]["json"] == {"embeds": [{"title": "a"}, {"title": "b"}]}
+    assert response.raise_for_status.call_count == 1
@@ -0,0 +1,193 @@
+# pragma pylint: disable=missing-docstring, C0103, protected-access
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from telegram.error import NetworkError, RetryAfter, TelegramError
+
+from freqtrade.enums import RPCMessageType
+from freqtrade.rpc.telegram_sender import (
+    MessagePriority,
+    SharedTokenBucket,
+    TelegramSender,
+    TokenBucket,
+    _senders,
+    get_telegram_sender,
+    message_priority,
+    shared_rate_limit_file,
+)
+from tests.conftest import log_has, log_has_re
+
+
+def get_bot():
+    bot = MagicMock()
+    bot.token = "1234:DEADBEEF"
+    bot.send_message = AsyncMock()
+    return bot
+
+
+def test_message_priority():
+    assert message_priority(RPCMessageType.EXIT_FILL) == MessagePriority.HIGH
+    assert message_priority(RPCMessageType.ENTRY_FILL) == MessagePriority.HIGH
+    assert message_priority(RPCMessageType.ENTRY) == MessagePriority.NORMAL
+    assert message_priority(RPCMessageType.STATUS) == MessagePriority.LOW
+    assert message_priority(RPCMessageType.STRATEGY_MSG) == MessagePriority.LOW
+
+
+def test_token_bucket():
+    bucket = TokenBucket(2.0, 2)
+    bucket._last = 100.0
+    assert bucket.delay(100.0) == 0
+    bucket.consume(100.0)
+    bucket.consume(100.0)
+    assert bucket.delay(100.0) == 0.5
+    assert bucket.delay(100.25) == 0.25
+    assert bucket.delay(100.5) == 0
+    bucket.pause(100.5, 3)
+    assert bucket.delay(100.5) == 3.5
+    bucket._last = 100.5
+    assert bucket.acquire(104.0) == 0
+    assert bucket.acquire(104.0) == 0.5
+
+
+def test_shared_token_bucket(tmp_path, time_machine):
+    time_machine.move_to(1_700_000_000, tick=False)
+    file = shared_rate_limit_file("1234:DEADBEEF", tmp_path)
+    assert "DEADBEEF" not in file.name
+    # Buckets of two processes using the same token
+    bucket1 = SharedTokenBucket(file, 2.0, 2)
+    bucket2 = SharedTokenBucket(file, 2.0, 2)
+    assert bucket1.acquire(0) == 0
+    assert bucket2.acquire(0) == 0
+    # Both tokens are used up - for both buckets
+    assert bucket1.acquire(0) == 0.5
+    assert bucket2.delay(0) == 0.5
+    time_machine.move_to(1_700_000_000.5, tick=False)
+    assert bucket2.acquire(0) == 0
+    assert bucket1.delay(0) == 0.5
+    # Flood limit pauses all processes
+    bucket1.pause(0, 3)
+    assert bucket2.delay(0) == 3.5
+    bucket1.close()
+    bucket2.close()
+
+
+async def test_telegram_sender_coalesce_priority():
+    bot = get_bot()
+    sender = TelegramSender(bot, asyncio.get_running_loop(), chat_rate=10)
+    sender.enqueue(1, "status", MessagePriority.LOW, parse_mode="Markdown")
+    sender.enqueue(1, "fill", MessagePriority.HIGH, parse_mode="Markdown")
+    sender.enqueue(1, "exit", MessagePriority.HIGH, parse_mode="Markdown")
+    sender.enqueue(1, "html", MessagePriority.HIGH, parse_mode="HTML")
+    sender.enqueue(1, "reply", coalesce=False, parse_mode="Markdown")
+    sender.enqueue(2, "other chat", parse_mode="Markdown")
+    sender._refs = 1
+    await sender.close()
+
+    sent = [(c[0][0], c[1]["text"]) for c in bot.send_message.call_args_list]
+    # Fills and exits first - messages with identical options are combined.
+    # Chat 1 exhausted its burst, so "status" is delayed behind the other chat.
+    assert sent == [
+        (1, "fill\n\nexit"),
+        (1, "html"),
+        (1, "reply"),
+        (2, "other chat"),
+        (1, "status"),
+    ]
+    assert sender.metrics["queued"] == 6
+    assert sender.metrics["sent"] == 5
+    assert sender.metrics["coalesced"] == 1
+    assert sender.metrics["latency_max"] >= sender.metrics["latency_avg"] > 0
+    assert sender.queue_size == 0
+
+
+async def test_telegram_sender_chat_rate_limit():
+    bot = get_bot()
+    sender = TelegramSender(bot, asyncio.get_running_loop(), chat_rate=5, chat_burst=1)
+    for i in range(3):
+        sender.enqueue(1, f"msg{i}", coalesce=False)
+    sender.enqueue(2, "other chat")
+    await asyncio.sleep(0.05)
+    # Other chats are not held up by a busy chat
+    assert bot.send_message.call_count == 2
+    assert bot.send_message.call_args_list[1][0][0] == 2
+    await asyncio.sleep(0.5)
+    assert bot.send_message.call_count == 4
+    assert sender.metrics["latency_max"] >= 0.35
+    sender._refs = 1
+    await sender.close()
+
+
+async def test_telegram_sender_errors(caplog):
+    bot = get_bot()
+    bot.send_message = AsyncMock(
+        side_effect=[RetryAfter(0.1), NetworkError("Oh snap"), None, TelegramError("DeadBEEF")]
+    )
+    sender = TelegramSender(bot, asyncio.get_running_loop())
+    sender.enqueue(1, "first")
+    await asyncio.sleep(0.05)
+    assert log_has_re(r"Telegram flood limit reached, retrying in 0.1s\.", caplog)
+    assert bot.send_message.call_count == 1
+    await asyncio.sleep(0.2)
+    # Retried after the flood limit, and once more after the network error
+    assert bot.send_message.call_count == 3
+    assert log_has("Telegram NetworkError: Oh snap! Trying one more time.", caplog)
+    assert sender.metrics["sent"] == 1
+    assert sender.metrics["retries"] == 1
+
+    sender.enqueue(1, "second")
+    sender._refs = 1
+    await sender.close()
+    assert log_has("TelegramError: DeadBEEF! Giving up on that message.", caplog)
+    assert sender.metrics["failed"] == 1
+
+
+async def test_telegram_sender_unexpected_error(caplog):
+    bot = get_bot()
+    bot.send_message = AsyncMock(side_effect=[ValueError("Oh snap"), None])
+    sender = TelegramSender(bot, asyncio.get_running_loop())
+    sender.enqueue(1, "first")
+    sender.enqueue(2, "second")
+    sender._refs = 1
+    await sender.close()
+    assert log_has("Unexpected error sending Telegram message to 1.", caplog)
+    # The worker keeps delivering messages
+    assert bot.send_message.call_count == 2
+    assert sender.metrics["failed"] == 1
+    assert sender.metrics["sent"] == 1
+
+
+async def test_get_telegram_sender(caplog, tmp_path):
+    bot = get_bot()
+    sender = get_telegram_sender(bot, rate_limit_dir=tmp_path)
+    assert isinstance(sender._global_bucket, SharedTokenBucket)
+    assert shared_rate_limit_file(bot.token, tmp_path).is_file()
+    assert get_telegram_sender(bot) is sender
+    assert _senders[bot.token] is sender
+
+    await sender.close()
+    # Still used by another user
+    assert _senders[bot.token] is sender
+    sender.enqueue(1, "msg")
+    await sender.close()
+    assert bot.send_message.call_count == 1
+    assert bot.token not in _senders
+    assert log_has_re(r"Telegram sender metrics: .*", caplog)
+
+    sender.enqueue(1, "too late")
+    await asyncio.sleep(0)
+    assert log_has("Telegram message to 1 dropped, sender stopped.", caplog)
+    sender2 = get_telegram_sender(bot, rate_limit_dir=None)
+    assert sender2 is not sender
+    assert type(sender2._global_bucket) is TokenBucket
+    _senders.clear()
+
+
+async def test_get_telegram_sender_no_token(tmp_path):
+    bot = get_bot()
+    # e.g. a mocked bot
+    bot.token = MagicMock()
+    sender = get_telegram_sender(bot, rate_limit_dir=tmp_path)
+    assert type(sender._global_bucket) is TokenBucket
+    assert list(tmp_path.iterdir()) == []
+    _senders.clear()
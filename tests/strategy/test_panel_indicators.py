@@ -0,0 +1,188 @@
+# pragma pylint: disable=missing-docstring, protected-access, invalid-name
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import freqtrade.vendor.qtpylib.indicators as qtpylib
+from freqtrade.strategy import panel_indicators as pi
+from freqtrade.strategy.panel_indicators import IndicatorPanel
+from tests.conftest import generate_test_data
+from tests.strategy.strats.strategy_test_v3 import StrategyTestV3
+
+
+def get_data(sizes=(300, 250, 31)) -> dict[str, pd.DataFrame]:
+    return {
+        f"PAIR{idx}/USDT": generate_test_data("5m", size, random_seed=idx)
+        for idx, size in enumerate(sizes)
+    }
+
+
+# name, panel function, per-series function
+INDICATORS = [
+    ("sma", lambda p: pi.sma(p["close"], 20), lambda df: qtpylib.sma(df["close"], 20)),
+    (
+        "sma_min_periods",
+        lambda p: pi.rolling_mean(p["close"], 20, 5),
+        lambda df: qtpylib.rolling_mean(df["close"], 20, 5),
+    ),
+    (
+        "std",
+        lambda p: pi.rolling_std(p["close"], 20),
+        lambda df: qtpylib.rolling_std(df["close"], 20),
+    ),
+    (
+        "std_min_periods",
+        lambda p: pi.rolling_std(p["close"], 20, 3),
+        lambda df: qtpylib.rolling_std(df["close"], 20, 3),
+    ),
+    (
+        "min",
+        lambda p: pi.rolling_min(p["low"], 14),
+        lambda df: qtpylib.rolling_min(df["low"], 14),
+    ),
+    (
+        "max",
+        lambda p: pi.rolling_max(p["high"], 14),
+        lambda df: qtpylib.rolling_max(df["high"], 14),
+    ),
+    ("wma", lambda p: pi.wma(p["close"], 50), lambda df: qtpylib.wma(df["close"], 50)),
+    ("hma", lambda p: pi.hma(p["close"], 16), lambda df: qtpylib.hma(df["close"], 16)),
+    ("rsi", lambda p: pi.rsi(p["close"], 14), lambda df: qtpylib.rsi(df["close"], 14)),
+    ("atr", lambda p: pi.atr(p, 14), lambda df: qtpylib.atr(df, 14)),
+    ("atr_exp", lambda p: pi.atr(p, 14, exp=True), lambda df: qtpylib.atr(df, 14, exp=True)),
+    ("vwap", lambda p: pi.rolling_vwap(p, 20), lambda df: qtpylib.rolling_vwap(df, 20)),
+    (
+        "bb_upper",
+        lambda p: pi.bollinger_bands(p["close"], 20)["upper"],
+        lambda df: qtpylib.bollinger_bands(df["close"], 20)["upper"],
+    ),
+    (
+        "bb_lower",
+        lambda p: pi.bollinger_bands(p["close"], 20)["lower"],
+        lambda df: qtpylib.bollinger_bands(df["close"], 20)["lower"],
+    ),
+]
+
+
+@pytest.mark.parametrize("name,panel_fn,series_fn", INDICATORS)
+def test_panel_indicators_parity(name, panel_fn, series_fn):
+    data = get_data()
+    # Gaps within the data
+    data["PAIR1/USDT"].loc[100:104, ["high", "low", "close"]] = np.nan
+    panel = IndicatorPanel(data)
+    panel[name] = panel_fn(panel)
+    result = panel.apply()
+
+    for pair, df in data.items():
+        expected = np.asarray(series_fn(df), dtype=np.float64)
+        assert name not in df.columns
+        np.testing.assert_allclose(result[pair][name].to_numpy(), expected, rtol=1e-9, atol=1e-9)
+
+
+def test_indicator_panel():
+    data = get_data()
+    panel = IndicatorPanel(data)
+    assert panel.pairs == ["PAIR0/USDT", "PAIR1/USDT", "PAIR2/USDT"]
+    assert panel.shape == (300, 3)
+    assert "close" in panel
+    assert "sma" not in panel
+
+    close = panel["close"]
+    assert close is panel["close"]
+    assert np.array_equal(close[:31, 2], data["PAIR2/USDT"]["close"].to_numpy())
+    # Shorter pairs are padded with NaN
+    assert np.isnan(close[31:, 2]).all()
+
+    with pytest.raises(ValueError, match=r"Indicator sma has shape \(299, 3\)"):
+        panel["sma"] = close[1:]
+
+    panel["sma"] = pi.sma(close, 10)
+    assert "sma" in panel
+    result = panel.apply()
+    assert list(result) == panel.pairs
+    for pair, df in result.items():
+        assert len(df) == len(data[pair])
+        assert list(df.columns) == [*data[pair].columns, "sma"]
+
+    assert IndicatorPanel({}).shape == (0, 0)
+
+
+class PanelStrategy(StrategyTestV3):
+    def populate_panel_indicators(self, panel):
+        panel["panel_rsi"] = pi.rsi(panel["close"], 14)
+        panel["panel_sma"] = pi.sma(panel["close"], 20)
+
+
+def test_advise_all_indicators_panel(mocker):
+    data = get_data()
+    strategy = PanelStrategy({})
+    assert strategy._ft_use_panel is True
+    assert StrategyTestV3({})._ft_use_panel is False
+    panel_mock = mocker.spy(strategy, "populate_panel_indicators")
+
+    processed = strategy.advise_all_indicators(data)
+    # One call for all pairs
+    assert panel_mock.call_count == 1
+    assert strategy._ft_panel_populated is False
+    for pair, df in processed.items():
+        assert "panel_rsi" not in data[pair].columns
+        assert np.allclose(df["panel_rsi"], qtpylib.rsi(data[pair]["close"], 14), equal_nan=True)
+        assert np.allclose(df["panel_sma"], qtpylib.sma(data[pair]["close"], 20), equal_nan=True)
+        # Regular indicators are still populated
+        assert "rsi" in df.columns
+
+    # Dry / live runs populate a panel per pair
+    df = strategy.advise_indicators(data["PAIR1/USDT"], {"pair": "PAIR1/USDT"})
+    assert panel_mock.call_count == 2
+    assert panel_mock.call_args[0][0].pairs == ["PAIR1/USDT"]
+    pd.testing.assert_frame_equal(df, processed["PAIR1/USDT"])
+
+
+@pytest.mark.longrun
+def test_panel_indicators_benchmark():
+    pairs = 100
+    size = 500_000
+    rng = np.random.default_rng(42)
+    close = 20 + np.cumsum(rng.normal(0, 0.1, size=(size, pairs)), axis=0)
+    data = {
+        f"PAIR{idx}/USDT": pd.DataFrame(
+            {
+                "high": close[:, idx] + rng.random(size),
+                "low": close[:, idx] - rng.random(size),
+                "close": close[:, idx],
+                "volume": rng.random(size) * 100,
+            }
+        )
+        for idx in range(pairs)
+    }
+
+    start = time.perf_counter()
+    for df in data.values():
+        df.assign(
+            sma=qtpylib.sma(df["close"], 50),
+            std=qtpylib.rolling_std(df["close"], 50),
+            wma=qtpylib.wma(df["close"], 50),
+            rsi=qtpylib.rsi(df["close"], 14),
+            atr=qtpylib.atr(df, 14),
+            vwap=qtpylib.rolling_vwap(df, 50),
+        )
+    series_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    panel = IndicatorPanel(data)
+    panel["sma"] = pi.sma(panel["close"], 50)
+    panel["std"] = pi.rolling_std(panel["close"], 50)
+    panel["wma"] = pi.wma(panel["close"], 50)
+    panel["rsi"] = pi.rsi(panel["close"], 14)
+    panel["atr"] = pi.atr(panel, 14)
+    panel["vwap"] = pi.rolling_vwap(panel, 50)
+    panel.apply()
+    panel_time = time.perf_counter() - start
+
+    print(
+        f"{pairs} pairs x {size} candles: per series {series_time:.2f}s, "
+        f"panel {panel_time:.2f}s ({series_time / panel_time:.1f}x)"
+    )
+    assert panel_time < series_time
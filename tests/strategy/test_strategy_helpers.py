@@ -6,6 +6,11 @@ from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import CandleType
 from freqtrade.resolvers.strategy_resolver import StrategyResolver
 from freqtrade.strategy import merge_informative_pair, stoploss_from_absolute, stoploss_from_open
+from freqtrade.strategy.informative_decorator import (
+    InformativeData,
+    _create_and_merge_informative_pair,
+)
+from freqtrade.strategy.strategy_helper import _merge_alignments
 from tests.conftest import generate_test_data, get_patched_exchange
 
 
@@ -217,6 +222,44 @@ def test_merge_informative_pair_suffix_append_timeframe():
         merge_informative_pair(data, informative, "15m", "1h", suffix="suf")
 
 
+@pytest.mark.parametrize("ffill", [True, False])
+def test_merge_informative_pair_alignment(mocker, ffill):
+    _merge_alignments.clear()
+    data = generate_test_data("15m", 200)
+    informative = generate_test_data("1h", 60)
+    informative["flag"] = informative["close"] > 20
+    informative["counter"] = np.arange(len(informative))
+    # Missing candles on both sides
+    data = data.drop(index=[30, 31, 32, 100]).reset_index(drop=True)
+    informative = informative.drop(index=[5, 20]).reset_index(drop=True)
+
+    result = merge_informative_pair(data, informative, "15m", "1h", ffill=ffill)
+    alignment = _merge_alignments[("15m", "1h")]
+    # Reused for another pair with the same dates
+    data2 = data.copy()
+    data2["close"] += 1
+    result2 = merge_informative_pair(data2, informative, "15m", "1h", ffill=ffill)
+    assert _merge_alignments[("15m", "1h")] is alignment
+    assert result2["close_1h"].equals(result["close_1h"])
+
+    mocker.patch("freqtrade.strategy.strategy_helper._get_merge_alignment", return_value=None)
+    expected = merge_informative_pair(data, informative, "15m", "1h", ffill=ffill)
+    pd.testing.assert_frame_equal(result, expected)
+
+    # Different dates are aligned again (row 11 is matched by an informative candle)
+    mocker.stopall()
+    result3 = merge_informative_pair(data.iloc[11:], informative, "15m", "1h", ffill=ffill)
+    assert _merge_alignments[("15m", "1h")] is not alignment
+    # Compared to a pandas merge of the same rows - dtypes depend on missing values
+    # (flag_1h is bool without them), so a slice of the full merge can't be used.
+    mocker.patch("freqtrade.strategy.strategy_helper._get_merge_alignment", return_value=None)
+    expected3 = merge_informative_pair(data.iloc[11:], informative, "15m", "1h", ffill=ffill)
+    pd.testing.assert_frame_equal(result3, expected3)
+    pd.testing.assert_frame_equal(
+        result3, expected.iloc[11:].reset_index(drop=True), check_dtype=False
+    )
+
+
 @pytest.mark.parametrize(
     "side,profitrange",
     [
@@ -404,3 +447,64 @@ def test_informative_decorator(mocker, default_conf_usdt, trading_mode):
     for _, dataframe in analyzed.items():
         for col in expected_columns:
             assert col in dataframe.columns
+
+    # Informatives of fixed assets are populated once and shared by all pairs
+    assert {key[:2] for key in strategy._ft_informative_cache} == {
+        ("NEO/USDT", "1h"),
+        ("NEO/USDT", "30m"),
+        ("XRP/BTC", "1h"),
+        ("LTC/BTC", "1h"),
+        ("ETH/BTC", "1h"),
+        ("ETH/USDT", "30m"),
+    }
+    for _, cached in strategy._ft_informative_cache.values():
+        assert "rsi" in cached.columns
+
+
+def test_informative_decorator_cache(mocker, default_conf_usdt):
+    default_conf_usdt["strategy"] = "InformativeDecoratorTest"
+    strategy = StrategyResolver.load_strategy(default_conf_usdt)
+    exchange = get_patched_exchange(mocker, default_conf_usdt)
+    strategy.dp = DataProvider({}, exchange, None)
+    inf_data = {"df": generate_test_data("1h", 40)}
+    mocker.patch.object(
+        strategy.dp, "get_pair_dataframe", side_effect=lambda *args: inf_data["df"].copy()
+    )
+    calls = []
+
+    def populate(strategy, dataframe, metadata):
+        calls.append(metadata["pair"])
+        dataframe["sma"] = dataframe["close"].rolling(3).mean()
+        return dataframe
+
+    informative = InformativeData("NEO/{stake}", "1h", None, True, CandleType.SPOT)
+    data = generate_test_data("5m", 480)
+    results = [
+        _create_and_merge_informative_pair(
+            strategy, data.copy(), {"pair": pair}, informative, populate
+        )
+        for pair in ("XRP/USDT", "LTC/USDT")
+    ]
+    assert calls == ["NEO/USDT"]
+    assert results[0]["neo_usdt_sma_1h"].equals(results[1]["neo_usdt_sma_1h"])
+    # Shared dataframe is not modified by merging
+    _, cached = next(iter(strategy._ft_informative_cache.values()))
+    assert "sma" in cached.columns
+
+    # A new informative candle invalidates the cache
+    inf_data["df"] = generate_test_data("1h", 41)
+    _create_and_merge_informative_pair(
+        strategy, data.copy(), {"pair": "XRP/USDT"}, informative, populate
+    )
+    assert calls == ["NEO/USDT", "NEO/USDT"]
+    assert len(strategy._ft_informative_cache) == 1
+
+    # Informatives of the current pair are not cached
+    informative = InformativeData(None, "1h", None, True, CandleType.SPOT)
+    _create_and_merge_informative_pair(
+        strategy, data.copy(), {"pair": "XRP/USDT"}, informative, populate
+    )
+    assert calls == ["NEO/USDT", "NEO/USDT", "XRP/USDT"]
+
+    strategy.advise_all_indicators({})
+    assert strategy._ft_informative_cache == {}
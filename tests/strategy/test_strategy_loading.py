@@ -1,5 +1,7 @@
 # pragma pylint: disable=missing-docstring, protected-access, C0103
 import logging
+import os
+import shutil
 from base64 import urlsafe_b64encode
 from pathlib import Path
 
@@ -9,6 +11,7 @@ from pandas import DataFrame
 from freqtrade.configuration import Configuration
 from freqtrade.exceptions import OperationalException
 from freqtrade.resolvers import StrategyResolver
+from freqtrade.resolvers.resolver_index import RESOLVER_INDEX_FILE, defined_names
 from freqtrade.strategy.interface import IStrategy
 from tests.conftest import CURRENT_TEST_STRATEGY, log_has, log_has_re
 
@@ -107,6 +110,75 @@ def test_load_not_found_strategy(default_conf, tmp_path):
         StrategyResolver.load_strategy(default_conf)
 
 
+@pytest.mark.filterwarnings("ignore:deprecated")
+def test_load_strategy_index(default_conf, tmp_path, mocker, caplog, resolver_index_file):
+    # Use the index location derived from user_data_dir
+    mocker.stop(resolver_index_file)
+    caplog.set_level(logging.DEBUG)
+    strategy_dir = tmp_path / "strategies"
+    shutil.copytree(
+        Path(__file__).parent / "strats",
+        strategy_dir,
+        ignore=shutil.ignore_patterns("__pycache__"),
+    )
+    default_conf.update(
+        {
+            "user_data_dir": tmp_path,
+            "strategy_path": str(strategy_dir),
+            "strategy": CURRENT_TEST_STRATEGY,
+        }
+    )
+    index_file = tmp_path / RESOLVER_INDEX_FILE
+    import_mock = mocker.spy(StrategyResolver, "_get_valid_object")
+    parse_mock = mocker.patch(
+        "freqtrade.resolvers.resolver_index.defined_names", wraps=defined_names
+    )
+    strategy = StrategyResolver.load_strategy(default_conf)
+    assert strategy.get_strategy_name() == CURRENT_TEST_STRATEGY
+    # Only the strategy's file is imported
+    assert import_mock.call_count == 1
+    assert import_mock.call_args[0][0].name == "strategy_test_v3.py"
+    assert index_file.is_file()
+
+    # Not found - indexes (and imports) all files
+    default_conf["strategy"] = "NotFoundStrategy"
+    with pytest.raises(OperationalException, match=r"Impossible to load Strategy"):
+        StrategyResolver.load_strategy(default_conf)
+    file_count = parse_mock.call_count
+    assert file_count == len(list(strategy_dir.glob("*.py")))
+
+    # Unchanged files are not parsed again
+    import_mock.reset_mock()
+    default_conf["strategy"] = CURRENT_TEST_STRATEGY
+    StrategyResolver.load_strategy(default_conf)
+    assert import_mock.call_count == 1
+    assert parse_mock.call_count == file_count
+
+    # Neither are files with a new modification time, but unchanged content
+    v2_file = strategy_dir / "strategy_test_v2.py"
+    os.utime(v2_file, (v2_file.stat().st_atime + 10, v2_file.stat().st_mtime + 10))
+    StrategyResolver.load_strategy(default_conf)
+    assert parse_mock.call_count == file_count
+
+    v2_file.write_text(v2_file.read_text() + "\n# changed\n")
+    default_conf["strategy"] = "StrategyTestV2"
+    StrategyResolver.load_strategy(default_conf)
+    assert parse_mock.call_count == file_count + 1
+
+    # Dynamically defined classes are found by searching all files
+    (strategy_dir / "dynamic_strategy.py").write_text(
+        "from strategy_test_v3 import StrategyTestV3\n\n"
+        'globals()["DynamicStrategy"] = type(\n'
+        '    "DynamicStrategy", (StrategyTestV3,), {"__module__": __name__}\n'
+        ")\n"
+    )
+    default_conf["strategy"] = "DynamicStrategy"
+    caplog.clear()
+    strategy = StrategyResolver.load_strategy(default_conf)
+    assert strategy.get_strategy_name() == "DynamicStrategy"
+    assert log_has("DynamicStrategy not found in resolver index, searching all files.", caplog)
+
+
 def test_load_strategy_noname(default_conf):
     default_conf["strategy"] = ""
     with pytest.raises(